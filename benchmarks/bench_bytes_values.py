@@ -0,0 +1,54 @@
+# Benchmarks validating bytes values, like fields sliced from network payloads, against decoding them to strs first.
+# Run with: python benchmarks/bench_bytes_values.py
+
+from __future__ import print_function
+
+import random
+import timeit
+
+import pysimplevalidate as pysv
+
+NUMBER = 20
+
+random.seed(42)
+
+# Short fields, and message bodies of UTF-8 text.
+IPV4S = [b"%d.%d.%d.%d" % tuple(random.randint(0, 255) for _ in range(4)) for _ in range(200)]
+EMAILS = [b"user%d@example%d.com" % (i, i % 50) for i in range(200)]
+WORDS = [u"hello", u"world", u"café", u"naïve", u"über", u"order", u"12345"]
+
+
+def makeBodies(size, count):
+    """Returns count bodies of about size bytes of UTF-8 encoded words."""
+    return [u" ".join(random.choice(WORDS) for _ in range(size // 6)).encode("utf-8") for _ in range(count)]
+
+
+BLOCK_REGEXES = [r"casino", r"^admin", r"\d{7,}", r"(?i)free\s+money", r"<script"]
+
+BENCHMARKS = [
+    ("validateIPv4", pysv.validateIPv4, IPV4S, {}),
+    ("validateEmail", pysv.validateEmail, EMAILS, {}),
+    ("validateStr 100 B", pysv.validateStr, makeBodies(100, 200), {"blockRegexes": BLOCK_REGEXES}),
+    ("validateStr 1 KB", pysv.validateStr, makeBodies(1000, 100), {"blockRegexes": BLOCK_REGEXES}),
+    ("validateStr 20 KB", pysv.validateStr, makeBodies(20000, 10), {"blockRegexes": BLOCK_REGEXES}),
+]
+
+
+def bench(function, values):
+    def run():
+        for value in values:
+            try:
+                function(value)
+            except pysv.ValidationException:
+                pass
+
+    return timeit.timeit(run, number=NUMBER) / (NUMBER * len(values)) * 1e6
+
+
+if __name__ == "__main__":
+    print("%-20s%12s%12s%10s" % ("validator", "decode us", "bytes us", "speedup"))
+    for name, validator, values, validatorArgs in BENCHMARKS:
+        views = [memoryview(value) for value in values]  # Slices of a payload, as a protocol parser hands them over.
+        decoded = bench(lambda value: validator(bytes(value).decode("utf-8"), **validatorArgs), views)
+        native = bench(lambda value: validator(value, **validatorArgs), views)
+        print("%-20s%12.2f%12.2f%9.1fx" % (name, decoded, native, decoded / native))
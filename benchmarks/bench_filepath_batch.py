@@ -0,0 +1,90 @@
+# Benchmarks for validateFilepathBatch() against calling validateFilepath() on each path.
+# Run with: python benchmarks/bench_filepath_batch.py
+#
+# The stat() and scandir() calls are counted by wrapping os.stat and os.scandir.
+
+from __future__ import print_function
+
+import os
+import shutil
+import tempfile
+import time
+
+import pysimplevalidate as pysv
+
+NUM_DIRS = 200
+FILES_PER_DIR = 50
+
+
+def makeTree(root):
+    paths = []
+    for d in range(NUM_DIRS):
+        dirPath = os.path.join(root, "dir%03d" % d)
+        os.mkdir(dirPath)
+        for f in range(FILES_PER_DIR):
+            path = os.path.join(dirPath, "file%03d.txt" % f)
+            with open(path, "w"):
+                pass
+            paths.append(path)
+        paths.append(os.path.join(dirPath, "missing.txt"))  # One path in each folder doesn't exist.
+    return paths
+
+
+class CallCounter(object):
+    def __init__(self, module, name):
+        self.module, self.name, self.original, self.calls = module, name, getattr(module, name), 0
+
+    def __enter__(self):
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return self.original(*args, **kwargs)
+
+        setattr(self.module, self.name, counted)
+        return self
+
+    def __exit__(self, *exc):
+        setattr(self.module, self.name, self.original)
+
+
+def bench(label, func, paths):
+    with CallCounter(os, "stat") as stats, CallCounter(os, "scandir") as scandirs:
+        startTime = time.time()
+        results = func(paths)
+        seconds = time.time() - startTime
+    print(
+        "%-45s %8.0f ns/path %8d stat() %6d scandir()"
+        % (label, seconds / len(paths) * 1e9, stats.calls, scandirs.calls)
+    )
+    return results
+
+
+def perPath(paths):
+    results = []
+    for path in paths:
+        try:
+            results.append(pysv.validateFilepath(path, mustBeFile=True))
+        except pysv.ValidationException:
+            results.append(None)
+    return results
+
+
+if __name__ == "__main__":
+    root = tempfile.mkdtemp()
+    try:
+        paths = makeTree(root)
+        print("%d paths in %d folders:" % (len(paths), NUM_DIRS))
+        expected = bench("pysv.validateFilepath(mustBeFile=True)", perPath, paths)
+        cache = pysv.DirectoryCache(ttl=60)
+        results = bench(
+            "pysv.validateFilepathBatch(mustBeFile=True)",
+            lambda p: pysv.validateFilepathBatch(p, mustBeFile=True, cache=cache),
+            paths,
+        )
+        assert results == expected
+        bench(
+            "  again, with the listings cached",
+            lambda p: pysv.validateFilepathBatch(p, mustBeFile=True, cache=cache),
+            paths,
+        )
+    finally:
+        shutil.rmtree(root)
@@ -0,0 +1,55 @@
+# Benchmarks the literal prefilter (see pysimplevalidate.literals) on long blockRegexes lists.
+# Run with: python benchmarks/bench_literal_prefilter.py
+
+from __future__ import print_function
+
+import random
+import timeit
+
+import pysimplevalidate as pysv
+
+NUMBER = 20
+
+random.seed(42)
+WORDS = ["".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(8)) for _ in range(5000)]
+
+# Values that none of the patterns block, so every pattern is checked.
+VALUES = ["hello world %d" % i for i in range(20)] + ["user%d@example.com" % i for i in range(20)]
+
+
+def makePatterns(count):
+    """Returns count block patterns like the ones in real block lists: keywords, prefixes, file
+    extensions, and a few that have no literal text to check for."""
+    patterns = []
+    for i, word in enumerate(WORDS[:count]):
+        kind = i % 5
+        if kind == 0:
+            patterns.append(r".*%s.*" % word)
+        elif kind == 1:
+            patterns.append(r"^%s" % word)
+        elif kind == 2:
+            patterns.append(r"\.%s$" % word[:3])
+        elif kind == 3:
+            patterns.append(r"\b%s\d+\b" % word)
+        else:
+            patterns.append(r"[0-9]{%d}-[a-z]{%d}" % (i % 7 + 3, i % 5 + 3))
+    return patterns
+
+
+def bench(patterns, prefilter):
+    pysv._literalPrefilters.clear()
+    if not prefilter:
+        # Caching None as each pattern's prefilter makes _prevalidationCheck() run every regex.
+        pysv._literalPrefilters.update(dict.fromkeys(patterns))
+    pysv.validateStr(VALUES[0], blockRegexes=patterns)  # Compile and analyze the patterns first.
+    seconds = timeit.timeit(lambda: [pysv.validateStr(value, blockRegexes=patterns) for value in VALUES], number=NUMBER)
+    return seconds / (NUMBER * len(VALUES)) * 1e6
+
+
+if __name__ == "__main__":
+    print("%-12s%16s%16s%10s" % ("patterns", "regex us/value", "prefilter", "speedup"))
+    for count in (10, 100, 1000, 5000):
+        patterns = makePatterns(count)
+        without = bench(patterns, False)
+        withPrefilter = bench(patterns, True)
+        print("%-12d%16.1f%16.1f%9.1fx" % (count, without, withPrefilter, without / withPrefilter))
@@ -0,0 +1,79 @@
+# Benchmarks for validateInt(), validateDecimal(), and validateNumBuffer().
+# Run with: python benchmarks/bench_numbers.py
+
+from __future__ import print_function
+
+import decimal
+import timeit
+
+import pysimplevalidate as pysv
+
+NUMBER = 100000
+
+INT_VALUES = [str(i * 7919) for i in range(1000)]
+BIG_INT_VALUES = [str(2 ** 64 + i) for i in range(1000)]
+DECIMAL_VALUES = ["%d.%02d" % (i, i % 100) for i in range(1000)]
+NUMBER_BUFFER = "\n".join(DECIMAL_VALUES).encode("ascii")
+
+
+def floatRoundTripInt(value):
+    # The int conversion validateNum() used before the exact integer path.
+    if float(value) % 1 != 0:
+        raise ValueError(value)
+    return int(float(value))
+
+
+def validateFloatLines(buffer):
+    # Decoding and validating each line one at a time, for comparison with validateNumBuffer().
+    return [pysv.validateFloat(line) for line in buffer.decode("ascii").split("\n")]
+
+
+def benchBuffer(label, func, buffer):
+    numValues = buffer.count(b"\n") + 1
+    seconds = timeit.timeit(lambda: func(buffer), number=NUMBER // numValues)
+    print("%-50s %8.0f ns/value" % (label, seconds / NUMBER * 1e9))
+
+
+def bench(label, func, values):
+    numValues = len(values)
+    seconds = timeit.timeit(lambda: [func(v) for v in values], number=NUMBER // numValues)
+    print("%-50s %8.0f ns/value" % (label, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    print("Integer parsing:")
+    bench("float round trip (previous validateInt path)", floatRoundTripInt, INT_VALUES)
+    bench("pysv._parseInt()", pysv._parseInt, INT_VALUES)
+    bench("pysv._parseInt() on '3.0' style values", pysv._parseInt, [v + ".0" for v in INT_VALUES])
+    bench("pysv.validateInt()", pysv.validateInt, INT_VALUES)
+    bench("pysv.validateInt() on ints > 2**64", pysv.validateInt, BIG_INT_VALUES)
+    # The float round trip can't represent these exactly:
+    print("  float round trip of 2**64 + 1 == %d" % floatRoundTripInt(str(2 ** 64 + 1)))
+    print("  pysv.validateInt('%d') == %d" % (2 ** 64 + 1, pysv.validateInt(str(2 ** 64 + 1))))
+
+    print("Decimal parsing:")
+    bench("decimal.Decimal()", decimal.Decimal, DECIMAL_VALUES)
+    bench("pysv.validateDecimal()", pysv.validateDecimal, DECIMAL_VALUES)
+    bench(
+        "pysv.validateDecimal(maxDigits=8, maxScale=2)",
+        lambda v: pysv.validateDecimal(v, maxDigits=8, maxScale=2),
+        DECIMAL_VALUES,
+    )
+    hugeExponent = "9" * 30 + "e999999999"
+
+    def rejectHuge(value):
+        try:
+            pysv.validateDecimal(value, maxDigits=18)
+        except pysv.ValidationException:
+            pass
+
+    bench("pysv.validateDecimal() rejecting a huge exponent", rejectHuge, [hugeExponent] * 1000)
+
+    print("Buffer parsing:")
+    benchBuffer("pysv.validateFloat() on each decoded line", validateFloatLines, NUMBER_BUFFER)
+    benchBuffer("pysv.validateNumBuffer()", pysv.validateNumBuffer, NUMBER_BUFFER)
+    benchBuffer(
+        "pysv.validateNumBuffer(min=0, max=500)",
+        lambda b: pysv.validateNumBuffer(b, min=0, max=500),
+        NUMBER_BUFFER,
+    )
@@ -0,0 +1,51 @@
+# Benchmarks loading a saved PatternBundle against compiling its patterns from their source.
+# Run with: python benchmarks/bench_pattern_bundle.py
+
+from __future__ import print_function
+
+import os
+import random
+import re
+import tempfile
+import time
+
+import pysimplevalidate as pysv
+
+random.seed(42)
+
+
+def makeRuleSets(numTenants, patternsPerTenant):
+    """Returns a dict of rule sets of block patterns like tenants' custom rules."""
+    ruleSets = {}
+    for tenant in range(numTenants):
+        rules = []
+        for i in range(patternsPerTenant):
+            word = "".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(8))
+            rules.append((r"^(?:%s|%s)[-_.]?\d{2,4}(?P<suffix>\w*)$" % (word, word[::-1]), "Reserved name."))
+        ruleSets["tenant%d" % tenant] = rules
+    return ruleSets
+
+
+def timed(function):
+    startTime = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - startTime
+
+
+if __name__ == "__main__":
+    print("%-10s%14s%14s%10s" % ("patterns", "compile ms", "load ms", "speedup"))
+    for numTenants in (10, 100, 500):
+        ruleSets = makeRuleSets(numTenants, 10)
+        filename = os.path.join(tempfile.mkdtemp(), "rules.bundle")
+        pysv.PatternBundle(ruleSets).save(filename)
+
+        re.purge()
+        compiled, compileSeconds = timed(lambda: pysv.PatternBundle(ruleSets))
+        re.purge()
+        loaded, loadSeconds = timed(lambda: pysv.PatternBundle.load(filename))
+        assert all(loaded[name] == compiled[name] for name in ruleSets)
+        print(
+            "%-10d%14.1f%14.1f%9.1fx"
+            % (numTenants * 10, compileSeconds * 1000, loadSeconds * 1000, compileSeconds / loadSeconds)
+        )
+        os.remove(filename)
@@ -0,0 +1,54 @@
+# Benchmarks for validatePhone() and validatePhoneBatch() against a regex alternation of every calling code.
+# Run with: python benchmarks/bench_phone.py
+
+from __future__ import print_function
+
+import re
+import timeit
+
+import pysimplevalidate as pysv
+
+NUMBER = 100000
+
+_, RULES, _ = pysv._getPhoneTables()
+SAMPLE_RULES = [rule for rule in RULES for _ in range(3)][:1000]
+PHONE_VALUES = [
+    "+%s %s" % (code, str(7000000000000 + i * 7919)[: maxLength - (i % 2)] if maxLength - (i % 2) >= minLength else "")
+    for i, (code, minLength, maxLength, trunkPrefix) in enumerate(SAMPLE_RULES)
+]
+
+# The approach validatePhone() avoids: one alternation with a branch for each calling code's length rule.
+ALTERNATION_REGEX = re.compile(
+    r"^\+(?:%s)$"
+    % "|".join(r"%s\d{%d,%d}" % (code, minLength, maxLength) for code, minLength, maxLength, trunkPrefix in RULES)
+)
+SEPARATORS_TABLE = {ord(c): None for c in " \t-.()/"}
+
+
+def alternationPhone(value):
+    value = value.strip().translate(SEPARATORS_TABLE)
+    return value if ALTERNATION_REGEX.match(value) else None
+
+
+def perValue(values):
+    results = []
+    for value in values:
+        try:
+            results.append(pysv.validatePhone(value))
+        except pysv.ValidationException:
+            results.append(None)
+    return results
+
+
+def bench(label, func, values):
+    numValues = len(values)
+    seconds = timeit.timeit(lambda: func(values), number=NUMBER // numValues)
+    print("%-50s %8.0f ns/value" % (label, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    assert pysv.validatePhoneBatch(PHONE_VALUES) == perValue(PHONE_VALUES) == [alternationPhone(v) for v in PHONE_VALUES]
+    print("%d numbers for %d calling codes:" % (len(PHONE_VALUES), len(RULES)))
+    bench("regex alternation of every calling code", lambda v: [alternationPhone(x) for x in v], PHONE_VALUES)
+    bench("pysv.validatePhone() per value", perValue, PHONE_VALUES)
+    bench("pysv.validatePhoneBatch()", pysv.validatePhoneBatch, PHONE_VALUES)
@@ -0,0 +1,52 @@
+# Benchmarks for the ZIP code and state check of validatePostalCode() and validatePostalCodeBatch().
+# Run with: python benchmarks/bench_postal_code.py
+
+from __future__ import print_function
+
+import re
+import timeit
+
+import pysimplevalidate as pysv
+
+NUMBER = 100000
+
+# An address file's ZIP code and state columns: every used ZIP3 prefix, with every tenth state wrong.
+PREFIX_TABLE, STATE_NUMBERS = pysv._getZIP3Tables()
+STATE_CODES = dict((number, state) for state, number in STATE_NUMBERS.items())
+ZIPS = ["%03d%02d" % (prefix, prefix % 100) for prefix in range(1000) if PREFIX_TABLE[prefix]]
+STATES = [STATE_CODES[PREFIX_TABLE[int(z[:3])]] if i % 10 else "NY" for i, z in enumerate(ZIPS)]
+
+# The approach the ZIP3 table avoids: a regex for each state, alternating its ZIP3 prefixes.
+STATE_REGEXES = dict(
+    (state, re.compile(r"(?:%s)\d{2}(?:-?\d{4})?" % "|".join(
+        "%03d" % prefix for prefix in range(1000) if PREFIX_TABLE[prefix] == number)))
+    for state, number in STATE_NUMBERS.items()
+)
+
+
+def regexPerState(zips, states):
+    return [z if STATE_REGEXES[state].fullmatch(z) else None for z, state in zip(zips, states)]
+
+
+def perValue(zips, states):
+    results = []
+    for z, state in zip(zips, states):
+        try:
+            results.append(pysv.validatePostalCode(z, state=state))
+        except pysv.ValidationException:
+            results.append(None)
+    return results
+
+
+def bench(label, func):
+    seconds = timeit.timeit(lambda: func(ZIPS, STATES), number=NUMBER // len(ZIPS))
+    print("%-50s %8.0f ns/value" % (label, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    expected = regexPerState(ZIPS, STATES)
+    assert perValue(ZIPS, STATES) == expected == pysv.validatePostalCodeBatch(ZIPS, states=STATES)
+    print("%d ZIP codes and states:" % len(ZIPS))
+    bench("regex of each state's ZIP3 prefixes", regexPerState)
+    bench("pysv.validatePostalCode() per value", perValue)
+    bench("pysv.validatePostalCodeBatch()", lambda z, s: pysv.validatePostalCodeBatch(z, states=s))
@@ -0,0 +1,50 @@
+# Benchmarks for the joined-buffer regex batch validators against per-value loops.
+# Run with: python benchmarks/bench_regex_batch.py
+
+from __future__ import print_function
+
+import timeit
+
+import pysimplevalidate as pysv
+
+NUMBER = 100000
+
+EMAIL_VALUES = ["user%d@example%d.com" % (i, i % 50) if i % 10 else "not an email %d" % i for i in range(1000)]
+URL_VALUES = ["https://example%d.com/page/%d" % (i % 50, i) if i % 10 else "blah blah %d" % i for i in range(1000)]
+IPV4_VALUES = ["10.%d.%d.%d" % (i % 256, (i * 7) % 256, (i * 13) % 300) for i in range(1000)]
+REGEX_VALUES = ["order-%06d" % i if i % 10 else "ORDER %d" % i for i in range(1000)]
+
+
+def perValue(validator, values, **kwargs):
+    results = []
+    for value in values:
+        try:
+            results.append(validator(value, **kwargs))
+        except pysv.ValidationException:
+            results.append(None)
+    return results
+
+
+def bench(label, func, values):
+    numValues = len(values)
+    seconds = timeit.timeit(lambda: func(values), number=NUMBER // numValues)
+    print("%-50s %8.0f ns/value" % (label, seconds / NUMBER * 1e9))
+
+
+if __name__ == "__main__":
+    for name, validator, batchValidator, values in (
+        ("validateEmail", pysv.validateEmail, pysv.validateEmailBatch, EMAIL_VALUES),
+        ("validateURL", pysv.validateURL, pysv.validateURLBatch, URL_VALUES),
+        ("validateIPv4", pysv.validateIPv4, pysv.validateIPv4Batch, IPV4_VALUES),
+    ):
+        assert batchValidator(values) == perValue(validator, values)
+        print(name + ":")
+        bench("pysv.%s() per value" % name, lambda v: perValue(validator, v), values)
+        bench("pysv.%sBatch()" % name, batchValidator, values)
+
+    print("validateRegex:")
+    assert pysv.validateRegexBatch(REGEX_VALUES, r"^order-\d+$") == perValue(
+        pysv.validateRegex, REGEX_VALUES, regex=r"^order-\d+$"
+    )
+    bench("pysv.validateRegex() per value", lambda v: perValue(pysv.validateRegex, v, regex=r"^order-\d+$"), REGEX_VALUES)
+    bench("pysv.validateRegexBatch()", lambda v: pysv.validateRegexBatch(v, r"^order-\d+$"), REGEX_VALUES)
@@ -0,0 +1,61 @@
+# Benchmarks comparing the regex engines (see pysv.REGEX_ENGINES) on the built-in patterns.
+# Run with: python benchmarks/bench_regex_engines.py
+
+from __future__ import print_function
+
+import timeit
+
+import pysimplevalidate as pysv
+
+NUMBER = 2000
+
+# Each built-in pattern, with values that match and values that don't.
+CASES = [
+    ("IPV4_REGEX", pysv.IPV4_REGEX, ["192.168.0.1", "10.0.0.255", "256.1.1.1", "cat"]),
+    ("IPV6_REGEX", pysv.IPV6_REGEX, ["2001:db8::1", "fe80::7:8%eth0", "::ffff:192.0.2.33", "2001:db8:::1"]),
+    ("URL_REGEX", pysv.URL_REGEX, ["https://www.example.com/a?b=c", "example.com", "not a url", "http://"]),
+    ("EMAIL_REGEX", pysv.EMAIL_REGEX, ["al@example.com", "a.b+c@mail.example.org", "al@", "@example.com"]),
+    ("DECIMAL_REGEX", pysv.DECIMAL_REGEX, ["-12.50", "1.5e3", "12..5", "cat"]),
+]
+
+# A pattern that backtracking engines take exponential time to fail to match on a value of n a's and a '!'.
+REDOS_PATTERN = r"^(a+)+$"
+
+
+def engines():
+    result = [pysv.StdlibRegexEngine(), pysv.PikeRegexEngine()]
+    try:
+        result.append(pysv.RegexModuleEngine())
+    except pysv.PySimpleValidateException:
+        print("(The regex module isn't installed, so RegexModuleEngine is skipped.)")
+    return result
+
+
+def bench(engine, name, regex, values):
+    compiled = pysv._compilePattern(regex, engine=engine)
+    seconds = timeit.timeit(lambda: [compiled.search(value) for value in values], number=NUMBER)
+    return seconds / (NUMBER * len(values)) * 1e9
+
+
+if __name__ == "__main__":
+    allEngines = engines()
+    print("%-15s" % "ns/value" + "".join("%12s" % engine.name for engine in allEngines))
+    for name, regex, values in CASES:
+        expected = [mo and mo.span() for mo in map(regex.search, values)]
+        for engine in allEngines:
+            compiled = pysv._compilePattern(regex, engine=engine)
+            assert [mo and mo.span() for mo in map(compiled.search, values)] == expected, (engine, name)
+        print("%-15s" % name + "".join("%12.0f" % bench(engine, name, regex, values) for engine in allEngines))
+
+    print()
+    print("%r on 'a' * n + '!', in ms:" % REDOS_PATTERN)
+    for n in (16, 20, 22, 10000):
+        row = "n=%-13d" % n
+        for engine in allEngines:
+            if engine.name != "pike" and n > 22:
+                row += "%12s" % "(hours)"
+                continue
+            compiled = pysv._compilePattern(REDOS_PATTERN, engine=engine)
+            seconds = timeit.timeit(lambda: compiled.search("a" * n + "!"), number=1)
+            row += "%12.1f" % (seconds * 1000)
+        print(row)
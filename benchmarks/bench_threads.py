@@ -0,0 +1,57 @@
+# Benchmarks for how validateBatchThreaded() throughput scales with 1 to 16 threads.
+# Run with: python benchmarks/bench_threads.py
+#
+# The threads only run in parallel on a free-threaded Python build (python3.13t and later) with
+# the GIL disabled. On other builds, the throughput stays about the same as the thread count grows.
+
+from __future__ import print_function
+
+import concurrent.futures
+import datetime
+import os
+import sys
+import time
+
+import pysimplevalidate as pysv
+
+NUM_VALUES = 40000
+THREAD_COUNTS = (1, 2, 4, 8, 16)
+
+INTS = [str(i) if i % 10 else "x" for i in range(NUM_VALUES)]
+DAYS = [datetime.date(2000, 1, 1) + datetime.timedelta(days=i % 9000) for i in range(NUM_VALUES)]
+DATES = [day.strftime("%Y-%m-%d") for day in DAYS]
+MONTH_NAME_DATES = [day.strftime("%d %b %Y") for day in DAYS]
+
+CASES = (
+    ("validateInt", INTS, pysv.validateInt, {}),
+    ("validateDate %Y-%m-%d (regex parser)", DATES, pysv.validateDate, {"formats": ["%Y-%m-%d"]}),
+    ("validateDate %d %b %Y (strptime)", MONTH_NAME_DATES, pysv.validateDate, {"formats": ["%d %b %Y"]}),
+)
+
+
+def valuesPerSecond(values, validator, numThreads, validatorArgs):
+    with concurrent.futures.ThreadPoolExecutor(numThreads) as pool:
+        pysv.validateBatchThreaded(values[:1000], validator, executor=pool, **validatorArgs)  # Warm up the threads.
+        startTime = time.perf_counter()
+        pysv.validateBatchThreaded(values, validator, executor=pool, chunkSize=500, **validatorArgs)
+        return len(values) / (time.perf_counter() - startTime)
+
+
+if __name__ == "__main__":
+    gilEnabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        "Python %s, %d CPUs, GIL %s"
+        % (sys.version.split()[0], os.cpu_count() or 1, "enabled" if gilEnabled else "disabled")
+    )
+    print("%-40s %s" % ("", " ".join("%12s" % ("%d thread%s" % (n, "" if n == 1 else "s")) for n in THREAD_COUNTS)))
+    for label, values, validator, validatorArgs in CASES:
+        rates = [valuesPerSecond(values, validator, n, validatorArgs) for n in THREAD_COUNTS]
+        print("%-40s %s" % (label, " ".join("%10.0f/s" % rate for rate in rates)))
+        print("%-40s %s" % ("  speedup", " ".join("%11.2fx" % (rate / rates[0]) for rate in rates)))
+
+    # The regex parser against strptime() in one thread.
+    for label, parse in (("datetime.strptime()", datetime.datetime.strptime), ("pysv._strptime()", pysv._strptime)):
+        startTime = time.perf_counter()
+        for value in DATES:
+            parse(value, "%Y-%m-%d")
+        print("%-40s %8.0f ns/value" % (label + " %Y-%m-%d", (time.perf_counter() - startTime) / NUM_VALUES * 1e9))
@@ -0,0 +1,46 @@
+# Benchmarks validating the int, float, Decimal, and date values that database drivers return, which are
+# checked as is, against validating their strs.
+# Run with: python benchmarks/bench_typed_values.py
+
+from __future__ import print_function
+
+import datetime
+import decimal
+import random
+import timeit
+
+import pysimplevalidate as pysv
+
+NUMBER = 20
+
+random.seed(42)
+
+# A batch of values like one column of rows fetched from a database.
+BATCH_SIZE = 1000
+INTS = [random.randint(0, 10**9) for _ in range(BATCH_SIZE)]
+FLOATS = [random.uniform(0, 1000) for _ in range(BATCH_SIZE)]
+DECIMALS = [decimal.Decimal(random.randint(0, 10**8)).scaleb(-2) for _ in range(BATCH_SIZE)]
+DATES = [datetime.date(2000, 1, 1) + datetime.timedelta(days=random.randint(0, 9000)) for _ in range(BATCH_SIZE)]
+DATETIMES = [datetime.datetime(2000, 1, 1) + datetime.timedelta(seconds=random.randint(0, 10**9)) for _ in range(BATCH_SIZE)]
+
+BENCHMARKS = [
+    ("validateInt", pysv.validateInt, INTS, {"min": 0}),
+    ("validateFloat", pysv.validateFloat, FLOATS, {"max": 1000}),
+    ("validateDecimal", pysv.validateDecimal, DECIMALS, {"maxDigits": 10, "maxScale": 2}),
+    ("validateDate", pysv.validateDate, DATES, {"formats": ["%Y-%m-%d"], "min": datetime.date(2000, 1, 1)}),
+    ("validateDatetime", pysv.validateDatetime, DATETIMES, {"formats": ["%Y-%m-%d %H:%M:%S"]}),
+]
+
+
+def bench(validator, values, validatorArgs):
+    seconds = timeit.timeit(lambda: [validator(value, **validatorArgs) for value in values], number=NUMBER)
+    return seconds / (NUMBER * len(values)) * 1e6
+
+
+if __name__ == "__main__":
+    print("%-18s%12s%12s%10s" % ("validator", "str us", "typed us", "speedup"))
+    for name, validator, values, validatorArgs in BENCHMARKS:
+        # The str of each value goes through the same parsing as text input.
+        strs = bench(validator, [str(value) for value in values], validatorArgs)
+        typed = bench(validator, values, validatorArgs)
+        print("%-18s%12.2f%12.2f%9.1fx" % (name, strs, typed, strs / typed))
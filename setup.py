@@ -22,13 +22,15 @@ setup(
     url='https://github.com/asweigart/pysimplevalidate',
     author='Al Sweigart',
     author_email='al@inventwithpython.com',
-    description=('A collection of string-based validation functions, suitable for use in other Python 2 and 3 applications.'),
+    description=('A collection of string-based validation functions, suitable for use in other Python 3 applications.'),
     long_description=long_description,
     license='BSD',
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
+    package_data={'pysimplevalidate': ['data/*.tsv']},
+    entry_points={'console_scripts': ['pysimplevalidate = pysimplevalidate.__main__:main']},
     test_suite='tests',
-    install_requires=['typing;python_version<"3.5"'],
+    python_requires='>=3.6',
     keywords="input validation text string",
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -36,11 +38,7 @@ setup(
         'License :: OSI Approved :: BSD License',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
@@ -3,22 +3,37 @@
 
 from __future__ import absolute_import, division, print_function
 
+import array
 import calendar
+import collections
+import contextlib
 import datetime
+import decimal
+import functools
+import gettext
+import inspect
+import io
+import json
+import os
 import re
+import stat
 import sys
+import threading
 import time
+import warnings
 
-from typing import Union, Pattern, Type, Dict, Tuple, Optional, Sequence, Any, List
-
-import gettext, os
-FOLDER_OF_THIS_FILE = os.path.dirname(os.path.abspath(__file__))
-enLang = gettext.translation('pysimplevalidate', localedir=os.path.join(FOLDER_OF_THIS_FILE, 'locale'), languages=['en'])
-enLang.install()
-# TODO - should i have a setLang() function?
+from typing import Union, Pattern, Type, Dict, Tuple, Optional, Sequence, Any, List, Iterator, Set, FrozenSet
 
 __version__ = "0.2.12"  # type: str
 
+FOLDER_OF_THIS_FILE = os.path.dirname(os.path.abspath(__file__))  # type: str
+
+# The gettext catalogs for the ValidationException messages are in this folder:
+LOCALE_FOLDER = os.path.join(FOLDER_OF_THIS_FILE, "locale")  # type: str
+
+# The language used when setLang() hasn't been called and there's no useLang() block.
+DEFAULT_LANG = "en"  # type: str
+
 # In Python 3, regex pattern classes are re.Pattern
 # In Python 2, regex pattern classes are SRE_Pattern but there's no exposed class that I can pass to isinstance.
 RE_PATTERN_TYPE = type(re.compile(""))
@@ -35,6 +50,17 @@ else:
 # Used by _errstr():
 MAX_ERROR_STR_LEN = 50  # type: int
 
+# Matches ints written with a decimal point and only zeros after it, like '3.0', so that
+# _parseInt() can convert them without going through float().
+ZERO_FRACTION_INT_REGEX = re.compile(r"^\s*([+-]?\d+)\.0*\s*$")  # type: Pattern
+
+# The bytes version of ZERO_FRACTION_INT_REGEX, for validateNumBuffer().
+ZERO_FRACTION_INT_BYTES_REGEX = re.compile(ZERO_FRACTION_INT_REGEX.pattern.encode("ascii"))  # type: Pattern
+
+# Matches decimal numbers like '-12.50' or '1.5e3'. The groups are the sign, the
+# digits before the decimal point, the digits after it, and the exponent.
+DECIMAL_REGEX = re.compile(r"^\s*([+-]?)(\d*)(?:\.(\d*))?(?:[eE]([+-]?\d+))?\s*$")  # type: Pattern
+
 # From https://stackoverflow.com/a/5284410/1893164
 IPV4_REGEX = re.compile(r"""((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)(\.|$)){4}""")  # type: Pattern
 
@@ -70,6 +96,15 @@ URL_REGEX = re.compile(
 # https://emailregex.com/
 EMAIL_REGEX = re.compile(r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)")  # type: Pattern
 
+# The bytes versions of IPV4_REGEX, IPV6_REGEX, URL_REGEX, and EMAIL_REGEX, for bytes values.
+IPV4_BYTES_REGEX = re.compile(IPV4_REGEX.pattern.encode("ascii"))  # type: Pattern
+IPV6_BYTES_REGEX = re.compile(IPV6_REGEX.pattern.encode("ascii"), re.VERBOSE)  # type: Pattern
+URL_BYTES_REGEX = re.compile(URL_REGEX.pattern.encode("ascii"))  # type: Pattern
+EMAIL_BYTES_REGEX = re.compile(EMAIL_REGEX.pattern.encode("ascii"))  # type: Pattern
+
+# The bytes-like types that validateStr(), validateRegex(), and the validators built on it accept as values.
+BYTES_TYPES = (bytes, bytearray, memoryview)  # type: Tuple[type, ...]
+
 # TODO - make STATES a dictionary mapping abbreviation to full name
 USA_STATES = {
     "AL": "Alabama",
@@ -123,6 +158,8 @@ USA_STATES = {
     "WI": "Wisconsin",
     "WY": "Wyoming",
 }  # type: Dict[str, str]
+# USA_STATES_REVERSED and USA_STATES_UPPER are kept for backwards compatibility. The
+# validators look up states with the enumeration index from _getEnumIndex() instead.
 USA_STATES_REVERSED = dict([(USA_STATES[abbrev], abbrev) for abbrev in USA_STATES.keys()])  # type: Dict[str, str]
 USA_STATES_UPPER = dict([(abbrev, USA_STATES[abbrev].upper()) for abbrev in USA_STATES.keys()])  # type: Dict[str, str]
 
@@ -166,8 +203,46 @@ ENGLISH_DAYS_OF_WEEK = {
     "SAT": "Saturday",
 }  # type: Dict[str, str]
 
+# The copies of ENGLISH_MONTHS and ENGLISH_DAYS_OF_WEEK that validateMonth() and validateDayOfWeek() use by
+# default. Their enumeration indexes are cached, so they must not change, while the public tables are mutable.
+_ENGLISH_MONTHS = dict(ENGLISH_MONTHS)  # type: Dict[str, str]
+_ENGLISH_DAYS_OF_WEEK = dict(ENGLISH_DAYS_OF_WEEK)  # type: Dict[str, str]
+
 DEFAULT_BLOCKLIST_RESPONSE = "This response is invalid."  # type: str
 
+# The bundled data files (countries, currencies, etc.) are in this folder:
+DATA_FOLDER = os.path.join(FOLDER_OF_THIS_FILE, "data")  # type: str
+
+# The rows of the data files, keyed by filename. Use _loadDataTable() to read these.
+_DATA_TABLES = {}  # type: Dict[str, List[Tuple[str, ...]]]
+
+# The enumeration indexes, keyed by the names in _ENUM_SOURCES. Use _getEnumIndex() to read these.
+_ENUM_INDEXES = {}  # type: Dict[str, Tuple[Dict[str, str], Dict[str, str]]]
+
+# Held while the lazily built tables (the data tables, enumeration indexes, and the phone, postal
+# code, and ZIP code tables) are built, so that each is only built once when threads race to use
+# it first. Reading a table that's already built doesn't take the lock. This is reentrant because
+# building some tables loads others.
+_tablesLock = threading.RLock()
+
+
+# The language set with setLang(), used by every thread and task that isn't in a useLang() block.
+_defaultLang = DEFAULT_LANG  # type: str
+
+# The language set with useLang(). Context variables are local to each thread
+# and each asyncio task. Before Python 3.7, a thread-local is used instead.
+if sys.version_info >= (3, 7):
+    import contextvars
+
+    _contextLang = contextvars.ContextVar("pysimplevalidate_lang", default=None)  # type: Any
+else:
+    _contextLang = None
+    _threadLang = threading.local()
+
+# The loaded gettext catalogs, keyed by language. Use _getCatalog() to read these.
+_catalogs = {}  # type: Dict[str, gettext.NullTranslations]
+_catalogsLock = threading.Lock()
+
 
 class PySimpleValidateException(Exception):
     """Base class for exceptions raised when PySimpleValidate functions are misused.
@@ -177,15 +252,216 @@ class PySimpleValidateException(Exception):
 
 
 class ValidationException(Exception):
-    """Raised when a validation function fails to validate the value."""
+    """Raised when a validation function fails to validate the value.
+
+    The code attribute is a machine-readable str for the reason the value
+    failed, such as 'NUM_MAX' (see ERROR_MESSAGES), and the params attribute
+    is a dict of the values that go into the message, such as
+    {'value': '5', 'limit': 4}. Code and params are None and {} for
+    exceptions raised by other code with just a message.
+
+    The message isn't formatted until the exception is converted to a str,
+    so rejecting a value is cheap when the caller only needs the code. It's
+    in the language that was current (see getLang()) when the exception was
+    raised. The args attribute is (message,), like other exceptions, and
+    reading it formats the message."""
+
+    def __init__(self, message=None, code=None, params=None):
+        # type: (Optional[str], Optional[str], Optional[Dict[str, Any]]) -> None
+        if message is None:
+            Exception.__init__(self)
+        else:
+            Exception.__init__(self, message)
+        self.code = code  # type: Optional[str]
+        self.params = params if params is not None else {}  # type: Dict[str, Any]
+        self._message = message  # type: Optional[str]
+        self._lang = getLang() if message is None else None  # type: Optional[str]
+        self._lazyArgs = message is None  # type: bool
+
+    def __str__(self):
+        # type: () -> str
+        if self._message is None:
+            self._message = _formatErrorMessage(self.code, self.params, self._lang)
+        return self._message
+
+    def __repr__(self):
+        # type: () -> str
+        return "%s(%r, code=%r)" % (type(self).__name__, str(self), self.code)
+
+    @property  # type: ignore
+    def args(self):
+        # type: () -> Tuple[Any, ...]
+        # A lazily formatted exception's message isn't known when Exception.__init__() is called.
+        if self._lazyArgs:
+            return (str(self),)
+        return BaseException.args.__get__(self)  # type: ignore
+
+    @args.setter
+    def args(self, value):
+        # type: (Tuple[Any, ...]) -> None
+        self._lazyArgs = False
+        BaseException.args.__set__(self, value)  # type: ignore
+
+    def __reduce__(self):
+        # type: () -> Tuple[Any, ...]
+        # The args are just (message,), so pickle the code and params along with it.
+        return (type(self), (str(self), self.code, self.params))
+
+
+def _getCatalog(lang):
+    # type: (str) -> gettext.NullTranslations
+    """Returns the gettext catalog for lang, loading it from LOCALE_FOLDER the
+    first time it's requested. If there's no catalog for lang, the messages
+    are left in English."""
+    catalog = _catalogs.get(lang)
+    if catalog is None:
+        with _catalogsLock:
+            catalog = _catalogs.get(lang)
+            if catalog is None:
+                catalog = gettext.translation(
+                    "pysimplevalidate", localedir=LOCALE_FOLDER, languages=[lang], fallback=True
+                )
+                _catalogs[lang] = catalog
+    return catalog
+
+
+def getLang():
+    # type: () -> str
+    """Returns the language of the ValidationException messages in the
+    current thread or asyncio task: the language of the innermost useLang()
+    block, or else the language set with setLang().
 
-    pass
+    >>> import pysimplevalidate as pysv
+    >>> pysv.getLang()
+    'en'
+    """
+    if _contextLang is not None:
+        lang = _contextLang.get()
+    else:
+        lang = getattr(_threadLang, "lang", None)
+    return _defaultLang if lang is None else lang
+
+
+def setLang(lang):
+    # type: (str) -> None
+    """Sets the language of the ValidationException messages for every
+    thread and asyncio task that isn't in a useLang() block. The lang
+    argument is a gettext language code such as 'de' or 'pt_BR'.
+
+    If there's no catalog for lang, the messages are in English."""
+    global _defaultLang
+    if not isinstance(lang, str):
+        raise PySimpleValidateException("lang argument must be a str")
+    _defaultLang = lang
+
+
+@contextlib.contextmanager
+def useLang(lang):
+    # type: (str) -> Iterator[None]
+    """A context manager that sets the language of the ValidationException
+    messages in the with block. It only affects the current thread (or
+    asyncio task), so threads serving different languages don't interfere.
+
+    >>> import pysimplevalidate as pysv
+    >>> with pysv.useLang('de'):
+    ...     pysv.getLang()
+    'de'
+    """
+    if not isinstance(lang, str):
+        raise PySimpleValidateException("lang argument must be a str")
+    if _contextLang is not None:
+        token = _contextLang.set(lang)
+        try:
+            yield
+        finally:
+            _contextLang.reset(token)
+    else:
+        previousLang = getattr(_threadLang, "lang", None)
+        _threadLang.lang = lang
+        try:
+            yield
+        finally:
+            _threadLang.lang = previousLang
 
 
-#def _(s):
-#    # type: (str) -> str
-#    """This function is a stub for implementing gettext and I18N for PySimpleValidate."""
-#    return s
+def _(message):
+    # type: (str) -> str
+    """Returns message translated into the current language from getLang()."""
+    return _getCatalog(getLang()).gettext(message)
+
+
+def _N(s):
+    # type: (str) -> str
+    """Marks s as a message to translate without translating it. The message
+    is translated with _() when it's used, in _formatErrorMessage()."""
+    return s
+
+
+# Maps each ValidationException code to the standard message for it, and
+# the names of the params that fill in the message's % placeholders, in order.
+ERROR_MESSAGES = {
+    "BLANK": (_N("Blank values are not allowed."), ()),
+    "NOT_NUM": (_N("%r is not a number."), ("value",)),
+    "NOT_FLOAT": (_N("%r is not a float."), ("value",)),
+    "NOT_INT": (_N("%r is not an integer."), ("value",)),
+    "NUM_MIN": (_N("Number must be at minimum %s."), ("limit",)),
+    "NUM_MAX": (_N("Number must be at maximum %s."), ("limit",)),
+    "NUM_LESS_THAN": (_N("Number must be less than %s."), ("limit",)),
+    "NUM_GREATER_THAN": (_N("Number must be greater than %s."), ("limit",)),
+    "NOT_DECIMAL": (_N("%r is not a decimal number."), ("value",)),
+    "DECIMAL_DIGITS": (_N("Number must have at most %s digits."), ("limit",)),
+    "DECIMAL_SCALE": (_N("Number must have at most %s digits after the decimal point."), ("limit",)),
+    "NOT_CHOICE": (_N("%r is not a valid choice."), ("value",)),
+    "NOT_TIME": (_N("%r is not a valid time."), ("value",)),
+    "NOT_DATE": (_N("%r is not a valid date."), ("value",)),
+    "NOT_DATETIME": (_N("%r is not a valid date and time."), ("value",)),
+    "DATE_MIN": (_N("%r is before the minimum of %s."), ("value", "limit")),
+    "DATE_MAX": (_N("%r is after the maximum of %s."), ("value", "limit")),
+    "NOT_FILENAME": (_N("%r is not a valid filename."), ("value",)),
+    "FILENAME_RESERVED": (_N("%r is a reserved filename."), ("value",)),
+    "FILENAME_TOO_LONG": (_N("%r is too long for a filename."), ("value",)),
+    "NOT_FILEPATH": (_N("%r is not a valid file path."), ("value",)),
+    "PATH_NOT_FOUND": (_N("%r does not exist."), ("value",)),
+    "NOT_FILE": (_N("%r is not a file."), ("value",)),
+    "NOT_DIR": (_N("%r is not a folder."), ("value",)),
+    "DIR_UNREADABLE": (_N("%r is a folder that can't be read."), ("value",)),
+    "NOT_IP": (_N("%r is not a valid IP address."), ("value",)),
+    "NOT_IPV4": (_N("%r is not a valid IPv4 address."), ("value",)),
+    "NOT_IPV6": (_N("%r is not a valid IPv6 address."), ("value",)),
+    "NO_MATCH": (_N("%r does not match the specified pattern."), ("value",)),
+    "NOT_REGEX": (_N("%r is not a valid regular expression: %s"), ("value", "error")),
+    "REGEX_TIMEOUT": (_N("%r took longer than %s seconds to match."), ("value", "timeout")),
+    "NOT_ANY_OF": (_N("%r did not pass any of the validators."), ("value",)),
+    "REGEX_REDOS": (_N("%r is a regular expression that can take exponential time to match: %s"), ("value", "problem")),
+    "NOT_URL": (_N("%r is not a valid URL."), ("value",)),
+    "NOT_EMAIL": (_N("%r is not a valid email address."), ("value",)),
+    "NOT_YES_NO": (_N("%r is not a valid %s/%s response."), ("value", "yesVal", "noVal")),
+    "NOT_BOOL": (_N("%r is not a valid %s/%s response."), ("value", "trueVal", "falseVal")),
+    "NOT_STATE": (_N("%r is not a state."), ("value",)),
+    "NOT_CA_PROVINCE": (_N("%r is not a Canadian province or territory."), ("value",)),
+    "NOT_COUNTRY": (_N("%r is not a country."), ("value",)),
+    "NOT_CURRENCY": (_N("%r is not a currency."), ("value",)),
+    "NOT_PHONE": (_N("%r is not a valid phone number."), ("value",)),
+    "NOT_POSTAL_CODE": (_N("%r is not a valid postal code."), ("value",)),
+    "POSTAL_CODE_STATE": (_N("%r is not a ZIP code in %s."), ("value", "state")),
+    "NOT_MONTH": (_N("%r is not a month."), ("value",)),
+    "NOT_DAY_OF_WEEK": (_N("%r is not a day of the week."), ("value",)),
+    "NOT_DAY_OF_MONTH": (_N("%r is not a day in the month of %s %s."), ("value", "monthName", "year")),
+}  # type: Dict[str, Tuple[str, Tuple[str, ...]]]
+
+
+def _formatErrorMessage(code, params, lang=None):
+    # type: (Optional[str], Dict[str, Any], Optional[str]) -> str
+    """Returns the message for the error code translated into lang (or the
+    current language if lang is None), filled in with params. The 'value'
+    param is shortened with _errstr()."""
+    if code not in ERROR_MESSAGES:
+        return ""  # There's no standard message for exceptions raised without a code or message.
+    template, paramNames = ERROR_MESSAGES[code]
+    args = tuple(_errstr(params[name]) if name == "value" else params[name] for name in paramNames)
+    if lang is None:
+        return _(template) % args
+    return _getCatalog(lang).gettext(template) % args
 
 
 def _errstr(value):
@@ -194,17 +470,38 @@ def _errstr(value):
     it's truncated, the returned value will have '...' on the end.
     """
     # We won't make the caller convert value to a string each time.
-    value = str(value)
+    value = _decodeBytes(value, "replace") if isinstance(value, BYTES_TYPES) else str(value)
     if len(value) > MAX_ERROR_STR_LEN:
         return value[:MAX_ERROR_STR_LEN] + "..."
     else:
         return value
 
 
+def _decodeBytes(value, errors="surrogateescape"):
+    # type: (Any, str) -> str
+    """Returns value, a bytes-like object, decoded from UTF-8. Invalid bytes
+    are decoded to surrogates by default, so that the str encodes back to
+    the same bytes, or are handled according to errors, e.g. 'replace'."""
+    return bytes(value).decode("utf-8", errors)
+
+
+# Matches a byte that isn't ASCII, for _isASCIIBytes() before Python 3.7.
+_NON_ASCII_BYTES_REGEX = re.compile(b"[\x80-\xff]")  # type: Pattern
+
+if sys.version_info >= (3, 7):
+    _isASCIIBytes = bytes.isascii  # type: Any
+else:
+
+    def _isASCIIBytes(value):
+        # type: (bytes) -> bool
+        """Returns True if every byte of value is ASCII, like bytes.isascii()."""
+        return _NON_ASCII_BYTES_REGEX.search(value) is None
+
+
 def _getStrippedValue(value, strip):
-    # type: (str, Union[None, str, bool]) -> str
+    # type: (Any, Union[None, str, bool]) -> Any
     """Like the strip() string method, except the strip argument describes
-    different behavior:
+    different behavior (value can be a str or bytes):
 
     If strip is None, whitespace is stripped.
 
@@ -214,23 +511,632 @@ def _getStrippedValue(value, strip):
     if strip is None:
         value = value.strip()  # Call strip() with no arguments to strip whitespace.
     elif isinstance(strip, str):
-        value = value.strip(strip)  # Call strip(), passing the strip argument.
+        if isinstance(value, str):
+            value = value.strip(strip)  # Call strip(), passing the strip argument.
+        else:
+            # For bytes values, non-ASCII characters can only be stripped from the decoded str.
+            try:
+                value = value.strip(strip.encode("ascii"))
+            except UnicodeEncodeError:
+                value = _decodeBytes(value).strip(strip).encode("utf-8", "surrogateescape")
     elif strip is False:
         pass  # Don't strip anything.
     return value
 
 
-def _raiseValidationException(standardExcMsg, customExcMsg=None):
-    # type: (str, Optional[str]) -> None
-    """Raise ValidationException with standardExcMsg, unless customExcMsg is specified."""
-    if customExcMsg is None:
-        raise ValidationException(str(standardExcMsg))
+def _loadDataTable(filename):
+    # type: (str) -> List[Tuple[str, ...]]
+    """Returns the rows of the tab-separated data file filename in DATA_FOLDER
+    as a list of tuples. Blank lines and lines beginning with # are skipped.
+    The file is only read the first time it's requested."""
+    if filename not in _DATA_TABLES:
+        with _tablesLock:
+            if filename not in _DATA_TABLES:
+                rows = []  # type: List[Tuple[str, ...]]
+                with io.open(os.path.join(DATA_FOLDER, filename), encoding="utf-8") as fileObj:
+                    for line in fileObj:
+                        line = line.rstrip("\r\n")
+                        if line == "" or line.startswith("#"):
+                            continue
+                        rows.append(tuple(line.split("\t")))
+                _DATA_TABLES[filename] = rows
+    return _DATA_TABLES[filename]
+
+
+def _normalizeEnumKey(value):
+    # type: (str) -> str
+    """Returns value case-folded and with its whitespace collapsed to single
+    spaces. This is the form of the keys in the enumeration indexes, so that
+    'new york', 'NEW YORK', and 'New  York' all find the same entry."""
+    return " ".join(value.split()).casefold()
+
+
+def _buildEnumIndex(rows, nameColumn):
+    # type: (Sequence[Sequence[str]], int) -> Tuple[Dict[str, str], Dict[str, str]]
+    """Returns a tuple of two dicts built from rows. The first column of each
+    row is the row's canonical value, e.g. 'CA'.
+
+    The first dict maps the normalized form of every column of every row
+    (abbreviations, alternate codes, and names) to the canonical value. The
+    second dict maps the canonical value to the name in nameColumn."""
+    index = {}  # type: Dict[str, str]
+    names = {}  # type: Dict[str, str]
+    for row in rows:
+        names[row[0]] = row[nameColumn]
+        for form in row:
+            # setdefault() so that an earlier row's code can't be replaced by a later row's name.
+            index.setdefault(_normalizeEnumKey(form), row[0])
+    return index, names
+
+
+# Maps each enumeration name to a function that returns the rows for
+# _buildEnumIndex() and the column in each row that has the display name.
+_ENUM_SOURCES = {
+    "usStates": lambda: (list(USA_STATES.items()), 1),
+    "caProvinces": lambda: (_loadDataTable("ca_provinces.tsv"), 1),
+    "countries": lambda: (_loadDataTable("countries.tsv"), 2),
+    "currencies": lambda: (_loadDataTable("currencies.tsv"), 2),
+    "englishMonths": lambda: (list(_ENGLISH_MONTHS.items()), 1),
+    "englishDaysOfWeek": lambda: (list(_ENGLISH_DAYS_OF_WEEK.items()), 1),
+}  # type: Dict[str, Any]
+
+
+def _getEnumIndex(name):
+    # type: (str) -> Tuple[Dict[str, str], Dict[str, str]]
+    """Returns the (index, names) tuple from _buildEnumIndex() for the
+    enumeration name in _ENUM_SOURCES. The index is built (and any data file
+    it needs is loaded) the first time it's requested."""
+    if name not in _ENUM_INDEXES:
+        with _tablesLock:
+            if name not in _ENUM_INDEXES:
+                rows, nameColumn = _ENUM_SOURCES[name]()
+                _ENUM_INDEXES[name] = _buildEnumIndex(rows, nameColumn)
+    return _ENUM_INDEXES[name]
+
+
+def _raiseValidationException(standardExcMsg, customExcMsg=None, code=None, params=None):
+    # type: (Optional[str], Optional[str], Optional[str], Optional[Dict[str, Any]]) -> None
+    """Raise ValidationException with standardExcMsg, unless customExcMsg is specified.
+
+    If standardExcMsg is None, the standard message for code in ERROR_MESSAGES
+    is used, but it isn't formatted from params until the exception is
+    converted to a str."""
+    if customExcMsg is not None:
+        raise ValidationException(str(customExcMsg), code, params)
+    elif standardExcMsg is not None:
+        raise ValidationException(str(standardExcMsg), code, params)
+    else:
+        raise ValidationException(None, code, params)
+
+
+class RegexEngine(object):
+    """The base class of the regex engines that the allowRegexes and
+    blockRegexes arguments, validateRegex(), and the validators built on it
+    (such as validateURL and validateIP) use to match values. Select an
+    engine with setRegexEngine(), useRegexEngine(), or validateRegex()'s
+    regexEngine argument.
+
+    A subclass's compile() method returns an object with search(), match(),
+    and fullmatch() methods that work like re's pattern objects. Engines are
+    equal if they're the same class with the same settings, so equal engines
+    share compiled patterns."""
+
+    name = ""  # type: str
+
+    # True if the engine takes time linear in the length of the value for every pattern, so
+    # patterns don't need to be checked for ReDoS risks (see setReDoSPolicy()).
+    linearTime = False  # type: bool
+
+    # True if the engine can compile bytes patterns. If it can't, bytes values are decoded to be matched.
+    bytesPatterns = False  # type: bool
+
+    def compile(self, pattern, flags=0):
+        # type: (str, int) -> Any
+        """Returns the compiled pattern. Raises re.error if pattern is invalid."""
+        raise NotImplementedError
+
+    def _settings(self):
+        # type: () -> Tuple[Any, ...]
+        """Returns the settings that make this engine match differently than another of its class."""
+        return ()
+
+    def __eq__(self, other):
+        # type: (Any) -> bool
+        return type(self) is type(other) and self._settings() == other._settings()
+
+    def __ne__(self, other):
+        # type: (Any) -> bool
+        return not self == other
+
+    def __hash__(self):
+        # type: () -> int
+        return hash((type(self), self._settings()))
+
+    def __repr__(self):
+        # type: () -> str
+        return "%s()" % (type(self).__name__,)
+
+
+class StdlibRegexEngine(RegexEngine):
+    """The default regex engine: the standard library's re module. It's a
+    backtracking engine, so some patterns can take exponential time to fail
+    to match a value (see RegexModuleEngine and PikeRegexEngine)."""
+
+    name = "re"
+    bytesPatterns = True
+
+    def compile(self, pattern, flags=0):
+        # type: (str, int) -> Pattern
+        return re.compile(pattern, flags)
+
+
+class RegexModuleEngine(RegexEngine):
+    """The engine of the third-party regex module (pip install regex). It's
+    also a backtracking engine, but if timeout is a number, a match that
+    takes longer than timeout seconds is stopped and the value fails
+    validation with a 'REGEX_TIMEOUT' ValidationException."""
+
+    name = "regex"
+    bytesPatterns = True
+
+    def __init__(self, timeout=None):
+        # type: (Optional[float]) -> None
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise PySimpleValidateException("timeout argument must be None or a positive number")
+        try:
+            import regex  # type: ignore
+        except ImportError:
+            raise PySimpleValidateException("the regex engine needs the regex module: pip install regex")
+        self._regexModule = regex
+        self.timeout = timeout  # type: Optional[float]
+
+    def compile(self, pattern, flags=0):
+        # type: (str, int) -> Any
+        try:
+            compiled = self._regexModule.compile(pattern, flags)
+        except self._regexModule.error as exc:
+            raise re.error(str(exc))
+        return _TimeoutPattern(compiled, self.timeout)
+
+    def _settings(self):
+        # type: () -> Tuple[Any, ...]
+        return (self.timeout,)
+
+    def __repr__(self):
+        # type: () -> str
+        return "RegexModuleEngine(timeout=%r)" % (self.timeout,)
+
+
+class _TimeoutPattern(object):
+    """Wraps a regex module pattern so that its search(), match(), and
+    fullmatch() methods pass the timeout, and raise a ValidationException
+    when it runs out."""
+
+    def __init__(self, compiled, timeout):
+        # type: (Any, Optional[float]) -> None
+        self._compiled = compiled
+        self._timeout = timeout
+        self.pattern = compiled.pattern
+        self.flags = compiled.flags
+        self.groups = compiled.groups
+        self.groupindex = compiled.groupindex
+
+    def _call(self, method, string, pos, endpos):
+        # type: (Any, str, int, Optional[int]) -> Any
+        try:
+            return method(string, pos, endpos, timeout=self._timeout)
+        except TimeoutError:
+            _raiseValidationException(None, None, "REGEX_TIMEOUT", {"value": string, "timeout": self._timeout})
+
+    def search(self, string, pos=0, endpos=None):
+        # type: (str, int, Optional[int]) -> Any
+        return self._call(self._compiled.search, string, pos, endpos)
+
+    def match(self, string, pos=0, endpos=None):
+        # type: (str, int, Optional[int]) -> Any
+        return self._call(self._compiled.match, string, pos, endpos)
+
+    def fullmatch(self, string, pos=0, endpos=None):
+        # type: (str, int, Optional[int]) -> Any
+        return self._call(self._compiled.fullmatch, string, pos, endpos)
+
+
+class PikeRegexEngine(RegexEngine):
+    """A regex engine in pure Python, in the pysimplevalidate.pikevm module,
+    that takes time linear in the length of the value for every pattern, so
+    hostile values can't make a pattern backtrack for exponential time.
+    It's slower than re for ordinary values, and doesn't support
+    backreferences or lookaround assertions."""
+
+    name = "pike"
+    linearTime = True
+
+    def compile(self, pattern, flags=0):
+        # type: (str, int) -> Any
+        from pysimplevalidate import pikevm
+
+        return pikevm.compile(pattern, flags)
+
+
+# Maps each engine name accepted by setRegexEngine() et al to its engine class.
+REGEX_ENGINES = {
+    "re": StdlibRegexEngine,
+    "regex": RegexModuleEngine,
+    "pike": PikeRegexEngine,
+}  # type: Dict[str, Type[RegexEngine]]
+
+# The engine set with setRegexEngine(), used by every thread and task that isn't in a useRegexEngine() block.
+_defaultRegexEngine = StdlibRegexEngine()  # type: RegexEngine
+
+# The engine set with useRegexEngine(), like _contextLang.
+if _contextLang is not None:
+    _contextRegexEngine = contextvars.ContextVar("pysimplevalidate_regex_engine", default=None)  # type: Any
+else:
+    _contextRegexEngine = None
+    _threadRegexEngine = threading.local()
+
+# The patterns compiled by engines other than re, keyed by (engine, pattern, flags). (The
+# re module keeps its own cache.) It's cleared when it reaches _MAX_COMPILED_PATTERNS entries.
+_compiledPatterns = {}  # type: Dict[Tuple[RegexEngine, str, int], Any]
+_MAX_COMPILED_PATTERNS = 512  # type: int
+
+# The patterns compiled by warmup(), keyed like _compiledPatterns, including those compiled by re. Unlike
+# _compiledPatterns and re's cache, it isn't cleared when it's full, so a warmed set of thousands of
+# patterns stays compiled instead of being recompiled on first use.
+_warmedPatterns = {}  # type: Dict[Tuple[RegexEngine, str, int], Any]
+
+# The most patterns that the results of analyzing them, such as _literalPrefilters, are kept for.
+# These results are small, so this is enough for long allowRegexes and blockRegexes lists.
+_MAX_ANALYZED_PATTERNS = 8192  # type: int
+
+
+def _toRegexEngine(engine):
+    # type: (Union[RegexEngine, str]) -> RegexEngine
+    """Returns engine if it's a RegexEngine, or a new engine of the class in
+    REGEX_ENGINES if it's a name. Raises PySimpleValidateException otherwise."""
+    if isinstance(engine, RegexEngine):
+        return engine
+    if isinstance(engine, str) and engine in REGEX_ENGINES:
+        return REGEX_ENGINES[engine]()
+    names = ", ".join(repr(name) for name in sorted(REGEX_ENGINES))
+    raise PySimpleValidateException("regexEngine argument must be a RegexEngine or one of %s" % (names,))
+
+
+def getRegexEngine():
+    # type: () -> RegexEngine
+    """Returns the regex engine in the current thread or asyncio task: the
+    engine of the innermost useRegexEngine() block, or else the engine set
+    with setRegexEngine().
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.getRegexEngine()
+    StdlibRegexEngine()
+    """
+    if _contextRegexEngine is not None:
+        engine = _contextRegexEngine.get()
+    else:
+        engine = getattr(_threadRegexEngine, "engine", None)
+    return _defaultRegexEngine if engine is None else engine
+
+
+def setRegexEngine(engine):
+    # type: (Union[RegexEngine, str]) -> None
+    """Sets the regex engine for every thread and asyncio task that isn't in
+    a useRegexEngine() block. The engine argument is a RegexEngine, such as
+    RegexModuleEngine(timeout=0.1), or the name of one in REGEX_ENGINES:
+    're' (the default), 'regex', or 'pike'."""
+    global _defaultRegexEngine
+    _defaultRegexEngine = _toRegexEngine(engine)
+
+
+@contextlib.contextmanager
+def useRegexEngine(engine):
+    # type: (Union[RegexEngine, str]) -> Iterator[None]
+    """A context manager that sets the regex engine in the with block. It
+    only affects the current thread (or asyncio task).
+
+    >>> import pysimplevalidate as pysv
+    >>> with pysv.useRegexEngine('pike'):
+    ...     pysv.validateIP('192.168.0.1')
+    '192.168.0.1'
+    """
+    engine = _toRegexEngine(engine)
+    if _contextRegexEngine is not None:
+        token = _contextRegexEngine.set(engine)
+        try:
+            yield
+        finally:
+            _contextRegexEngine.reset(token)
+    else:
+        previousEngine = getattr(_threadRegexEngine, "engine", None)
+        _threadRegexEngine.engine = engine
+        try:
+            yield
+        finally:
+            _threadRegexEngine.engine = previousEngine
+
+
+def _contextRunner():
+    # type: () -> Any
+    """Returns a function that calls its first argument with the rest of its
+    arguments in the current useLang() and useRegexEngine() settings, for
+    running validators in other threads, which don't inherit them. This is
+    the run() method of a copy of the current context, so each call from
+    another thread needs its own _contextRunner(). Before Python 3.7, the
+    thread-local settings are copied instead."""
+    if _contextLang is not None:
+        return contextvars.copy_context().run
+
+    lang = getattr(_threadLang, "lang", None)
+    engine = getattr(_threadRegexEngine, "engine", None)
+
+    def run(function, *args, **kwargs):
+        # type: (Any, Any, Any) -> Any
+        previousLang = getattr(_threadLang, "lang", None)
+        previousEngine = getattr(_threadRegexEngine, "engine", None)
+        _threadLang.lang, _threadRegexEngine.engine = lang, engine
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _threadLang.lang, _threadRegexEngine.engine = previousLang, previousEngine
+
+    return run
+
+
+def _compilePattern(regex, flags=0, engine=None, keep=False):
+    # type: (Union[str, Pattern], int, Optional[RegexEngine], bool) -> Any
+    """Returns regex, a str or re regex object, compiled by engine (or the
+    current engine from getRegexEngine() if engine is None). A regex object
+    is recompiled from its pattern and flags by engines other than re, or
+    when it's rewritten to remove a ReDoS risk (see setReDoSPolicy()). If
+    keep is True, the compiled pattern is kept in _warmedPatterns."""
+    if engine is None:
+        engine = getRegexEngine()
+    if _reDoSRewrite and not engine.linearTime:
+        rewritten = _getReDoSRisk(regex, flags)[1]
+        if rewritten is not None:
+            regex, flags = rewritten, regex.flags if isinstance(regex, RE_PATTERN_TYPE) else flags
+    if isinstance(regex, RE_PATTERN_TYPE):
+        if type(engine) is StdlibRegexEngine:
+            return regex
+        regex, flags = regex.pattern, regex.flags
+    key = (engine, regex, flags)
+    if _warmedPatterns:
+        compiled = _warmedPatterns.get(key)
+        if compiled is not None:
+            return compiled
+    if type(engine) is StdlibRegexEngine:
+        compiled = re.compile(regex, flags)
     else:
-        raise ValidationException(str(customExcMsg))
+        compiled = _compiledPatterns.get(key)
+        if compiled is None:
+            if len(_compiledPatterns) >= _MAX_COMPILED_PATTERNS:
+                _compiledPatterns.clear()
+            compiled = engine.compile(regex, flags)
+            _compiledPatterns[key] = compiled
+    if keep:
+        _warmedPatterns[key] = compiled
+    return compiled
+
+
+# The ways setReDoSPolicy() can handle a regex pattern that can take exponential time to match.
+REDOS_POLICIES = ("allow", "warn", "reject")  # type: Tuple[str, ...]
+
+# The policy set with setReDoSPolicy(), and whether risky patterns are rewritten when they can be.
+_reDoSPolicy = "warn"  # type: str
+_reDoSRewrite = False  # type: bool
+
+# The (problems, rewritten pattern) tuple from _getReDoSRisk() for each (pattern, flags). It's
+# cleared when it reaches _MAX_ANALYZED_PATTERNS entries.
+_reDoSRisks = {}  # type: Dict[Tuple[Any, int], Tuple[List[str], Optional[str]]]
+
+
+class ReDoSWarning(UserWarning):
+    """Issued for a regex pattern that can take exponential time to match,
+    when the ReDoS policy is 'warn' (see setReDoSPolicy())."""
+
+    pass
+
+
+def getReDoSPolicy():
+    # type: () -> str
+    """Returns the ReDoS policy set with setReDoSPolicy(): 'allow', 'warn', or 'reject'.
 
+    >>> import pysimplevalidate as pysv
+    >>> pysv.getReDoSPolicy()
+    'warn'
+    """
+    return _reDoSPolicy
+
+
+def setReDoSPolicy(policy, rewrite=False):
+    # type: (str, bool) -> None
+    """Sets what the allowRegexes and blockRegexes arguments, validateRegex(),
+    validateRegexBatch(), and validateRegexStr() do with a pattern that
+    analyzeRegex() finds can take exponential time to match (a "ReDoS"),
+    such as r'^(\\w+\\s?)+$':
 
-def _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg=None):
-    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> Tuple[bool, str]
+    * 'allow': Patterns aren't checked.
+    * 'warn': A ReDoSWarning is issued. This is the default.
+    * 'reject': PySimpleValidateException is raised. For validateRegexStr(), the value fails validation instead.
+
+    Patterns aren't checked when the regex engine (see setRegexEngine())
+    takes linear time, like the 'pike' engine, because they can't take
+    exponential time.
+
+    If rewrite is True, a risky pattern that rewriteRegex() can make safe,
+    such as (?:a+)+, is matched as the safe pattern, a+, instead.
+
+    * policy (str): One of the policies in REDOS_POLICIES.
+    * rewrite (bool): If True, risky patterns are rewritten when they can be. Defaults to False.
+    """
+    global _reDoSPolicy, _reDoSRewrite
+    if policy not in REDOS_POLICIES:
+        raise PySimpleValidateException("policy argument must be one of %s" % (", ".join(map(repr, REDOS_POLICIES)),))
+    if not isinstance(rewrite, bool):
+        raise PySimpleValidateException("rewrite argument must be a bool")
+    _reDoSPolicy = policy
+    _reDoSRewrite = rewrite
+    _bytesPatterns.clear()  # They're rewritten when they're created.
+
+
+def _getReDoSRisk(regex, flags=0):
+    # type: (Union[str, Pattern], int) -> Tuple[List[str], Optional[str]]
+    """Returns a tuple of the problems that analyzeRegex() finds in regex, a
+    str or regex object, and the pattern from rewriteRegex() if it has none
+    of those problems (or else None). Bytes patterns and patterns that
+    analyzeRegex() can't parse, or that are nested too deeply for it, have
+    no problems. The results are cached."""
+    if isinstance(regex, RE_PATTERN_TYPE):
+        regex, flags = regex.pattern, regex.flags
+    key = (regex, flags)
+    risk = _reDoSRisks.get(key)
+    if risk is None:
+        problems = []  # type: List[str]
+        rewritten = None  # type: Optional[str]
+        if isinstance(regex, str):
+            try:
+                problems = analyzeRegex(regex, flags)
+                if problems:
+                    rewritten = rewriteRegex(regex, flags)
+                    if rewritten == regex or analyzeRegex(rewritten, flags):
+                        rewritten = None
+            except re.error:
+                pass  # An invalid pattern is reported when it's compiled, and atomic groups can't backtrack.
+            except RecursionError:
+                pass  # The pattern is nested too deeply to analyze, so it's treated like one that can't be parsed.
+        if len(_reDoSRisks) >= _MAX_ANALYZED_PATTERNS:
+            _reDoSRisks.clear()
+        risk = (problems, rewritten)
+        _reDoSRisks[key] = risk
+    return risk
+
+
+def _checkReDoSRisk(regex, flags=0, engine=None, stacklevel=2):
+    # type: (Union[str, Pattern], int, Optional[RegexEngine], int) -> None
+    """Issues a ReDoSWarning or raises PySimpleValidateException, according
+    to the ReDoS policy, if regex can take exponential time to match with
+    engine (or the current engine if engine is None). The stacklevel is
+    the warning's stack level for the function that calls this one."""
+    if _reDoSPolicy == "allow" or (getRegexEngine() if engine is None else engine).linearTime:
+        return
+    problems, rewritten = _getReDoSRisk(regex, flags)
+    if not problems or (_reDoSRewrite and rewritten is not None):
+        return
+    pattern = regex.pattern if isinstance(regex, RE_PATTERN_TYPE) else regex
+    message = "%r can take exponential time to match: %s" % (pattern, problems[0])
+    if _reDoSPolicy == "reject":
+        raise PySimpleValidateException(message)
+    warnings.warn(message, ReDoSWarning, stacklevel=stacklevel + 1)
+
+
+# The LiteralPrefilter from literalPrefilter() for each allowRegexes and blockRegexes str or regex
+# object, or None if it has none. It's cleared when it reaches _MAX_ANALYZED_PATTERNS entries.
+_literalPrefilters = {}  # type: Dict[Union[str, Pattern], Any]
+
+
+def _getLiteralPrefilter(regex):
+    # type: (Union[str, Pattern]) -> Any
+    """Returns the LiteralPrefilter for regex, a str or regex object, or None
+    if it has none or can't be analyzed. The results are cached."""
+    try:
+        if isinstance(regex, RE_PATTERN_TYPE):
+            prefilter = None if isinstance(regex.pattern, bytes) else literalPrefilter(regex.pattern, regex.flags)
+        else:
+            prefilter = literalPrefilter(regex)
+    except (re.error, RecursionError):
+        # The regex is always run, and reports an invalid pattern when it's compiled. A pattern that's
+        # nested too deeply for the parser doesn't get a prefilter either.
+        prefilter = None
+    if len(_literalPrefilters) >= _MAX_ANALYZED_PATTERNS:
+        _literalPrefilters.clear()
+    _literalPrefilters[regex] = prefilter
+    return prefilter
+
+
+def _regexSearches(regex, value, engine):
+    # type: (Union[str, Pattern], str, RegexEngine) -> bool
+    """Returns True if regex, a str or regex object, matches somewhere in
+    value. The regex engine isn't run when a quick check for the literal
+    text that regex needs (see pysimplevalidate.literals) decides it."""
+    try:
+        prefilter = _literalPrefilters[regex]
+    except KeyError:
+        prefilter = _getLiteralPrefilter(regex)
+    if prefilter is not None:
+        found = prefilter.check(value)
+        if found is not None:
+            return found
+    if _slowInputLog is None:
+        return _compilePattern(regex, 0, engine).search(value) is not None
+    _slowInputStep("regex", regex)
+    found = _compilePattern(regex, 0, engine).search(value) is not None
+    _slowInputStep()
+    return found
+
+
+# The bytes regex object for each (pattern, flags), for matching bytes values, or None if the pattern
+# isn't ASCII. (Regex objects are keyed by their pattern, because hashing a regex object hashes its
+# compiled code.) It's cleared when it reaches _MAX_ANALYZED_PATTERNS entries.
+_bytesPatterns = dict(
+    ((regex.pattern, regex.flags), bytesRegex)
+    for regex, bytesRegex in (
+        (IPV4_REGEX, IPV4_BYTES_REGEX),
+        (IPV6_REGEX, IPV6_BYTES_REGEX),
+        (URL_REGEX, URL_BYTES_REGEX),
+        (EMAIL_REGEX, EMAIL_BYTES_REGEX),
+    )
+)  # type: Dict[Tuple[Any, int], Optional[Pattern]]
+
+
+def _getBytesPattern(regex, flags=0):
+    # type: (Union[str, Pattern], int) -> Optional[Pattern]
+    """Returns a regex object that matches bytes values the way regex, a str
+    or regex object, matches strs, or None if regex isn't ASCII (or can't
+    be compiled as bytes). Like all bytes patterns, \\w, \\d, \\s, and
+    re.IGNORECASE only match ASCII characters. The results are cached."""
+    if isinstance(regex, RE_PATTERN_TYPE):
+        regex, flags = regex.pattern, regex.flags
+    key = (regex, flags)
+    try:
+        return _bytesPatterns[key]
+    except KeyError:
+        pass
+    if _reDoSRewrite:
+        rewritten = _getReDoSRisk(regex, flags)[1]
+        if rewritten is not None:
+            regex = rewritten
+    try:
+        bytesRegex = re.compile(regex.encode("ascii"), flags & ~re.UNICODE)  # type: Optional[Pattern]
+    except (UnicodeEncodeError, re.error, ValueError):
+        bytesRegex = None  # Invalid patterns are reported when the str pattern is compiled.
+    if len(_bytesPatterns) >= _MAX_ANALYZED_PATTERNS:
+        _bytesPatterns.clear()
+    _bytesPatterns[key] = bytesRegex
+    return bytesRegex
+
+
+def _bytesRegexSearches(regex, value, engine):
+    # type: (Union[str, Pattern], bytes, RegexEngine) -> bool
+    """The same as _regexSearches(), except value is bytes. ASCII patterns are
+    matched as bytes patterns if value is ASCII too. Otherwise (or if engine
+    can't compile bytes patterns) they're matched against value decoded from
+    UTF-8, since \\w, \\d, \\s, and re.IGNORECASE only match ASCII characters
+    in bytes patterns, and a blockRegexes pattern mustn't miss a value that it
+    blocks as a str."""
+    bytesRegex = _getBytesPattern(regex) if engine.bytesPatterns and _isASCIIBytes(value) else None
+    if bytesRegex is None:
+        return _regexSearches(regex, _decodeBytes(value), engine)
+    if _slowInputLog is None:
+        return _compilePattern(bytesRegex, 0, engine).search(value) is not None
+    _slowInputStep("regex", regex)
+    found = _compilePattern(bytesRegex, 0, engine).search(value) is not None
+    _slowInputStep()
+    return found
+
+
+def _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg=None, keepBytes=False):
+    # type: (Any, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], bool) -> Tuple[bool, Any]
     """Returns a tuple of two values: the first is a bool that tells the caller
     if they should immediately return True, the second is a new, possibly stripped
     value to replace the value passed for value parameter.
@@ -239,21 +1145,31 @@ def _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg=
     validation isn't needed, such as if value is blank and blanks are
     allowed, or if value matches an allowlist or blocklist regex.
 
+    If keepBytes is True, a bytes-like value is returned as bytes instead of
+    being converted to a str, and the regexes are matched against the bytes.
+
     This function is called by the validate*() functions to perform some common
     housekeeping."""
 
     # TODO - add a allowlistFirst and blocklistFirst to determine which is checked first. (Right now it's allowlist)
 
-    value = str(value)
+    if isinstance(value, str):
+        pass
+    elif keepBytes and isinstance(value, BYTES_TYPES):
+        if type(value) is not bytes:
+            value = bytes(value)  # Copy a bytearray or memoryview, since strip() and re need bytes.
+    else:
+        value = str(value)
+    regexSearches = _bytesRegexSearches if isinstance(value, bytes) else _regexSearches
 
     # Optionally strip whitespace or other characters from value.
     value = _getStrippedValue(value, strip)
 
     # Validate for blank values.
-    if not blank and value == "":
+    if not blank and not value:
         # value is blank but blanks aren't allowed.
-        _raiseValidationException(_("Blank values are not allowed."), excMsg)
-    elif blank and value == "":
+        _raiseValidationException(None, excMsg, "BLANK", {"value": value})
+    elif blank and not value:
         return (
             True,
             value,
@@ -263,33 +1179,31 @@ def _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg=
 
     # Check the allowRegexes.
     if allowRegexes is not None:
+        engine = getRegexEngine()
         for allowRegex in allowRegexes:
-            if isinstance(allowRegex, RE_PATTERN_TYPE):
-                if allowRegex.search(value) is not None:
-                    return (
-                        True,
-                        value,
-                    )  # The value is in the allowlist, so return True to indicate that the caller should return value immediately.
-            else:
-                if re.search(allowRegex, value) is not None:
-                    return (
-                        True,
-                        value,
-                    )  # The value is in the allowlist, so return True to indicate that the caller should return value immediately.
+            if regexSearches(allowRegex, value, engine):
+                return (
+                    True,
+                    value,
+                )  # The value is in the allowlist, so return True to indicate that the caller should return value immediately.
 
     # Check the blockRegexes.
     if blockRegexes is not None:
+        engine = getRegexEngine()
         for blocklistRegexItem in blockRegexes:
-            if isinstance(blocklistRegexItem, (str, RE_PATTERN_TYPE)):
+            if isinstance(blocklistRegexItem, Blocklist):
+                response = blocklistRegexItem.search(_decodeBytes(value) if isinstance(value, bytes) else value)
+                if response is not None:
+                    _raiseValidationException(response, excMsg, "BLOCKED", {"value": value})  # value is on a blocklist
+                continue
+            elif isinstance(blocklistRegexItem, (str, RE_PATTERN_TYPE)):
                 regex, response = blocklistRegexItem, DEFAULT_BLOCKLIST_RESPONSE
             else:
                 # NOTE: blockRegexes is potentially so many types at runtime, so ignore the type hint error on this next line:
                 regex, response = blocklistRegexItem  # type: ignore
 
-            if isinstance(regex, RE_PATTERN_TYPE) and regex.search(value) is not None:
-                _raiseValidationException(response, excMsg)  # value is on a blocklist
-            elif re.search(regex, value) is not None:
-                _raiseValidationException(response, excMsg)  # value is on a blocklist
+            if regexSearches(regex, value, engine):
+                _raiseValidationException(response, excMsg, "BLOCKED", {"value": value})  # value is on a blocklist
 
     return (
         False,
@@ -297,11 +1211,20 @@ def _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg=
     )  # Return False and the possibly modified value, and leave it up to the caller to decide if it's valid or not.
 
 
+def _isBytesPattern(regex):
+    # type: (Any) -> bool
+    """Returns True if regex is a regex object compiled from a bytes pattern.
+    These can't search str values, so the regex arguments must be str
+    patterns, which are also used to match bytes values."""
+    return isinstance(regex, RE_PATTERN_TYPE) and isinstance(regex.pattern, bytes)
+
+
 def _validateGenericParameters(blank, strip, allowRegexes, blockRegexes):
     # type: (bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]]) -> None
     """Returns None if the blank, strip, and blockRegexes parameters are valid
     of PySimpleValidate's validation functions have. Raises a PySimpleValidateException
-    if any of the arguments are invalid."""
+    if any of the arguments are invalid. The regexes are checked for ReDoS
+    risks according to the ReDoS policy (see setReDoSPolicy())."""
 
     # Check blank parameter.
     if not isinstance(blank, bool):
@@ -311,6 +1234,8 @@ def _validateGenericParameters(blank, strip, allowRegexes, blockRegexes):
     if not isinstance(strip, (bool, str, type(None))):
         raise PySimpleValidateException("strip argument must be a bool, None, or str")
 
+    engine = getRegexEngine()  # The regexes are checked for ReDoS risks with this engine.
+
     # Check allowRegexes parameter (including each regex in it).
     if allowRegexes is None:
         allowRegexes = []  # allowRegexes defaults to a blank list.
@@ -321,6 +1246,9 @@ def _validateGenericParameters(blank, strip, allowRegexes, blockRegexes):
     for allowRegex in allowRegexes:
         if not isinstance(allowRegex, (str, RE_PATTERN_TYPE)):
             raise PySimpleValidateException("items in allowRegexes must be a regex pattern or regex str")
+        if _isBytesPattern(allowRegex):
+            raise PySimpleValidateException("items in allowRegexes must be str patterns, which also match bytes values")
+        _checkReDoSRisk(allowRegex, 0, engine, stacklevel=3)
 
     # Check allowRegexes parameter (including each regex in it).
     # NOTE: blockRegexes is NOT the same format as allowlistRegex, it can
@@ -334,17 +1262,27 @@ def _validateGenericParameters(blank, strip, allowRegexes, blockRegexes):
             "blockRegexes must be a pattern, regex str, or sequence of (pattern, regex str) tuples"
         )
     for blockRegex in blockRegexes:
+        if isinstance(blockRegex, Blocklist):
+            continue
         if isinstance(blockRegex, (str, RE_PATTERN_TYPE)):
+            if _isBytesPattern(blockRegex):
+                raise PySimpleValidateException(
+                    "items in blockRegexes must be str patterns, which also match bytes values"
+                )
+            _checkReDoSRisk(blockRegex, 0, engine, stacklevel=3)
             continue
         # NOTE: blockRegex is potentially so many types at runtime, so ignore the type hint error on this next line:
         if len(blockRegex) != 2:  # type: ignore
             raise PySimpleValidateException(
                 "blockRegexes must be a pattern, regex str, or sequence of (pattern, regex str) tuples"
             )
-        if not isinstance(blockRegex[0], str) or not isinstance(blockRegex[1], str):  # type: ignore
+        if not isinstance(blockRegex[0], (str, RE_PATTERN_TYPE)) or not isinstance(blockRegex[1], str):  # type: ignore
             raise PySimpleValidateException(
                 "blockRegexes must be a pattern, regex str, or sequence of (pattern, regex str) tuples"
             )
+        if _isBytesPattern(blockRegex[0]):  # type: ignore
+            raise PySimpleValidateException("items in blockRegexes must be str patterns, which also match bytes values")
+        _checkReDoSRisk(blockRegex[0], 0, engine, stacklevel=3)  # type: ignore
 
 
 def _validateParamsFor_validateNum(min=None, max=None, lessThan=None, greaterThan=None):
@@ -373,6 +1311,24 @@ def _validateParamsFor_validateNum(min=None, max=None, lessThan=None, greaterTha
             raise PySimpleValidateException(name + " argument must be int, float, or NoneType")
 
 
+def _timeValidated(validator):
+    # type: (Any) -> Any
+    """A decorator for the validation functions that take a value. While a
+    SlowInputLog is set, the decorated function times each call with
+    _timeValidation(), unless it was called by another validator whose call
+    is already being timed."""
+
+    @functools.wraps(validator)
+    def timedValidator(*args, **kwargs):
+        # type: (Any, Any) -> Any
+        if _slowInputLog is not None and _slowInputState.startTime is None:
+            return _timeValidation(validator, args, kwargs)
+        return validator(*args, **kwargs)
+
+    return timedValidator
+
+
+@_timeValidated
 def validateStr(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
     # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> str
     """Raises ValidationException if value is not a string. This function
@@ -414,14 +1370,14 @@ def validateStr(value, blank=False, strip=None, allowRegexes=None, blockRegexes=
     >>> pysv.validateStr('hello', allowRegexes=['hello'], blockRegexes=['llo'])
     'hello'
     """
-
     # Validate parameters.
-    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=None, blockRegexes=blockRegexes)
-    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg, keepBytes=True)
 
     return value
 
 
+@_timeValidated
 def validateNum(
     value,
     blank=False,
@@ -478,15 +1434,20 @@ def validateNum(
     >>> pysv.validateNum('4', min=2, max=5)
     4
     """
-
     # TODO - Add notes to the documentation that the parameters (except value) should all be passed using keyword arguments.
 
     assert _numType in ("num", "int", "float")
 
     # Validate parameters.
-    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=None, blockRegexes=blockRegexes)
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
     _validateParamsFor_validateNum(min=min, max=max, lessThan=lessThan, greaterThan=greaterThan)
 
+    # An int or float value is checked as is, instead of being converted to a str and parsed back.
+    if _isTypedValue(value, _NUMBER_TYPES, strip, allowRegexes, blockRegexes):
+        numericValue = _typedNumber(value, _numType)
+        if numericValue is not None:
+            return _checkNumRange(value, numericValue, min, max, lessThan, greaterThan, excMsg)
+
     returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
     if returnNow:
         # If we can convert value to an int/float, then do so. For example,
@@ -510,48 +1471,124 @@ def validateNum(
         try:
             numericValue = float(value)  # type: Union[int, float]
         except:
-            _raiseValidationException(_("%r is not a number.") % (_errstr(value)), excMsg)
+            _raiseValidationException(None, excMsg, "NOT_NUM", {"value": value})
     elif _numType == "num" and "." not in value:
         # We are expecting a "num" (float or int) type and the user entered an int.
         try:
             numericValue = int(value)
         except:
-            _raiseValidationException(_("%r is not a number.") % (_errstr(value)), excMsg)
+            _raiseValidationException(None, excMsg, "NOT_NUM", {"value": value})
     elif _numType == "float":
         try:
             numericValue = float(value)
         except:
-            _raiseValidationException(_("%r is not a float.") % (_errstr(value)), excMsg)
+            _raiseValidationException(None, excMsg, "NOT_FLOAT", {"value": value})
     elif _numType == "int":
-        try:
-            if float(value) % 1 != 0:
-                # The number is a float that doesn't end with ".0"
-                _raiseValidationException(_("%r is not an integer.") % (_errstr(value)), excMsg)
-            numericValue = int(float(value))
-        except:
-            _raiseValidationException(_("%r is not an integer.") % (_errstr(value)), excMsg)
+        parsedInt = _parseInt(value)
+        if parsedInt is None:
+            _raiseValidationException(None, excMsg, "NOT_INT", {"value": value})
+        numericValue = parsedInt  # type: ignore
     else:
         assert False  # This branch should never happen.
 
+    return _checkNumRange(value, numericValue, min, max, lessThan, greaterThan, excMsg)
+
+
+def _checkNumRange(value, numericValue, min, max, lessThan, greaterThan, excMsg):
+    # type: (Any, Any, Any, Any, Any, Any, Optional[str]) -> Any
+    """Raises ValidationException if numericValue, the number from value,
+    is outside of the min, max, lessThan, and greaterThan arguments of
+    validateNum(). Otherwise returns numericValue."""
+
     # Validate against min argument.
     if min is not None and numericValue < min:
-        _raiseValidationException(_("Number must be at minimum %s.") % (min), excMsg)
+        _raiseValidationException(None, excMsg, "NUM_MIN", {"value": value, "limit": min})
 
     # Validate against max argument.
     if max is not None and numericValue > max:
-        _raiseValidationException(_("Number must be at maximum %s.") % (max), excMsg)
+        _raiseValidationException(None, excMsg, "NUM_MAX", {"value": value, "limit": max})
 
     # Validate against max argument.
     if lessThan is not None and numericValue >= lessThan:
-        _raiseValidationException(_("Number must be less than %s.") % (lessThan), excMsg)
+        _raiseValidationException(None, excMsg, "NUM_LESS_THAN", {"value": value, "limit": lessThan})
 
     # Validate against max argument.
     if greaterThan is not None and numericValue <= greaterThan:
-        _raiseValidationException(_("Number must be greater than %s.") % (greaterThan), excMsg)
+        _raiseValidationException(None, excMsg, "NUM_GREATER_THAN", {"value": value, "limit": greaterThan})
 
     return numericValue
 
 
+# The types of values that validateNum(), validateDecimal(), and the date/time validators check without
+# converting them to a str first. These are exact types, so bools (a subclass of int) are still rejected.
+_NUMBER_TYPES = (int, float)  # type: Tuple[type, ...]
+_DECIMAL_TYPES = (int, decimal.Decimal)  # type: Tuple[type, ...]
+
+
+def _isTypedValue(value, types, strip, allowRegexes, blockRegexes):
+    # type: (Any, Tuple[type, ...], Union[None, str, bool], Any, Any) -> bool
+    """Returns True if value's type is one of types, and value doesn't need
+    to be converted to a str to be stripped of characters or matched against
+    allowRegexes or blockRegexes. Such values are already the type that the
+    validator would parse them into, so they're checked directly."""
+    return (
+        type(value) in types
+        and allowRegexes is None
+        and blockRegexes is None
+        and (strip is None or strip is True or strip is False)
+    )
+
+
+def _typedNumber(value, numType):
+    # type: (Union[int, float], str) -> Union[int, float, None]
+    """Returns value, an int or float, converted to the number that
+    validateNum() parses from str(value) for numType. Returns None if the
+    str has to be parsed instead, such as for floats that aren't integers
+    when numType is 'int', so that validateNum() raises the same exception."""
+    if type(value) is int:
+        if numType != "float":
+            return value
+        try:
+            return float(value)
+        except OverflowError:
+            return None  # float() of the str gives inf instead.
+    if numType == "float":
+        return value
+    if numType == "int":
+        return int(value) if value.is_integer() else None  # type: ignore
+    # The str of a float in exponent notation (like '1e+16') has no '.', so validateNum() parses it as an int.
+    if value == 0 or 1e-4 <= abs(value) < 1e16:
+        return value
+    return None
+
+
+def _parseInt(value):
+    # type: (str) -> Optional[int]
+    """Returns value converted to an int, or None if it isn't an integer.
+
+    Strings of digits are converted exactly by int(), so ints larger than
+    2**53 don't lose precision. Strings like '3.0' are converted from their
+    digits, and only other forms, like '3e2', go through float()."""
+    if "." not in value:
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    else:
+        mo = ZERO_FRACTION_INT_REGEX.match(value)
+        if mo is not None:
+            return int(mo.group(1))
+
+    try:
+        floatValue = float(value)
+    except ValueError:
+        return None
+    if not floatValue.is_integer():
+        return None  # The number is a float that doesn't end with ".0" (or is inf or nan).
+    return int(floatValue)
+
+
+@_timeValidated
 def validateInt(
     value,
     blank=False,
@@ -597,7 +1634,6 @@ def validateInt(
         ...
     pysimplevalidate.ValidationException: 'forty two' is not an integer.
     """
-
     # Even though validateNum *could* return a float, it won't if _numType is 'int', so ignore mypy's complaint:
     return validateNum(
         value=value,
@@ -613,6 +1649,7 @@ def validateInt(
     )
 
 
+@_timeValidated
 def validateFloat(
     value,
     blank=False,
@@ -671,7 +1708,6 @@ def validateFloat(
         ...
     pysimplevalidate.ValidationException: Number must be greater than 3.
     """
-
     # Even though validateNum *could* return a int, it won't if _numType is 'float', so ignore mypy's complaint:
     return validateNum(
         value=value,
@@ -687,6 +1723,254 @@ def validateFloat(
     )
 
 
+def _parseIntBytes(field):
+    # type: (bytes) -> Optional[int]
+    """The same as _parseInt(), except field is a bytes object of ASCII digits."""
+    try:
+        return int(field)
+    except ValueError:
+        pass
+
+    mo = ZERO_FRACTION_INT_BYTES_REGEX.match(field)
+    if mo is not None:
+        return int(mo.group(1))
+
+    try:
+        floatValue = float(field)
+    except ValueError:
+        return None
+    if not floatValue.is_integer():
+        return None
+    return int(floatValue)
+
+
+def validateNumBuffer(
+    buffer, delimiter=b"\n", numType="float", min=None, max=None, lessThan=None, greaterThan=None
+):
+    # type: (Any, bytes, str, Union[int, float, None], Union[int, float, None], Union[int, float, None], Union[int, float, None]) -> Tuple[array.array, bytearray]
+    """Validates every number in buffer, a bytes-like object (such as bytes,
+    a memoryview, or an mmap) of ASCII numbers separated by delimiter. The
+    numbers are converted from the bytes directly, without decoding them
+    into strs. A delimiter at the end of the buffer is ignored.
+
+    Returns a tuple of two values. The first is an array('q') of the
+    numbers if numType is 'int', or an array('d') if numType is 'float',
+    with 0 in place of each invalid number. The second is a bytearray
+    bitmap of which numbers were valid: number i is valid if
+    validity[i // 8] & (1 << (i % 8)) is nonzero.
+
+    Numbers are valid if validateInt() or validateFloat() would accept them
+    with the same min, max, lessThan, and greaterThan arguments. Ints must
+    also fit in 64 bits.
+
+    * buffer (bytes-like): The numbers to validate.
+    * delimiter (bytes): The bytes between the numbers. Defaults to a newline.
+    * numType (str): Either 'int' or 'float'. Defaults to 'float'.
+    * min (int, float): The (inclusive) minimum value for a number to pass validation.
+    * max (int, float): The (inclusive) maximum value for a number to pass validation.
+    * lessThan (int, float): The (exclusive) minimum value for a number to pass validation.
+    * greaterThan (int, float): The (exclusive) maximum value for a number to pass validation.
+
+    >>> import pysimplevalidate as pysv
+    >>> values, validity = pysv.validateNumBuffer(b'1\\nfoo\\n3\\n400\\n', numType='int', max=100)
+    >>> values
+    array('q', [1, 0, 3, 0])
+    >>> [bool(validity[i // 8] & (1 << (i % 8))) for i in range(len(values))]
+    [True, False, True, False]
+    """
+
+    # Validate parameters.
+    _validateParamsFor_validateNum(min=min, max=max, lessThan=lessThan, greaterThan=greaterThan)
+    if numType not in ("int", "float"):
+        raise PySimpleValidateException("numType argument must be 'int' or 'float'")
+    if not isinstance(delimiter, bytes) or delimiter == b"":
+        raise PySimpleValidateException("delimiter argument must be a non-empty bytes object")
+    try:
+        memoryview(buffer)
+    except TypeError:
+        raise PySimpleValidateException("buffer argument must be a bytes-like object")
+    if isinstance(buffer, str):
+        raise PySimpleValidateException("buffer argument must be a bytes-like object")
+
+    values = array.array("q" if numType == "int" else "d")
+    validity = bytearray()
+    bufferLen = len(buffer)
+
+    # Each match is one number and the delimiter after it (or the end of the buffer).
+    fieldRegex = re.compile(b"(.*?)(?:" + re.escape(delimiter) + b"|\\Z)", re.DOTALL)
+    for i, mo in enumerate(fieldRegex.finditer(buffer)):
+        if mo.start() == bufferLen:
+            break  # This is the empty match at the end of the buffer, not a number.
+        field = mo.group(1)
+        if not isinstance(field, bytes):
+            field = bytes(field)  # Some Python versions return memoryview slices, which int() doesn't accept.
+
+        if numType == "int":
+            number = _parseIntBytes(field)  # type: Union[int, float, None]
+        else:
+            try:
+                number = float(field)
+            except ValueError:
+                number = None
+
+        if i % 8 == 0:
+            validity.append(0)
+        if (
+            number is None
+            or (min is not None and number < min)
+            or (max is not None and number > max)
+            or (lessThan is not None and number >= lessThan)
+            or (greaterThan is not None and number <= greaterThan)
+        ):
+            values.append(0)
+            continue
+        try:
+            values.append(number)  # type: ignore
+        except OverflowError:
+            values.append(0)  # The int doesn't fit in 64 bits.
+            continue
+        validity[-1] |= 1 << (i % 8)
+
+    return values, validity
+
+
+def _validateParamsFor_validateDecimal(
+    min=None, max=None, lessThan=None, greaterThan=None, maxDigits=None, maxScale=None
+):
+    # type: (Union[int, float, decimal.Decimal, None], Union[int, float, decimal.Decimal, None], Union[int, float, decimal.Decimal, None], Union[int, float, decimal.Decimal, None], Optional[int], Optional[int]) -> None
+    """Raises PySimpleValidateException if the arguments are invalid. This is called by
+    the validateDecimal() function to check its arguments. Unlike validateNum(),
+    the min, max, lessThan, and greaterThan arguments can also be Decimals.
+    """
+    limits = {}  # type: Dict[str, Union[int, float, None]]
+    for name, val in (("min", min), ("max", max), ("lessThan", lessThan), ("greaterThan", greaterThan)):
+        if not isinstance(val, (int, float, decimal.Decimal, type(None))):
+            raise PySimpleValidateException(name + " argument must be int, float, Decimal, or NoneType")
+        limits[name] = float(val) if isinstance(val, decimal.Decimal) else val
+    _validateParamsFor_validateNum(**limits)  # type: ignore
+
+    if maxDigits is not None and (not isinstance(maxDigits, int) or maxDigits < 1):
+        raise PySimpleValidateException("maxDigits argument must be a positive int or None")
+    if maxScale is not None and (not isinstance(maxScale, int) or maxScale < 0):
+        raise PySimpleValidateException("maxScale argument must be a non-negative int or None")
+    if maxDigits is not None and maxScale is not None and maxScale > maxDigits:
+        raise PySimpleValidateException("the maxScale argument must be less than or equal to the maxDigits argument")
+
+
+@_timeValidated
+def validateDecimal(
+    value,
+    blank=False,
+    strip=None,
+    allowRegexes=None,
+    blockRegexes=None,
+    min=None,
+    max=None,
+    lessThan=None,
+    greaterThan=None,
+    maxDigits=None,
+    maxScale=None,
+    excMsg=None,
+):
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Union[int, float, decimal.Decimal, None], Union[int, float, decimal.Decimal, None], Union[int, float, decimal.Decimal, None], Union[int, float, decimal.Decimal, None], Optional[int], Optional[int], Optional[str]) -> Union[decimal.Decimal, str]
+    """Raises ValidationException if value is not a decimal number. Returns
+    a decimal.Decimal of value, so there's no floating point rounding.
+
+    The maxDigits and maxScale arguments work like the precision and scale
+    of a SQL NUMERIC column: maxDigits limits the total number of digits and
+    maxScale limits the number of digits after the decimal point. Digits
+    after the decimal point count even if they're zeros, i.e. '1.50' has a
+    scale of 2. These limits are checked before the Decimal is created, so
+    values like '1e999999999' are rejected cheaply.
+
+    * value (str): The value being validated as a decimal number.
+    * blank (bool): If True, a blank string will be accepted. Defaults to False.
+    * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
+    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
+    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
+    * min (int, float, Decimal): The (inclusive) minimum value for the value to pass validation.
+    * max (int, float, Decimal): The (inclusive) maximum value for the value to pass validation.
+    * lessThan (int, float, Decimal): The (exclusive) minimum value for the value to pass validation.
+    * greaterThan (int, float, Decimal): The (exclusive) maximum value for the value to pass validation.
+    * maxDigits (int, None): The maximum number of digits in value.
+    * maxScale (int, None): The maximum number of digits after the decimal point in value.
+    * excMsg (str): A custom message to use in the raised ValidationException.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateDecimal('3.14')
+    Decimal('3.14')
+    >>> pysv.validateDecimal('12345.678', maxDigits=8, maxScale=3)
+    Decimal('12345.678')
+    >>> pysv.validateDecimal('12345.678', maxScale=2)
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: Number must have at most 2 digits after the decimal point.
+    >>> pysv.validateDecimal('1e999999999', maxDigits=10)
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: Number must have at most 10 digits.
+    """
+    # Validate parameters.
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+    _validateParamsFor_validateDecimal(
+        min=min, max=max, lessThan=lessThan, greaterThan=greaterThan, maxDigits=maxDigits, maxScale=maxScale
+    )
+
+    # An int or Decimal value is checked as is, instead of being converted to a str and parsed back. Floats
+    # are still converted to a str, so that 0.1 is Decimal('0.1') and not the float's exact binary value.
+    decimalValue = None  # type: Optional[decimal.Decimal]
+    if _isTypedValue(value, _DECIMAL_TYPES, strip, allowRegexes, blockRegexes):
+        decimalValue = decimal.Decimal(value)
+        if not decimalValue.is_finite():
+            decimalValue = None  # Let DECIMAL_REGEX reject NaN and Infinity, like their strs.
+
+    if decimalValue is not None:
+        # Count the digits from the Decimal's digit tuple, which never has leading zeros.
+        digits, exponent = decimalValue.as_tuple()[1:]  # type: ignore
+        significantDigits = len(digits) if any(digits) else 0
+    else:
+        returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+        if returnNow:
+            # If an allowlist regex allows something like '42', then we should return Decimal('42').
+            try:
+                return decimal.Decimal(value)
+            except decimal.InvalidOperation:
+                return value  # Return the value as is.
+
+        mo = DECIMAL_REGEX.match(value)
+        if mo is None or (mo.group(2) == "" and not mo.group(3)):
+            _raiseValidationException(None, excMsg, "NOT_DECIMAL", {"value": value})
+
+        # Count the digits from the text, without creating the Decimal.
+        intDigits, fractionDigits, exponent = mo.group(2), mo.group(3) or "", mo.group(4)  # type: ignore
+        exponent = int(exponent or 0) - len(fractionDigits)
+        significantDigits = len((intDigits + fractionDigits).lstrip("0"))
+    scale = -exponent if exponent < 0 else 0
+    if significantDigits > 0 and significantDigits + exponent > 0:
+        precision = significantDigits + exponent + scale  # The digits before the decimal point, plus the scale.
+    else:
+        precision = scale  # The value is zero or less than 1.
+
+    if maxScale is not None and scale > maxScale:
+        _raiseValidationException(None, excMsg, "DECIMAL_SCALE", {"value": value, "limit": maxScale})
+    if maxDigits is not None and precision > maxDigits:
+        _raiseValidationException(None, excMsg, "DECIMAL_DIGITS", {"value": value, "limit": maxDigits})
+
+    if decimalValue is None:
+        decimalValue = decimal.Decimal(value)
+
+    if min is not None and decimalValue < min:
+        _raiseValidationException(None, excMsg, "NUM_MIN", {"value": value, "limit": min})
+    if max is not None and decimalValue > max:
+        _raiseValidationException(None, excMsg, "NUM_MAX", {"value": value, "limit": max})
+    if lessThan is not None and decimalValue >= lessThan:
+        _raiseValidationException(None, excMsg, "NUM_LESS_THAN", {"value": value, "limit": lessThan})
+    if greaterThan is not None and decimalValue <= greaterThan:
+        _raiseValidationException(None, excMsg, "NUM_GREATER_THAN", {"value": value, "limit": greaterThan})
+
+    return decimalValue
+
+
 def _validateParamsFor_validateChoice(
     choices,
     blank=False,
@@ -720,7 +2004,7 @@ def _validateParamsFor_validateChoice(
     elif blank == True and len(choices) < 1:
         raise PySimpleValidateException("choices must have at least one item")
 
-    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=None, blockRegexes=blockRegexes)
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
 
     if lettered and len(choices) > 26:
         raise PySimpleValidateException("lettered argument cannot be True if there are more than 26 choices")
@@ -734,6 +2018,7 @@ def _validateParamsFor_validateChoice(
         raise PySimpleValidateException("duplicate case-insensitive entries in choices argument")
 
 
+@_timeValidated
 def validateChoice(
     value,
     choices,
@@ -801,7 +2086,6 @@ def validateChoice(
         ...
     pysimplevalidate.ValidationException: 'spider' is not a valid choice.
     """
-
     # Validate parameters.
     _validateParamsFor_validateChoice(
         choices=choices,
@@ -841,10 +2125,103 @@ def validateChoice(
         # Return the original item in strChoices that value has a case-insensitive match with.
         return strChoices[[choice.upper() for choice in strChoices].index(value.upper())]
 
-    _raiseValidationException(_("%r is not a valid choice.") % (_errstr(value)), excMsg)
+    _raiseValidationException(None, excMsg, "NOT_CHOICE", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+# The regexes of the numeric strptime() directives that _strptime() parses without calling
+# strptime(). These are the same as the regexes in the standard library's _strptime module.
+_NUMERIC_STRPTIME_DIRECTIVES = {
+    "Y": r"(\d\d\d\d)",
+    "y": r"(\d\d)",
+    "m": r"(1[0-2]|0[1-9]|[1-9])",
+    "d": r"(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(2[0-3]|[0-1]\d|\d)",
+    "M": r"([0-5]\d|\d)",
+    "S": r"(6[0-1]|[0-5]\d|\d)",
+    "f": r"([0-9]{1,6})",
+}  # type: Dict[str, str]
+
+# Matches the characters in a strptime() format that are escaped in its regex (group 1) and
+# the runs of whitespace, which match any run of whitespace (group 2).
+_STRPTIME_LITERAL_REGEX = re.compile(r"([\\.^$*+?(){}\[\]|])|(\s+)")  # type: Pattern
+
+# Maps each strptime() format to the (regex, directives) tuple that _strptime() parses it with,
+# or to None if the format has directives that only strptime() can parse. Threads that race to
+# compile the same format store equal values, so this isn't locked.
+_strptimeRegexes = {}  # type: Dict[str, Optional[Tuple[Pattern, str]]]
+
+
+def _escapeStrptimeLiteral(mo):
+    # type: (Any) -> str
+    """Returns the regex for a _STRPTIME_LITERAL_REGEX match in a strptime() format."""
+    return "\\s+" if mo.group(2) else "\\" + mo.group(1)
+
+
+def _compileStrptimeFormat(timeFormat):
+    # type: (str) -> Optional[Tuple[Pattern, str]]
+    """Returns a (regex, directives) tuple for parsing values in the
+    strptime() format timeFormat, where the regex's groups are the fields
+    for the directive letters in directives, in order. Returns None if the
+    format has any directives besides %Y %y %m %d %H %M %S %f and %%, or if
+    a field is set by more than one directive."""
+    parts = []  # type: List[str]
+    directives = ""
+    i = 0
+    while i < len(timeFormat):
+        if timeFormat[i] == "%":
+            directive = timeFormat[i + 1 : i + 2]
+            if directive == "%":
+                parts.append("%")
+            elif directive not in _NUMERIC_STRPTIME_DIRECTIVES:
+                return None  # Leave month names, AM/PM, time zones, and so on to strptime().
+            elif directive in directives or (directive in "Yy" and ("Y" in directives or "y" in directives)):
+                return None  # Leave the rules for which of two directives sets a field to strptime().
+            else:
+                parts.append(_NUMERIC_STRPTIME_DIRECTIVES[directive])
+                directives += directive
+            i += 2
+        else:
+            # Copy the literal text up to the next directive, like the _strptime module does.
+            end = timeFormat.find("%", i)
+            end = len(timeFormat) if end == -1 else end
+            parts.append(_STRPTIME_LITERAL_REGEX.sub(_escapeStrptimeLiteral, timeFormat[i:end]))
+            i = end
+    return re.compile("".join(parts), re.IGNORECASE), directives
+
+
+def _strptime(value, timeFormat):
+    # type: (str, str) -> datetime.datetime
+    """Returns the same datetime object as datetime.datetime.strptime(value,
+    timeFormat), and raises ValueError in the same cases.
+
+    strptime() takes a lock shared by every thread, so threads validating
+    dates at once wait on each other. Formats made of only numeric
+    directives, like '%Y-%m-%d %H:%M:%S', are parsed here with a cached
+    regex instead, which doesn't need the lock. Other formats still go to
+    strptime()."""
+    if timeFormat not in _strptimeRegexes:
+        _strptimeRegexes[timeFormat] = _compileStrptimeFormat(timeFormat)
+    compiled = _strptimeRegexes[timeFormat]
+    if compiled is None:
+        return datetime.datetime.strptime(value, timeFormat)
+
+    regex, directives = compiled
+    mo = regex.match(value)
+    if mo is None or mo.end() != len(value):
+        raise ValueError("time data %r does not match format %r" % (value, timeFormat))
+    fields = {"Y": 1900, "m": 1, "d": 1, "H": 0, "M": 0, "S": 0, "f": 0}
+    for directive, text in zip(directives, mo.groups()):
+        if directive == "y":
+            year = int(text)
+            fields["Y"] = year + 2000 if year <= 68 else year + 1900  # The same cutoff as strptime().
+        elif directive == "f":
+            fields["f"] = int(text + "0" * (6 - len(text)))
+        else:
+            fields[directive] = int(text)
+    return datetime.datetime(fields["Y"], fields["m"], fields["d"], fields["H"], fields["M"], fields["S"], fields["f"])
+
+
 def _validateParamsFor__validateToDateTimeFormat(
     formats, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None
 ):
@@ -889,34 +2266,137 @@ def _validateToDateTimeFormat(
         for timeFormat in formats:
             # If value can be converted to a datetime object, convert it.
             try:
-                return datetime.datetime.strptime(value, timeFormat)
+                return _strptime(value, timeFormat)
             except ValueError:
                 continue  # If this format fails to parse, move on to the next format.
         return value  # Return the value as is.
 
     # Validate against the given formats.
     for timeFormat in formats:
+        if _slowInputLog is not None:
+            _slowInputStep("format", timeFormat)
         try:
-            return datetime.datetime.strptime(value, timeFormat)
+            return _strptime(value, timeFormat)
         except ValueError:
             continue  # If this format fails to parse, move on to the next format.
 
-    _raiseValidationException(_("%r is not a valid time.") % (value), excMsg)
+    _raiseValidationException(None, excMsg, "NOT_TIME", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
-def validateTime(
-    value,
-    formats=("%H:%M:%S", "%H:%M", "%X"),
-    blank=False,
-    strip=None,
-    allowRegexes=None,
-    blockRegexes=None,
-    excMsg=None,
+# The day ordinal of 1970-01-01, for converting dates to Unix epoch times.
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()  # type: int
+
+# The output arguments that validateTime(), validateDate(), and validateDatetime() accept.
+_DATE_TIME_OUTPUTS = {
+    "time": (None, "epoch", "epochms", "tuple"),
+    "date": (None, "epoch", "epochms", "ordinal", "tuple"),
+    "datetime": (None, "epoch", "epochms", "ordinal", "tuple"),
+}  # type: Dict[str, Tuple[Optional[str], ...]]
+
+# The type that the min and max arguments must be for each kind of date/time validator.
+_DATE_TIME_TYPES = {"time": datetime.time, "date": datetime.date, "datetime": datetime.datetime}  # type: Dict[str, Any]
+
+
+def _validateParamsFor_dateTimeOutput(kind, min=None, max=None, output=None):
+    # type: (str, Any, Any, Optional[str]) -> None
+    """Raises PySimpleValidateException if the min, max, or output arguments
+    are invalid for validateTime(), validateDate(), or validateDatetime(),
+    depending on kind, which is 'time', 'date', or 'datetime'."""
+    if output not in _DATE_TIME_OUTPUTS[kind]:
+        raise PySimpleValidateException(
+            "output argument must be one of %s" % (", ".join(repr(o) for o in _DATE_TIME_OUTPUTS[kind]))
+        )
+    limitType = _DATE_TIME_TYPES[kind]
+    for name, limit in (("min", min), ("max", max)):
+        # A datetime.datetime is also a datetime.date, but they can't be compared to each other.
+        if limit is not None and (
+            not isinstance(limit, limitType) or (kind == "date" and isinstance(limit, datetime.datetime))
+        ):
+            raise PySimpleValidateException("%s argument must be a %s.%s object" % (name, "datetime", kind))
+    try:
+        if min is not None and max is not None and min > max:
+            raise PySimpleValidateException("the min argument must be less than or equal to the max argument")
+    except TypeError:
+        raise PySimpleValidateException("the min and max arguments must both have a timezone, or both not have one")
+
+
+def _dateTimeRangeAndOutput(value, dt, kind, min, max, output, excMsg):
+    # type: (str, datetime.datetime, str, Any, Any, Optional[str], Optional[str]) -> Any
+    """Raises ValidationException if dt, the datetime parsed from value (or
+    value itself, if it's already the kind's type), is outside of min and
+    max. Otherwise returns dt converted to the kind ('time', 'date', or
+    'datetime') and output form.
+
+    The ints for the 'epoch', 'epochms', and 'ordinal' outputs are
+    calculated from dt's fields, without creating any more objects. Times
+    are converted to seconds (or milliseconds) since midnight, and
+    datetimes without a timezone are treated as UTC."""
+    if min is not None or max is not None:
+        if kind == "time":
+            comparable = datetime.time(dt.hour, dt.minute, dt.second, dt.microsecond)  # type: Any
+        elif kind == "date":
+            comparable = datetime.date(dt.year, dt.month, dt.day)
+        else:
+            comparable = dt
+        try:
+            if min is not None and comparable < min:
+                _raiseValidationException(None, excMsg, "DATE_MIN", {"value": value, "limit": min})
+            if max is not None and comparable > max:
+                _raiseValidationException(None, excMsg, "DATE_MAX", {"value": value, "limit": max})
+        except TypeError:
+            raise PySimpleValidateException("the min and max arguments must have a timezone if the values do")
+
+    if output is None:
+        if type(dt) is _DATE_TIME_TYPES[kind]:
+            return dt  # The validator was passed a date, time, or datetime value instead of a str.
+        if kind == "time":
+            return datetime.time(dt.hour, dt.minute, dt.second, dt.microsecond)
+        elif kind == "date":
+            return datetime.date(dt.year, dt.month, dt.day)
+        return dt
+    elif output == "tuple":
+        if kind == "time":
+            return (dt.hour, dt.minute, dt.second, dt.microsecond)
+        elif kind == "date":
+            return (dt.year, dt.month, dt.day)
+        return (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond)
+    elif output == "ordinal":
+        return dt.toordinal()
+
+    # The output is 'epoch' or 'epochms'.
+    if kind == "time":
+        seconds = dt.hour * 3600 + dt.minute * 60 + dt.second
+    elif kind == "date":
+        seconds = (dt.toordinal() - _EPOCH_ORDINAL) * 86400
+    else:
+        seconds = (dt.toordinal() - _EPOCH_ORDINAL) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+        if dt.tzinfo is not None:
+            offset = dt.utcoffset()
+            if offset is not None:
+                seconds -= offset.days * 86400 + offset.seconds
+    if output == "epoch" or kind == "date":
+        return seconds if output == "epoch" else seconds * 1000
+    return seconds * 1000 + dt.microsecond // 1000
+
+
+@_timeValidated
+def validateTime(
+    value,
+    formats=("%H:%M:%S", "%H:%M", "%X"),
+    blank=False,
+    strip=None,
+    allowRegexes=None,
+    blockRegexes=None,
+    excMsg=None,
+    min=None,
+    max=None,
+    output=None,
 ):
-    # type: (str, Union[str, Sequence[str]], bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> Union[datetime.time, str]
+    # type: (str, Union[str, Sequence[str]], bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], Optional[datetime.time], Optional[datetime.time], Optional[str]) -> Any
     """Raises ValidationException if value is not a time formatted in one
-    of the formats formats. Returns a datetime.time object of value.
+    of the formats formats. Returns a datetime.time object of value, or
+    the form given by output.
 
     * value (str): The value being validated as a time.
     * formats: A tuple of strings that can be passed to time.strftime, dictating the possible formats for a valid time.
@@ -925,10 +2405,15 @@ def validateTime(
     * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
     * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
     * excMsg (str): A custom message to use in the raised ValidationException.
+    * min (datetime.time): The (inclusive) earliest time to pass validation.
+    * max (datetime.time): The (inclusive) latest time to pass validation.
+    * output (str, None): If None, a datetime.time is returned. If 'epoch' or 'epochms', the int seconds or milliseconds since midnight is returned. If 'tuple', an (hour, minute, second, microsecond) tuple is returned.
 
     >>> import pysimplevalidate as pysv
     >>> pysv.validateTime('12:00:01')
     datetime.time(12, 0, 1)
+    >>> pysv.validateTime('12:00:01', output='epoch')
+    43201
     >>> pysv.validateTime('13:00:01')
     datetime.time(13, 0, 1)
     >>> pysv.validateTime('25:00:01')
@@ -938,8 +2423,13 @@ def validateTime(
     >>> pysv.validateTime('hour 12 minute 01', formats=['hour %H minute %M'])
     datetime.time(12, 1)
     """
+    # Validate parameters.
+    _validateParamsFor_dateTimeOutput("time", min, max, output)
 
-    # TODO - handle this
+    # A datetime.time value is checked as is, instead of being converted to a str and parsed back.
+    if _isTypedValue(value, (datetime.time,), strip, allowRegexes, blockRegexes):
+        _validateParamsFor__validateToDateTimeFormat(formats, blank=blank, strip=strip)
+        return _dateTimeRangeAndOutput(value, value, "time", min, max, output, excMsg)
 
     # Reuse the logic in _validateToDateTimeFormat() for this function.
     try:
@@ -947,15 +2437,16 @@ def validateTime(
             value, formats, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes
         )
     except ValidationException:
-        _raiseValidationException(_("%r is not a valid time.") % (_errstr(value)), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_TIME", {"value": value})
 
     # `dt` could be a str if `value` matched one of the `allowRegexes`.
     if isinstance(dt, str):
         return dt  # Return the string value as-is.
-    # At this point, dt is definitely a time object, so ignore mypy's complaints:
-    return datetime.time(dt.hour, dt.minute, dt.second, dt.microsecond)  # type: ignore
+    # At this point, dt is definitely a datetime object, so ignore mypy's complaints:
+    return _dateTimeRangeAndOutput(value, dt, "time", min, max, output, excMsg)  # type: ignore
 
 
+@_timeValidated
 def validateDate(
     value,
     formats=("%Y/%m/%d", "%y/%m/%d", "%m/%d/%Y", "%m/%d/%y", "%x"),
@@ -964,10 +2455,14 @@ def validateDate(
     allowRegexes=None,
     blockRegexes=None,
     excMsg=None,
+    min=None,
+    max=None,
+    output=None,
 ):
-    # type: (str, Union[str, Sequence[str]], bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> Union[datetime.date, str]
+    # type: (str, Union[str, Sequence[str]], bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], Optional[datetime.date], Optional[datetime.date], Optional[str]) -> Any
     """Raises ValidationException if value is not a time formatted in one
-    of the formats formats. Returns a datetime.date object of value.
+    of the formats formats. Returns a datetime.date object of value, or
+    the form given by output.
 
     * value (str): The value being validated as a time.
     * blank (bool): If True, a blank string for value will be accepted.
@@ -976,10 +2471,19 @@ def validateDate(
     * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
     * formats: A tuple of strings that can be passed to time.strftime, dictating the possible formats for a valid date.
     * excMsg (str): A custom message to use in the raised ValidationException.
+    * min (datetime.date): The (inclusive) earliest date to pass validation.
+    * max (datetime.date): The (inclusive) latest date to pass validation.
+    * output (str, None): If None, a datetime.date is returned. If 'epoch' or 'epochms', the int seconds or milliseconds from 1970-01-01 UTC to the start of the day is returned. If 'ordinal', the int from date.toordinal() is returned. If 'tuple', a (year, month, day) tuple is returned.
 
     >>> import pysimplevalidate as pysv
     >>> pysv.validateDate('2/29/2004')
     datetime.date(2004, 2, 29)
+    >>> pysv.validateDate('2/29/2004', output='epoch')
+    1078012800
+    >>> pysv.validateDate('2/29/2004', max=datetime.date(2003, 12, 31))
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: '2/29/2004' is after the maximum of 2003-12-31.
     >>> pysv.validateDate('2/29/2005')
     Traceback (most recent call last):
         ...
@@ -987,21 +2491,30 @@ def validateDate(
     >>> pysv.validateDate('September 2019', formats=['%B %Y'])
     datetime.date(2019, 9, 1)
     """
+    # Validate parameters.
+    _validateParamsFor_dateTimeOutput("date", min, max, output)
+
+    # A datetime.date value is checked as is, instead of being converted to a str and parsed back.
+    if _isTypedValue(value, (datetime.date,), strip, allowRegexes, blockRegexes):
+        _validateParamsFor__validateToDateTimeFormat(formats, blank=blank, strip=strip)
+        return _dateTimeRangeAndOutput(value, value, "date", min, max, output, excMsg)
+
     # Reuse the logic in _validateToDateTimeFormat() for this function.
     try:
         dt = _validateToDateTimeFormat(
             value, formats, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes
         )
     except ValidationException:
-        _raiseValidationException(_("%r is not a valid date.") % (_errstr(value)), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_DATE", {"value": value})
 
     # `dt` could be a str if `value` matched one of the `allowRegexes`.
     if isinstance(dt, str):
         return dt  # Return the string value as-is.
-    # At this point, dt is definitely a date object, so ignore mypy's complaints:
-    return datetime.date(dt.year, dt.month, dt.day)  # type: ignore
+    # At this point, dt is definitely a datetime object, so ignore mypy's complaints:
+    return _dateTimeRangeAndOutput(value, dt, "date", min, max, output, excMsg)  # type: ignore
 
 
+@_timeValidated
 def validateDatetime(
     value,
     formats=(
@@ -1026,10 +2539,14 @@ def validateDatetime(
     allowRegexes=None,
     blockRegexes=None,
     excMsg=None,
+    min=None,
+    max=None,
+    output=None,
 ):
-    # type: (str, Union[str, Sequence[str]], bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> Union[datetime.datetime, str]
+    # type: (str, Union[str, Sequence[str]], bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], Optional[datetime.datetime], Optional[datetime.datetime], Optional[str]) -> Any
     """Raises ValidationException if value is not a datetime formatted in one
-    of the formats formats. Returns a datetime.datetime object of value.
+    of the formats formats. Returns a datetime.datetime object of value, or
+    the form given by output.
 
     * value (str): The value being validated as a datetime.
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
@@ -1038,10 +2555,15 @@ def validateDatetime(
     * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
     * formats: A tuple of strings that can be passed to time.strftime, dictating the possible formats for a valid datetime.
     * excMsg (str): A custom message to use in the raised ValidationException.
+    * min (datetime.datetime): The (inclusive) earliest datetime to pass validation.
+    * max (datetime.datetime): The (inclusive) latest datetime to pass validation.
+    * output (str, None): If None, a datetime.datetime is returned. If 'epoch' or 'epochms', the int seconds or milliseconds since 1970-01-01 UTC is returned, treating datetimes without a timezone as UTC. If 'ordinal', the int from datetime.toordinal() is returned. If 'tuple', a (year, month, day, hour, minute, second, microsecond) tuple is returned.
 
     >>> import pysimplevalidate as pysv
     >>> pysv.validateDatetime('2018/10/31 12:00:01')
     datetime.datetime(2018, 10, 31, 12, 0, 1)
+    >>> pysv.validateDatetime('2018/10/31 12:00:01', output='epochms')
+    1540987201000
     >>> pysv.validateDatetime('10/31/2018 12:00:01')
     datetime.datetime(2018, 10, 31, 12, 0, 1)
     >>> pysv.validateDatetime('10/31/2018')
@@ -1049,23 +2571,176 @@ def validateDatetime(
         ...
     pysimplevalidate.ValidationException: '10/31/2018' is not a valid date and time.
     """
+    # Validate parameters.
+    _validateParamsFor_dateTimeOutput("datetime", min, max, output)
+
+    # A datetime.datetime value is checked as is, instead of being converted to a str and parsed back.
+    if _isTypedValue(value, (datetime.datetime,), strip, allowRegexes, blockRegexes):
+        _validateParamsFor__validateToDateTimeFormat(formats, blank=blank, strip=strip)
+        return _dateTimeRangeAndOutput(value, value, "datetime", min, max, output, excMsg)
 
     # Reuse the logic in _validateToDateTimeFormat() for this function.
     try:
-        return _validateToDateTimeFormat(
+        dt = _validateToDateTimeFormat(
             value, formats, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes
         )
     except ValidationException:
-        _raiseValidationException(_("%r is not a valid date and time.") % (_errstr(value)), excMsg)
-    assert False, "The execution reached this point, even though the previous line should have raised an exception."
+        _raiseValidationException(None, excMsg, "NOT_DATETIME", {"value": value})
 
+    # `dt` could be a str if `value` matched one of the `allowRegexes`.
+    if isinstance(dt, str):
+        return dt  # Return the string value as-is.
+    # At this point, dt is definitely a datetime object, so ignore mypy's complaints:
+    return _dateTimeRangeAndOutput(value, dt, "datetime", min, max, output, excMsg)  # type: ignore
 
-def validateFilename(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
-    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> str
-    """Raises ValidationException if value is not a valid filename.
-    Filenames can't contain \\ / : * ? " < > | or end with a space.
+
+def validateDateTimeArray(values, validator=validateDate, output="epoch", **validatorArgs):
+    # type: (Any, Any, str, Any) -> Tuple[array.array, bytearray]
+    """Validates each value in values with validator, which is validateDate,
+    validateDatetime, or validateTime, and returns the results as ints in
+    an array('q') instead of a list of objects. output is 'epoch',
+    'epochms', or 'ordinal', and is passed to validator.
+
+    Returns a tuple of two values, like validateNumBuffer(): the array,
+    with 0 in place of each invalid value, and a bytearray bitmap of which
+    values were valid. Value i is valid if validity[i // 8] & (1 << (i % 8))
+    is nonzero. Blank values and values accepted by allowRegexes that
+    aren't dates are marked as invalid, since they have no int.
+
+    * values (Iterable): The values to validate.
+    * validator (function): validateDate, validateDatetime, or validateTime. Defaults to validateDate.
+    * output (str): 'epoch', 'epochms', or 'ordinal'. Defaults to 'epoch'.
+    * validatorArgs: Any other keyword arguments are passed to validator, i.e. formats=['%Y-%m-%d'].
+
+    >>> import pysimplevalidate as pysv
+    >>> values, validity = pysv.validateDateTimeArray(['2019/01/02', 'today', '1970/01/01'], output='ordinal')
+    >>> values
+    array('q', [737061, 0, 719163])
+    >>> [bool(validity[i // 8] & (1 << (i % 8))) for i in range(len(values))]
+    [True, False, True]
+    """
+    if validator not in (validateDate, validateDatetime, validateTime):
+        raise PySimpleValidateException("validator argument must be validateDate, validateDatetime, or validateTime")
+    if output not in ("epoch", "epochms", "ordinal"):
+        raise PySimpleValidateException("output argument must be 'epoch', 'epochms', or 'ordinal'")
+
+    results = array.array("q")
+    validity = bytearray()
+    for i, value in enumerate(values):
+        if i % 8 == 0:
+            validity.append(0)
+        try:
+            result = validator(value, output=output, **validatorArgs)
+        except ValidationException:
+            results.append(0)
+            continue
+        if isinstance(result, str):
+            results.append(0)  # A blank value, or a value accepted by allowRegexes.
+            continue
+        results.append(result)
+        validity[-1] |= 1 << (i % 8)
+    return results, validity
+
+
+# The ASCII control characters, which Windows doesn't allow in filenames.
+_CONTROL_CHARS = "".join(chr(i) for i in range(32))  # type: str
+
+# Windows device names, which can't be used as a filename (or as the part of one before
+# the first period) in any letter case, e.g. 'con', 'NUL.txt', or 'Com1.tar.gz'.
+_WINDOWS_RESERVED_STEMS = frozenset(
+    ["CON", "PRN", "AUX", "NUL"]
+    + ["COM" + c for c in "123456789\u00b9\u00b2\u00b3"]
+    + ["LPT" + c for c in "123456789\u00b9\u00b2\u00b3"]
+)  # type: frozenset
+
+# The rules that validateFilename() checks for each platform argument:
+# * forbiddenChars: Characters that can't appear anywhere in the filename.
+# * reservedNames: Filenames that can't be used.
+# * reservedStems: Uppercase names that can't be used as the part of the filename before the first period.
+# * forbiddenLastChars: Characters that the filename can't end with.
+# * noSurroundingWhitespace: If True, the filename can't begin or end with whitespace.
+# * maxUTF8Bytes, maxUTF16Units: The maximum length of the filename, or None for no limit.
+FILENAME_RULES = {
+    "windows": {
+        "forbiddenChars": frozenset('\\/:*?"<>|' + _CONTROL_CHARS),
+        "reservedNames": frozenset([".", ".."]),
+        "reservedStems": _WINDOWS_RESERVED_STEMS,
+        "forbiddenLastChars": " .",
+        "noSurroundingWhitespace": False,
+        "maxUTF8Bytes": None,
+        "maxUTF16Units": 255,
+    },
+    "posix": {
+        "forbiddenChars": frozenset("/\0"),
+        "reservedNames": frozenset([".", ".."]),
+        "reservedStems": frozenset(),
+        "forbiddenLastChars": "",
+        "noSurroundingWhitespace": False,
+        "maxUTF8Bytes": 255,
+        "maxUTF16Units": None,
+    },
+    # Filenames that are valid on both Windows and POSIX systems.
+    "portable": {
+        "forbiddenChars": frozenset('\\/:*?"<>|' + _CONTROL_CHARS),
+        "reservedNames": frozenset([".", ".."]),
+        "reservedStems": _WINDOWS_RESERVED_STEMS,
+        "forbiddenLastChars": " .",
+        "noSurroundingWhitespace": True,
+        "maxUTF8Bytes": 255,
+        "maxUTF16Units": 255,
+    },
+}  # type: Dict[str, Dict[str, Any]]
+
+
+def _filenameErrorCode(value, rules):
+    # type: (str, Dict[str, Any]) -> Optional[str]
+    """Returns the ValidationException code for why value breaks the
+    FILENAME_RULES entry rules, or None if it's a valid filename."""
+    if not rules["forbiddenChars"].isdisjoint(value):
+        return "NOT_FILENAME"
+    if value in rules["reservedNames"] or value.split(".", 1)[0].rstrip(" ").upper() in rules["reservedStems"]:
+        return "FILENAME_RESERVED"
+    if value[-1] in rules["forbiddenLastChars"] or (rules["noSurroundingWhitespace"] and value != value.strip()):
+        return "NOT_FILENAME"
+    # Only encode the filename when it's long enough that it could be over a limit.
+    maxUTF8Bytes, maxUTF16Units = rules["maxUTF8Bytes"], rules["maxUTF16Units"]
+    if maxUTF8Bytes is not None and len(value) * 4 > maxUTF8Bytes:
+        if len(value.encode("utf-8", "surrogatepass")) > maxUTF8Bytes:
+            return "FILENAME_TOO_LONG"
+    if maxUTF16Units is not None and len(value) * 2 > maxUTF16Units:
+        if len(value.encode("utf-16-le", "surrogatepass")) // 2 > maxUTF16Units:
+            return "FILENAME_TOO_LONG"
+    return None
+
+
+def _validateParamsFor_validateFilename(
+    blank=False, strip=None, allowRegexes=None, blockRegexes=None, platform="portable"
+):
+    # type: (bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], str) -> None
+    """Raises PySimpleValidateException if the arguments are invalid. This is called by
+    the validateFilename() and validateFilenameTree() functions to check its arguments."""
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+    if platform not in FILENAME_RULES:
+        raise PySimpleValidateException("platform argument must be one of %s" % (", ".join(sorted(FILENAME_RULES))))
+
+
+@_timeValidated
+def validateFilename(
+    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, platform="portable"
+):
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], str) -> str
+    """Raises ValidationException if value is not a valid filename on
+    platform, which is 'windows', 'posix', or 'portable' (valid on both).
     Returns the value argument.
 
+    Windows filenames can't contain \\ / : * ? " < > | or control
+    characters, end with a space or period, be a device name such as CON or
+    NUL.txt, or be longer than 255 UTF-16 code units. POSIX filenames can't
+    contain / or the null character, or be longer than 255 UTF-8 bytes.
+    Portable filenames follow both sets of rules, and also can't begin or
+    end with whitespace. No platform allows the filenames . and .. either.
+    The rules for each platform are in FILENAME_RULES.
+
     Note that this validates filenames, not filepaths. The / and \\ characters
     are invalid for filenames.
 
@@ -1075,6 +2750,7 @@ def validateFilename(value, blank=False, strip=None, allowRegexes=None, blockReg
     * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
     * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
     * excMsg (str): A custom message to use in the raised ValidationException.
+    * platform (str): The platform whose rules the filename must follow: 'windows', 'posix', or 'portable'. Defaults to 'portable'.
 
     >>> import pysimplevalidate as pysv
     >>> pysv.validateFilename('foobar.txt')
@@ -1087,23 +2763,140 @@ def validateFilename(value, blank=False, strip=None, allowRegexes=None, blockReg
     Traceback (most recent call last):
         ...
     pysimplevalidate.ValidationException: '/full/path/to/foo.txt' is not a valid filename.
+    >>> pysv.validateFilename('nul.txt')
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: 'nul.txt' is a reserved filename.
+    >>> pysv.validateFilename('nul.txt', platform='posix')
+    'nul.txt'
     """
-
-    # TODO: Did I capture the Linux/macOS invalid file characters too, or just Windows's?
+    # Validate parameters.
+    _validateParamsFor_validateFilename(blank, strip, allowRegexes, blockRegexes, platform)
 
     returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
     if returnNow:
         return value
 
-    if (value != value.strip()) or (any(c in value for c in '\\/:*?"<>|')):
-        _raiseValidationException(_("%r is not a valid filename.") % (_errstr(value)), excMsg)
+    code = _filenameErrorCode(value, FILENAME_RULES[platform])
+    if code is not None:
+        _raiseValidationException(None, excMsg, code, {"value": value})
     return value
 
 
+def validateFilenameTree(root, platform="portable", followSymlinks=False):
+    # type: (str, str, bool) -> List[Tuple[str, ValidationException]]
+    """Checks the name of every file and folder under the folder root with
+    validateFilename(), and returns a list of (path, ValidationException)
+    tuples for the names that aren't valid on platform. The paths begin
+    with root. An empty list means every name is valid. Folders that can't
+    be read are in the list too, with a 'DIR_UNREADABLE' exception.
+
+    This is useful for checking that a folder can be copied to another
+    platform, e.g. that a folder made on Linux can be unzipped on Windows.
+
+    * root (str): The folder to check.
+    * platform (str): The platform whose rules the filenames must follow: 'windows', 'posix', or 'portable'. Defaults to 'portable'.
+    * followSymlinks (bool): If True, folders that are symlinks are checked too. Defaults to False.
+
+    >>> import pysimplevalidate as pysv
+    >>> for path, exc in pysv.validateFilenameTree('project'): # doctest: +SKIP
+    ...     print(exc)
+    'aux.c' is a reserved filename.
+    """
+    _validateParamsFor_validateFilename(platform=platform)
+    if not isinstance(followSymlinks, bool):
+        raise PySimpleValidateException("followSymlinks argument must be a bool")
+    if not os.path.isdir(root):
+        raise PySimpleValidateException("root argument must be an existing folder")
+
+    rules = FILENAME_RULES[platform]
+    failures = []  # type: List[Tuple[str, ValidationException]]
+
+    def reportUnreadable(exc):
+        # type: (OSError) -> None
+        path = exc.filename if exc.filename is not None else root
+        failures.append((path, ValidationException(code="DIR_UNREADABLE", params={"value": path})))
+
+    for dirPath, dirNames, fileNames in os.walk(root, onerror=reportUnreadable, followlinks=followSymlinks):
+        for name in dirNames + fileNames:
+            code = _filenameErrorCode(name, rules)
+            if code is not None:
+                failures.append((os.path.join(dirPath, name), ValidationException(code=code, params={"value": name})))
+    return failures
+
+
+# The kinds of path returned by _statPathKind() and DirectoryCache.
+PATH_MISSING, PATH_FILE, PATH_DIR, PATH_OTHER = range(4)
+
+# On these platforms, the filesystem is usually case-insensitive, so a name that isn't
+# in a directory listing could still exist with different casing.
+_CASE_INSENSITIVE_FILESYSTEM = sys.platform in ("win32", "cygwin", "darwin")  # type: bool
+
+
+def _statPathKind(path):
+    # type: (str) -> int
+    """Returns PATH_MISSING, PATH_FILE, PATH_DIR, or PATH_OTHER for path, following symlinks."""
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return PATH_MISSING
+    if stat.S_ISREG(mode):
+        return PATH_FILE
+    elif stat.S_ISDIR(mode):
+        return PATH_DIR
+    return PATH_OTHER
+
+
+def _pathKindErrorCode(kind, mustExist, mustBeFile, mustBeDir):
+    # type: (int, bool, bool, bool) -> Optional[str]
+    """Returns the ValidationException code for a path of this kind, or None if it's acceptable."""
+    if (mustExist or mustBeFile or mustBeDir) and kind == PATH_MISSING:
+        return "PATH_NOT_FOUND"
+    if mustBeFile and kind != PATH_FILE:
+        return "NOT_FILE"
+    if mustBeDir and kind != PATH_DIR:
+        return "NOT_DIR"
+    return None
+
+
+# Matches the characters that can't be in a file path. This is the same as
+# validateFilename, except we allow \ and / and :
+_INVALID_FILEPATH_CHARS_REGEX = re.compile(r'[*?"<>|]')  # type: Pattern
+
+
+def _isValidFilepath(value):
+    # type: (str) -> bool
+    """Returns True if value is a syntactically valid file path."""
+    return value == value.strip() and _INVALID_FILEPATH_CHARS_REGEX.search(value) is None
+
+
+def _validateParamsFor_validateFilepath(
+    blank=False, strip=None, allowRegexes=None, blockRegexes=None, mustExist=False, mustBeFile=False, mustBeDir=False
+):
+    # type: (bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], bool, bool, bool) -> None
+    """Raises PySimpleValidateException if the arguments are invalid. This is called by
+    the validateFilepath() and validateFilepathBatch() functions to check its arguments."""
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+    for name, arg in (("mustExist", mustExist), ("mustBeFile", mustBeFile), ("mustBeDir", mustBeDir)):
+        if not isinstance(arg, bool):
+            raise PySimpleValidateException("%s argument must be a bool" % (name,))
+    if mustBeFile and mustBeDir:
+        raise PySimpleValidateException("only one argument for mustBeFile or mustBeDir can be True, not both")
+
+
+@_timeValidated
 def validateFilepath(
-    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, mustExist=False
+    value,
+    blank=False,
+    strip=None,
+    allowRegexes=None,
+    blockRegexes=None,
+    excMsg=None,
+    mustExist=False,
+    mustBeFile=False,
+    mustBeDir=False,
 ):
-    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], bool) -> str
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], bool, bool, bool) -> str
     r"""Raises ValidationException if value is not a valid filename.
     Filenames can't contain \\ / : * ? " < > |
     Returns the value argument.
@@ -1114,6 +2907,9 @@ def validateFilepath(
     * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
     * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
     * excMsg (str): A custom message to use in the raised ValidationException.
+    * mustExist (bool): If True, the path must exist on the filesystem. Defaults to False.
+    * mustBeFile (bool): If True, the path must be an existing file (or a symlink to one). Defaults to False.
+    * mustBeDir (bool): If True, the path must be an existing folder (or a symlink to one). Defaults to False.
 
     >>> import pysimplevalidate as pysv
     >>> pysv.validateFilepath('foo.txt')
@@ -1126,23 +2922,184 @@ def validateFilepath(
     Traceback (most recent call last):
       ...
     pysimplevalidate.ValidationException: 'c:\\spam\\???.txt' is not a valid file path.
+    >>> pysv.validateFilepath('/no/such/folder/foo.txt', mustExist=True)
+    Traceback (most recent call last):
+      ...
+    pysimplevalidate.ValidationException: '/no/such/folder/foo.txt' does not exist.
     """
+    # Validate parameters.
+    _validateParamsFor_validateFilepath(blank, strip, allowRegexes, blockRegexes, mustExist, mustBeFile, mustBeDir)
+
     returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
     if returnNow:
         return value
 
-    if (value != value.strip()) or (
-        any(c in value for c in '*?"<>|')
-    ):  # Same as validateFilename, except we allow \ and / and :
-        if ":" in value:
-            if value.find(":", 2) != -1 or not value[0].isalpha():
-                # For Windows: Colon can only be found at the beginning, e.g. 'C:\', or the first letter is not a letter drive.
-                _raiseValidationException(_("%r is not a valid file path.") % (_errstr(value)), excMsg)
-        _raiseValidationException(_("%r is not a valid file path.") % (_errstr(value)), excMsg)
+    if not _isValidFilepath(value):
+        _raiseValidationException(None, excMsg, "NOT_FILEPATH", {"value": value})
+
+    if mustExist or mustBeFile or mustBeDir:
+        code = _pathKindErrorCode(_statPathKind(value), mustExist, mustBeFile, mustBeDir)
+        if code is not None:
+            _raiseValidationException(None, excMsg, code, {"value": value})
     return value
-    raise NotImplementedError()
 
 
+class DirectoryCache(object):
+    """A cache of directory listings for validateFilepathBatch(). Checking
+    whether many paths exist takes one os.scandir() call per directory
+    instead of one stat() call per path. Listings older than ttl seconds are
+    listed again, so a DirectoryCache can be reused across batches without
+    missing changes for longer than that.
+
+    * ttl (int, float): The number of seconds a listing is used for. Defaults to 60.
+
+    >>> import pysimplevalidate as pysv
+    >>> cache = pysv.DirectoryCache(ttl=300)
+    >>> pysv.validateFilepathBatch(['/no/such/folder/foo.txt'], mustExist=True, cache=cache)
+    [None]
+    """
+
+    def __init__(self, ttl=60.0):
+        # type: (float) -> None
+        if not isinstance(ttl, (int, float)) or ttl < 0:
+            raise PySimpleValidateException("ttl argument must be a number that is 0 or more")
+        self.ttl = ttl
+        # Maps absolute folder paths to a (time listed, listing) tuple. The listing maps each
+        # name in the folder to its PATH_* kind, or is None if the folder doesn't exist, or
+        # is False if the folder couldn't be listed.
+        self._listings = {}  # type: Dict[str, Tuple[float, Any]]
+
+    def clear(self):
+        # type: () -> None
+        """Forgets all of the cached listings."""
+        self._listings.clear()
+
+    def _listing(self, dirPath):
+        # type: (str) -> Any
+        now = time.monotonic()
+        cached = self._listings.get(dirPath)
+        if cached is not None and now - cached[0] <= self.ttl:
+            return cached[1]
+
+        listing = {}  # type: Any
+        try:
+            with os.scandir(dirPath) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        listing[entry.name] = _statPathKind(entry.path)  # Find the kind of what it links to.
+                    elif entry.is_dir(follow_symlinks=False):
+                        listing[entry.name] = PATH_DIR
+                    elif entry.is_file(follow_symlinks=False):
+                        listing[entry.name] = PATH_FILE
+                    else:
+                        listing[entry.name] = PATH_OTHER
+        except (FileNotFoundError, NotADirectoryError):
+            listing = None
+        except OSError:
+            listing = False  # For example, a folder that can't be read but whose contents can still be stat()'d.
+        self._listings[dirPath] = (now, listing)
+        return listing
+
+    def pathKind(self, path):
+        # type: (str) -> int
+        """Returns PATH_MISSING, PATH_FILE, PATH_DIR, or PATH_OTHER for
+        path, following symlinks."""
+        head, name = os.path.split(path)
+        return self._pathKindsInDir(head, [(path, name)])[0]
+
+    def _pathKindsInDir(self, head, pathsAndNames):
+        # type: (str, List[Tuple[str, str]]) -> List[int]
+        """Returns the kind of each path in pathsAndNames, a list of
+        (path, name) tuples where os.path.split(path) is (head, name)."""
+        if ".." in head:
+            # os.path.abspath() would remove the .. before any symlinks in head are followed.
+            return [_statPathKind(path) for path, name in pathsAndNames]
+        listing = self._listing(os.path.abspath(head or os.curdir))
+        if listing is None:
+            return [PATH_MISSING] * len(pathsAndNames)
+
+        kinds = []  # type: List[int]
+        for path, name in pathsAndNames:
+            if listing is False or name in ("", ".", ".."):
+                kinds.append(_statPathKind(path))  # The listing can't answer for these paths.
+                continue
+            kind = listing.get(name)
+            if kind is None:
+                kind = _statPathKind(path) if _CASE_INSENSITIVE_FILESYSTEM else PATH_MISSING
+            kinds.append(kind)
+        return kinds
+
+
+def validateFilepathBatch(
+    values,
+    blank=False,
+    strip=None,
+    allowRegexes=None,
+    blockRegexes=None,
+    mustExist=False,
+    mustBeFile=False,
+    mustBeDir=False,
+    cache=None,
+):
+    # type: (Any, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], bool, bool, bool, Optional[DirectoryCache]) -> List[Optional[str]]
+    """Returns a list with the value that validateFilepath() would return for
+    each value in values, or None for each value that would fail validation.
+
+    The mustExist, mustBeFile, and mustBeDir checks are answered from one
+    os.scandir() listing of each parent folder instead of a stat() call for
+    each path, which is much faster when many paths share the same folders.
+    Pass a DirectoryCache as cache to reuse the listings in later batches.
+
+    * values (Iterable): The values to validate.
+    * cache (DirectoryCache, None): The cache of directory listings to use. If None, a new one is used for this batch.
+
+    The other arguments are the same as validateFilepath()'s.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateFilepathBatch(['foo.txt', '???.txt'])
+    ['foo.txt', None]
+    """
+
+    # Validate parameters.
+    _validateParamsFor_validateFilepath(blank, strip, allowRegexes, blockRegexes, mustExist, mustBeFile, mustBeDir)
+    if cache is None:
+        cache = DirectoryCache()
+    elif not isinstance(cache, DirectoryCache):
+        raise PySimpleValidateException("cache argument must be a DirectoryCache or None")
+
+    results = []  # type: List[Optional[str]]
+    checkKind = mustExist or mustBeFile or mustBeDir
+    pathsByHead = {}  # type: Dict[str, List[Tuple[int, str]]]
+    for i, value in enumerate(values):
+        try:
+            returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes)
+        except ValidationException:
+            results.append(None)
+            continue
+        if returnNow or not checkKind:
+            results.append(value if returnNow or _isValidFilepath(value) else None)
+            continue
+        if not _isValidFilepath(value):
+            results.append(None)
+            continue
+
+        results.append(value)
+        head, name = os.path.split(value)
+        if head in pathsByHead:
+            pathsByHead[head].append((i, name))
+        else:
+            pathsByHead[head] = [(i, name)]
+
+    # Check each folder's paths together, so the folder is only looked up in the cache once.
+    for head, indexesAndNames in pathsByHead.items():
+        kinds = cache._pathKindsInDir(head, [(results[i], name) for i, name in indexesAndNames])  # type: ignore
+        for (i, name), kind in zip(indexesAndNames, kinds):
+            if _pathKindErrorCode(kind, mustExist, mustBeFile, mustBeDir) is not None:
+                results[i] = None
+    return results
+
+
+@_timeValidated
 def validateIP(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
     # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> str
     """Raises ValidationException if value is not an IPv4 or IPv6 address.
@@ -1175,7 +3132,7 @@ def validateIP(value, blank=False, strip=None, allowRegexes=None, blockRegexes=N
     # Validate parameters.
     _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
 
-    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg, keepBytes=True)
     if returnNow:
         return value
 
@@ -1204,10 +3161,11 @@ def validateIP(value, blank=False, strip=None, allowRegexes=None, blockRegexes=N
             blockRegexes=blockRegexes,
         )
     except ValidationException:
-        _raiseValidationException(_("%r is not a valid IP address.") % (_errstr(value)), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_IP", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+@_timeValidated
 def validateIPv4(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
     # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> str
     """Raises ValidationException if value is not an IPv4 address.
@@ -1229,11 +3187,10 @@ def validateIPv4(value, blank=False, strip=None, allowRegexes=None, blockRegexes
     Traceback (most recent call last):
     pysimplevalidate.ValidationException: '256.256.256.256' is not a valid IP address.
     """
-
     # Validate parameters.
     _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
 
-    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg, keepBytes=True)
     if returnNow:
         return value
 
@@ -1250,10 +3207,11 @@ def validateIPv4(value, blank=False, strip=None, allowRegexes=None, blockRegexes
             blockRegexes=blockRegexes,
         )
     except ValidationException:
-        _raiseValidationException(_("%r is not a valid IPv4 address.") % (_errstr(value)), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_IPV4", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+@_timeValidated
 def validateIPv6(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
     # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> str
     """Raises ValidationException if value is not an IPv6 address.
@@ -1279,7 +3237,7 @@ def validateIPv6(value, blank=False, strip=None, allowRegexes=None, blockRegexes
     # Validate parameters.
     _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
 
-    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg, keepBytes=True)
     if returnNow:
         return value
 
@@ -1295,12 +3253,15 @@ def validateIPv6(value, blank=False, strip=None, allowRegexes=None, blockRegexes
             blockRegexes=blockRegexes,
         )
     except ValidationException:
-        _raiseValidationException(_("%r is not a valid IPv6 address.") % (_errstr(value)), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_IPV6", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
-def validateRegex(value, regex, flags=0, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
-    # type: (str, Union[str, Pattern], int, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> str
+@_timeValidated
+def validateRegex(
+    value, regex, flags=0, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, regexEngine=None
+):
+    # type: (str, Union[str, Pattern], int, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], Union[None, RegexEngine, str]) -> str
     """Raises ValidationException if value does not match the regular expression in regex.
     Returns the value argument.
 
@@ -1312,6 +3273,19 @@ def validateRegex(value, regex, flags=0, blank=False, strip=None, allowRegexes=N
     If you want to check if a string is a regular expression string, call
     validateRegexStr().
 
+    The regex is matched by regexEngine, or by the current engine from
+    getRegexEngine() if regexEngine is None. A regex object is recompiled
+    from its pattern and flags by engines other than re.
+
+    If value is bytes-like (bytes, bytearray, or memoryview), the match is
+    returned as bytes. If value is ASCII, an ASCII regex is matched as a
+    bytes pattern. Other values and regexes are matched against value
+    decoded from UTF-8, because \\w, \\d, \\s, and re.IGNORECASE only match
+    ASCII characters in bytes patterns. Either way, the result is the same
+    as for the str value. The same goes for
+    allowRegexes and blockRegexes, and for validateStr() and the validators
+    built on this one, such as validateIP() and validateEmail().
+
     * value (str): The value being validated as a regular expression string.
     * regex (str, regex): The regular expression to match the value against.
     * flags (int): Identical to the flags argument in re.compile(). Pass re.VERBOSE et al here.
@@ -1320,36 +3294,229 @@ def validateRegex(value, regex, flags=0, blank=False, strip=None, allowRegexes=N
     * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
     * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
     * excMsg (str): A custom message to use in the raised ValidationException.
+    * regexEngine (RegexEngine, str, None): The engine that matches regex, or the name of one in REGEX_ENGINES, i.e. 'pike'.
 
     >>> pysv.validateRegex('cat bat rat', r'(cat)|(dog)|(moose)', re.IGNORECASE)
     'cat'
     >>> pysv.validateRegex('He said "Hello".', r'"(.*?)"', re.IGNORECASE)
     '"Hello"'
+    >>> pysv.validateRegex('aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa!', r'^(a+)+$', regexEngine='pike')
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: 'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa!' does not match the specified pattern.
+    >>> pysv.validateRegex(b'GET /index.html HTTP/1.1', r'/\\S*')
+    b'/index.html'
     """
-
     # Validate parameters.
     _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+    engine = None if regexEngine is None else _toRegexEngine(regexEngine)
+    if not isinstance(regex, (str, REGEX_TYPE)):
+        raise PySimpleValidateException("regex must be a str or regex object")
+    if _isBytesPattern(regex):
+        raise PySimpleValidateException("regex must be a str pattern, which also matches bytes values")
+    _checkReDoSRisk(regex, flags, engine)
 
-    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg, keepBytes=True)
     if returnNow:
         return value
 
+    searched = value  # type: Any
+    if isinstance(value, bytes):
+        # Match an ASCII bytes value with the bytes version of regex, or else match the decoded value.
+        bytesRegex = None
+        if (engine or getRegexEngine()).bytesPatterns and _isASCIIBytes(value):
+            bytesRegex = _getBytesPattern(regex, flags)
+        if bytesRegex is None:
+            searched = _decodeBytes(value)
+        else:
+            regex, flags = bytesRegex, 0
+
     # Search value with regex, whether regex is a str or regex object.
-    if isinstance(regex, str):
-        # TODO - check flags to see they're valid regex flags.
-        mo = re.compile(regex, flags).search(value)
-    elif isinstance(regex, REGEX_TYPE):
-        mo = regex.search(value)
-    else:
-        raise PySimpleValidateException("regex must be a str or regex object")
+    # TODO - check flags to see they're valid regex flags.
+    if _slowInputLog is not None:
+        _slowInputStep("regex", regex)
+    mo = _compilePattern(regex, flags, engine).search(searched)
+    if _slowInputLog is not None:
+        _slowInputStep()
 
     if mo is not None:
-        return mo.group()
+        return mo.group().encode("utf-8", "surrogateescape") if searched is not value else mo.group()
     else:
-        _raiseValidationException(_("%r does not match the specified pattern.") % (_errstr(value)), excMsg)
+        _raiseValidationException(None, excMsg, "NO_MATCH", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+# Regex syntax that can behave differently when a value is searched as one line of
+# a larger str: \A and \Z, lookarounds that could see the neighboring values, and
+# group references, which would be renumbered by the group _getJoinedScanRegex() adds.
+_JOINED_SCAN_UNSAFE_REGEX = re.compile(r"\\[AZ1-9]|\\g<|\(\?<?[=!]|\(\?\(|\(\?P=")  # type: Pattern
+
+# Matches inline flags at the start of a regex, such as (?i), which must stay at the start.
+_LEADING_INLINE_FLAGS_REGEX = re.compile(r"^\(\?[aiLmsux]+\)")  # type: Pattern
+
+# Maps each regex object's (pattern, flags) to its joined-scan regex, or to None if it can't be used for
+# joined scans. It's cleared when it reaches _MAX_COMPILED_PATTERNS entries.
+_joinedScanRegexes = {}  # type: Dict[Tuple[Any, int], Optional[Pattern]]
+
+
+def _getJoinedScanRegex(regex):
+    # type: (Pattern) -> Optional[Pattern]
+    """Returns a regex that, in a str of non-blank values joined by
+    newlines, matches each whole line. The first match of regex in the line
+    is in group 1. If regex doesn't match the line, the line is in the last
+    group instead. Group 1 is the same match that regex.search() finds in
+    the value by itself.
+
+    Returns None if regex uses syntax that could match differently in the
+    joined str, or if it can't be compiled this way."""
+    key = (regex.pattern, regex.flags)
+    if key in _joinedScanRegexes:
+        return _joinedScanRegexes[key]
+
+    joinedRegex = None
+    source = regex.pattern
+    if isinstance(source, str) and _JOINED_SCAN_UNSAFE_REGEX.search(source) is None:
+        mo = _LEADING_INLINE_FLAGS_REGEX.match(source)
+        leadingFlags = mo.group() if mo is not None else ""
+        source = source[len(leadingFlags) :]
+        if regex.flags & re.VERBOSE or "x" in leadingFlags:
+            source += "\n"  # End any comment on the last line, so it doesn't comment out the closing parenthesis.
+        try:
+            joinedRegex = re.compile(
+                leadingFlags + r"^(?:[^\n]*?(" + source + r")[^\n]*|([^\n]*))", regex.flags | re.MULTILINE
+            )
+        except re.error:
+            pass
+    if len(_joinedScanRegexes) >= _MAX_COMPILED_PATTERNS:
+        _joinedScanRegexes.clear()
+    _joinedScanRegexes[key] = joinedRegex
+    return joinedRegex
+
+
+def _joinedSearch(regex, values):
+    # type: (Pattern, List[str]) -> List[Optional[str]]
+    """Returns regex.search(value).group() for each value in values, or None
+    for each value that regex doesn't match. The values must not be blank.
+
+    Instead of calling search() once per value, the values are joined with
+    newlines and scanned by a single findall() call, which returns one match
+    per line. Values that contain a newline are searched individually, and
+    if a match runs past the end of its line, finditer() is used to find
+    which lines to search individually. Regexes compiled by engines other
+    than re search each value individually."""
+    joinedRegex = _getJoinedScanRegex(regex) if isinstance(regex, RE_PATTERN_TYPE) else None
+    joined = "\n".join(values)
+    if joinedRegex is None or joined.count("\n") != len(values) - 1:
+        # Either the regex can't be used, or a value contains the newline separator.
+        return [_searchGroup(regex, value) for value in values]
+
+    found = joinedRegex.findall(joined)
+    if len(found) == len(values):
+        # Each line had its own match. (findall() returns '' for groups that didn't match, so check the last group.)
+        return [None if groups[-1] else groups[0] for groups in found]
+
+    results = [None] * len(values)  # type: List[Optional[str]]
+    recheck = []  # type: List[int]
+    line = pos = 0  # The line number of joined[pos].
+    for mo in joinedRegex.finditer(joined):
+        start, end = mo.span()
+        line += joined.count("\n", pos, start)
+        pos = start
+        if joined.find("\n", start, end) != -1:
+            # The match ran past the end of the line, so it and the lines it covered are searched individually.
+            recheck.extend(range(line, line + joined.count("\n", start, end) + 1))
+            continue
+        results[line] = mo.group(1)
+
+    for i in recheck:
+        results[i] = _searchGroup(regex, values[i])
+    return results
+
+
+def _searchGroup(regex, value):
+    # type: (Pattern, str) -> Optional[str]
+    """Returns regex.search(value).group(), or None if regex doesn't match
+    value or the search fails, such as by running out of time."""
+    try:
+        mo = regex.search(value)
+    except ValidationException:
+        return None
+    return mo.group() if mo is not None else None
+
+
+def validateRegexBatch(
+    values, regex, flags=0, blank=False, strip=None, allowRegexes=None, blockRegexes=None, regexEngine=None
+):
+    # type: (Any, Union[str, Pattern], int, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Union[None, RegexEngine, str]) -> List[Any]
+    """Returns a list with the value that validateRegex() would return for
+    each value in values, or None for each value that would fail validation.
+    This is much faster than calling validateRegex() in a loop: the values
+    are joined into one str and scanned by the regex engine all at once.
+
+    Bytes-like values are searched decoded from UTF-8, and their results
+    are bytes, like validateRegex() returns.
+
+    * values (Iterable): The values to validate.
+    * regex (str, regex): The regular expression to match the values against.
+    * flags (int): Identical to the flags argument in re.compile(). Pass re.VERBOSE et al here.
+    * blank (bool): If True, blank strings will be accepted. Defaults to False.
+    * strip (bool, str, None): If None, whitespace is stripped from the values. If a str, the characters in it are stripped from the values. If False, nothing is stripped.
+    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
+    * regexEngine (RegexEngine, str, None): The engine that matches regex, or the name of one in REGEX_ENGINES, i.e. 'pike'.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateRegexBatch(['cat', 'moose', 'bat rat', ''], r'(cat)|(moose)')
+    ['cat', 'moose', None, None]
+    >>> mask = [result is not None for result in pysv.validateRegexBatch(['cat', 'dog'], r'cat')]
+    >>> mask
+    [True, False]
+    """
+
+    # Validate parameters.
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+    if not isinstance(regex, (str, REGEX_TYPE)):
+        raise PySimpleValidateException("regex must be a str or regex object")
+    if _isBytesPattern(regex):
+        raise PySimpleValidateException("regex must be a str pattern, which also matches bytes values")
+    engine = None if regexEngine is None else _toRegexEngine(regexEngine)
+    _checkReDoSRisk(regex, flags, engine)
+    regex = _compilePattern(regex, flags, engine)
+
+    # Bytes-like values are stripped as bytes, like _prevalidationCheck() strips them, and then decoded.
+    values = list(values)
+    bytesIndexes = [i for i, value in enumerate(values) if isinstance(value, BYTES_TYPES)]
+    strValues = [
+        _decodeBytes(_getStrippedValue(bytes(value), strip))
+        if isinstance(value, BYTES_TYPES)
+        else _getStrippedValue(str(value), strip)
+        for value in values
+    ]
+    if allowRegexes is None and blockRegexes is None and "" not in strValues:
+        # None of the values need _prevalidationCheck().
+        results = _joinedSearch(regex, strValues)  # type: List[Any]
+    else:
+        results = [None] * len(values)
+        searchIndexes = []  # type: List[int]
+        for i, value in enumerate(values):
+            try:
+                returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, keepBytes=True)
+            except ValidationException:
+                continue
+            if returnNow:
+                results[i] = value
+            else:
+                searchIndexes.append(i)
+        for i, result in zip(searchIndexes, _joinedSearch(regex, [strValues[i] for i in searchIndexes])):
+            results[i] = result
+
+    for i in bytesIndexes:
+        if isinstance(results[i], str):
+            results[i] = results[i].encode("utf-8", "surrogateescape")
+    return results
+
+
+@_timeValidated
 def validateRegexStr(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
     # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> Union[str, Pattern]
     """Raises ValidationException if value can't be used as a regular expression string.
@@ -1377,7 +3544,6 @@ def validateRegexStr(value, blank=False, strip=None, allowRegexes=None, blockReg
         ...
     pysimplevalidate.ValidationException: '"(.*?"' is not a valid regular expression: missing ), unterminated subpattern at position 1
     """
-
     # TODO - I'd be nice to check regexes in other languages, i.e. JS and Perl.
     _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
 
@@ -1386,12 +3552,24 @@ def validateRegexStr(value, blank=False, strip=None, allowRegexes=None, blockReg
         return value
 
     try:
-        return re.compile(value)
+        regex = re.compile(value)
     except Exception as ex:
-        _raiseValidationException(_("%r is not a valid regular expression: %s") % (_errstr(value), ex), excMsg)
-    assert False, "The execution reached this point, even though the previous line should have raised an exception."
-
-
+        _raiseValidationException(None, excMsg, "NOT_REGEX", {"value": value, "error": str(ex)})
+
+    # The regex is for the re module, so it's checked for ReDoS risks whatever the regex engine is.
+    if _reDoSPolicy != "allow" or _reDoSRewrite:
+        problems, rewritten = _getReDoSRisk(value)
+        if _reDoSRewrite and rewritten is not None:
+            return re.compile(rewritten)
+        if problems and _reDoSPolicy == "reject":
+            _raiseValidationException(None, excMsg, "REGEX_REDOS", {"value": value, "problem": problems[0]})
+        elif problems and _reDoSPolicy == "warn":
+            message = "%r can take exponential time to match: %s" % (value, problems[0])
+            warnings.warn(message, ReDoSWarning, stacklevel=2)
+    return regex
+
+
+@_timeValidated
 def validateURL(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
     # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> str
     """Raises ValidationException if value is not a URL.
@@ -1424,7 +3602,6 @@ def validateURL(value, blank=False, strip=None, allowRegexes=None, blockRegexes=
         ...
     pysimplevalidate.ValidationException: 'blah blah blah' is not a valid URL.
     """
-
     # Reuse the logic in validateRegex()
     try:
         return validateRegex(
@@ -1434,11 +3611,14 @@ def validateURL(value, blank=False, strip=None, allowRegexes=None, blockRegexes=
         # 'localhost' is also an acceptable URL:
         if value == "localhost":
             return "localhost"
+        if isinstance(value, BYTES_TYPES) and bytes(value) == b"localhost":
+            return b"localhost"
 
-        _raiseValidationException(_("%r is not a valid URL.") % (value), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_URL", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+@_timeValidated
 def validateEmail(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
     # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> str
     """Raises ValidationException if value is not an email address.
@@ -1459,7 +3639,6 @@ def validateEmail(value, blank=False, strip=None, allowRegexes=None, blockRegexe
         ...
     pysimplevalidate.ValidationException: 'alinventwithpython.com' is not a valid email address.
     """
-
     # Reuse the logic in validateRegex()
     try:
         return validateRegex(
@@ -1471,10 +3650,78 @@ def validateEmail(value, blank=False, strip=None, allowRegexes=None, blockRegexe
             blockRegexes=blockRegexes,
         )
     except ValidationException:
-        _raiseValidationException(_("%r is not a valid email address.") % (value), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_EMAIL", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+def validateEmailBatch(values, blank=False, strip=None, allowRegexes=None, blockRegexes=None):
+    # type: (Any, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]]) -> List[Any]
+    """Returns a list with the value that validateEmail() would return for
+    each value in values, or None for each value that would fail validation.
+    See validateRegexBatch() for details.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateEmailBatch(['al@inventwithpython.com', 'alinventwithpython.com'])
+    ['al@inventwithpython.com', None]
+    """
+    return validateRegexBatch(
+        values, EMAIL_REGEX, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes
+    )
+
+
+def validateURLBatch(values, blank=False, strip=None, allowRegexes=None, blockRegexes=None):
+    # type: (Any, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]]) -> List[Any]
+    """Returns a list with the value that validateURL() would return for
+    each value in values, or None for each value that would fail validation.
+    See validateRegexBatch() for details.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateURLBatch(['https://inventwithpython.com', 'localhost', 'blah blah blah'])
+    ['https://inventwithpython.com', 'localhost', None]
+    """
+    values = list(values)
+    results = validateRegexBatch(
+        values, URL_REGEX, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes
+    )
+    for i, result in enumerate(results):
+        if result is None and values[i] == "localhost":
+            results[i] = "localhost"  # 'localhost' is also an acceptable URL.
+        elif result is None and isinstance(values[i], BYTES_TYPES) and bytes(values[i]) == b"localhost":
+            results[i] = b"localhost"
+    return results
+
+
+def validateIPv4Batch(values, blank=False, strip=None, allowRegexes=None, blockRegexes=None):
+    # type: (Any, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]]) -> List[Any]
+    """Returns a list with the value that validateIPv4() would return for
+    each value in values, or None for each value that would fail validation.
+    See validateRegexBatch() for details.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateIPv4Batch(['127.0.0.1', '256.256.256.256'])
+    ['127.0.0.1', None]
+    """
+    return validateRegexBatch(
+        values, IPV4_REGEX, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes
+    )
+
+
+def validateIPv6Batch(values, blank=False, strip=None, allowRegexes=None, blockRegexes=None):
+    # type: (Any, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]]) -> List[Any]
+    """Returns a list with the value that validateIPv6() would return for
+    each value in values, or None for each value that would fail validation.
+    See validateRegexBatch() for details.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateIPv6Batch(['1:2:3:4:5:6:7:8', '127.0.0.1'])
+    ['1:2:3:4:5:6:7:8', None]
+    """
+    return validateRegexBatch(
+        values, IPV6_REGEX, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes
+    )
+
+
+@_timeValidated
 def validateYesNo(
     value,
     blank=False,
@@ -1510,7 +3757,6 @@ def validateYesNo(
     >>> pysv.validateYesNo('OUI', yesVal='oui', noVal='no')
     'oui'
     """
-
     # Validate parameters. TODO - can probably improve this to remove the duplication.
     _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
 
@@ -1544,10 +3790,11 @@ def validateYesNo(
         elif value.upper() in (noVal.upper(), noVal[0].upper()):
             return noVal
 
-    _raiseValidationException(_("%r is not a valid %s/%s response.") % (_errstr(value), yesVal, noVal), excMsg)
+    _raiseValidationException(None, excMsg, "NOT_YES_NO", {"value": value, "yesVal": yesVal, "noVal": noVal})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+@_timeValidated
 def validateBool(
     value,
     blank=False,
@@ -1583,7 +3830,6 @@ def validateBool(
     >>> pysv.validateYesNo('OUI', yesVal='oui', noVal='no')
     'oui'
     """
-
     # Validate parameters. TODO - can probably improve this to remove the duplication.
     _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
 
@@ -1616,7 +3862,7 @@ def validateBool(
             excMsg=None,
         )
     except ValidationException:
-        _raiseValidationException(_("%r is not a valid %s/%s response.") % (_errstr(value), trueVal, falseVal), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_BOOL", {"value": value, "trueVal": trueVal, "falseVal": falseVal})
 
     # Return a bool value instead of a string.
     if result == trueVal:
@@ -1629,6 +3875,7 @@ def validateBool(
         ), "inner validateYesNo() call returned something that was not yesVal or noVal. This should never happen."
 
 
+@_timeValidated
 def validateUSState(
     value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, returnStateName=False
 ):
@@ -1655,7 +3902,6 @@ def validateUSState(
     >>> pysv.validateState('WASHINGTON', returnStateName=True)
     'Washington'
     """
-
     # TODO - note that this is USA-centric. I should work on trying to make this more international.
 
     # Validate parameters.
@@ -1665,18 +3911,142 @@ def validateUSState(
     if returnNow:
         return value
 
-    if value.upper() in USA_STATES_UPPER.keys():  # check if value is a state abbreviation
-        if returnStateName:
-            return USA_STATES[value.upper()]  # Return full state name.
-        else:
-            return value.upper()  # Return abbreviation.
-    elif value.title() in USA_STATES.values():  # check if value is a state name
+    index, names = _getEnumIndex("usStates")
+    abbrev = index.get(_normalizeEnumKey(value))  # value can be a state abbreviation or name
+    if abbrev is not None:
         if returnStateName:
-            return value.title()  # Return full state name.
+            return names[abbrev]  # Return full state name.
         else:
-            return USA_STATES_REVERSED[value.title()]  # Return abbreviation.
+            return abbrev  # Return abbreviation.
 
-    _raiseValidationException(_("%r is not a state.") % (_errstr(value)), excMsg)
+    _raiseValidationException(None, excMsg, "NOT_STATE", {"value": value})
+    assert False, "The execution reached this point, even though the previous line should have raised an exception."
+
+
+@_timeValidated
+def validateCAProvince(
+    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, returnProvinceName=False
+):
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], bool) -> str
+    """Raises ValidationException if value is not a Canadian province or territory.
+    Returns the capitalized abbreviation, unless returnProvinceName is True
+    in which case it returns the province name.
+
+    * value (str): The value being validated as a Canadian province or territory.
+    * blank (bool):  If True, a blank string will be accepted. Defaults to False.
+    * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
+    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
+    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
+    * excMsg (str): A custom message to use in the raised ValidationException.
+    * returnProvinceName (bool): If True, the full name is returned, i.e. 'Ontario'. Otherwise, the abbreviation, i.e. 'ON'. Defaults to False.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateCAProvince('bc')
+    'BC'
+    >>> pysv.validateCAProvince('nova scotia')
+    'NS'
+    >>> pysv.validateCAProvince('YT', returnProvinceName=True)
+    'Yukon'
+    """
+    # Validate parameters.
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    if returnNow:
+        return value
+
+    index, names = _getEnumIndex("caProvinces")
+    abbrev = index.get(_normalizeEnumKey(value))
+    if abbrev is not None:
+        return names[abbrev] if returnProvinceName else abbrev
+
+    _raiseValidationException(None, excMsg, "NOT_CA_PROVINCE", {"value": value})
+    assert False, "The execution reached this point, even though the previous line should have raised an exception."
+
+
+@_timeValidated
+def validateCountry(
+    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, returnCountryName=False
+):
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], bool) -> str
+    """Raises ValidationException if value is not an ISO 3166-1 country.
+    The value can be an alpha-2 code, an alpha-3 code, or the country's name.
+    Returns the alpha-2 code, unless returnCountryName is True in which case
+    it returns the country name.
+
+    * value (str): The value being validated as a country.
+    * blank (bool):  If True, a blank string will be accepted. Defaults to False.
+    * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
+    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
+    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
+    * excMsg (str): A custom message to use in the raised ValidationException.
+    * returnCountryName (bool): If True, the country name is returned, i.e. 'Germany'. Otherwise, the alpha-2 code, i.e. 'DE'. Defaults to False.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateCountry('de')
+    'DE'
+    >>> pysv.validateCountry('DEU')
+    'DE'
+    >>> pysv.validateCountry('germany')
+    'DE'
+    >>> pysv.validateCountry('FRA', returnCountryName=True)
+    'France'
+    """
+    # Validate parameters.
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    if returnNow:
+        return value
+
+    index, names = _getEnumIndex("countries")
+    code = index.get(_normalizeEnumKey(value))
+    if code is not None:
+        return names[code] if returnCountryName else code
+
+    _raiseValidationException(None, excMsg, "NOT_COUNTRY", {"value": value})
+    assert False, "The execution reached this point, even though the previous line should have raised an exception."
+
+
+@_timeValidated
+def validateCurrency(
+    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, returnCurrencyName=False
+):
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], bool) -> str
+    """Raises ValidationException if value is not an ISO 4217 currency.
+    The value can be the alphabetic code, the numeric code, or the currency's
+    name. Returns the alphabetic code, unless returnCurrencyName is True in
+    which case it returns the currency name.
+
+    * value (str): The value being validated as a currency.
+    * blank (bool):  If True, a blank string will be accepted. Defaults to False.
+    * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
+    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
+    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
+    * excMsg (str): A custom message to use in the raised ValidationException.
+    * returnCurrencyName (bool): If True, the currency name is returned, i.e. 'Euro'. Otherwise, the alphabetic code, i.e. 'EUR'. Defaults to False.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validateCurrency('usd')
+    'USD'
+    >>> pysv.validateCurrency('978')
+    'EUR'
+    >>> pysv.validateCurrency('JPY', returnCurrencyName=True)
+    'Yen'
+    """
+    # Validate parameters.
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    if returnNow:
+        return value
+
+    index, names = _getEnumIndex("currencies")
+    code = index.get(_normalizeEnumKey(value))
+    if code is not None:
+        return names[code] if returnCurrencyName else code
+
+    _raiseValidationException(None, excMsg, "NOT_CURRENCY", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
@@ -1688,14 +4058,423 @@ def validateAddress():
     raise NotImplementedError()
 
 
-def validatePhone():
-    raise NotImplementedError()
+# The postal code rules, keyed by country, compiled from postal_codes.tsv by _getPostalCodeRule() when they're first used.
+_postalCodeRules = {}  # type: Dict[str, Optional[Tuple[Pattern, str]]]
+
+# The ZIP code tables, built from us_zip3.tsv by _getZIP3Tables().
+_zip3Tables = None  # type: Any
+
+
+def _getPostalCodeRule(country):
+    # type: (str) -> Optional[Tuple[Pattern, str]]
+    """Returns the (regex, template) tuple for the ISO 3166-1 alpha-2 code
+    country in postal_codes.tsv, or None if the country has no postal code
+    format. Each regex is only compiled the first time its country is
+    requested, so only the countries that are used cost anything."""
+    if country not in _postalCodeRules:
+        with _tablesLock:
+            if country not in _postalCodeRules:
+                rule = None  # type: Optional[Tuple[Pattern, str]]
+                for rowCountry, pattern, template in _loadDataTable("postal_codes.tsv"):
+                    if rowCountry == country:
+                        rule = (re.compile(pattern, re.IGNORECASE), template)
+                        break
+                _postalCodeRules[country] = rule
+    return _postalCodeRules[country]
+
+
+def _getZIP3Tables():
+    # type: () -> Tuple[Tuple[FrozenSet[int], ...], Dict[str, int]]
+    """Returns the tables used to check that a ZIP code is in a state,
+    building them from the bundled us_zip3.tsv file the first time it's
+    called:
+
+    * A tuple with an entry for each of the 1000 ZIP3 prefixes (the first
+      three digits of a ZIP code) 000 to 999. Each entry is a frozenset of
+      the state numbers of the states with ZIP codes in the prefix, which
+      is empty if the prefix isn't used. Most prefixes are in one state,
+      but some are shared, such as 969 by Guam and the Pacific territories.
+    * A dict of each USPS state code to its state number. The states in
+      USA_STATES are numbered first, in alphabetical order, followed by DC,
+      the territories, and the military state codes in us_zip3.tsv.
+
+    Checking a ZIP code's state is one tuple lookup and one set lookup."""
+    global _zip3Tables
+    if _zip3Tables is None:
+        with _tablesLock:
+            if _zip3Tables is None:
+                stateNumbers = {}  # type: Dict[str, int]
+                for abbrev in sorted(USA_STATES):
+                    stateNumbers[abbrev] = len(stateNumbers) + 1
+                prefixStates = [set() for prefix in range(1000)]  # type: List[Set[int]]
+                for firstPrefix, lastPrefix, states in _loadDataTable("us_zip3.tsv"):
+                    for state in states.split(","):
+                        stateNumber = stateNumbers.setdefault(state, len(stateNumbers) + 1)
+                        for prefix in range(int(firstPrefix), int(lastPrefix) + 1):
+                            prefixStates[prefix].add(stateNumber)
+                _zip3Tables = (tuple(frozenset(states) for states in prefixStates), stateNumbers)
+    return _zip3Tables
+
+
+def _usStateNumber(state):
+    # type: (str) -> int
+    """Returns the state number from _getZIP3Tables() for state, which can be
+    a state abbreviation or name (like validateUSState() accepts) or the code
+    of DC, a territory, or a military state. Returns 0 if it's none of these."""
+    stateNumbers = _getZIP3Tables()[1]
+    abbrev = _getEnumIndex("usStates")[0].get(_normalizeEnumKey(state))
+    if abbrev is None:
+        abbrev = state.strip().upper()
+    return stateNumbers.get(abbrev, 0)
+
+
+def _parsePostalCode(value, rule):
+    # type: (str, Tuple[Pattern, str]) -> Optional[str]
+    """Returns value, a postal code, uppercased and in the format of the
+    rule's template, or None if it doesn't match the rule's regex."""
+    regex, template = rule
+    if _slowInputLog is not None:
+        _slowInputStep("regex", regex)
+    match = regex.fullmatch(value)
+    if _slowInputLog is not None:
+        _slowInputStep()
+    if match is None:
+        return None
+    return (match.expand(template) if template else value).upper()
+
+
+def _validateParamsFor_validatePostalCode(
+    blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, country="US"
+):
+    # type: (bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], str) -> Tuple[str, Tuple[Pattern, str]]
+    """Raises PySimpleValidateException if the arguments are invalid. This is called by
+    the validatePostalCode() and validatePostalCodeBatch() functions to check their arguments.
+    Returns the country's alpha-2 code and its postal code rule."""
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+    if not isinstance(country, str):
+        raise PySimpleValidateException("country argument must be a str")
+    code = _getEnumIndex("countries")[0].get(_normalizeEnumKey(country))
+    rule = _getPostalCodeRule(code) if code is not None else None
+    if rule is None:
+        raise PySimpleValidateException("country argument must be a country with a postal code format, such as 'US'")
+    return code, rule  # type: ignore
+
+
+@_timeValidated
+def validatePostalCode(
+    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, country="US", state=None
+):
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], str, Optional[str]) -> str
+    """Raises ValidationException if value is not a postal code of country.
+    Returns the uppercased postal code. For countries with a standard way to
+    write their postal codes, it's returned in that format, e.g. 'K1A 0B1'
+    for the Canadian postal code 'k1a0b1'.
+
+    If state is given, value must be a US ZIP code in that state. The state
+    is checked with the ZIP code's first three digits.
+
+    * value (str): The value being validated as a postal code.
+    * blank (bool): If True, a blank string will be accepted. Defaults to False.
+    * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
+    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
+    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
+    * excMsg (str): A custom message to use in the raised ValidationException.
+    * country (str): The country of the postal code, as anything validateCountry() accepts. Defaults to 'US'.
+    * state (str, None): The state, DC, territory, or military state that a US ZIP code must be in, as a code or name.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validatePostalCode('90210')
+    '90210'
+    >>> pysv.validatePostalCode('sw1a1aa', country='GB')
+    'SW1A 1AA'
+    >>> pysv.validatePostalCode('90210', state='NY')
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: '90210' is not a ZIP code in NY.
+    """
+    # Validate parameters.
+    country, rule = _validateParamsFor_validatePostalCode(blank, strip, allowRegexes, blockRegexes, excMsg, country)
+    if state is not None:
+        if country != "US":
+            raise PySimpleValidateException("state argument can only be used with US postal codes")
+        stateNumber = _usStateNumber(str(state))
+        if stateNumber == 0:
+            raise PySimpleValidateException("state argument must be a US state, DC, territory, or military state")
+
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    if returnNow:
+        return value
+
+    postalCode = _parsePostalCode(value, rule)
+    if postalCode is None:
+        _raiseValidationException(None, excMsg, "NOT_POSTAL_CODE", {"value": value})
+    if state is not None:
+        if stateNumber not in _getZIP3Tables()[0][int(postalCode[:3])]:  # type: ignore
+            _raiseValidationException(None, excMsg, "POSTAL_CODE_STATE", {"value": value, "state": state})
+    return postalCode  # type: ignore
+
+
+def validatePostalCodeBatch(
+    values, blank=False, strip=None, allowRegexes=None, blockRegexes=None, country="US", states=None
+):
+    # type: (Any, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], str, Optional[Sequence[Optional[str]]]) -> List[Optional[str]]
+    """Returns a list with the value that validatePostalCode() would return
+    for each value in values, or None for each value that would fail
+    validation. The arguments are only checked once, and no exceptions are
+    raised for the invalid values, so this is much faster than a loop.
+
+    For the ZIP code and state columns of an address file, pass the states
+    as states, a sequence with the state of each value (or None to not
+    check that value's state).
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validatePostalCodeBatch(['90210', '10001-0001', '9021'], states=['CA', 'New York', 'CA'])
+    ['90210', '10001-0001', None]
+    >>> pysv.validatePostalCodeBatch(['90210', '10001'], states=['NY', None])
+    [None, '10001']
+    """
+    country, rule = _validateParamsFor_validatePostalCode(blank, strip, allowRegexes, blockRegexes, None, country)
+    if states is not None:
+        if country != "US":
+            raise PySimpleValidateException("states argument can only be used with US postal codes")
+        if not isinstance(values, SEQUENCE_ABC) or not isinstance(states, SEQUENCE_ABC) or len(values) != len(states):
+            raise PySimpleValidateException("states argument must be a sequence with a state for each value")
+        prefixTable = _getZIP3Tables()[0]
+        stateNumbers = {}  # type: Dict[Any, int]  # The state numbers of the states seen so far in this batch.
+
+    regex, template = rule
+    results = []  # type: List[Optional[str]]
+    for i, value in enumerate(values):
+        if allowRegexes is None and blockRegexes is None:
+            # The value doesn't need _prevalidationCheck(), except to handle blanks.
+            value = _getStrippedValue(str(value), strip)
+            if value == "":
+                results.append("" if blank else None)
+                continue
+        else:
+            try:
+                returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes)
+            except ValidationException:
+                results.append(None)
+                continue
+            if returnNow:
+                results.append(value)
+                continue
+
+        match = regex.fullmatch(value)
+        if match is None:
+            results.append(None)
+            continue
+        postalCode = (match.expand(template) if template else value).upper()
+        if states is not None and states[i] is not None:
+            state = states[i]
+            if state not in stateNumbers:
+                stateNumbers[state] = _usStateNumber(str(state))
+            if stateNumbers[state] not in prefixTable[int(postalCode[:3])]:
+                postalCode = None
+        results.append(postalCode)
+    return results
+
+
+# The characters that are removed from phone numbers before they're parsed.
+_PHONE_SEPARATORS_TABLE = {ord(c): None for c in " \t-.()/"}  # type: Dict[int, None]
+
+# Matches one or more ASCII digits. (str.isdigit() also accepts digits from other scripts.)
+_ASCII_DIGITS_REGEX = re.compile(r"[0-9]+")  # type: Pattern
+
+# The calling code tables, built from calling_codes.tsv by _getPhoneTables().
+_phoneTables = None  # type: Any
+
+
+def _getPhoneTables():
+    # type: () -> Tuple[array.array, List[Tuple[str, int, int, str]], Dict[str, int]]
+    """Returns the tables that validatePhone() uses, building them from the
+    bundled calling_codes.tsv file the first time it's called:
+
+    * The calling code trie compiled into an array('H') with an entry for
+      each of the 1000 three-digit prefixes 000 to 999. Each entry is the
+      rule number plus one of the calling code that the prefix begins with,
+      or 0 if it doesn't begin with a calling code.
+    * The rules, as a list of (calling code, minimum national number length,
+      maximum national number length, trunk prefix) tuples.
+    * A dict of each ISO 3166-1 alpha-2 region code to its rule number.
+
+    Calling codes are 1 to 3 digits long and prefix-free, so the trie of
+    calling codes has at most one code on the path to each three-digit
+    prefix. Compiling the trie into the table means finding a number's
+    calling code takes one array lookup instead of a walk of the trie."""
+    global _phoneTables
+    if _phoneTables is None:
+        with _tablesLock:
+            if _phoneTables is None:
+                # Build the trie as an array('H') of 10 child node numbers for each node
+                # (for the digits 0 to 9), where 0 means no child. Node 0 is the root.
+                trie = array.array("H", [0] * 10)
+                ruleNumbers = array.array("H", [0])  # The rule number plus one of the code ending at each node, or 0.
+                rules = []  # type: List[Tuple[str, int, int, str]]
+                regions = {}  # type: Dict[str, int]
+                for code, regionCodes, minLength, maxLength, trunkPrefix in _loadDataTable("calling_codes.tsv"):
+                    node = 0
+                    for digit in code:
+                        child = trie[node * 10 + int(digit)]
+                        if child == 0:
+                            child = len(ruleNumbers)
+                            trie[node * 10 + int(digit)] = child
+                            trie.extend([0] * 10)
+                            ruleNumbers.append(0)
+                        node = child
+                    rules.append((code, int(minLength), int(maxLength), trunkPrefix))
+                    ruleNumbers[node] = len(rules)
+                    for region in regionCodes.split(","):
+                        regions[region] = len(rules) - 1
+
+                # Compile the trie into the prefix table by walking it for every three-digit prefix.
+                prefixTable = array.array("H", [0] * 1000)
+                for prefix in range(1000):
+                    node = 0
+                    for digit in (prefix // 100, prefix // 10 % 10, prefix % 10):
+                        node = trie[node * 10 + digit]
+                        if node == 0 or ruleNumbers[node]:
+                            prefixTable[prefix] = ruleNumbers[node] if node else 0
+                            break
+                _phoneTables = (prefixTable, rules, regions)
+    return _phoneTables
+
+
+def _parsePhone(value, defaultRule):
+    # type: (str, Optional[int]) -> Optional[str]
+    """Returns value, a phone number, in E.164 form, or None if it isn't a
+    valid phone number. If value doesn't begin with + or the international
+    prefix 00, it's parsed as a national number for defaultRule, the rule
+    number of a region in the phone tables. If defaultRule is None, value
+    must be an international number."""
+    prefixTable, rules, regions = _phoneTables or _getPhoneTables()
+    digits = value.translate(_PHONE_SEPARATORS_TABLE)
+    if digits[:1] == "+":
+        digits = digits[1:]
+    elif digits[:2] == "00":
+        digits = digits[2:]
+    elif defaultRule is not None:
+        digits = rules[defaultRule][0] + digits
+    else:
+        return None  # A national number, but there's no default region.
+    if len(digits) < 4 or _ASCII_DIGITS_REGEX.fullmatch(digits) is None:
+        return None
+
+    ruleNumber = prefixTable[int(digits[:3])]
+    if ruleNumber == 0:
+        return None  # No calling code begins with these digits.
+    code, minLength, maxLength, trunkPrefix = rules[ruleNumber - 1]
+
+    nationalNumber = digits[len(code) :]
+    if trunkPrefix and nationalNumber.startswith(trunkPrefix) and len(nationalNumber) - len(trunkPrefix) >= minLength:
+        # Remove the trunk prefix, i.e. the 0 in '030 123456' or '+49 (0)30 123456'. It's kept if removing it
+        # leaves too few digits, since then it's the first digit of the number, as the 8 in '+7 812 123 45 67' is.
+        nationalNumber = nationalNumber[len(trunkPrefix) :]
+    if not minLength <= len(nationalNumber) <= maxLength or len(code) + len(nationalNumber) > 15:
+        return None
+    return "+" + code + nationalNumber
+
+
+def _validateParamsFor_validatePhone(
+    blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, defaultRegion=None
+):
+    # type: (bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], Optional[str]) -> Optional[int]
+    """Raises PySimpleValidateException if the arguments are invalid. This is called by
+    the validatePhone() and validatePhoneBatch() functions to check their arguments.
+    Returns the rule number of defaultRegion, or None if defaultRegion is None."""
+    _validateGenericParameters(blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+    if defaultRegion is None:
+        return None
+    regions = _getPhoneTables()[2]
+    if not isinstance(defaultRegion, str) or defaultRegion.upper() not in regions:
+        raise PySimpleValidateException("defaultRegion argument must be an ISO 3166-1 alpha-2 code, such as 'US'")
+    return regions[defaultRegion.upper()]
+
+
+@_timeValidated
+def validatePhone(value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None, defaultRegion=None):
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str], Optional[str]) -> str
+    """Raises ValidationException if value is not a phone number. Returns
+    the phone number in E.164 form, e.g. '+14155552671'.
+
+    International numbers begin with + or 00 and the country calling code.
+    Other numbers are national numbers for defaultRegion, and are only
+    accepted if defaultRegion is given. The length of the national number
+    must be valid for its calling code. Spaces, tabs, and the characters
+    - . ( ) / are ignored, and a trunk prefix before the national number
+    (such as the 0 in '+44 (0)20 7946 0958') is removed.
+
+    * value (str): The value being validated as a phone number.
+    * blank (bool): If True, a blank string will be accepted. Defaults to False.
+    * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
+    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
+    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
+    * excMsg (str): A custom message to use in the raised ValidationException.
+    * defaultRegion (str, None): The ISO 3166-1 alpha-2 code, such as 'US', of the region for national numbers.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validatePhone('+1 (415) 555-2671')
+    '+14155552671'
+    >>> pysv.validatePhone('020 7946 0958', defaultRegion='GB')
+    '+442079460958'
+    >>> pysv.validatePhone('+44 20 79')
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: '+44 20 79' is not a valid phone number.
+    """
+    # Validate parameters.
+    defaultRule = _validateParamsFor_validatePhone(blank, strip, allowRegexes, blockRegexes, excMsg, defaultRegion)
+
+    returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes, excMsg)
+    if returnNow:
+        return value
 
+    phone = _parsePhone(value, defaultRule)
+    if phone is None:
+        _raiseValidationException(None, excMsg, "NOT_PHONE", {"value": value})
+    return phone  # type: ignore
 
+
+def validatePhoneBatch(values, blank=False, strip=None, allowRegexes=None, blockRegexes=None, defaultRegion=None):
+    # type: (Any, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> List[Optional[str]]
+    """Returns a list with the value that validatePhone() would return for
+    each value in values, or None for each value that would fail validation.
+    The arguments are only checked once, and no exceptions are raised for
+    the invalid values, so this is much faster than a loop.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.validatePhoneBatch(['+1 415 555 2671', '(415) 555-2671', '555-2671'], defaultRegion='US')
+    ['+14155552671', '+14155552671', None]
+    """
+    defaultRule = _validateParamsFor_validatePhone(blank, strip, allowRegexes, blockRegexes, None, defaultRegion)
+    if allowRegexes is None and blockRegexes is None:
+        # None of the values need _prevalidationCheck(), except to handle blanks.
+        results = []  # type: List[Optional[str]]
+        for value in values:
+            value = _getStrippedValue(str(value), strip)
+            if value == "":
+                results.append("" if blank else None)
+            else:
+                results.append(_parsePhone(value, defaultRule))
+        return results
+
+    results = []
+    for value in values:
+        try:
+            returnNow, value = _prevalidationCheck(value, blank, strip, allowRegexes, blockRegexes)
+        except ValidationException:
+            results.append(None)
+            continue
+        results.append(value if returnNow else _parsePhone(value, defaultRule))
+    return results
+
+
+@_timeValidated
 def validateMonth(
-    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, monthNames=ENGLISH_MONTHS, excMsg=None
+    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, monthNames=None, excMsg=None
 ):
-    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Dict[str, str], Optional[str]) -> str
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[Dict[str, str]], Optional[str]) -> str
     """Raises ValidationException if value is not a month, like 'Jan' or 'March'.
     Returns the titlecased month.
 
@@ -1704,7 +4483,7 @@ def validateMonth(
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
     * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
     * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
-    * monthNames (Mapping): A mapping of uppercase month abbreviations to month names, i.e. {'JAN': 'January', ... }. The default provides English month names.
+    * monthNames (Mapping, None): A mapping of uppercase month abbreviations to month names, i.e. {'JAN': 'January', ... }. If None, English month names are used.
     * excMsg (str): A custom message to use in the raised ValidationException.
 
     >>> import pysimplevalidate as pysv
@@ -1713,7 +4492,6 @@ def validateMonth(
     >>> pysv.validateMonth('MARCH')
     'March'
     """
-
     # returns full month name, e.g. 'January'
 
     # Validate parameters.
@@ -1724,7 +4502,7 @@ def validateMonth(
         return value
 
     try:
-        if (monthNames == ENGLISH_MONTHS) and (
+        if (monthNames is None or monthNames == _ENGLISH_MONTHS) and (
             1 <= int(value) <= 12
         ):  # This check here only applies to months, not when validateDayOfWeek() calls this function.
             return ENGLISH_MONTH_NAMES[int(value) - 1]
@@ -1733,21 +4511,31 @@ def validateMonth(
 
     # Both month names and month abbreviations will be at least 3 characters.
     if len(value) < 3:
-        _raiseValidationException(_("%r is not a month.") % (_errstr(value)), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_MONTH", {"value": value})
 
-    if value[:3].upper() in monthNames.keys():  # check if value is a month abbreviation
-        return monthNames[value[:3].upper()]  # It turns out that titlecase is good for all the month.
-    elif value.upper() in monthNames.values():  # check if value is a month name
-        return value.title()
+    # The default tables have cached indexes, other mappings get an index built for this call.
+    if monthNames is None:
+        index, names = _getEnumIndex("englishMonths")
+    elif monthNames is _ENGLISH_DAYS_OF_WEEK:
+        index, names = _getEnumIndex("englishDaysOfWeek")
+    else:
+        index, names = _buildEnumIndex(list(monthNames.items()), 1)
+
+    abbrev = index.get(_normalizeEnumKey(value))  # check if value is a month name or abbreviation
+    if abbrev is None:
+        abbrev = index.get(_normalizeEnumKey(value[:3]))  # check if value starts with a month abbreviation, i.e. 'Sept'
+    if abbrev is not None:
+        return names[abbrev]
 
-    _raiseValidationException(_("%r is not a month.") % (_errstr(value)), excMsg)
+    _raiseValidationException(None, excMsg, "NOT_MONTH", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+@_timeValidated
 def validateDayOfWeek(
-    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, dayNames=ENGLISH_DAYS_OF_WEEK, excMsg=None
+    value, blank=False, strip=None, allowRegexes=None, blockRegexes=None, dayNames=None, excMsg=None
 ):
-    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Dict[str, str], Optional[str]) -> str
+    # type: (str, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[Dict[str, str]], Optional[str]) -> str
     """Raises ValidationException if value is not a day of the week, such as 'Mon' or 'Friday'.
     Returns the titlecased day of the week.
 
@@ -1756,7 +4544,7 @@ def validateDayOfWeek(
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
     * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation, even if they aren't numbers.
     * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, response_str) tuples that, if matched, will explicitly fail validation.
-    * dayNames (Mapping): A mapping of uppercase day abbreviations to day names, i.e. {'SUN': 'Sunday', ...} The default provides English day names.
+    * dayNames (Mapping, None): A mapping of uppercase day abbreviations to day names, i.e. {'SUN': 'Sunday', ...} If None, English day names are used.
     * excMsg (str): A custom message to use in the raised ValidationException.
 
     >>> import pysimplevalidate as pysv
@@ -1765,7 +4553,6 @@ def validateDayOfWeek(
     >>> pysv.validateDayOfWeek('THURSday')
     'Thursday'
     """
-
     # TODO - reuse validateChoice for this function
 
     # returns full day of the week str, e.g. 'Sunday'
@@ -1778,14 +4565,34 @@ def validateDayOfWeek(
             strip=strip,
             allowRegexes=allowRegexes,
             blockRegexes=blockRegexes,
-            monthNames=ENGLISH_DAYS_OF_WEEK,
+            monthNames=_ENGLISH_DAYS_OF_WEEK if dayNames is None else dayNames,
         )
     except:
         # Replace the exception message.
-        _raiseValidationException(_("%r is not a day of the week.") % (_errstr(value)), excMsg)
+        _raiseValidationException(None, excMsg, "NOT_DAY_OF_WEEK", {"value": value})
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
+# The number of days in each (year, month) that _daysInMonth() has been called for.
+_DAYS_IN_MONTH = {}  # type: Dict[Tuple[int, int], int]
+
+
+def _daysInMonth(year, month):
+    # type: (int, int) -> int
+    """Returns the number of days in the month of the year, calling
+    calendar.monthrange() only the first time each month is requested.
+    Raises PySimpleValidateException if year or month are invalid."""
+    daysInMonth = _DAYS_IN_MONTH.get((year, month))
+    if daysInMonth is None:
+        try:
+            daysInMonth = calendar.monthrange(year, month)[1]
+        except:
+            raise PySimpleValidateException("invalid arguments for year and/or month")
+        _DAYS_IN_MONTH[(year, month)] = daysInMonth  # Only valid months are stored, so there are at most 9999 * 12.
+    return daysInMonth
+
+
+@_timeValidated
 def validateDayOfMonth(value, year, month, blank=False, strip=None, allowRegexes=None, blockRegexes=None, excMsg=None):
     # type: (str, int, int, bool, Union[None, str, bool], Union[None, Sequence[Union[Pattern, str]]], Union[None, Sequence[Union[Pattern, str, Sequence[Union[Pattern, str]]]]], Optional[str]) -> int
     """Raises ValidationException if value is not a day of the month, from
@@ -1818,10 +4625,7 @@ def validateDayOfMonth(value, year, month, blank=False, strip=None, allowRegexes
     """
     year = int(year)
     month = int(month)
-    try:
-        daysInMonth = calendar.monthrange(year, month)[1]
-    except:
-        raise PySimpleValidateException("invalid arguments for year and/or month")
+    daysInMonth = _daysInMonth(year, month)
 
     try:
         return int(
@@ -1838,12 +4642,875 @@ def validateDayOfMonth(value, year, month, blank=False, strip=None, allowRegexes
     except:
         # Replace the exception message.
         _raiseValidationException(
-            _("%r is not a day in the month of %s %s.") % (_errstr(value), ENGLISH_MONTH_NAMES[month - 1], year), excMsg
+            None,
+            excMsg,
+            "NOT_DAY_OF_MONTH",
+            {"value": value, "monthName": ENGLISH_MONTH_NAMES[month - 1], "year": year},
         )
     assert False, "The execution reached this point, even though the previous line should have raised an exception."
 
 
-if __name__ == "__main__":
-    pass
-    # import doctest
-    # doctest.testmod()
+class BatchResult(object):
+    """The summary of validating many values, returned by validateBatch().
+
+    * results (list): The return value of the validator for each value, or None for values that failed. Values after an early exit aren't included.
+    * numValidated (int): The number of values that were validated.
+    * numFailed (int): The number of values that failed validation.
+    * failures (list): An (index, ValidationException) tuple for each value that failed.
+    * failureCounts (dict): Maps each ValidationException code to the number of values that failed with it.
+    * firstFailures (dict): Maps each ValidationException code to the index of the first value that failed with it.
+    * aborted (bool): True if validation stopped early because of the maxErrors or maxErrorRate arguments.
+    * abortReason (str, None): 'collectAll', 'maxErrors', or 'maxErrorRate' for the argument that stopped validation if aborted is True, otherwise None.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.results = []  # type: List[Any]
+        self.numValidated = 0
+        self.numFailed = 0
+        self.failures = []  # type: List[Tuple[int, ValidationException]]
+        self.failureCounts = {}  # type: Dict[Optional[str], int]
+        self.firstFailures = {}  # type: Dict[Optional[str], int]
+        self.aborted = False
+        self.abortReason = None  # type: Optional[str]
+
+    def _addFailure(self, index, exc):
+        # type: (int, ValidationException) -> None
+        self.numFailed += 1
+        self.failures.append((index, exc))
+        if exc.code in self.failureCounts:
+            self.failureCounts[exc.code] += 1
+        else:
+            self.failureCounts[exc.code] = 1
+            self.firstFailures[exc.code] = index
+
+    def __repr__(self):
+        # type: () -> str
+        return "<BatchResult numValidated=%s numFailed=%s aborted=%s failureCounts=%r>" % (
+            self.numValidated,
+            self.numFailed,
+            self.aborted,
+            self.failureCounts,
+        )
+
+
+def _validateParamsFor_validateBatch(validator, collectAll=True, maxErrors=None, maxErrorRate=None, minSampleSize=100):
+    # type: (Any, bool, Optional[int], Optional[float], int) -> None
+    """Raises PySimpleValidateException if the arguments are invalid. This is called by
+    validateBatch() and the other batch functions to check their arguments."""
+    if not callable(validator):
+        raise PySimpleValidateException("validator argument must be a function")
+    if not isinstance(collectAll, bool):
+        raise PySimpleValidateException("collectAll argument must be a bool")
+    if maxErrors is not None and (not isinstance(maxErrors, int) or isinstance(maxErrors, bool) or maxErrors < 1):
+        raise PySimpleValidateException("maxErrors argument must be a positive int or None")
+    if maxErrorRate is not None and (not isinstance(maxErrorRate, (int, float)) or not 0 <= maxErrorRate < 1):
+        raise PySimpleValidateException("maxErrorRate argument must be a number from 0 up to (but not including) 1, or None")
+    if not isinstance(minSampleSize, int) or isinstance(minSampleSize, bool) or minSampleSize < 1:
+        raise PySimpleValidateException("minSampleSize argument must be a positive int")
+
+
+def validateBatch(
+    values, validator, collectAll=True, maxErrors=None, maxErrorRate=None, minSampleSize=100, **validatorArgs
+):
+    # type: (Any, Any, bool, Optional[int], Optional[float], int, Any) -> BatchResult
+    """Validates each value in values with the validator function, such as
+    validateInt, and returns a BatchResult with the results and a summary
+    of the failures grouped by their ValidationException code.
+
+    Validation can stop early: after the first failure if collectAll is
+    False, after maxErrors failures, or once the fraction of values that
+    failed goes over maxErrorRate. The BatchResult's aborted attribute is
+    set to True when this happens.
+
+    * values (Iterable): The values to validate. This can be any iterable, such as a file object.
+    * validator (function): The validation function to call on each value.
+    * collectAll (bool): If True, every failure is collected. If False, validation stops at the first failure. Defaults to True.
+    * maxErrors (int, None): If not None, validation stops after this many failures.
+    * maxErrorRate (float, None): If not None, validation stops once the fraction of values that failed is over this rate, i.e. 0.05 for 5%.
+    * minSampleSize (int): The number of values to validate before maxErrorRate is checked. Defaults to 100.
+    * validatorArgs: Any other keyword arguments are passed to validator, i.e. min=0.
+
+    >>> import pysimplevalidate as pysv
+    >>> result = pysv.validateBatch(['1', 'two', '3', '400'], pysv.validateInt, max=100)
+    >>> result.results
+    [1, None, 3, None]
+    >>> result.failureCounts
+    {'NOT_INT': 1, 'NUM_MAX': 1}
+    >>> result.firstFailures
+    {'NOT_INT': 1, 'NUM_MAX': 3}
+    >>> pysv.validateBatch(['1', 'two', '3', '400'], pysv.validateInt, maxErrors=1).numValidated
+    2
+    """
+    _validateParamsFor_validateBatch(validator, collectAll, maxErrors, maxErrorRate, minSampleSize)
+
+    batchResult = BatchResult()
+    results = batchResult.results
+    numValidated = 0
+    for index, value in enumerate(values):
+        numValidated = index + 1
+        try:
+            results.append(validator(value, **validatorArgs))
+        except ValidationException as exc:
+            results.append(None)
+            batchResult._addFailure(index, exc)
+            if not collectAll:
+                batchResult.aborted, batchResult.abortReason = True, "collectAll"
+                break
+            if maxErrors is not None and batchResult.numFailed >= maxErrors:
+                batchResult.aborted, batchResult.abortReason = True, "maxErrors"
+                break
+        else:
+            if numValidated != minSampleSize:
+                continue  # The error rate can only go over maxErrorRate after a failure or when the sample is big enough.
+
+        if (
+            maxErrorRate is not None
+            and numValidated >= minSampleSize
+            and batchResult.numFailed > maxErrorRate * numValidated
+        ):
+            batchResult.aborted, batchResult.abortReason = True, "maxErrorRate"
+            break
+
+    batchResult.numValidated = numValidated
+    return batchResult
+
+
+def _validateChunk(validator, values, start, validatorArgs):
+    # type: (Any, Sequence[Any], int, Dict[str, Any]) -> Tuple[List[Any], List[Tuple[int, ValidationException]]]
+    """Returns the results and the (index, ValidationException) failures of
+    validating values with validator, for validateBatchThreaded(). The
+    indexes are numbered from start."""
+    results = []  # type: List[Any]
+    failures = []  # type: List[Tuple[int, ValidationException]]
+    for index, value in enumerate(values, start):
+        try:
+            results.append(validator(value, **validatorArgs))
+        except ValidationException as exc:
+            results.append(None)
+            failures.append((index, exc))
+    return results, failures
+
+
+def validateBatchThreaded(values, validator, numThreads=None, chunkSize=1000, executor=None, **validatorArgs):
+    # type: (Any, Any, Optional[int], int, Any, Any) -> BatchResult
+    """Like validateBatch(), but the values are split into chunks of
+    chunkSize values that are validated by a pool of numThreads threads.
+    Returns a BatchResult with the results and failures in the same order
+    as validateBatch() (every value is validated, there's no early exit).
+    The chunks are validated with the useLang() and useRegexEngine()
+    settings of the calling thread.
+
+    The validators don't share any state that changes between calls, so
+    they can be called from many threads at once. On free-threaded Python
+    builds, the threads run in parallel. On builds with a global
+    interpreter lock, only one thread runs Python code at a time, so this
+    won't be faster than validateBatch() unless validator releases the lock.
+
+    * values (Iterable): The values to validate.
+    * validator (function): The validation function to call on each value.
+    * numThreads (int, None): The number of threads. Defaults to os.cpu_count().
+    * chunkSize (int): The number of values each thread validates at a time. Defaults to 1000.
+    * executor (concurrent.futures.Executor, None): An executor to run the chunks in, such as a ThreadPoolExecutor that's reused for many batches. If given, numThreads is ignored.
+    * validatorArgs: Any other keyword arguments are passed to validator, i.e. min=0.
+
+    >>> import pysimplevalidate as pysv
+    >>> values = ['1', 'two', '3', '400']
+    >>> result = pysv.validateBatchThreaded(values, pysv.validateInt, numThreads=2, chunkSize=2, max=100)
+    >>> result.results
+    [1, None, 3, None]
+    >>> result.failureCounts
+    {'NOT_INT': 1, 'NUM_MAX': 1}
+    """
+    _validateParamsFor_validateBatch(validator)
+    if numThreads is not None and (not isinstance(numThreads, int) or numThreads < 1):
+        raise PySimpleValidateException("numThreads argument must be a positive int or None")
+    if not isinstance(chunkSize, int) or chunkSize < 1:
+        raise PySimpleValidateException("chunkSize argument must be a positive int")
+
+    if not isinstance(values, SEQUENCE_ABC):
+        values = list(values)
+    if executor is None:
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=numThreads or os.cpu_count() or 1) as pool:
+            return validateBatchThreaded(values, validator, chunkSize=chunkSize, executor=pool, **validatorArgs)
+
+    # Each chunk runs in a copy of this thread's context, so it's validated with the useLang() and useRegexEngine()
+    # settings of this thread rather than those of the executor's thread.
+    futures = [
+        executor.submit(_contextRunner(), _validateChunk, validator, values[i : i + chunkSize], i, validatorArgs)
+        for i in range(0, len(values), chunkSize)
+    ]
+
+    batchResult = BatchResult()
+    for future in futures:
+        results, failures = future.result()
+        batchResult.results.extend(results)
+        for index, exc in failures:
+            batchResult._addFailure(index, exc)
+    batchResult.numValidated = len(values)
+    return batchResult
+
+
+class RecordSchema(object):
+    """The validation rules for the fields of records, such as the rows of
+    a CSV file read with csv.DictReader, where some fields depend on
+    others. For example, the valid days depend on the year and month
+    fields, and the valid ZIP codes depend on the state field.
+
+    Add a rule for each field with addField(), then validate records with
+    validateRecord() or validateRecords(). The fields are validated in
+    dependency order: a field is validated after the fields it depends on,
+    and is passed their validated values. If a field it depends on fails,
+    the field isn't validated.
+
+    A field's derive function computes extra validator arguments from the
+    values of the fields it depends on. Its results are memoized for each
+    combination of those values, so a million rows from the same month
+    only call it once. Up to maxMemoSize results are kept for each field.
+
+    >>> import pysimplevalidate as pysv
+    >>> schema = pysv.RecordSchema()
+    >>> schema.addField('day', pysv.validateDayOfMonth, dependsOn=['year', 'month'])
+    >>> schema.addField('year', pysv.validateInt, min=1900, max=2100)
+    >>> schema.addField('month', pysv.validateInt, min=1, max=12)
+    >>> schema.addField('zip', pysv.validatePostalCode, dependsOn={'state': 'state'})
+    >>> schema.addField('state', pysv.validateUSState)
+    >>> record = {'year': '2019', 'month': '2', 'day': '29', 'state': 'ca', 'zip': '90210'}
+    >>> values, errors = schema.validateRecord(record)
+    >>> values
+    {'year': 2019, 'month': 2, 'state': 'CA', 'zip': '90210'}
+    >>> errors
+    {'day': ValidationException("'29' is not a day in the month of February 2019.", code='NOT_DAY_OF_MONTH')}
+    """
+
+    def __init__(self, maxMemoSize=10000):
+        # type: (int) -> None
+        if not isinstance(maxMemoSize, int) or maxMemoSize < 0:
+            raise PySimpleValidateException("maxMemoSize argument must be a non-negative int")
+        self.maxMemoSize = maxMemoSize
+        self._fields = {}  # type: Dict[str, Tuple[Any, Dict[str, Any], Tuple[Tuple[str, str], ...], Any]]
+        self._fieldNames = []  # type: List[str]  # In the order they were added.
+        self._order = None  # type: Optional[List[str]]  # The dependency order, computed by _getOrder().
+        self._memos = {}  # type: Dict[str, Dict[Tuple[Any, ...], Dict[str, Any]]]
+
+    def addField(self, name, validator, dependsOn=None, derive=None, **validatorArgs):
+        # type: (str, Any, Any, Any, Any) -> None
+        """Adds the validation rule for the field name, replacing any earlier rule for it.
+
+        * name (str): The field's key in the records.
+        * validator (function): The validation function for the field's value, such as validateInt.
+        * dependsOn (Sequence, Mapping, None): The fields this field depends on. A mapping maps the keyword argument names for validator (or derive) to field names. A sequence of field names uses the field names as the argument names.
+        * derive (function, None): If not None, this is called with the dependency values as keyword arguments, and returns a dict of keyword arguments for validator instead of passing the dependency values to validator. Its results are memoized.
+        * validatorArgs: Any other keyword arguments are passed to validator, i.e. min=0.
+        """
+        if not isinstance(name, str):
+            raise PySimpleValidateException("name argument must be a str")
+        if not callable(validator):
+            raise PySimpleValidateException("validator argument must be a function")
+        if derive is not None and not callable(derive):
+            raise PySimpleValidateException("derive argument must be a function or None")
+        if dependsOn is None:
+            dependencies = ()  # type: Tuple[Tuple[str, str], ...]
+        elif isinstance(dependsOn, dict):
+            dependencies = tuple(dependsOn.items())
+        elif isinstance(dependsOn, SEQUENCE_ABC) and not isinstance(dependsOn, str):
+            dependencies = tuple((fieldName, fieldName) for fieldName in dependsOn)
+        else:
+            raise PySimpleValidateException("dependsOn argument must be a sequence or dict of field names, or None")
+        for argName, fieldName in dependencies:
+            if not isinstance(argName, str) or not isinstance(fieldName, str):
+                raise PySimpleValidateException("dependsOn argument must be a sequence or dict of field names, or None")
+
+        if name not in self._fields:
+            self._fieldNames.append(name)
+        self._fields[name] = (validator, validatorArgs, dependencies, derive)
+        self._memos[name] = {}
+        self._order = None
+
+    def _getOrder(self):
+        # type: () -> List[str]
+        """Returns the field names in dependency order, sorting them the first
+        time it's called after a field is added. Fields that don't depend on
+        each other stay in the order they were added. Raises
+        PySimpleValidateException if a field depends on a field with no
+        rule, or if the dependencies form a cycle."""
+        if self._order is None:
+            dependents = dict((name, []) for name in self._fieldNames)  # type: Dict[str, List[str]]
+            numUnsorted = {}  # type: Dict[str, int]  # The number of each field's dependencies not yet in the order.
+            for name in self._fieldNames:
+                fieldNames = set(fieldName for argName, fieldName in self._fields[name][2])
+                for fieldName in fieldNames:
+                    if fieldName not in self._fields:
+                        raise PySimpleValidateException("field %r depends on %r, which has no rule" % (name, fieldName))
+                    dependents[fieldName].append(name)
+                numUnsorted[name] = len(fieldNames)
+
+            # Kahn's algorithm, taking the ready fields in the order they were added.
+            order = []  # type: List[str]
+            ready = [name for name in self._fieldNames if numUnsorted[name] == 0]
+            while ready:
+                name = ready.pop(0)
+                order.append(name)
+                for dependent in dependents[name]:
+                    numUnsorted[dependent] -= 1
+                    if numUnsorted[dependent] == 0:
+                        ready.append(dependent)
+                ready.sort(key=self._fieldNames.index)
+            if len(order) != len(self._fieldNames):
+                cycle = [name for name in self._fieldNames if numUnsorted[name] > 0]
+                raise PySimpleValidateException("the dependencies of these fields form a cycle: %s" % ", ".join(cycle))
+            self._order = order
+        return self._order
+
+    def _derive(self, name, derive, dependencyArgs):
+        # type: (str, Any, Dict[str, Any]) -> Dict[str, Any]
+        """Returns derive(**dependencyArgs) for the field name, memoized by the dependency values."""
+        key = tuple(dependencyArgs.values())
+        memo = self._memos[name]
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return derive(**dependencyArgs)  # Unhashable dependency values can't be memoized.
+        derived = derive(**dependencyArgs)
+        if len(memo) >= self.maxMemoSize:
+            memo.clear()
+        if self.maxMemoSize > 0:
+            memo[key] = derived
+        return derived
+
+    def validateRecord(self, record):
+        # type: (Any) -> Tuple[Dict[str, Any], Dict[str, ValidationException]]
+        """Validates the fields of record, a mapping of field names to values.
+        A field that's missing from record is validated as a blank string.
+
+        Returns a tuple of two dicts: the validated value of each field that
+        passed, and the ValidationException of each field that failed.
+        Fields that weren't validated because a field they depend on failed
+        are in neither dict."""
+        values = {}  # type: Dict[str, Any]
+        errors = {}  # type: Dict[str, ValidationException]
+        for name in self._getOrder():
+            validator, validatorArgs, dependencies, derive = self._fields[name]
+            if dependencies:
+                if any(fieldName not in values for argName, fieldName in dependencies):
+                    continue  # A field this depends on failed.
+                dependencyArgs = dict((argName, values[fieldName]) for argName, fieldName in dependencies)
+                validatorArgs = dict(validatorArgs)
+            try:
+                if dependencies:
+                    validatorArgs.update(self._derive(name, derive, dependencyArgs) if derive else dependencyArgs)
+                values[name] = validator(record.get(name, ""), **validatorArgs)
+            except ValidationException as exc:
+                errors[name] = exc
+        return values, errors
+
+    def validateRecords(self, records):
+        # type: (Any) -> Iterator[Tuple[Dict[str, Any], Dict[str, ValidationException]]]
+        """Yields the (values, errors) tuple from validateRecord() for each
+        record in records, such as a csv.DictReader. The dependency order is
+        only worked out once, and the derive results are shared by all the
+        records."""
+        self._getOrder()
+        for record in records:
+            yield self.validateRecord(record)
+
+
+# The number of calls between the times an adaptive CombinedValidator re-sorts its validators.
+_ADAPT_INTERVAL = 256  # type: int
+
+# The combinator options that anyOf(), allOf(), and then() accept, and their defaults.
+_COMBINATOR_OPTIONS = {
+    "blank": False,
+    "strip": None,
+    "allowRegexes": None,
+    "blockRegexes": None,
+    "excMsg": None,
+    "adaptive": False,
+}  # type: Dict[str, Any]
+
+
+class CombinedValidator(object):
+    """A validator made of other validators by anyOf(), allOf(), or then().
+    Call it with a value like any other validation function. The combined
+    validator's blank, strip, allowRegexes, and blockRegexes checks are done
+    first, and then the validators are called with the prevalidated value.
+    Each validator still does these checks itself with its own arguments,
+    such as stripping whitespace by default.
+
+    If adaptive is True, anyOf() and allOf() validators keep track of how
+    often each validator passes and how long it takes, and every
+    _ADAPT_INTERVAL calls they re-sort the validators so the one most likely
+    to decide the result for the least time goes first. The order attribute
+    is the validators in the order they're called.
+    """
+
+    def __init__(self, mode, validators, options):
+        # type: (str, Sequence[Any], Dict[str, Any]) -> None
+        for name in options:
+            if name not in _COMBINATOR_OPTIONS or (name == "adaptive" and mode == "then"):
+                raise PySimpleValidateException("%s() got an unexpected keyword argument %r" % (mode, name))
+        options = dict(_COMBINATOR_OPTIONS, **options)
+        if not validators:
+            raise PySimpleValidateException("%s() needs at least one validator" % (mode,))
+        for validator in validators:
+            if not callable(validator):
+                raise PySimpleValidateException("validators must be functions")
+        if not isinstance(options["adaptive"], bool):
+            raise PySimpleValidateException("adaptive argument must be a bool")
+        _validateGenericParameters(options["blank"], options["strip"], options["allowRegexes"], options["blockRegexes"])
+
+        self.mode = mode  # type: str
+        self.validators = tuple(validators)  # type: Tuple[Any, ...]
+        self.blank = options["blank"]  # type: bool
+        self.strip = options["strip"]  # type: Union[None, str, bool]
+        self.allowRegexes = options["allowRegexes"]  # type: Any
+        self.blockRegexes = options["blockRegexes"]  # type: Any
+        self.excMsg = options["excMsg"]  # type: Optional[str]
+        self.adaptive = options["adaptive"]  # type: bool
+
+        # The indexes of the validators in the order they're called. It's replaced, not changed, so
+        # other threads calling this validator always see a complete order.
+        self._order = list(range(len(validators)))  # type: List[int]
+
+        # The number of calls, the number of passes, and the total seconds for each validator. These are
+        # updated without a lock, so they can be a little off when many threads share the validator.
+        self._calls = [0] * len(validators)  # type: List[int]
+        self._passes = [0] * len(validators)  # type: List[int]
+        self._seconds = [0.0] * len(validators)  # type: List[float]
+        self._untilReorder = _ADAPT_INTERVAL  # type: int
+
+    @property
+    def order(self):
+        # type: () -> Tuple[Any, ...]
+        return tuple(self.validators[index] for index in self._order)
+
+    def __repr__(self):
+        # type: () -> str
+        names = ", ".join(getattr(validator, "__name__", repr(validator)) for validator in self.validators)
+        return "<CombinedValidator %s(%s)>" % (self.mode, names)
+
+    def _call(self, index, value):
+        # type: (int, Any) -> Any
+        """Returns the result of the validator at index for value, timing it
+        if this validator is adaptive. Raises its ValidationException."""
+        if not self.adaptive:
+            return self.validators[index](value)
+        self._calls[index] += 1
+        startTime = time.perf_counter()
+        try:
+            result = self.validators[index](value)
+        finally:
+            self._seconds[index] += time.perf_counter() - startTime
+        self._passes[index] += 1
+        return result
+
+    def _reorder(self):
+        # type: () -> None
+        """Sorts the validators by their average seconds per call divided by
+        the chance they decide the result: passing for anyOf(), failing for
+        allOf(). Validators that tie stay in the order they were given."""
+        self._untilReorder = _ADAPT_INTERVAL
+
+        def costPerDecision(index):
+            # type: (int) -> float
+            calls, passes = self._calls[index], self._passes[index]
+            decided = passes if self.mode == "anyOf" else calls - passes
+            averageSeconds = self._seconds[index] / calls if calls else 0.0
+            return averageSeconds * (calls + 2) / (decided + 1)  # The +1 and +2 keep untried validators in the running.
+
+        self._order = sorted(range(len(self.validators)), key=costPerDecision)
+
+    def __call__(self, value):
+        # type: (Any) -> Any
+        returnNow, value = _prevalidationCheck(
+            value, self.blank, self.strip, self.allowRegexes, self.blockRegexes, self.excMsg
+        )
+        if returnNow:
+            return value
+
+        if self.adaptive:
+            self._untilReorder -= 1
+            if self._untilReorder <= 0:
+                self._reorder()
+
+        try:
+            if self.mode == "then":
+                for index in self._order:
+                    value = self._call(index, value)
+                return value
+
+            if self.mode == "allOf":
+                results = [None] * len(self.validators)  # type: List[Any]
+                tried = [False] * len(self.validators)  # type: List[bool]
+                for index in self._order:
+                    try:
+                        results[index] = self._call(index, value)
+                    except ValidationException:
+                        # The validators given before this one that haven't been tried yet could also fail the
+                        # value, and the first of them that does is reported, so the exception doesn't depend on
+                        # the adaptive order.
+                        for earlierIndex in range(index):
+                            if not tried[earlierIndex]:
+                                self._call(earlierIndex, value)
+                        raise
+                    tried[index] = True
+                return results[0]
+        except ValidationException as exc:
+            if self.excMsg is None:
+                raise
+            raise ValidationException(str(self.excMsg), exc.code, exc.params)
+
+        # The mode is "anyOf".
+        errors = [None] * len(self.validators)  # type: List[Any]
+        for index in self._order:
+            try:
+                result = self._call(index, value)
+            except ValidationException as exc:
+                errors[index] = exc
+                continue
+            # The validators given before this one that haven't been tried yet could also pass the value, and the
+            # first of them that does decides the result, so the result doesn't depend on the adaptive order.
+            for earlierIndex in range(index):
+                if errors[earlierIndex] is None:
+                    try:
+                        return self._call(earlierIndex, value)
+                    except ValidationException as exc:
+                        errors[earlierIndex] = exc
+            return result
+        _raiseValidationException(None, self.excMsg, "NOT_ANY_OF", {"value": value, "errors": errors})
+
+
+def anyOf(*validators, **options):
+    # type: (Any, Any) -> CombinedValidator
+    """Returns a CombinedValidator that passes a value if any of the
+    validators pass it, and returns the result of the first one that does.
+    This replaces a stack of try/except ValidationException blocks. If every
+    validator fails, it raises a ValidationException with the code
+    'NOT_ANY_OF', whose params['errors'] has each validator's exception.
+
+    The keyword arguments are blank, strip, allowRegexes, blockRegexes, and
+    excMsg, which work like they do for the validation functions, and
+    adaptive. If adaptive is True, the validators are re-sorted now and
+    then so the one that passes the most values for the least time is tried
+    first. The result is still that of the first validator in the given
+    order that passes: when a validator passes, the validators given before
+    it that haven't been tried yet are tried first. So adaptive saves the
+    most time when a value can't pass more than one of the validators, such
+    as validateIPv4 and validateIPv6.
+
+    * validators (functions): The validation functions, such as pysv.validateInt. Use functools.partial() to give them arguments.
+
+    >>> import pysimplevalidate as pysv
+    >>> validateIntOrYesNo = pysv.anyOf(pysv.validateInt, pysv.validateYesNo)
+    >>> validateIntOrYesNo(' 42 '), validateIntOrYesNo('y')
+    (42, 'yes')
+    >>> validateIntOrYesNo('maybe')
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: 'maybe' did not pass any of the validators.
+    """
+    return CombinedValidator("anyOf", validators, options)
+
+
+def allOf(*validators, **options):
+    # type: (Any, Any) -> CombinedValidator
+    """Returns a CombinedValidator that passes a value only if all of the
+    validators pass it, and returns the first validator's result. If a
+    validator fails, its ValidationException is raised and the rest aren't
+    called.
+
+    The keyword arguments are the same as anyOf()'s. If adaptive is True,
+    the validators are re-sorted now and then so the one that fails the
+    most values for the least time is called first. The exception is still
+    that of the first validator in the given order that fails: when a
+    validator fails, the validators given before it that haven't been tried
+    yet are tried first.
+
+    * validators (functions): The validation functions, such as pysv.validateInt. Use functools.partial() to give them arguments.
+
+    >>> import functools
+    >>> import pysimplevalidate as pysv
+    >>> validateOddInt = pysv.allOf(pysv.validateInt, functools.partial(pysv.validateRegex, regex=r'[13579]$'))
+    >>> validateOddInt('43')
+    43
+    >>> validateOddInt('42')
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: '42' does not match the specified pattern.
+    """
+    return CombinedValidator("allOf", validators, options)
+
+
+def then(*validators, **options):
+    # type: (Any, Any) -> CombinedValidator
+    """Returns a CombinedValidator that passes a value through each of the
+    validators in turn, so each one validates the result of the one before
+    it, and returns the last validator's result. If a validator fails, its
+    ValidationException is raised.
+
+    The keyword arguments are blank, strip, allowRegexes, blockRegexes, and
+    excMsg, which apply to the value before the first validator.
+
+    * validators (functions): The validation functions, such as pysv.validateInt. Use functools.partial() to give them arguments.
+
+    >>> import functools
+    >>> import pysimplevalidate as pysv
+    >>> validateHalf = pysv.then(pysv.validateInt, functools.partial(pysv.validateChoice, choices=['0', '50', '100']))
+    >>> validateHalf('50')
+    '50'
+    """
+    return CombinedValidator("then", validators, options)
+
+
+def warmup(patterns=None, dateFormats=None, langs=None, regexEngine=None):
+    # type: (Any, Optional[Sequence[str]], Optional[Sequence[str]], Union[None, str, RegexEngine]) -> None
+    """Does the work that the validators otherwise do the first time they're
+    called: loads the data tables and builds their indexes, compiles the
+    built-in patterns for the regex engine, compiles the date and time
+    formats, loads the translation catalogs, and analyzes and compiles the
+    patterns argument's patterns. The compiled patterns are kept for the
+    life of the process, however many there are, while other patterns are
+    only kept in caches of a few hundred patterns.
+
+    Call this in a parent process before it forks its worker processes,
+    such as a preforking server or multiprocessing with the 'fork' start
+    method, so the workers start with this work done and share its memory
+    copy-on-write. Calling gc.freeze() afterwards stops the garbage
+    collector from writing to (and so copying) these objects in the workers.
+    To also skip compiling thousands of patterns in the parent, load them
+    from a PatternBundle.
+
+    * patterns (Iterable, PatternBundle, None): The allowRegexes and blockRegexes patterns the workers will use: str or re patterns, (pattern, response) tuples, or all of a PatternBundle's rule sets.
+    * dateFormats (Sequence, None): The strptime() formats to compile, besides the default formats of validateDate(), validateTime(), and validateDatetime().
+    * langs (Sequence, None): The languages whose translation catalogs are loaded. Defaults to the current language (see getLang()).
+    * regexEngine (RegexEngine, str, None): The engine to compile the patterns for. Defaults to the current engine (see getRegexEngine()).
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.warmup(patterns=[r'.*casino.*', (r'^admin', 'Reserved name.')], dateFormats=['%d.%m.%Y'])
+    """
+    engine = getRegexEngine() if regexEngine is None else _toRegexEngine(regexEngine)
+    if isinstance(patterns, PatternBundle):
+        patterns = [rule for name in patterns for rule in patterns[name]]
+    if isinstance(patterns, (str, RE_PATTERN_TYPE)) or isinstance(dateFormats, str) or isinstance(langs, str):
+        raise PySimpleValidateException("patterns, dateFormats, and langs arguments must be sequences of items")
+
+    for lang in [getLang()] if langs is None else langs:
+        _getCatalog(lang)
+
+    for name in _ENUM_SOURCES:
+        _getEnumIndex(name)
+    for country, pattern, template in _loadDataTable("postal_codes.tsv"):
+        _getPostalCodeRule(country)
+    _getZIP3Tables()
+    _getPhoneTables()
+
+    for regex in (DECIMAL_REGEX, ZERO_FRACTION_INT_REGEX, IPV4_REGEX, IPV6_REGEX, URL_REGEX, EMAIL_REGEX):
+        _compilePattern(regex, 0, engine)
+        _getJoinedScanRegex(regex)
+
+    # Each date and time validator tries all of its default formats on a value that matches none of them.
+    for validator in (validateDate, validateTime, validateDatetime):
+        try:
+            validator("-")
+        except ValidationException:
+            pass
+    for timeFormat in dateFormats or ():
+        try:
+            _strptime("-", timeFormat)
+        except ValueError:
+            pass
+
+    for rule in patterns or ():
+        regex = rule[0] if isinstance(rule, tuple) else rule
+        if isinstance(regex, (str, RE_PATTERN_TYPE)):
+            _getReDoSRisk(regex)
+            _getLiteralPrefilter(regex)
+            _compilePattern(regex, 0, engine, keep=True)
+
+
+class SlowInputLog(object):
+    """Records the validations that take threshold seconds or longer, when
+    set with setSlowInputLog(), to find the values (and the patterns) that
+    cause latency spikes. Only the last maxRecords records are kept.
+
+    Each record is a dict with these keys:
+
+    * 'validator' (str): The validation function's name, such as 'validateEmail'.
+    * 'args' (dict): The arguments it was called with that aren't their default values, besides value.
+    * 'value' (str): The value, truncated to MAX_ERROR_STR_LEN characters like in error messages.
+    * 'seconds' (float): How long the validation took.
+    * 'regex' (str, None): The regex that was running when the validation went over threshold, or None.
+    * 'format' (str, None): The strptime() format that was being parsed when it went over threshold, or None.
+    * 'timestamp' (float): When the validation finished, in seconds since the epoch.
+
+    >>> import pysimplevalidate as pysv
+    >>> log = pysv.SlowInputLog(threshold=0.0)
+    >>> pysv.setSlowInputLog(log)
+    >>> pysv.validateRegex('cat', r'c.t', blank=True)
+    'cat'
+    >>> pysv.setSlowInputLog(None)
+    >>> record = log.records[0]
+    >>> record['validator'], record['args'], record['value'], record['regex']
+    ('validateRegex', {'regex': 'c.t', 'blank': True}, 'cat', 'c.t')
+    """
+
+    def __init__(self, threshold=0.01, maxRecords=1000):
+        # type: (float, int) -> None
+        if not isinstance(threshold, (int, float)) or isinstance(threshold, bool) or threshold < 0:
+            raise PySimpleValidateException("threshold argument must be a non-negative number of seconds")
+        if not isinstance(maxRecords, int) or maxRecords < 1:
+            raise PySimpleValidateException("maxRecords argument must be a positive int")
+        self.threshold = threshold  # type: float
+        self.maxRecords = maxRecords  # type: int
+        self._records = collections.deque(maxlen=maxRecords)  # type: Any
+
+    @property
+    def records(self):
+        # type: () -> List[Dict[str, Any]]
+        """The records, oldest first."""
+        return list(self._records)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._records)
+
+    def clear(self):
+        # type: () -> None
+        self._records.clear()
+
+    def dumps(self, indent=None):
+        # type: (Optional[int]) -> str
+        """Returns the records as a JSON array. Arguments that JSON has no type
+        for, such as regex objects, are written as their repr()."""
+        return json.dumps(self.records, default=repr, indent=indent)
+
+    def dump(self, fileObj, indent=None):
+        # type: (Any, Optional[int]) -> None
+        """Writes the records to the text file object fileObj as a JSON array."""
+        fileObj.write(self.dumps(indent))
+
+
+# The log set with setSlowInputLog(), or None if slow inputs aren't being recorded.
+_slowInputLog = None  # type: Optional[SlowInputLog]
+
+
+class _SlowInputState(threading.local):
+    """The timing of the validation running in each thread. A validation
+    doesn't await anything, so a thread-local also works for asyncio tasks."""
+
+    startTime = None  # type: Optional[float]  # None when no timed validation is running.
+    step = None  # type: Optional[Tuple[str, Any]]  # The ('regex' or 'format', pattern) that's running.
+    stepStart = 0.0  # type: float
+    culprit = None  # type: Optional[Tuple[str, Any]]  # The step that was running when the threshold was crossed.
+
+
+_slowInputState = _SlowInputState()
+
+
+def _slowInputStep(kind=None, pattern=None):
+    # type: (Optional[str], Any) -> None
+    """Ends the current step of the timed validation running in this thread,
+    noting it as the culprit if the validation went over the threshold
+    during it, and starts the step (kind, pattern) if kind isn't None.
+    The validators call this around the regexes and formats they run when
+    _slowInputLog isn't None."""
+    state = _slowInputState
+    log = _slowInputLog
+    if state.startTime is None or log is None:
+        return
+    now = time.perf_counter()
+    if state.step is not None and state.culprit is None and now - state.startTime >= log.threshold:
+        state.culprit = state.step
+    state.step = None if kind is None else (kind, getattr(pattern, "pattern", pattern))
+    state.stepStart = now
+
+
+def _timeValidation(validator, args, kwargs):
+    # type: (Any, Tuple[Any, ...], Dict[str, Any]) -> Any
+    """Returns validator(*args, **kwargs), adding a record to _slowInputLog
+    if the call takes its threshold or longer. The validators decorated with
+    _timeValidated() call this when _slowInputLog is set and no timed
+    validation is already running in this thread, so validators called by
+    another validator, such as validateRegex() by validateIP(), are part of
+    the outer validator's record."""
+    log = _slowInputLog
+    state = _slowInputState
+    state.startTime = startTime = time.perf_counter()
+    state.step = state.culprit = None
+    try:
+        return validator(*args, **kwargs)
+    finally:
+        _slowInputStep()
+        seconds = time.perf_counter() - startTime
+        culprit = state.culprit
+        state.startTime = None
+        if log is not None and seconds >= log.threshold:
+            _addSlowInputRecord(log, validator, args, kwargs, seconds, culprit)
+
+
+def _addSlowInputRecord(log, validator, args, kwargs, seconds, culprit):
+    # type: (SlowInputLog, Any, Tuple[Any, ...], Dict[str, Any], float, Optional[Tuple[str, Any]]) -> None
+    """Adds a record of the validator's call to log. The record's args are
+    the arguments that aren't their default values."""
+    signature = inspect.signature(validator)
+    try:
+        arguments = signature.bind(*args, **kwargs).arguments
+    except TypeError:
+        return  # The validator was called with the wrong arguments, so it raised a TypeError instead.
+    parameters = signature.parameters
+    config = dict(
+        (name, arg) for name, arg in arguments.items() if name != "value" and arg is not parameters[name].default
+    )
+    log._records.append(
+        {
+            "validator": validator.__name__,
+            "args": config,
+            "value": _errstr(arguments["value"]),
+            "seconds": seconds,
+            "regex": culprit[1] if culprit is not None and culprit[0] == "regex" else None,
+            "format": culprit[1] if culprit is not None and culprit[0] == "format" else None,
+            "timestamp": time.time(),
+        }
+    )
+
+
+def getSlowInputLog():
+    # type: () -> Optional[SlowInputLog]
+    """Returns the SlowInputLog set with setSlowInputLog(), or None."""
+    return _slowInputLog
+
+
+def setSlowInputLog(log):
+    # type: (Optional[SlowInputLog]) -> None
+    """Starts recording the validations that take log.threshold seconds or
+    longer in log, a SlowInputLog, or stops recording if log is None.
+
+    While a log is set, each call to this module's validate*() functions
+    that take a value is timed, however the function was imported. When no
+    log is set, a validator only checks that there isn't one, so recording
+    costs next to nothing until it's turned on.
+
+    * log (SlowInputLog, None): The log to record slow validations in, or None to stop recording.
+    """
+    global _slowInputLog
+    if log is not None and not isinstance(log, SlowInputLog):
+        raise PySimpleValidateException("log argument must be a SlowInputLog or None")
+    _slowInputLog = log
+
+
+# Blocklist and PatternBundle are imported last because their modules import names from this one.
+from pysimplevalidate.blocklist import Blocklist  # noqa: E402
+from pysimplevalidate.bundle import PatternBundle  # noqa: E402
+
+# The ReDoS analyzer and the literal prefilter share the pike engine's regex parser, so they're in
+# modules of their own.
+from pysimplevalidate.redos import analyzeRegex, rewriteRegex  # noqa: E402
+from pysimplevalidate.literals import LiteralPrefilter, literalPrefilter  # noqa: E402
+
+# The asyncio stream validator uses async generators, which need Python 3.6 or later.
+if sys.version_info >= (3, 6):
+    from pysimplevalidate.aio import validateStream  # noqa: E402
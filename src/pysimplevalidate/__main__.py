@@ -0,0 +1,372 @@
+# PySimpleValidate
+# By Al Sweigart al@inventwithpython.com
+
+"""The command-line interface, for validating a stream of values:
+
+    $ python -m pysimplevalidate --validator int --min 0 --max 100 scores.txt > valid.txt 2> invalid.txt
+    $ cat emails.txt | python -m pysimplevalidate --validator email --jobs 4 --rejects bad.txt --stats
+
+Each line of the input files (or stdin, if no files or "-" are given) is
+validated. The accepted values, as returned by the validation function, are
+written to stdout and the rejected lines are written unchanged to stderr or
+to the --rejects file. The exit code is 0 if every value was accepted, 1 if
+any were rejected, and 2 for bad arguments.
+
+The input is read and written in large chunks, and with --jobs the chunks
+are validated by a pool of worker processes. The output is always in the
+same order as the input.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import collections
+import inspect
+import multiprocessing
+import sys
+import time
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pysimplevalidate as pysv
+
+# The --validator names and the validation function each one uses.
+VALIDATORS = collections.OrderedDict(
+    [
+        ("str", "validateStr"),
+        ("num", "validateNum"),
+        ("int", "validateInt"),
+        ("float", "validateFloat"),
+        ("decimal", "validateDecimal"),
+        ("choice", "validateChoice"),
+        ("time", "validateTime"),
+        ("date", "validateDate"),
+        ("datetime", "validateDatetime"),
+        ("filename", "validateFilename"),
+        ("filepath", "validateFilepath"),
+        ("ip", "validateIP"),
+        ("ipv4", "validateIPv4"),
+        ("ipv6", "validateIPv6"),
+        ("regex", "validateRegex"),
+        ("regexstr", "validateRegexStr"),
+        ("url", "validateURL"),
+        ("email", "validateEmail"),
+        ("yesno", "validateYesNo"),
+        ("bool", "validateBool"),
+        ("state", "validateUSState"),
+        ("caprovince", "validateCAProvince"),
+        ("country", "validateCountry"),
+        ("currency", "validateCurrency"),
+        ("phone", "validatePhone"),
+        ("postalcode", "validatePostalCode"),
+        ("month", "validateMonth"),
+        ("dayofweek", "validateDayOfWeek"),
+    ]
+)  # type: collections.OrderedDict
+
+# The command-line options that are passed to the validation function, and the keyword argument for each one.
+VALIDATOR_OPTIONS = (
+    ("blank", "blank"),
+    ("strip", "strip"),
+    ("allow_regex", "allowRegexes"),
+    ("block_regex", "blockRegexes"),
+    ("min", "min"),
+    ("max", "max"),
+    ("less_than", "lessThan"),
+    ("greater_than", "greaterThan"),
+    ("max_digits", "maxDigits"),
+    ("max_scale", "maxScale"),
+    ("choice", "choices"),
+    ("format", "formats"),
+    ("regex", "regex"),
+    ("platform", "platform"),
+    ("default_region", "defaultRegion"),
+    ("country", "country"),
+    ("state", "state"),
+)
+
+# The number of bytes of input in each chunk that is validated at once.
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # type: int
+
+# The validation function and keyword arguments used by _validateChunk(), set by _initWorker().
+_workerValidator = None  # type: Any
+_workerKwargs = {}  # type: Dict[str, Any]
+_workerEncoding = "utf-8"  # type: str
+
+
+def _number(text):
+    # type: (str) -> Any
+    """Converts a command-line argument to an int, or a float if it isn't an int."""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError("%r is not a number" % (text,))
+
+
+def _functionParams(func):
+    # type: (Any) -> Tuple[str, ...]
+    """Returns the names of the parameters of func. For a decorated function, these are the parameters of the
+    function it wraps."""
+    return tuple(inspect.signature(func).parameters)
+
+
+def _makeParser():
+    # type: () -> argparse.ArgumentParser
+    parser = argparse.ArgumentParser(
+        prog="python -m pysimplevalidate",
+        description="Validate each line of the input files (or stdin). Accepted values are written to stdout "
+        "and rejected lines are written to stderr (or the --rejects file).",
+    )
+    parser.add_argument("files", nargs="*", default=["-"], help='input files; "-" or no files reads stdin')
+    parser.add_argument(
+        "-v", "--validator", choices=list(VALIDATORS), default="str", help="the validation function to use"
+    )
+
+    group = parser.add_argument_group("validator options")
+    group.add_argument("--blank", action="store_true", help="accept blank values")
+    group.add_argument(
+        "--strip", metavar="CHARS", help="the characters to strip from the ends of values (default: whitespace)"
+    )
+    group.add_argument(
+        "--no-strip", dest="strip", action="store_false", help="don't strip anything from values"
+    )
+    group.add_argument(
+        "--allow-regex", metavar="REGEX", action="append", help="accept values that match REGEX (repeatable)"
+    )
+    group.add_argument(
+        "--block-regex", metavar="REGEX", action="append", help="reject values that match REGEX (repeatable)"
+    )
+    group.add_argument("--min", type=_number, help="the (inclusive) minimum number")
+    group.add_argument("--max", type=_number, help="the (inclusive) maximum number")
+    group.add_argument("--less-than", type=_number, metavar="NUM", help="the (exclusive) maximum number")
+    group.add_argument("--greater-than", type=_number, metavar="NUM", help="the (exclusive) minimum number")
+    group.add_argument("--max-digits", type=int, metavar="N", help="the maximum significant digits of a decimal")
+    group.add_argument("--max-scale", type=int, metavar="N", help="the maximum digits after a decimal point")
+    group.add_argument("--choice", action="append", help="an accepted choice for --validator choice (repeatable)")
+    group.add_argument("--format", action="append", help="a strptime() format for date and time (repeatable)")
+    group.add_argument("--regex", help="the regex for --validator regex")
+    group.add_argument(
+        "--platform",
+        choices=sorted(pysv.FILENAME_RULES),
+        help="the platform whose filename rules --validator filename uses (default: portable)",
+    )
+    group.add_argument(
+        "--default-region", metavar="REGION", help="the region code, such as US, for national phone numbers"
+    )
+    group.add_argument("--country", help="the country of --validator postalcode's postal codes (default: US)")
+    group.add_argument("--state", help="the state that --validator postalcode's ZIP codes must be in")
+
+    group = parser.add_argument_group("input and output")
+    group.add_argument("--rejects", metavar="FILE", help="write rejected lines to FILE instead of stderr")
+    group.add_argument(
+        "--reasons", action="store_true", help="append a tab and the reason to each rejected line"
+    )
+    group.add_argument("--encoding", default="utf-8", help="the encoding of the input and output (default: utf-8)")
+    group.add_argument(
+        "-j", "--jobs", type=int, default=1, help="the number of worker processes (0 for one per CPU; default: 1)"
+    )
+    group.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar="BYTES",
+        help="the bytes of input validated at a time (default: %d)" % DEFAULT_CHUNK_SIZE,
+    )
+    group.add_argument(
+        "--stats", action="store_true", help="write a summary of the throughput and failures to stderr at the end"
+    )
+    return parser
+
+
+def _validatorKwargs(parser, args):
+    # type: (argparse.ArgumentParser, argparse.Namespace) -> Dict[str, Any]
+    """Returns the keyword arguments for the validation function, and exits with an error if the function
+    doesn't accept one of the options that was given."""
+    funcName = VALIDATORS[args.validator]
+    params = _functionParams(getattr(pysv, funcName))
+    kwargs = {}  # type: Dict[str, Any]
+    for optionName, kwargName in VALIDATOR_OPTIONS:
+        optionValue = getattr(args, optionName)
+        if optionValue is None or (optionName == "blank" and not optionValue):
+            continue
+        if kwargName not in params:
+            parser.error(
+                "--%s can't be used with --validator %s" % (optionName.replace("_", "-"), args.validator)
+            )
+        kwargs[kwargName] = optionValue
+    for kwargName in ("choices", "regex"):
+        if kwargName in params and kwargName not in kwargs:
+            parser.error("--validator %s requires --%s" % (args.validator, kwargName.rstrip("s")))
+
+    # Check the arguments now rather than once per line, or once per worker process. Some arguments, such
+    # as a single choice, are only invalid when blank is False, so the real arguments are used.
+    try:
+        getattr(pysv, funcName)("", **kwargs)
+    except pysv.ValidationException:
+        pass  # The arguments are checked before the value is.
+    except pysv.PySimpleValidateException as exc:
+        parser.error(str(exc))
+    return kwargs
+
+
+def _initWorker(funcName, kwargs, encoding):
+    # type: (str, Dict[str, Any], str) -> None
+    global _workerValidator, _workerKwargs, _workerEncoding
+    _workerValidator = getattr(pysv, funcName)
+    _workerKwargs = kwargs
+    _workerEncoding = encoding
+
+
+def _validateChunk(chunk, reasons=False):
+    # type: (bytes, bool) -> Tuple[bytes, bytes, int, Dict[str, int]]
+    """Validates each line of chunk, which must end with a complete line.
+
+    Returns the accepted values, the rejected lines, the number of lines,
+    and the number of failures for each ValidationException code."""
+    lines = chunk.decode(_workerEncoding, "surrogateescape").split("\n")
+    if lines[-1] == "":
+        lines.pop()  # Remove the empty "line" after the final newline.
+    validator, kwargs = _workerValidator, _workerKwargs
+    accepted = []  # type: List[str]
+    rejected = []  # type: List[str]
+    failureCounts = {}  # type: Dict[str, int]
+    for line in lines:
+        if line.endswith("\r"):
+            line = line[:-1]
+        try:
+            returnedValue = validator(line, **kwargs)
+        except pysv.ValidationException as exc:
+            code = exc.code or "UNKNOWN"
+            failureCounts[code] = failureCounts.get(code, 0) + 1
+            rejected.append(line + "\t" + str(exc) if reasons else line)
+            continue
+        accepted.append(returnedValue if isinstance(returnedValue, str) else str(returnedValue))
+
+    acceptedText = "\n".join(accepted) + "\n" if accepted else ""
+    rejectedText = "\n".join(rejected) + "\n" if rejected else ""
+    return (
+        acceptedText.encode(_workerEncoding, "surrogateescape"),
+        rejectedText.encode(_workerEncoding, "surrogateescape"),
+        len(lines),
+        failureCounts,
+    )
+
+
+def _validateChunkWithReasons(chunk):
+    # type: (bytes) -> Tuple[bytes, bytes, int, Dict[str, int]]
+    return _validateChunk(chunk, reasons=True)
+
+
+def _readChunks(filenames, stdin, chunkSize):
+    # type: (List[str], Any, int) -> Iterator[bytes]
+    """Yields chunks of about chunkSize bytes from the files, each ending with a complete line."""
+    for filename in filenames:
+        fo = stdin if filename == "-" else open(filename, "rb")
+        try:
+            while True:
+                # readlines() with a size hint reads whole lines, so no line is split across chunks.
+                lines = fo.readlines(chunkSize)
+                if not lines:
+                    break
+                if not lines[-1].endswith(b"\n"):
+                    lines[-1] += b"\n"  # The last line of a file with no final newline.
+                yield b"".join(lines)
+        finally:
+            if fo is not stdin:
+                fo.close()
+
+
+def _runChunks(chunks, validateChunk, jobs, initArgs):
+    # type: (Iterator[bytes], Any, int, Tuple[Any, ...]) -> Iterator[Tuple[bytes, bytes, int, Dict[str, int]]]
+    """Yields the results of validateChunk() for each chunk, in order, using jobs worker processes."""
+    if jobs == 1:
+        _initWorker(*initArgs)
+        for chunk in chunks:
+            yield validateChunk(chunk)
+        return
+
+    pool = multiprocessing.Pool(jobs, _initWorker, initArgs)
+    try:
+        # Only keep a few chunks per worker in flight, so that a huge input isn't read into memory all at once.
+        pending = collections.deque()  # type: collections.deque
+        for chunk in chunks:
+            pending.append(pool.apply_async(validateChunk, (chunk,)))
+            if len(pending) >= jobs * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+    # type: (Optional[List[str]], Any, Any, Any) -> int
+    """Runs the command-line interface with the arguments in argv (or
+    sys.argv), and returns the exit code. The stdin, stdout, and stderr
+    arguments are binary file objects that default to the standard streams."""
+    parser = _makeParser()
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or more")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be 1 or more")
+    jobs = args.jobs or multiprocessing.cpu_count()
+    kwargs = _validatorKwargs(parser, args)
+
+    stdin = stdin or getattr(sys.stdin, "buffer", sys.stdin)
+    stdout = stdout or getattr(sys.stdout, "buffer", sys.stdout)
+    stderr = stderr or getattr(sys.stderr, "buffer", sys.stderr)
+    rejectsFile = open(args.rejects, "wb") if args.rejects else stderr
+
+    numValues = 0
+    numBytes = [0]  # A list so that countedChunks() can update it.
+    failureCounts = collections.Counter()  # type: collections.Counter
+    startTime = time.time()
+
+    def countedChunks():
+        # type: () -> Iterator[bytes]
+        for chunk in _readChunks(args.files, stdin, args.chunk_size):
+            numBytes[0] += len(chunk)
+            yield chunk
+
+    try:
+        validateChunk = _validateChunkWithReasons if args.reasons else _validateChunk
+        initArgs = (VALIDATORS[args.validator], kwargs, args.encoding)
+        for acceptedBytes, rejectedBytes, chunkNumValues, chunkFailureCounts in _runChunks(
+            countedChunks(), validateChunk, jobs, initArgs
+        ):
+            stdout.write(acceptedBytes)
+            rejectsFile.write(rejectedBytes)
+            numValues += chunkNumValues
+            failureCounts.update(chunkFailureCounts)
+        stdout.flush()
+        rejectsFile.flush()
+    except IOError as exc:
+        parser.exit(2, "%s: error: %s\n" % (parser.prog, exc))
+    finally:
+        if rejectsFile is not stderr:
+            rejectsFile.close()
+    numFailed = sum(failureCounts.values())
+
+    if args.stats:
+        seconds = max(time.time() - startTime, 1e-9)
+        lines = [
+            "%d values, %d accepted, %d rejected (%.2f%%)"
+            % (numValues, numValues - numFailed, numFailed, 100.0 * numFailed / numValues if numValues else 0.0),
+            "%.3f seconds, %.0f values/second, %.1f MB/second" % (seconds, numValues / seconds, numBytes[0] / seconds / 1e6),
+        ]
+        for code, count in failureCounts.most_common():
+            lines.append("  %s: %d" % (code, count))
+        stderr.write(("\n".join(lines) + "\n").encode(args.encoding))
+        stderr.flush()
+
+    return 1 if numFailed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+# PySimpleValidate
+# By Al Sweigart al@inventwithpython.com
+
+"""validateStream(), for validating the lines of an asyncio stream, such as
+the values that a log shipper receives over a TCP or Unix socket. This
+module needs Python 3.6 or later, and is only imported by the
+pysimplevalidate package on those versions.
+
+    >>> import asyncio
+    >>> import pysimplevalidate as pysv
+    >>> async def main(reader):
+    ...     async for line, result, exc in pysv.validateStream(reader, pysv.validateInt, max=100):
+    ...         print(line, result, exc)
+    >>> reader = asyncio.StreamReader()
+    >>> reader.feed_data(b'42\\nforty-two\\n400\\n')
+    >>> reader.feed_eof()
+    >>> asyncio.run(main(reader))
+    42 42 None
+    forty-two None 'forty-two' is not an integer.
+    400 None Number must be at maximum 100.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+
+from typing import Any, AsyncIterator, Optional, Tuple
+
+from pysimplevalidate import PySimpleValidateException, ValidationException, _contextRunner, _validateChunk
+
+# Put in the queue by the reader task when the source runs out of lines.
+_END_OF_STREAM = object()  # type: Any
+
+
+def _decodeLine(line, encoding):
+    # type: (Any, str) -> str
+    """Returns line, a str or bytes line from the source, as a str without its line ending."""
+    if isinstance(line, (bytes, bytearray)):
+        line = line.decode(encoding)
+    return line.rstrip("\r\n")
+
+
+async def _readLines(source, queue, encoding, executor, chunkSize, validator, validatorArgs):
+    # type: (Any, asyncio.Queue, str, Any, int, Any, Any) -> None
+    """Reads the lines of source into queue, then puts _END_OF_STREAM in it.
+    If source raises an exception, the exception is put in the queue instead.
+
+    Without an executor, each queue item is a line. With an executor, the
+    lines are validated in chunks of up to chunkSize lines in the executor,
+    and each queue item is a (lines, future) tuple. A partial chunk is sent
+    when the executor has finished the previous chunk and the queue is
+    empty, so values that trickle in aren't held back waiting for a full
+    chunk. Chunks only fill up while the executor or the caller of
+    validateStream() is busy.
+
+    The chunks run in copies of this task's context, which is a copy of
+    the context validateStream() was called in, so the executor's threads
+    use the caller's useLang() and useRegexEngine() settings."""
+    loop = asyncio.get_event_loop()
+    chunk = []
+    future = None  # The future of the last chunk sent to the executor.
+    try:
+        async for line in source:
+            line = _decodeLine(line, encoding)
+            if executor is None:
+                await queue.put(line)  # Waits while the queue is full, so no more is read from the source.
+                continue
+            chunk.append(line)
+            if len(chunk) >= chunkSize or (queue.empty() and (future is None or future.done())):
+                future = loop.run_in_executor(
+                    executor, _contextRunner(), _validateChunk, validator, chunk, 0, validatorArgs
+                )
+                await queue.put((chunk, future))
+                chunk = []
+        if chunk:
+            future = loop.run_in_executor(
+                executor, _contextRunner(), _validateChunk, validator, chunk, 0, validatorArgs
+            )
+            await queue.put((chunk, future))
+    except Exception as exc:
+        await queue.put(exc)
+        return
+    await queue.put(_END_OF_STREAM)
+
+
+async def validateStream(
+    source, validator, maxQueueSize=1000, executor=None, chunkSize=100, encoding="utf-8", **validatorArgs
+):
+    # type: (Any, Any, int, Any, int, str, Any) -> AsyncIterator[Tuple[str, Any, Optional[ValidationException]]]
+    """An async generator that validates each line of source with the
+    validator function, such as validateInt, and yields a (line, result,
+    exception) tuple for each line, in order. For a line that passes,
+    result is the validator's return value and exception is None. For a
+    line that fails, result is None and exception is the ValidationException.
+
+    The source is an asyncio.StreamReader or any async iterable of str or
+    bytes lines. Bytes lines are decoded with encoding, and the line ending
+    is removed from each line.
+
+    Lines are read ahead into a queue of at most maxQueueSize lines. When
+    the queue is full, no more is read from the source until the caller
+    takes more results, so a slow consumer slows the sender down (for a
+    socket, through TCP flow control) instead of using unbounded memory.
+
+    CPU-heavy validators such as validateDatetime and validateURL can run in
+    executor, a concurrent.futures executor, instead of the event loop's
+    thread. The lines are sent to it in chunks of up to chunkSize lines.
+
+    * source (StreamReader, AsyncIterable): The lines to validate.
+    * validator (function): The validation function to call on each line.
+    * maxQueueSize (int): The maximum number of lines read ahead of the results that have been taken. Defaults to 1000.
+    * executor (concurrent.futures.Executor, None): If not None, the lines are validated in this executor.
+    * chunkSize (int): The maximum number of lines sent to the executor at a time. Defaults to 100.
+    * encoding (str): The encoding of bytes lines. Defaults to 'utf-8'.
+    * validatorArgs: Any other keyword arguments are passed to validator, i.e. min=0.
+    """
+    if not callable(validator):
+        raise PySimpleValidateException("validator argument must be a function")
+    if not isinstance(maxQueueSize, int) or maxQueueSize < 1:
+        raise PySimpleValidateException("maxQueueSize argument must be a positive int")
+    if not isinstance(chunkSize, int) or chunkSize < 1:
+        raise PySimpleValidateException("chunkSize argument must be a positive int")
+    if not hasattr(source, "__aiter__"):
+        raise PySimpleValidateException("source argument must be an asyncio.StreamReader or an async iterable")
+
+    # With an executor, each queue item is a chunk, so the queue holds maxQueueSize lines at most.
+    queue = asyncio.Queue(maxQueueSize if executor is None else max(1, maxQueueSize // chunkSize))  # type: Any
+    reader = asyncio.ensure_future(
+        _readLines(source, queue, encoding, executor, chunkSize, validator, validatorArgs)
+    )
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, Exception):
+                raise item
+
+            if executor is None:
+                try:
+                    result = validator(item, **validatorArgs)
+                except ValidationException as exc:
+                    yield item, None, exc
+                else:
+                    yield item, result, None
+                continue
+
+            lines, future = item
+            results, failures = await future
+            failuresByIndex = dict(failures)
+            for index, line in enumerate(lines):
+                yield line, results[index], failuresByIndex.get(index)
+    finally:
+        # Stop reading if the caller stopped early, such as with a break out of its async for loop.
+        reader.cancel()
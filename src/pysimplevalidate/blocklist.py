@@ -0,0 +1,362 @@
+# PySimpleValidate
+# By Al Sweigart al@inventwithpython.com
+
+"""The Blocklist class, for blocklists with too many literal entries to pass
+as blockRegexes. Exact-match entries are looked up in a hash table and
+substring entries are found with an Aho-Corasick automaton, so checking a
+value takes time proportional to the value's length rather than to the
+number of entries.
+
+A Blocklist can be saved to a file and loaded with mmap, so that many worker
+processes can share the same pages of memory:
+
+    >>> import pysimplevalidate as pysv
+    >>> blocklist = pysv.Blocklist(exact=['admin', ('root', 'Reserved name.')], substrings=['darn'])
+    >>> blocklist.search('root')
+    'Reserved name.'
+    >>> pysv.validateStr('well darn it', blockRegexes=[blocklist])
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: This response is invalid.
+    >>> import os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'names.blocklist')
+    >>> blocklist.save(filename)
+    >>> blocklist = pysv.Blocklist.load(filename)
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import array
+import bisect
+import mmap
+import struct
+import zlib
+
+from typing import Union, Optional, Sequence, Any, List, Dict
+
+from pysimplevalidate import DEFAULT_BLOCKLIST_RESPONSE, PySimpleValidateException
+
+# The first 8 bytes of a saved blocklist file.
+BLOCKLIST_MAGIC = b"PSVBLST1"  # type: bytes
+
+# Written as a native uint32 so that load() can detect a file saved on a machine with a different byte order.
+_BYTE_ORDER_MARK = 0x01020304  # type: int
+
+# The sections of a blocklist file, in order, and the array typecode of each one.
+# All of the integer sections are arrays of unsigned 32-bit ints.
+_SECTIONS = (
+    ("responseOffsets", "I"),  # Start of each response in responseBlob, plus the end of the last one.
+    ("responseBlob", "B"),  # The UTF-8 encoded responses, concatenated.
+    ("exactOffsets", "I"),  # Start of each exact entry in exactBlob, plus the end of the last one.
+    ("exactBlob", "B"),  # The UTF-8 encoded exact entries, concatenated.
+    ("exactResponses", "I"),  # The response index of each exact entry.
+    ("exactSlots", "I"),  # Open-addressing hash table of exact entry index + 1, or 0 for an empty slot.
+    ("transStart", "I"),  # Start of each automaton state's transitions, plus the end of the last state's.
+    ("transChars", "I"),  # The code point of each transition, sorted within each state.
+    ("transTargets", "I"),  # The state each transition goes to.
+    ("failLinks", "I"),  # The failure link of each state.
+    ("outputs", "I"),  # The response index + 1 of the substring entry ending at each state, or 0.
+    ("dictLinks", "I"),  # The nearest state on the failure chain with an output, or 0.
+)
+
+# magic, byte order mark, flags, number of entries, then (offset, length) for each section.
+_HEADER_FORMAT = "=8sIII" + "QQ" * len(_SECTIONS)  # type: str
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)  # type: int
+
+# Set in the header's flags when the entries were case-folded.
+_FLAG_CASE_INSENSITIVE = 1  # type: int
+
+
+def _uint32Array(values):
+    # type: (Any) -> array.array
+    """Returns an array of unsigned 32-bit ints, regardless of the platform's int sizes."""
+    for typecode in ("I", "L"):
+        if array.array(typecode).itemsize == 4:
+            return array.array(typecode, values)
+    raise PySimpleValidateException("this platform has no 32-bit unsigned int array type")
+
+
+def _iterEntries(entries, argName):
+    # type: (Optional[Sequence[Union[str, Sequence[str]]]], str) -> Any
+    """Yields an (entry, response) tuple for each item in entries, which can
+    be a str or a (entry_str, response_str) tuple like the items in blockRegexes."""
+    if entries is None:
+        return
+    for item in entries:
+        if isinstance(item, str):
+            entry, response = item, DEFAULT_BLOCKLIST_RESPONSE
+        else:
+            try:
+                entry, response = item
+            except (TypeError, ValueError):
+                raise PySimpleValidateException(argName + " must be a sequence of str or (str, response_str) tuples")
+            if not isinstance(entry, str) or not isinstance(response, str):
+                raise PySimpleValidateException(argName + " must be a sequence of str or (str, response_str) tuples")
+        if entry == "":
+            raise PySimpleValidateException(argName + " cannot contain blank entries")
+        yield entry, response
+
+
+def _compileBlocklist(exact, substrings, caseSensitive):
+    # type: (Optional[Sequence[Union[str, Sequence[str]]]], Optional[Sequence[Union[str, Sequence[str]]]], bool) -> bytes
+    """Returns the contents of a blocklist file for the given entries. The
+    Blocklist class reads the compiled form directly, whether it's in memory
+    or mapped from a file."""
+    responses = []  # type: List[str]
+    responseIndexes = {}  # type: Dict[str, int]
+
+    def getResponseIndex(response):
+        # type: (str) -> int
+        if response not in responseIndexes:
+            responseIndexes[response] = len(responses)
+            responses.append(response)
+        return responseIndexes[response]
+
+    def normalize(entry):
+        # type: (str) -> str
+        return entry if caseSensitive else entry.casefold()
+
+    # Build the exact-match hash table. When an entry is repeated, the first response is used.
+    exactEntries = {}  # type: Dict[bytes, int]
+    for entry, response in _iterEntries(exact, "exact"):
+        encoded = normalize(entry).encode("utf-8")
+        if encoded not in exactEntries:
+            exactEntries[encoded] = getResponseIndex(response)
+
+    exactOffsets = _uint32Array([0])
+    exactResponses = _uint32Array([])
+    numSlots = 8
+    while numSlots < len(exactEntries) * 2:
+        numSlots *= 2
+    exactSlots = _uint32Array([0]) * numSlots
+    for i, (encoded, responseIndex) in enumerate(exactEntries.items()):
+        exactOffsets.append(exactOffsets[-1] + len(encoded))
+        exactResponses.append(responseIndex)
+        slot = zlib.crc32(encoded) & (numSlots - 1)
+        while exactSlots[slot] != 0:
+            slot = (slot + 1) & (numSlots - 1)  # Linear probing.
+        exactSlots[slot] = i + 1
+    exactBlob = b"".join(exactEntries.keys())
+
+    # Build the Aho-Corasick automaton's trie. State 0 is the root.
+    gotos = [{}]  # type: List[Dict[int, int]]
+    outputs = [0]  # type: List[int]
+    numSubstrings = 0
+    for entry, response in _iterEntries(substrings, "substrings"):
+        numSubstrings += 1
+        state = 0
+        for ch in normalize(entry):
+            nextState = gotos[state].get(ord(ch))
+            if nextState is None:
+                nextState = len(gotos)
+                gotos[state][ord(ch)] = nextState
+                gotos.append({})
+                outputs.append(0)
+            state = nextState
+        if outputs[state] == 0:
+            outputs[state] = getResponseIndex(response) + 1
+
+    # Add the failure and dictionary links in breadth-first order.
+    failLinks = [0] * len(gotos)
+    dictLinks = [0] * len(gotos)
+    queue = list(gotos[0].values())
+    for state in queue:
+        for c, nextState in gotos[state].items():
+            queue.append(nextState)
+            fail = failLinks[state]
+            while fail != 0 and c not in gotos[fail]:
+                fail = failLinks[fail]
+            if c in gotos[fail]:
+                fail = gotos[fail][c]
+            failLinks[nextState] = fail
+            dictLinks[nextState] = fail if outputs[fail] != 0 else dictLinks[fail]
+
+    transStart = _uint32Array([0])
+    transChars = _uint32Array([])
+    transTargets = _uint32Array([])
+    for goto in gotos:
+        for c in sorted(goto):
+            transChars.append(c)
+            transTargets.append(goto[c])
+        transStart.append(len(transChars))
+
+    responseOffsets = _uint32Array([0])
+    encodedResponses = [response.encode("utf-8") for response in responses]
+    for encoded in encodedResponses:
+        responseOffsets.append(responseOffsets[-1] + len(encoded))
+
+    sections = {
+        "responseOffsets": responseOffsets.tobytes(),
+        "responseBlob": b"".join(encodedResponses),
+        "exactOffsets": exactOffsets.tobytes(),
+        "exactBlob": exactBlob,
+        "exactResponses": exactResponses.tobytes(),
+        "exactSlots": exactSlots.tobytes(),
+        "transStart": transStart.tobytes(),
+        "transChars": transChars.tobytes(),
+        "transTargets": transTargets.tobytes(),
+        "failLinks": _uint32Array(failLinks).tobytes(),
+        "outputs": _uint32Array(outputs).tobytes(),
+        "dictLinks": _uint32Array(dictLinks).tobytes(),
+    }
+
+    # Lay out the sections after the header, each one aligned to 8 bytes so they can be cast in place.
+    body = []  # type: List[bytes]
+    offsetsAndLengths = []  # type: List[int]
+    position = _HEADER_SIZE
+    for name, typecode in _SECTIONS:
+        padding = -position % 8
+        body.append(b"\0" * padding)
+        position += padding
+        offsetsAndLengths.extend((position, len(sections[name])))
+        body.append(sections[name])
+        position += len(sections[name])
+
+    flags = 0 if caseSensitive else _FLAG_CASE_INSENSITIVE
+    header = struct.pack(
+        _HEADER_FORMAT, BLOCKLIST_MAGIC, _BYTE_ORDER_MARK, flags, len(exactEntries) + numSubstrings, *offsetsAndLengths
+    )
+    return header + b"".join(body)
+
+
+class Blocklist(object):
+    """A large set of literal blocklist entries, each with an optional
+    response message. Put a Blocklist object in the blockRegexes argument of
+    any validation function to use it alongside (or instead of) regexes:
+
+        pysv.validateStr(username, blockRegexes=[reservedNames, r'^\\d'])
+
+    * exact (Sequence, None): A sequence of str or (str, response_str) tuples. Values that are equal to one of these entries fail validation.
+    * substrings (Sequence, None): A sequence of str or (str, response_str) tuples. Values that contain one of these entries fail validation.
+    * caseSensitive (bool): If False, entries and values are case-folded before being compared. Defaults to True.
+
+    Entries without a response use DEFAULT_BLOCKLIST_RESPONSE.
+    """
+
+    def __init__(self, exact=None, substrings=None, caseSensitive=True):
+        # type: (Optional[Sequence[Union[str, Sequence[str]]]], Optional[Sequence[Union[str, Sequence[str]]]], bool) -> None
+        if not isinstance(caseSensitive, bool):
+            raise PySimpleValidateException("caseSensitive argument must be a bool")
+        self._mmap = None  # type: Optional[mmap.mmap]
+        self._open(_compileBlocklist(exact, substrings, caseSensitive))
+
+    @classmethod
+    def load(cls, filename):
+        # type: (str) -> Blocklist
+        """Returns a Blocklist for a file written by save(). The file is
+        mapped into memory read-only rather than read, so processes that load
+        the same file share its pages."""
+        with open(filename, "rb") as fileObj:
+            mm = mmap.mmap(fileObj.fileno(), 0, access=mmap.ACCESS_READ)
+        blocklist = cls.__new__(cls)
+        blocklist._mmap = mm
+        try:
+            blocklist._open(mm)
+        except Exception:
+            mm.close()
+            raise
+        return blocklist
+
+    def _open(self, buffer):
+        # type: (Any) -> None
+        """Sets up the section views over buffer, which is either the bytes
+        from _compileBlocklist() or an mmap of a saved file."""
+        if len(buffer) < _HEADER_SIZE or buffer[:8] != BLOCKLIST_MAGIC:
+            raise PySimpleValidateException("not a blocklist file")
+        header = struct.unpack(_HEADER_FORMAT, buffer[:_HEADER_SIZE])
+        if header[1] != _BYTE_ORDER_MARK:
+            raise PySimpleValidateException("blocklist file was saved on a platform with a different byte order")
+        self._buffer = buffer
+        self._caseSensitive = not (header[2] & _FLAG_CASE_INSENSITIVE)
+        self._numEntries = header[3]
+
+        view = memoryview(buffer)
+        intTypecode = _uint32Array([]).typecode
+        for i, (name, typecode) in enumerate(_SECTIONS):
+            offset, length = header[4 + i * 2], header[5 + i * 2]
+            if offset + length > len(buffer):
+                raise PySimpleValidateException("blocklist file is truncated")
+            section = view[offset : offset + length]
+            setattr(self, "_" + name, section if typecode == "B" else section.cast(intTypecode))
+        self._slotMask = len(self._exactSlots) - 1
+
+    def save(self, filename):
+        # type: (str) -> None
+        """Writes the compiled blocklist to filename, to be loaded later with Blocklist.load()."""
+        with open(filename, "wb") as fileObj:
+            fileObj.write(self._buffer[:])
+
+    def close(self):
+        # type: () -> None
+        """Unmaps the file of a Blocklist returned by load(). The Blocklist can't be used after this."""
+        if self._mmap is not None:
+            for name, typecode in _SECTIONS:
+                getattr(self, "_" + name).release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self):
+        # type: () -> int
+        return self._numEntries
+
+    def _getResponse(self, responseIndex):
+        # type: (int) -> str
+        start, end = self._responseOffsets[responseIndex], self._responseOffsets[responseIndex + 1]
+        return bytes(self._responseBlob[start:end]).decode("utf-8")
+
+    def _searchExact(self, value):
+        # type: (str) -> Optional[int]
+        """Returns the response index of the exact entry equal to value, or None."""
+        encoded = value.encode("utf-8")
+        exactSlots, exactOffsets, exactBlob = self._exactSlots, self._exactOffsets, self._exactBlob
+        slot = zlib.crc32(encoded) & self._slotMask
+        while exactSlots[slot] != 0:
+            i = exactSlots[slot] - 1
+            if exactBlob[exactOffsets[i] : exactOffsets[i + 1]] == encoded:
+                return self._exactResponses[i]
+            slot = (slot + 1) & self._slotMask
+        return None
+
+    def _searchSubstrings(self, value):
+        # type: (str) -> Optional[int]
+        """Returns the response index of the first substring entry found in value, or None."""
+        transStart, transChars, transTargets = self._transStart, self._transChars, self._transTargets
+        failLinks, outputs, dictLinks = self._failLinks, self._outputs, self._dictLinks
+        if len(transChars) == 0:
+            return None  # There are no substring entries.
+
+        state = 0
+        for ch in value:
+            c = ord(ch)
+            while True:
+                lo, hi = transStart[state], transStart[state + 1]
+                i = bisect.bisect_left(transChars, c, lo, hi)
+                if i < hi and transChars[i] == c:
+                    state = transTargets[i]
+                    break
+                if state == 0:
+                    break
+                state = failLinks[state]
+            if outputs[state] != 0:
+                return outputs[state] - 1
+            if dictLinks[state] != 0:
+                return outputs[dictLinks[state]] - 1
+        return None
+
+    def search(self, value):
+        # type: (str) -> Optional[str]
+        """Returns the response for the first entry that value matches, or
+        None if value isn't blocked. Exact entries are checked before
+        substring entries."""
+        if not self._caseSensitive:
+            value = value.casefold()
+        responseIndex = self._searchExact(value)
+        if responseIndex is None:
+            responseIndex = self._searchSubstrings(value)
+        if responseIndex is None:
+            return None
+        return self._getResponse(responseIndex)
+
+    def __contains__(self, value):
+        # type: (str) -> bool
+        return self.search(value) is not None
@@ -0,0 +1,190 @@
+# PySimpleValidate
+# By Al Sweigart al@inventwithpython.com
+
+"""The PatternBundle class, for rule sets of allowRegexes and blockRegexes
+patterns that are compiled once and saved to a file, so that worker
+processes can load them faster than compiling the patterns again.
+
+The re module parses and compiles patterns in Python code, which is slow
+for thousands of patterns. A saved bundle has each pattern's compiled code,
+so loading it only has to hand the code to the re module's C engine. The
+code depends on the Python version, so a bundle saved by a different
+version of Python is loaded by compiling its patterns from their source.
+
+    >>> import pysimplevalidate as pysv
+    >>> bundle = pysv.PatternBundle({'tenant1': [r'.*casino.*', (r'^admin', 'Reserved name.')]})
+    >>> import os, tempfile
+    >>> filename = os.path.join(tempfile.mkdtemp(), 'rules.bundle')
+    >>> bundle.save(filename)
+    >>> bundle = pysv.PatternBundle.load(filename)
+    >>> pysv.validateStr('administrator', blockRegexes=bundle['tenant1'])
+    Traceback (most recent call last):
+        ...
+    pysimplevalidate.ValidationException: Reserved name.
+
+Only load bundles from trusted sources, like you would a pickle file.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import json
+import re
+import sys
+
+from typing import Any, Dict, Iterator, List, Optional
+
+from pysimplevalidate import RE_PATTERN_TYPE, PySimpleValidateException
+
+try:
+    import _sre
+    from re import _compiler as _sreCompiler, _parser as _sreParser  # type: ignore
+except ImportError:
+    try:
+        import _sre
+        import sre_compile as _sreCompiler  # type: ignore  # Before Python 3.11.
+        import sre_parse as _sreParser  # type: ignore
+    except ImportError:
+        _sre = None  # type: ignore  # Not CPython, so patterns are always compiled from their source.
+
+# The "format" value of a saved bundle.
+BUNDLE_FORMAT = "pysimplevalidate-pattern-bundle-1"  # type: str
+
+# A saved bundle's compiled code is only used by a Python with the same version and regex engine.
+_CODE_VERSION = "%s/%s" % (".".join(map(str, sys.version_info[:2])), getattr(_sre, "MAGIC", None))  # type: str
+
+
+def _compiledCode(regex):
+    # type: (Any) -> Optional[List[Any]]
+    """Returns the arguments for _sre.compile() that recreate regex, a
+    compiled re pattern, as a JSON-compatible list, or None if they can't
+    be worked out on this Python."""
+    if _sre is None:
+        return None
+    try:
+        tree = _sreParser.parse(regex.pattern, regex.flags)
+        code = _sreCompiler._code(tree, regex.flags)
+        indexGroup = [None] * tree.state.groups  # type: List[Optional[str]]
+        for name, index in tree.state.groupdict.items():
+            indexGroup[index] = name
+        flags = regex.flags | tree.state.flags
+        args = [flags, list(code), tree.state.groups - 1, dict(tree.state.groupdict), indexGroup]
+        if _fromCompiledCode(regex.pattern, args) != regex:
+            return None  # This Python's re module works differently than expected.
+        return args
+    except Exception:
+        return None
+
+
+def _fromCompiledCode(pattern, args):
+    # type: (str, List[Any]) -> Any
+    """Returns the re pattern object for pattern from the _sre.compile()
+    arguments from _compiledCode()."""
+    flags, code, groups, groupIndex, indexGroup = args
+    return _sre.compile(pattern, flags, code, groups, groupIndex, tuple(indexGroup))
+
+
+class PatternBundle(object):
+    """Named rule sets of compiled regex patterns, which can be passed as the
+    allowRegexes or blockRegexes arguments. Each rule set is a list of str
+    or re patterns, or (pattern, response) tuples for blockRegexes. The
+    patterns are compiled with the re module when they're added.
+
+    Get a rule set with bundle[name], save the bundle with save(), and load
+    it with PatternBundle.load().
+    """
+
+    def __init__(self, ruleSets=None):
+        # type: (Optional[Dict[str, Any]]) -> None
+        self._ruleSets = {}  # type: Dict[str, List[Any]]
+        if ruleSets is not None:
+            if not isinstance(ruleSets, dict):
+                raise PySimpleValidateException("ruleSets argument must be a dict of rule set names to patterns")
+            for name, rules in ruleSets.items():
+                self.add(name, rules)
+
+    def add(self, name, rules):
+        # type: (str, Any) -> None
+        """Compiles the patterns in rules and adds them as the rule set name,
+        replacing any rule set with that name. Raises re.error if a pattern
+        is invalid.
+
+        * name (str): The rule set's name.
+        * rules (Sequence): The str or re patterns, or (pattern, response str) tuples.
+        """
+        if not isinstance(name, str):
+            raise PySimpleValidateException("name argument must be a str")
+        compiled = []  # type: List[Any]
+        for rule in rules:
+            if isinstance(rule, tuple) and len(rule) == 2 and isinstance(rule[1], str):
+                regex, response = rule  # type: Any, Optional[str]
+            else:
+                regex, response = rule, None
+            if isinstance(regex, str):
+                regex = re.compile(regex)
+            elif not isinstance(regex, RE_PATTERN_TYPE) or not isinstance(regex.pattern, str):
+                raise PySimpleValidateException("rules must be str or re patterns, or (pattern, response str) tuples")
+            compiled.append(regex if response is None else (regex, response))
+        self._ruleSets[name] = compiled
+
+    def __getitem__(self, name):
+        # type: (str) -> List[Any]
+        return self._ruleSets[name]
+
+    def __contains__(self, name):
+        # type: (Any) -> bool
+        return name in self._ruleSets
+
+    def __iter__(self):
+        # type: () -> Iterator[str]
+        return iter(self._ruleSets)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._ruleSets)
+
+    def __repr__(self):
+        # type: () -> str
+        sizes = ", ".join("%s=%d" % (name, len(rules)) for name, rules in self._ruleSets.items())
+        return "<PatternBundle %s>" % (sizes,)
+
+    def save(self, filename):
+        # type: (str) -> None
+        """Saves the rule sets, with each pattern's compiled code, to the JSON file filename."""
+        ruleSets = {}  # type: Dict[str, List[Dict[str, Any]]]
+        for name, rules in self._ruleSets.items():
+            entries = ruleSets[name] = []  # type: List[Dict[str, Any]]
+            for rule in rules:
+                regex = rule[0] if isinstance(rule, tuple) else rule
+                entry = {"pattern": regex.pattern, "flags": regex.flags, "code": _compiledCode(regex)}
+                if isinstance(rule, tuple):
+                    entry["response"] = rule[1]
+                entries.append(entry)
+        with io.open(filename, "w", encoding="utf-8") as fileObj:
+            json.dump({"format": BUNDLE_FORMAT, "codeVersion": _CODE_VERSION, "ruleSets": ruleSets}, fileObj)
+
+    @classmethod
+    def load(cls, filename):
+        # type: (str) -> PatternBundle
+        """Returns the PatternBundle saved to filename by save(). The patterns
+        are recreated from their compiled code if the bundle was saved by
+        this version of Python, and compiled from their source otherwise."""
+        with io.open(filename, encoding="utf-8") as fileObj:
+            try:
+                data = json.load(fileObj)
+            except ValueError:
+                data = None
+        if not isinstance(data, dict) or data.get("format") != BUNDLE_FORMAT:
+            raise PySimpleValidateException("%r is not a pattern bundle file" % (filename,))
+
+        useCode = _sre is not None and data["codeVersion"] == _CODE_VERSION
+        bundle = cls()
+        for name, entries in data["ruleSets"].items():
+            rules = bundle._ruleSets[name] = []  # type: List[Any]
+            for entry in entries:
+                if useCode and entry["code"] is not None:
+                    regex = _fromCompiledCode(entry["pattern"], entry["code"])
+                else:
+                    regex = re.compile(entry["pattern"], entry["flags"])
+                rules.append((regex, entry["response"]) if "response" in entry else regex)
+        return bundle
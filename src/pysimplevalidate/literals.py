@@ -0,0 +1,172 @@
+# PySimpleValidate
+# By Al Sweigart al@inventwithpython.com
+
+"""literalPrefilter(), which finds the literal text that a regex pattern
+needs to match, so that the allowRegexes and blockRegexes patterns can be
+skipped with a quick str.startswith(), str.endswith(), or in check instead
+of running the regex engine, like grep's literal optimizations.
+
+For example, .*casino.* matches a value only if 'casino' is in the value,
+and ^admin only if the value starts with 'admin':
+
+    >>> from pysimplevalidate import literals
+    >>> prefilter = literals.literalPrefilter(r'.*casino.*')
+    >>> prefilter
+    LiteralPrefilter(literal='casino', exact=True)
+    >>> prefilter.check('online casino'), prefilter.check('cashier')
+    (True, False)
+    >>> prefilter = literals.literalPrefilter(r'^admin\\d+')
+    >>> prefilter.check('user1'), prefilter.check('admin1'), prefilter.check('admin')
+    (False, None, None)
+
+check() returns None when the value has the literal text but the regex
+still has to decide, such as for 'admin1' and 'admin' above. Characters
+matched case-insensitively aren't used as literal text.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import re
+
+from typing import Any, List, Optional
+
+from pysimplevalidate.pikevm import _Parser
+
+
+class LiteralPrefilter(object):
+    """The literal text that a pattern needs to match a value, from
+    literalPrefilter(). If exact is True, the pattern matches a value
+    that has this text, so the regex doesn't need to be run at all."""
+
+    __slots__ = ("prefix", "suffix", "newlineSuffix", "literal", "exact", "whole")
+
+    def __init__(self, prefix="", suffix=None, newlineSuffix=False, literal="", exact=False, whole=False):
+        # type: (str, Optional[str], bool, str, bool, bool) -> None
+        self.prefix = prefix  # The value must start with this.
+        self.suffix = suffix  # The value must end with this, if it isn't None.
+        self.newlineSuffix = newlineSuffix  # If True, the suffix can also be followed by a final newline, as with $.
+        self.literal = literal  # The value must contain this.
+        self.exact = exact
+        self.whole = whole  # If True, the value must be the prefix (and a final newline if newlineSuffix is True).
+
+    def __repr__(self):
+        # type: () -> str
+        defaults = LiteralPrefilter.__init__.__defaults__  # type: Any
+        args = [
+            "%s=%r" % (name, getattr(self, name))
+            for name, default in zip(self.__slots__, defaults)
+            if getattr(self, name) != default
+        ]
+        return "LiteralPrefilter(%s)" % (", ".join(args),)
+
+    def check(self, value):
+        # type: (str) -> Optional[bool]
+        """Returns False if the pattern can't match anywhere in value, True if
+        it must, or None if the regex has to be run to find out."""
+        if self.whole:
+            return value == self.prefix or (self.newlineSuffix and value == self.prefix + "\n")
+        if self.prefix and not value.startswith(self.prefix):
+            return False
+        if self.suffix is not None and not (
+            value.endswith(self.suffix) or (self.newlineSuffix and value.endswith(self.suffix + "\n"))
+        ):
+            return False
+        if self.literal and self.literal not in value:
+            return False
+        return True if self.exact else None
+
+
+def _flatten(node, items):
+    # type: (Any, List[Any]) -> List[Any]
+    """Appends the items of node to items, with concatenations and groups
+    flattened, since groups don't change where a pattern can match."""
+    if node[0] == "concat":
+        for child in node[1]:
+            _flatten(child, items)
+    elif node[0] == "group":
+        _flatten(node[2], items)
+    else:
+        items.append(node)
+    return items
+
+
+def _isLiteral(item):
+    # type: (Any) -> bool
+    return item[0] == "char" and not item[2] & re.IGNORECASE
+
+
+def _literalRuns(items, runs):
+    # type: (List[Any], List[str]) -> List[str]
+    """Appends the runs of literal characters in items to runs, along with the
+    runs inside the items repeated at least once, and returns runs. The first
+    and last runs are the text at the start and end of items, which can be ''."""
+    run = []  # type: List[str]
+    for item in items:
+        if _isLiteral(item):
+            run.append(item[1])
+            continue
+        runs.append("".join(run))
+        run = []
+        if item[0] == "repeat" and item[2] >= 1:
+            runs.extend(run for run in _literalRuns(_flatten(item[1], []), []) if run)
+    runs.append("".join(run))
+    return runs
+
+
+def literalPrefilter(pattern, flags=0):
+    # type: (str, int) -> Optional[LiteralPrefilter]
+    """Returns a LiteralPrefilter with the literal text that pattern needs to
+    match a value, or None if it doesn't need any. Raises re.error if pattern
+    isn't a valid pattern, or uses a feature that can't be analyzed.
+
+    >>> import pysimplevalidate as pysv
+    >>> pysv.literalPrefilter(r'\\.exe$')
+    LiteralPrefilter(suffix='.exe', newlineSuffix=True, exact=True)
+    >>> pysv.literalPrefilter(r'\\.(exe|bat)$')
+    LiteralPrefilter(literal='.')
+    >>> pysv.literalPrefilter(r'^admin$')
+    LiteralPrefilter(prefix='admin', suffix='admin', newlineSuffix=True, exact=True, whole=True)
+    >>> print(pysv.literalPrefilter(r'\\d+|cat'))
+    None
+    """
+    items = _flatten(_Parser(pattern, flags).parse(), [])
+
+    # Parts that can match nothing at the ends, like the .* in .*casino.*, don't change whether a pattern matches.
+    while items and items[0][0] == "repeat" and items[0][2] == 0:
+        items.pop(0)
+    while items and items[-1][0] == "repeat" and items[-1][2] == 0:
+        items.pop()
+
+    anchoredStart = bool(items) and items[0][0] == "assert" and (
+        items[0][1] == "A" or (items[0][1] == "^" and not items[0][2] & re.MULTILINE)
+    )
+    if anchoredStart:
+        items.pop(0)
+    anchoredEnd = bool(items) and items[-1][0] == "assert" and (
+        items[-1][1] == "Z" or (items[-1][1] == "$" and not items[-1][2] & re.MULTILINE)
+    )
+    newlineSuffix = anchoredEnd and items[-1][1] == "$"
+    if anchoredEnd:
+        items.pop()
+
+    runs = _literalRuns(items, [])
+    if len(runs) == 1:
+        # The pattern is all literal text, so checking for the text is as good as running the regex.
+        text = runs[0]
+        if anchoredStart and anchoredEnd:
+            return LiteralPrefilter(text, text, newlineSuffix, exact=True, whole=True)
+        if anchoredStart:
+            return LiteralPrefilter(text, exact=True)
+        if anchoredEnd:
+            return LiteralPrefilter(suffix=text, newlineSuffix=newlineSuffix, exact=True)
+        return LiteralPrefilter(literal=text, exact=True)
+
+    # The first and last runs are the literal text at the start and end of the items.
+    prefix = runs[0] if anchoredStart else ""
+    suffix = runs[-1] if anchoredEnd and runs[-1] else None
+    literal = max(runs, key=len)
+    if literal == prefix or literal == suffix:
+        literal = ""
+    if not (prefix or suffix or literal):
+        return None
+    return LiteralPrefilter(prefix, suffix, newlineSuffix and suffix is not None, literal)
@@ -0,0 +1,861 @@
+# PySimpleValidate
+# By Al Sweigart al@inventwithpython.com
+
+"""A regex engine that runs in time linear in the length of the string, for
+the 'pike' regex engine backend (see setRegexEngine()).
+
+The standard library's re module is a backtracking engine: some patterns,
+such as r'(a+)+$', take exponential time on strings that almost match. This
+engine compiles a pattern to a program for a Pike VM, which runs all of the
+ways the pattern can match in lockstep, one character of the string at a
+time. Each program instruction is visited at most once per character, so a
+search takes O(len(pattern) * len(string)) time no matter what the pattern
+or string is. It finds the same match and groups as re.
+
+It supports re's syntax except for the features that can't run in linear
+time: backreferences, lookahead and lookbehind assertions, conditional
+groups, atomic groups, and possessive quantifiers. Compiling a pattern that
+uses these raises re.error.
+
+For a pattern that repeats a group that can match the empty string, such
+as (a*)*, the match or its groups can differ from re's, because re stops
+repeating a group after it matches the empty string.
+
+    >>> from pysimplevalidate import pikevm
+    >>> mo = pikevm.compile(r'(\\w+)@(\\w+)\\.com').search('mail al@example.com today')
+    >>> mo.group(), mo.group(1), mo.span(2)
+    ('al@example.com', 'al', (8, 15))
+    >>> pikevm.compile(r'(a+)+$').match('a' * 50000 + '!') is None
+    True
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import re
+import threading
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# The flags that compile() accepts. Other flags (re.LOCALE, re.DEBUG) raise re.error.
+SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE | re.ASCII | re.UNICODE  # type: int
+
+# The inline flag letters, such as the i in (?i), and their flags.
+_INLINE_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL, "x": re.VERBOSE, "a": re.ASCII, "u": re.UNICODE}
+
+# Program opcodes. Each instruction is a tuple of the opcode and its arguments.
+_CHAR = 0  # (_CHAR, ch): Consumes ch.
+_CHAR_IGNORECASE = 1  # (_CHAR_IGNORECASE, lowercase ch): Consumes a character whose lowercase is ch.
+_ANY = 2  # (_ANY,): Consumes any character but a newline.
+_ANY_ALL = 3  # (_ANY_ALL,): Consumes any character.
+_CLASS = 4  # (_CLASS, _CharClass): Consumes a character in the class.
+_MATCH = 5  # (_MATCH,): The pattern has matched.
+_JUMP = 6  # (_JUMP, pc): Continues at pc.
+_SPLIT = 7  # (_SPLIT, pc1, pc2): Continues at both pc1 and pc2, preferring pc1.
+_SAVE = 8  # (_SAVE, slot): Records the position in the capture slot.
+_ASSERT = 9  # (_ASSERT, kind, flags): Continues only if the zero-width assertion kind holds.
+
+# The characters that re's \s matches with the ASCII flag.
+_ASCII_WHITESPACE = frozenset(" \t\n\r\f\v")
+
+# The escapes for single characters, such as \n.
+_CHAR_ESCAPES = {"a": "\a", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+
+def _isWord(ch, flags):
+    # type: (str, int) -> bool
+    """Returns True if re's \\w matches ch."""
+    if flags & re.ASCII and ch >= "\x80":
+        return False
+    return ch.isalnum() or ch == "_"
+
+
+def _inCategory(category, ch, flags):
+    # type: (str, str, int) -> bool
+    """Returns True if ch is in category, the letter of a class escape such as d for \\d."""
+    lower = category.lower()
+    if lower == "d":
+        result = "0" <= ch <= "9" if flags & re.ASCII else ch.isdecimal()
+    elif lower == "w":
+        result = _isWord(ch, flags)
+    else:
+        result = ch in _ASCII_WHITESPACE if flags & re.ASCII else ch.isspace()
+    return result if category == lower else not result
+
+
+class _CharClass(object):
+    """A character class, such as [a-z\\d_] or \\w, for the _CLASS instruction."""
+
+    def __init__(self, chars, ranges, categories, negated, flags):
+        # type: (str, List[Tuple[str, str]], str, bool, int) -> None
+        self.chars = frozenset(chars)
+        self.ranges = ranges
+        self.categories = categories  # Class escape letters, such as 'dW' for \d and \W.
+        self.negated = negated
+        self.flags = flags
+        self._memo = {}  # type: Dict[str, bool]  # The result of matches() for each character tested so far.
+
+    def _contains(self, ch):
+        # type: (str) -> bool
+        if ch in self.chars:
+            return True
+        for low, high in self.ranges:
+            if low <= ch <= high:
+                return True
+        for category in self.categories:
+            if _inCategory(category, ch, self.flags):
+                return True
+        return False
+
+    def matches(self, ch):
+        # type: (str) -> bool
+        """Returns True if ch is in the class."""
+        result = self._memo.get(ch)
+        if result is None:
+            if self.flags & re.IGNORECASE:
+                result = self._contains(ch) or self._contains(ch.lower()) or self._contains(ch.upper())
+            else:
+                result = self._contains(ch)
+            result = result != self.negated
+            if len(self._memo) < 4096:
+                self._memo[ch] = result
+        return result
+
+
+class _Parser(object):
+    """Parses a pattern into a syntax tree for _Compiler and for the
+    pysimplevalidate.redos analyzer. The nodes are tuples:
+
+    * ('char', ch, flags), ('any', flags), ('class', _CharClass)
+    * ('assert', kind, flags), where kind is ^ $ A Z b or B
+    * ('group', index or None, node)
+    * ('concat', [nodes]), ('alternate', [nodes], source text)
+    * ('repeat', node, min, max or None, greedy, source text)
+    * ('lookaround', node) and ('backref',), which _Compiler rejects
+    """
+
+    def __init__(self, pattern, flags):
+        # type: (str, int) -> None
+        self.pattern = pattern
+        self.pos = 0
+        self.flags = flags
+        self.numGroups = 0
+        self.groupIndex = {}  # type: Dict[str, int]
+
+    def error(self, message):
+        # type: (str) -> None
+        raise re.error(message, self.pattern, self.pos)
+
+    def parse(self):
+        # type: () -> Any
+        self._parseLeadingFlags()
+        node = self._parseAlternation(self.flags)
+        if self.pos < len(self.pattern):
+            self.error("unbalanced parenthesis")
+        return node
+
+    def _parseLeadingFlags(self):
+        # type: () -> None
+        """Applies the global inline flags at the start of the pattern, such as (?i)."""
+        while True:
+            self._skipVerbose(self.flags)
+            mo = re.match(r"\(\?([aimsux]+)\)", self.pattern[self.pos :])
+            if mo is None:
+                return
+            for letter in mo.group(1):
+                self.flags |= _INLINE_FLAGS[letter]
+            self.pos += mo.end()
+
+    def _skipVerbose(self, flags):
+        # type: (int) -> None
+        """Skips whitespace and comments in verbose mode."""
+        if not flags & re.VERBOSE:
+            return
+        pattern = self.pattern
+        while self.pos < len(pattern):
+            if pattern[self.pos].isspace():
+                self.pos += 1
+            elif pattern[self.pos] == "#":
+                end = pattern.find("\n", self.pos)
+                self.pos = len(pattern) if end == -1 else end + 1
+            else:
+                return
+
+    def _peek(self, flags):
+        # type: (int) -> Optional[str]
+        self._skipVerbose(flags)
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def _parseAlternation(self, flags):
+        # type: (int) -> Any
+        start = self.pos
+        branches = [self._parseConcat(flags)]
+        while self._peek(flags) == "|":
+            self.pos += 1
+            branches.append(self._parseConcat(flags))
+        return branches[0] if len(branches) == 1 else ("alternate", branches, self.pattern[start : self.pos])
+
+    def _parseConcat(self, flags):
+        # type: (int) -> Any
+        items = []
+        while True:
+            ch = self._peek(flags)
+            if ch is None or ch in "|)":
+                break
+            items.append(self._parseRepeat(flags))
+        return items[0] if len(items) == 1 else ("concat", items)
+
+    def _parseRepeat(self, flags):
+        # type: (int) -> Any
+        start = self.pos
+        node = self._parseAtom(flags)
+        while True:
+            ch = self._peek(flags)
+            if ch == "*":
+                minCount, maxCount = 0, None  # type: Tuple[int, Optional[int]]
+                self.pos += 1
+            elif ch == "+":
+                minCount, maxCount = 1, None
+                self.pos += 1
+            elif ch == "?":
+                minCount, maxCount = 0, 1
+                self.pos += 1
+            elif ch == "{":
+                mo = re.match(r"\{(\d*)(,?)(\d*)\}", self.pattern[self.pos :])
+                if mo is None or (mo.group(1) == "" and mo.group(2) == ""):
+                    return node  # Not a repeat, so the { is a literal that the next atom parses.
+                minCount = int(mo.group(1) or 0)
+                maxCount = int(mo.group(3)) if mo.group(3) else (None if mo.group(2) else minCount)
+                if maxCount is not None and maxCount < minCount:
+                    self.error("min repeat greater than max repeat")
+                self.pos += mo.end()
+            else:
+                return node
+            if node[0] == "repeat":
+                self.error("multiple repeat")  # Such as a**. Repeating a repeated group, such as (a*)*, is fine.
+            if node[0] in ("assert", "lookaround"):
+                self.error("nothing to repeat")
+            greedy = True
+            if self.pattern[self.pos : self.pos + 1] == "?":
+                greedy = False
+                self.pos += 1
+            elif self.pattern[self.pos : self.pos + 1] == "+":
+                self.error("possessive quantifiers are not supported by the pike regex engine")
+            node = ("repeat", node, minCount, maxCount, greedy, self.pattern[start : self.pos])
+
+    def _parseAtom(self, flags):
+        # type: (int) -> Any
+        ch = self.pattern[self.pos]
+        self.pos += 1
+        if ch == "(":
+            return self._parseGroup(flags)
+        if ch == "[":
+            return ("class", self._parseClass(flags))
+        if ch == ".":
+            return ("any", flags)
+        if ch == "^":
+            return ("assert", "^", flags)
+        if ch == "$":
+            return ("assert", "$", flags)
+        if ch in "*+?":
+            self.error("nothing to repeat")
+        if ch == "\\":
+            return self._parseEscape(flags)
+        return ("char", ch, flags)
+
+    def _parseGroup(self, flags):
+        # type: (int) -> Any
+        pattern = self.pattern
+        index = None  # type: Optional[int]
+        if pattern.startswith("?", self.pos):
+            mo = re.match(r"\?P<([^\W\d]\w*)>", pattern[self.pos :])
+            if mo is not None:
+                if mo.group(1) in self.groupIndex:
+                    self.error("redefinition of group name %r" % mo.group(1))
+                self.numGroups += 1
+                index = self.numGroups
+                self.groupIndex[mo.group(1)] = index
+                self.pos += mo.end()
+            elif pattern.startswith("?:", self.pos):
+                self.pos += 2
+            elif re.match(r"\?<?[=!]", pattern[self.pos :]):
+                self.pos += 3 if pattern.startswith("?<", self.pos) else 2
+                node = self._parseAlternation(flags)
+                if self._peek(flags) != ")":
+                    self.error("missing ), unterminated subpattern")
+                self.pos += 1
+                return ("lookaround", node)
+            elif re.match(r"\?P=[^\W\d]\w*\)", pattern[self.pos :]):
+                self.pos = pattern.index(")", self.pos) + 1
+                return ("backref",)
+            elif pattern.startswith("?#", self.pos):
+                end = pattern.find(")", self.pos)
+                if end == -1:
+                    self.error("missing ), unterminated comment")
+                self.pos = end + 1
+                return ("concat", [])
+            else:
+                mo = re.match(r"\?([aimsux]*)(?:-([imsx]*))?:", pattern[self.pos :])
+                if mo is None:
+                    self.error("this group syntax is not supported by the pike regex engine")
+                for letter in mo.group(1):
+                    flags |= _INLINE_FLAGS[letter]
+                for letter in mo.group(2) or "":
+                    flags &= ~_INLINE_FLAGS[letter]
+                self.pos += mo.end()
+        else:
+            self.numGroups += 1
+            index = self.numGroups
+        node = self._parseAlternation(flags)
+        if self._peek(flags) != ")":
+            self.error("missing ), unterminated subpattern")
+        self.pos += 1
+        return ("group", index, node)
+
+    def _parseEscape(self, flags, inClass=False):
+        # type: (int, bool) -> Any
+        """Parses the escape after a backslash. In a class, returns a
+        ('char', ch) or ('category', letter) tuple."""
+        if self.pos >= len(self.pattern):
+            self.error("bad escape (end of pattern)")
+        ch = self.pattern[self.pos]
+        self.pos += 1
+        if ch in "dDwWsS":
+            if inClass:
+                return ("category", ch)
+            return ("class", _CharClass("", [], ch, False, flags))
+        if ch in _CHAR_ESCAPES:
+            return ("char", _CHAR_ESCAPES[ch], flags)
+        if ch == "b" and inClass:
+            return ("char", "\b", flags)
+        if ch in "bBAZ" and not inClass:
+            return ("assert", ch, flags)
+        if ch in "xuU":
+            length = {"x": 2, "u": 4, "U": 8}[ch]
+            digits = self.pattern[self.pos : self.pos + length]
+            if len(digits) != length or re.match(r"[0-9a-fA-F]+$", digits) is None:
+                self.error("incomplete escape \\%s%s" % (ch, digits))
+            self.pos += length
+            return ("char", chr(int(digits, 16)), flags)
+        if ch == "0" or (inClass and ch in "1234567"):
+            mo = re.match(r"[0-7]{0,2}", self.pattern[self.pos :])
+            self.pos += mo.end()  # type: ignore
+            return ("char", chr(int(ch + mo.group(), 8)), flags)  # type: ignore
+        if ch in "123456789" and not inClass:
+            if self.pattern[self.pos : self.pos + 1].isdigit():
+                self.pos += 1
+            return ("backref",)
+        if ch < "\x80" and ch.isalnum():
+            self.error("bad escape \\%s" % ch)
+        return ("char", ch, flags)
+
+    def _parseClass(self, flags):
+        # type: (int) -> _CharClass
+        pattern = self.pattern
+        negated = False
+        if pattern.startswith("^", self.pos):
+            negated = True
+            self.pos += 1
+        chars = []  # type: List[str]
+        ranges = []  # type: List[Tuple[str, str]]
+        categories = ""
+        first = True
+        while True:
+            if self.pos >= len(pattern):
+                self.error("unterminated character set")
+            ch = pattern[self.pos]
+            if ch == "]" and not first:
+                self.pos += 1
+                break
+            first = False
+            self.pos += 1
+            if ch == "\\":
+                item = self._parseEscape(flags, inClass=True)
+                if item[0] == "category":
+                    categories += item[1]
+                    continue
+                ch = item[1]
+            if pattern.startswith("-", self.pos) and not pattern.startswith("-]", self.pos):
+                self.pos += 1
+                high = pattern[self.pos]
+                self.pos += 1
+                if high == "\\":
+                    item = self._parseEscape(flags, inClass=True)
+                    if item[0] == "category":
+                        self.error("bad character range")
+                    high = item[1]
+                if high < ch:
+                    self.error("bad character range %s-%s" % (ch, high))
+                ranges.append((ch, high))
+            else:
+                chars.append(ch)
+        return _CharClass("".join(chars), ranges, categories, negated, flags)
+
+
+class _Compiler(object):
+    """Compiles a syntax tree from _Parser into a Pike VM program."""
+
+    def __init__(self):
+        # type: () -> None
+        self.program = []  # type: List[Tuple[Any, ...]]
+
+    def emit(self, *instruction):
+        # type: (Any) -> int
+        self.program.append(instruction)
+        return len(self.program) - 1
+
+    def compile(self, node):
+        # type: (Any) -> None
+        kind = node[0]
+        if kind == "char":
+            if node[2] & re.IGNORECASE and node[1].lower() != node[1].upper():
+                self.emit(_CHAR_IGNORECASE, node[1].lower())
+            else:
+                self.emit(_CHAR, node[1])
+        elif kind == "any":
+            self.emit(_ANY_ALL if node[1] & re.DOTALL else _ANY)
+        elif kind == "class":
+            self.emit(_CLASS, node[1])
+        elif kind == "assert":
+            self.emit(_ASSERT, node[1], node[2])
+        elif kind == "group":
+            if node[1] is None:
+                self.compile(node[2])
+            else:
+                self.emit(_SAVE, node[1] * 2)
+                self.compile(node[2])
+                self.emit(_SAVE, node[1] * 2 + 1)
+        elif kind == "concat":
+            for item in node[1]:
+                self.compile(item)
+        elif kind == "alternate":
+            jumps = []
+            for branch in node[1][:-1]:
+                split = self.emit(_SPLIT, None, None)
+                self.compile(branch)
+                jumps.append(self.emit(_JUMP, None))
+                self.program[split] = (_SPLIT, split + 1, len(self.program))
+            self.compile(node[1][-1])
+            for jump in jumps:
+                self.program[jump] = (_JUMP, len(self.program))
+        elif kind == "repeat":
+            self._compileRepeat(*node[1:5])
+        elif kind == "lookaround":
+            raise re.error("lookaround assertions are not supported by the pike regex engine")
+        elif kind == "backref":
+            raise re.error("backreferences are not supported by the pike regex engine")
+
+    def _split(self, pc, greedy, body, exit):
+        # type: (int, bool, int, int) -> None
+        self.program[pc] = (_SPLIT, body, exit) if greedy else (_SPLIT, exit, body)
+
+    def _compileRepeat(self, node, minCount, maxCount, greedy):
+        # type: (Any, int, Optional[int], bool) -> None
+        for i in range(minCount):
+            self.compile(node)
+        if maxCount is None:
+            # L: SPLIT body, exit; body; JUMP L
+            split = self.emit(_SPLIT, None, None)
+            self.compile(node)
+            self.emit(_JUMP, split)
+            self._split(split, greedy, split + 1, len(self.program))
+        else:
+            # Each optional copy: SPLIT body, exit; body. Every SPLIT exits to the end.
+            splits = []
+            for i in range(maxCount - minCount):
+                splits.append(self.emit(_SPLIT, None, None))
+                self.compile(node)
+            for split in splits:
+                self._split(split, greedy, split + 1, len(self.program))
+
+
+def _assertion(kind, flags, prev, cur, curIsLast):
+    # type: (str, int, Optional[str], Optional[str], bool) -> bool
+    """Returns True if the zero-width assertion kind holds at a position in
+    the string. The prev argument is the character before the position, or
+    None at the start of the string, and cur is the character at it, or
+    None at the end. The curIsLast argument is True if cur is the last
+    character of the string."""
+    if kind == "^":
+        return prev is None or bool(flags & re.MULTILINE) and prev == "\n"
+    if kind == "$":
+        return cur is None or cur == "\n" and (curIsLast or bool(flags & re.MULTILINE))
+    if kind == "A":
+        return prev is None
+    if kind == "Z":
+        return cur is None
+    before = prev is not None and _isWord(prev, flags)
+    after = cur is not None and _isWord(cur, flags)
+    if kind == "b":
+        return before != after
+    return (prev is not None or cur is not None) and before == after  # \B doesn't match in an empty string, like re.
+
+
+class PikeMatch(object):
+    """The match object returned by PikePattern's search(), match(), and
+    fullmatch() methods. It has the same methods as re's match objects for
+    getting the groups."""
+
+    def __init__(self, pattern, string, start, end, slots=None):
+        # type: (PikePattern, str, int, int, Optional[Tuple[Optional[int], ...]]) -> None
+        self.re = pattern
+        self.string = string
+        self._start = start
+        self._end = end
+        self._slots = slots  # The positions of the groups, which are found when a group is first requested.
+
+    def _index(self, group):
+        # type: (Any) -> int
+        if isinstance(group, str):
+            if group not in self.re.groupindex:
+                raise IndexError("no such group")
+            return self.re.groupindex[group]
+        if not 0 <= group <= self.re.groups:
+            raise IndexError("no such group")
+        return group
+
+    def span(self, group=0):
+        # type: (Any) -> Tuple[int, int]
+        index = self._index(group)
+        if index == 0:
+            return (self._start, self._end)
+        if self._slots is None:
+            self._slots = self.re._findSlots(self.string, self._start, False, self._end)
+        start, end = self._slots[index * 2], self._slots[index * 2 + 1]  # type: ignore
+        return (-1, -1) if start is None or end is None else (start, end)
+
+    def start(self, group=0):
+        # type: (Any) -> int
+        return self.span(group)[0]
+
+    def end(self, group=0):
+        # type: (Any) -> int
+        return self.span(group)[1]
+
+    def group(self, *groups):
+        # type: (Any) -> Any
+        if len(groups) > 1:
+            return tuple(self.group(group) for group in groups)
+        start, end = self.span(groups[0] if groups else 0)
+        return None if start == -1 else self.string[start:end]
+
+    def groups(self, default=None):
+        # type: (Any) -> Tuple[Any, ...]
+        return tuple(default if self.span(i)[0] == -1 else self.group(i) for i in range(1, self.re.groups + 1))
+
+    def groupdict(self, default=None):
+        # type: (Any) -> Dict[str, Any]
+        return dict((name, self.group(name) if self.span(name)[0] != -1 else default) for name in self.re.groupindex)
+
+    def __getitem__(self, group):
+        # type: (Any) -> Any
+        return self.group(group)
+
+    def __repr__(self):
+        # type: () -> str
+        return "<pysimplevalidate.pikevm.PikeMatch object; span=%r, match=%r>" % (self.span(), self.group())
+
+
+# The modes of a DFA state: new threads are started at each position (search() before it has
+# found a match), no new threads are started (match(), or search() after it has found a
+# match), or no new threads are started and only a match at the end counts (fullmatch()).
+_SEARCHING = 0
+_ANCHORED = 1
+_FULL = 2
+
+# When a pattern's DFA has this many transitions, it stops growing, and the pattern's
+# searches are run on the Pike VM directly instead.
+MAX_DFA_TRANSITIONS = 20000  # type: int
+
+
+class PikePattern(object):
+    """A compiled pattern, returned by compile(). Its search(), match(), and
+    fullmatch() methods work like the methods of re's pattern objects, but
+    take time linear in the length of the string.
+
+    Which threads of the Pike VM are running at a position, and in what
+    order, only depends on the threads at the previous position and the
+    characters around the position, not on where the threads' groups
+    matched. So these transitions are cached as the states of a DFA as
+    they're found, and later searches that see the same characters are a
+    dict lookup per character. The start of the match is found by tracing
+    the matching thread back through the transitions, and the groups are
+    found when they're first requested, by running the Pike VM over just
+    the match."""
+
+    def __init__(self, pattern, flags=0):
+        # type: (str, int) -> None
+        if not isinstance(pattern, str):
+            raise TypeError("the pike regex engine only supports str patterns")
+        if flags & ~SUPPORTED_FLAGS:
+            raise re.error("unsupported flags for the pike regex engine")
+        parser = _Parser(pattern, flags)
+        tree = parser.parse()
+        compiler = _Compiler()
+        compiler.emit(_SAVE, 0)
+        compiler.compile(tree)
+        compiler.emit(_SAVE, 1)
+        compiler.emit(_MATCH)
+
+        self.pattern = pattern
+        self.flags = parser.flags
+        self.groups = parser.numGroups
+        self.groupindex = dict(parser.groupIndex)
+        self._program = compiler.program
+        # A literal character the match must start with, used to skip ahead in search().
+        self._firstChar = compiler.program[1][1] if compiler.program[1][0] == _CHAR else None
+        # Without assertions, the transitions only depend on the character at each position.
+        self._hasAssertions = any(instruction[0] == _ASSERT for instruction in compiler.program)
+
+        # Each DFA state is the tuple of the pcs of the running threads, in priority order, and the mode.
+        self._states = []  # type: List[Tuple[Tuple[int, ...], int]]
+        self._stateNumbers = {}  # type: Dict[Tuple[Tuple[int, ...], int], int]
+        # Maps (state number, character, ...) to a (next state number, sources, match index, done) tuple. See _step().
+        self._transitions = {}  # type: Dict[Tuple[Any, ...], Tuple[int, Tuple[int, ...], int, bool]]
+        self._statesLock = threading.Lock()
+
+    def __repr__(self):
+        # type: () -> str
+        return "pikevm.compile(%r)" % (self.pattern,)
+
+    def search(self, string, pos=0, endpos=None):
+        # type: (str, int, Optional[int]) -> Optional[PikeMatch]
+        return self._run(string, pos, endpos, _SEARCHING)
+
+    def match(self, string, pos=0, endpos=None):
+        # type: (str, int, Optional[int]) -> Optional[PikeMatch]
+        return self._run(string, pos, endpos, _ANCHORED)
+
+    def fullmatch(self, string, pos=0, endpos=None):
+        # type: (str, int, Optional[int]) -> Optional[PikeMatch]
+        return self._run(string, pos, endpos, _FULL)
+
+    def _closure(self, threads, prev, cur, curIsLast):
+        # type: (List[Tuple[int, int]], Optional[str], Optional[str], bool) -> Tuple[Tuple[int, ...], Tuple[int, ...]]
+        """Follows the jumps, splits, saves, and assertions from each (pc,
+        source) tuple in threads, in priority order, to the instructions
+        that consume a character or match. Returns a tuple of their pcs, in
+        priority order, and a tuple of the source of each. Each instruction
+        is only added once. The prev, cur, and curIsLast arguments are the
+        same as _assertion()'s."""
+        program = self._program
+        visited = set()
+        pcs = []  # type: List[int]
+        sources = []  # type: List[int]
+        for pc, source in threads:
+            stack = [pc]
+            while stack:
+                pc = stack.pop()
+                if pc in visited:
+                    continue
+                visited.add(pc)
+                instruction = program[pc]
+                opcode = instruction[0]
+                if opcode == _JUMP:
+                    stack.append(instruction[1])
+                elif opcode == _SPLIT:
+                    stack.append(instruction[2])
+                    stack.append(instruction[1])  # Popped first, so it has priority.
+                elif opcode == _SAVE:
+                    stack.append(pc + 1)
+                elif opcode == _ASSERT:
+                    if _assertion(instruction[1], instruction[2], prev, cur, curIsLast):
+                        stack.append(pc + 1)
+                else:
+                    pcs.append(pc)
+                    sources.append(source)
+        return tuple(pcs), tuple(sources)
+
+    def _stateNumber(self, pcs, mode):
+        # type: (Tuple[int, ...], int) -> int
+        """Returns the number of the DFA state, numbering it if it's new."""
+        state = (pcs, mode)
+        number = self._stateNumbers.get(state)
+        if number is None:
+            with self._statesLock:
+                number = self._stateNumbers.get(state)
+                if number is None:
+                    number = len(self._states)
+                    self._states.append(state)
+                    self._stateNumbers[state] = number
+        return number
+
+    def _consumes(self, instruction, ch):
+        # type: (Tuple[Any, ...], str) -> bool
+        """Returns True if instruction consumes the character ch."""
+        opcode = instruction[0]
+        if opcode == _CHAR:
+            return ch == instruction[1]
+        if opcode == _CHAR_IGNORECASE:
+            return ch.lower() == instruction[1]
+        if opcode == _CLASS:
+            return instruction[1].matches(ch)
+        if opcode == _ANY:
+            return ch != "\n"
+        return True  # _ANY_ALL
+
+    def _step(self, stateNumber, ch, nextCh, nextIsLast):
+        # type: (int, Optional[str], Optional[str], bool) -> Tuple[int, Tuple[int, ...], int, bool]
+        """Returns the transition from the DFA state on the character ch
+        (None at the end of the string): a tuple of the next state's number,
+        the index in this state of the thread that each of the next state's
+        threads came from (-1 for a new thread), the index of the thread
+        that matched (or -1), and whether the search is done."""
+        pcs, mode = self._states[stateNumber]
+        program = self._program
+        matchIndex = -1
+        advanced = []  # type: List[Tuple[int, int]]
+        for index, pc in enumerate(pcs):
+            instruction = program[pc]
+            if instruction[0] == _MATCH:
+                if mode == _FULL and ch is not None:
+                    continue
+                matchIndex = index
+                break  # The rest of the threads have lower priority than this match.
+            if ch is not None and self._consumes(instruction, ch):
+                advanced.append((pc + 1, index))
+        if ch is None:
+            return (-1, (), matchIndex, True)
+        if mode == _SEARCHING:
+            if matchIndex == -1:
+                advanced.append((0, -1))  # Start a new lowest-priority thread at the next position.
+            else:
+                mode = _ANCHORED
+        nextPcs, sources = self._closure(advanced, ch, nextCh, nextIsLast)
+        return (self._stateNumber(nextPcs, mode), sources, matchIndex, not nextPcs and mode != _SEARCHING)
+
+    def _run(self, string, pos, endpos, mode):
+        # type: (str, int, Optional[int], int) -> Optional[PikeMatch]
+        if not isinstance(string, str):
+            raise TypeError("expected string, got %r" % type(string).__name__)
+        if endpos is not None and endpos < len(string):
+            string = string[: max(endpos, 0)]
+        length = len(string)
+        pos = min(max(pos, 0), length)
+
+        if mode == _SEARCHING and self._firstChar is not None:
+            pos = string.find(self._firstChar, pos)
+            if pos == -1:
+                return None
+
+        transitions = self._transitions
+        if len(transitions) >= MAX_DFA_TRANSITIONS:
+            slots = self._findSlots(string, pos, mode == _SEARCHING, length if mode == _FULL else None)
+            return None if slots is None else PikeMatch(self, string, slots[0], slots[1], slots)  # type: ignore
+
+        hasAssertions = self._hasAssertions
+        prev = string[pos - 1] if pos > 0 else None
+        cur = string[pos] if pos < length else None
+        key = (-1, mode, prev, cur, pos == length - 1) if hasAssertions else (-1, mode)  # type: Tuple[Any, ...]
+        transition = transitions.get(key)
+        if transition is None:
+            pcs, sources = self._closure([(0, -1)], prev, cur, pos == length - 1)
+            transition = (self._stateNumber(pcs, mode), sources, -1, not pcs and mode != _SEARCHING)
+            transitions[key] = transition
+
+        state = transition[0]
+        # The sources of each transition taken, to trace the match back to its start.
+        history = []  # type: List[Tuple[int, ...]]
+        # The position of the match, the index of its thread, and len(history) at the match.
+        matchedAt = None  # type: Optional[Tuple[int, int, int]]
+        i = pos
+        nextCh = None  # type: Optional[str]
+        while not transition[3]:
+            ch = string[i] if i < length else None
+            if hasAssertions:
+                nextCh = string[i + 1] if i + 1 < length else None
+                key = (state, ch, nextCh, i + 2 == length)
+            else:
+                key = (state, ch)
+            transition = transitions.get(key)  # type: ignore
+            if transition is None:
+                transition = self._step(state, ch, nextCh, i + 2 == length)
+                transitions[key] = transition
+            if transition[2] != -1:
+                matchedAt = (i, transition[2], len(history))
+            history.append(transition[1])
+            state = transition[0]
+            i += 1
+
+        if matchedAt is None:
+            return None
+        end, index, step = matchedAt
+        start = pos
+        if mode == _SEARCHING:
+            # Follow the matching thread back to the position where it was started.
+            for step in range(step - 1, -1, -1):
+                index = history[step][index]
+                if index == -1:
+                    start = pos + step + 1
+                    break
+        return PikeMatch(self, string, start, end)
+
+    def _addThread(self, threads, visited, pc, slots, string, i):
+        # type: (List[Tuple[int, Tuple[Optional[int], ...]]], List[int], int, Tuple[Optional[int], ...], str, int) -> None
+        """Like _closure(), but adds the thread at pc to threads with the
+        positions of its groups in slots. The visited list marks the
+        instructions already added at position i."""
+        program = self._program
+        prev = string[i - 1] if i > 0 else None
+        cur = string[i] if i < len(string) else None
+        stack = [(pc, slots)]
+        while stack:
+            pc, slots = stack.pop()
+            if visited[pc] == i:
+                continue
+            visited[pc] = i
+            instruction = program[pc]
+            opcode = instruction[0]
+            if opcode == _JUMP:
+                stack.append((instruction[1], slots))
+            elif opcode == _SPLIT:
+                stack.append((instruction[2], slots))
+                stack.append((instruction[1], slots))
+            elif opcode == _SAVE:
+                slot = instruction[1]
+                stack.append((pc + 1, slots[:slot] + (i,) + slots[slot + 1 :]))
+            elif opcode == _ASSERT:
+                if _assertion(instruction[1], instruction[2], prev, cur, i == len(string) - 1):
+                    stack.append((pc + 1, slots))
+            else:
+                threads.append((pc, slots))
+
+    def _findSlots(self, string, pos, searching, end):
+        # type: (str, int, bool, Optional[int]) -> Optional[Tuple[Optional[int], ...]]
+        """Runs the Pike VM on string from pos, tracking the positions of the
+        groups, and returns the slots of the match (the start and end of
+        each group), or None if there's no match. If searching is False, the
+        match must start at pos, and if end isn't None, it must end at end."""
+        program = self._program
+        length = len(string)
+        visited = [-1] * len(program)
+        emptySlots = (None,) * (self.groups * 2 + 2)
+        matched = None  # type: Optional[Tuple[Optional[int], ...]]
+        threads = []  # type: List[Tuple[int, Tuple[Optional[int], ...]]]
+        self._addThread(threads, visited, 0, emptySlots, string, pos)
+        i = pos
+        while threads or (searching and matched is None and i < length):
+            ch = string[i] if i < length else None
+            nextThreads = []  # type: List[Tuple[int, Tuple[Optional[int], ...]]]
+            for pc, slots in threads:
+                instruction = program[pc]
+                if instruction[0] == _MATCH:
+                    if end is not None and i != end:
+                        continue
+                    matched = slots
+                    break  # The rest of the threads have lower priority than this match.
+                if ch is not None and self._consumes(instruction, ch):
+                    self._addThread(nextThreads, visited, pc + 1, slots, string, i + 1)
+            if ch is None:
+                break
+            if searching and matched is None:
+                self._addThread(nextThreads, visited, 0, emptySlots, string, i + 1)
+            threads = nextThreads
+            i += 1
+        return matched
+
+
+def compile(pattern, flags=0):
+    # type: (str, int) -> PikePattern
+    """Returns a PikePattern for the regex pattern. Raises re.error if the
+    pattern is invalid or uses syntax this engine doesn't support."""
+    return PikePattern(pattern, flags)
@@ -0,0 +1,320 @@
+# PySimpleValidate
+# By Al Sweigart al@inventwithpython.com
+
+"""analyzeRegex() and rewriteRegex(), for finding the regex patterns that
+can make a backtracking regex engine, such as the re module's, take
+exponential time to fail to match a value (a "ReDoS"). PySimpleValidate
+checks the patterns passed to its validators with these, as set by
+setReDoSPolicy().
+
+Backtracking takes exponential time when a repeated part of a pattern can
+match the same text in more than one way, because each way is tried for
+each repetition. analyzeRegex() looks for the three common causes under an
+unbounded quantifier (* + or {m,}):
+
+* A nested quantifier, such as (a+)+ or (\\w+\\s?)*
+* A quantifier followed by something that matches the same characters,
+  such as (\\d+\\d+)+ or ([a-z]+.)+
+* An alternation whose branches match the same text, such as (a|aa)+
+
+    >>> from pysimplevalidate import redos
+    >>> redos.analyzeRegex(r'^(\\w+\\s?)+$')
+    ["nested quantifiers in '(\\\\w+\\\\s?)+'"]
+    >>> redos.analyzeRegex(r'^(\\w+\\s)+$')
+    []
+    >>> redos.rewriteRegex(r'^(?:\\d+)+$')
+    '^\\\\d+$'
+
+This is a quick check, not a proof: it can flag a pattern that is safe,
+and it doesn't look for patterns that take polynomial time, such as
+\\d+\\d+$, which slow down on long values but can't freeze a worker. To
+keep the check quick, only the first 500 pairs of branches of a long
+alternation are compared.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import itertools
+import re
+
+from typing import Any, List, Optional
+
+from pysimplevalidate.pikevm import _Parser
+
+# The characters tried when checking if two character classes overlap, besides the characters and
+# range ends that the classes list. They cover the categories such as \w, \d, and \s.
+_SAMPLE_CHARS = "".join(chr(i) for i in range(128)) + u"\u00a0\u00e9\u00df\u0661\u2028\u4e2d"  # type: str
+
+# The most pairs of branches of an alternation that are compared for overlaps. Comparing every pair of a
+# 500-word alternation takes seconds, and the analysis runs the first time a pattern is used.
+_MAX_BRANCH_PAIRS = 500  # type: int
+
+# A part of a pattern that matches one character: an escape other than a backreference or
+# assertion, a character class, or a character that isn't a metacharacter.
+_ATOM_PATTERN = r"\\[^\dAbBZ]|\[\^?\]?(?:\\.|[^\]\\])*\]|[^\\()\[\]|*+?{}^$]"  # type: str
+
+# Matches a repeated group around a repeated atom, such as (?:a+)+, or an escape or character
+# class, which is skipped over so that an escaped parenthesis isn't mistaken for a group.
+_NESTED_REPEAT_REGEX = re.compile(
+    r"\((\?:)?(" + _ATOM_PATTERN + r")([*+])\)([*+])(?![?+*{])|(\\.|\[\^?\]?(?:\\.|[^\]\\])*\])"
+)
+
+
+def _atomMatches(atom, ch):
+    # type: (Any, str) -> bool
+    """Returns True if atom, a 'char', 'any', or 'class' node, matches ch."""
+    kind = atom[0]
+    if kind == "char":
+        return ch == atom[1] or bool(atom[2] & re.IGNORECASE) and ch.lower() == atom[1].lower()
+    if kind == "any":
+        return ch != "\n" or bool(atom[1] & re.DOTALL)
+    return atom[1].matches(ch)
+
+
+def _atomChars(atom):
+    # type: (Any) -> str
+    """Returns the characters that atom names, to test for overlaps with."""
+    if atom[0] == "char":
+        return atom[1] + atom[1].lower() + atom[1].upper()
+    if atom[0] == "class":
+        return "".join(atom[1].chars) + "".join(low + high for low, high in atom[1].ranges)
+    return ""
+
+
+def _atomsOverlap(atoms1, atoms2):
+    # type: (List[Any], List[Any]) -> bool
+    """Returns True if an atom in atoms1 and an atom in atoms2 can match the same character."""
+    for atom1 in atoms1:
+        for atom2 in atoms2:
+            if atom1[0] == "char" or atom2[0] == "char":
+                chars = _atomChars(atom1) + _atomChars(atom2)
+            else:
+                chars = _atomChars(atom1) + _atomChars(atom2) + _SAMPLE_CHARS
+            for ch in chars:
+                if _atomMatches(atom1, ch) and _atomMatches(atom2, ch):
+                    return True
+    return False
+
+
+def _unwrap(node):
+    # type: (Any) -> Any
+    """Returns node without the groups around it."""
+    while node[0] == "group":
+        node = node[2]
+    return node
+
+
+def _isVariableRepeat(node):
+    # type: (Any) -> bool
+    """Returns True if node is a quantifier that can repeat more than once
+    and can repeat a different number of times, such as a+ or a{1,3}."""
+    return node[0] == "repeat" and (node[3] is None or node[3] > max(node[2], 1))
+
+
+def _nullable(node):
+    # type: (Any) -> bool
+    """Returns True if node can match the empty string."""
+    kind = node[0]
+    if kind in ("char", "any", "class"):
+        return False
+    if kind == "group":
+        return _nullable(node[2])
+    if kind == "concat":
+        return all(_nullable(item) for item in node[1])
+    if kind == "alternate":
+        return any(_nullable(branch) for branch in node[1])
+    if kind == "repeat":
+        return node[2] == 0 or _nullable(node[1])
+    return True  # Assertions, lookarounds, and backreferences (which can refer to an empty group).
+
+
+def _firstAtoms(node):
+    # type: (Any) -> List[Any]
+    """Returns a list of the atoms that can match the first character that node matches."""
+    kind = node[0]
+    if kind in ("char", "any", "class"):
+        return [node]
+    if kind == "group":
+        return _firstAtoms(node[2])
+    if kind == "concat":
+        atoms = []  # type: List[Any]
+        for item in node[1]:
+            atoms.extend(_firstAtoms(item))
+            if not _nullable(item):
+                break
+        return atoms
+    if kind == "alternate":
+        return [atom for branch in node[1] for atom in _firstAtoms(branch)]
+    if kind == "repeat":
+        return _firstAtoms(node[1]) if node[3] != 0 else []
+    if kind == "backref":
+        return [("any", re.DOTALL)]  # A backreference could match anything.
+    return []
+
+
+def _atomSequence(node):
+    # type: (Any) -> Optional[List[Any]]
+    """Returns the list of atoms that node matches one after another, such
+    as the atoms for a, b, and [cd] in ab[cd], or None if node matches
+    something other than a fixed number of characters."""
+    kind = node[0]
+    if kind in ("char", "any", "class"):
+        return [node]
+    if kind == "group":
+        return _atomSequence(node[2])
+    if kind == "concat":
+        atoms = []  # type: List[Any]
+        for item in node[1]:
+            itemAtoms = _atomSequence(item)
+            if itemAtoms is None:
+                return None
+            atoms.extend(itemAtoms)
+        return atoms
+    if kind == "repeat" and node[2] == node[3]:
+        bodyAtoms = _atomSequence(node[1])
+        return None if bodyAtoms is None else bodyAtoms * node[2]
+    return None
+
+
+def _soleRepeats(node):
+    # type: (Any) -> List[Any]
+    """Returns a list of the variable quantifiers in node that node can
+    match with by themselves, with the rest of node matching the empty
+    string. In (\\w+\\s?), that's \\w+."""
+    kind = node[0]
+    if kind == "group":
+        return _soleRepeats(node[2])
+    if kind == "alternate":
+        return [repeat for branch in node[1] for repeat in _soleRepeats(branch)]
+    if kind == "concat":
+        repeats = []  # type: List[Any]
+        for i, item in enumerate(node[1]):
+            if all(_nullable(other) for j, other in enumerate(node[1]) if j != i):
+                repeats.extend(_soleRepeats(item))
+        return repeats
+    if _isVariableRepeat(node):
+        return [node]
+    return []
+
+
+def _branchesOverlap(branch1, branch2, follow):
+    # type: (Any, Any, List[Any]) -> bool
+    """Returns True if the alternation branches can match the same text.
+    The follow argument is the list of atoms that can match the character
+    after the alternation, which decides if a longer branch like aa can
+    also be matched as a shorter branch like a, twice."""
+    atoms1, atoms2 = _atomSequence(branch1), _atomSequence(branch2)
+    if atoms1 is None or atoms2 is None:
+        return _atomsOverlap(_firstAtoms(branch1), _firstAtoms(branch2))
+    shorter = min(len(atoms1), len(atoms2))
+    for i in range(shorter):
+        if not _atomsOverlap([atoms1[i]], [atoms2[i]]):
+            return False
+    if len(atoms1) == len(atoms2):
+        return True
+    if shorter == 0:
+        return False  # re stops repeating a group when it matches the empty string.
+    longer = atoms1 if len(atoms1) > len(atoms2) else atoms2
+    return _atomsOverlap([longer[shorter]], follow)
+
+
+def _repeatProblem(repeat):
+    # type: (Any) -> Optional[str]
+    """Returns a description of why the unbounded quantifier node repeat can
+    take exponential time, or None if it can't."""
+    body = repeat[1]
+    text = repeat[5]
+    if _soleRepeats(body):
+        return "nested quantifiers in '%s'" % (text,)
+
+    unwrapped = _unwrap(body)
+    items = unwrapped[1] if unwrapped[0] == "concat" else [unwrapped]
+    for i, item in enumerate(items):
+        item = _unwrap(item)
+        if _isVariableRepeat(item):
+            # If what comes after the quantifier can match the same characters, the body can end in different places.
+            for other in items[i + 1 :]:
+                if _atomsOverlap(_firstAtoms(item[1]), _firstAtoms(other)):
+                    return "overlapping quantifier '%s' in '%s'" % (item[5], text)
+                if not _nullable(other):
+                    break
+        if item[0] == "alternate":
+            # The atoms that can follow the alternation: the rest of the body, then the next repetition.
+            follow = []  # type: List[Any]
+            for after in items[i + 1 :]:
+                follow.extend(_firstAtoms(after))
+                if not _nullable(after):
+                    break
+            else:
+                follow.extend(_firstAtoms(body))
+            for branch, otherBranch in itertools.islice(itertools.combinations(item[1], 2), _MAX_BRANCH_PAIRS):
+                if _branchesOverlap(branch, otherBranch, follow):
+                    return "overlapping alternation '%s' in '%s'" % (item[2], text)
+    return None
+
+
+def _findProblems(node, problems):
+    # type: (Any, List[str]) -> None
+    """Appends the description of each problem in node to problems."""
+    if node[0] == "repeat" and node[3] is None:
+        problem = _repeatProblem(node)
+        if problem is not None:
+            problems.append(problem)
+            return  # Any problem inside this quantifier is part of this one.
+    kind = node[0]
+    if kind in ("group",):
+        _findProblems(node[2], problems)
+    elif kind in ("concat", "alternate"):
+        for child in node[1]:
+            _findProblems(child, problems)
+    elif kind in ("repeat", "lookaround"):
+        _findProblems(node[1], problems)
+
+
+def analyzeRegex(pattern, flags=0):
+    # type: (str, int) -> List[str]
+    """Returns a list of descriptions of the parts of the str pattern that
+    can make a backtracking regex engine take exponential time, or an empty
+    list if none were found. Raises re.error if the pattern is invalid or
+    uses syntax that pysimplevalidate.pikevm doesn't parse, such as atomic
+    groups (which can't backtrack anyway).
+
+    >>> from pysimplevalidate import redos
+    >>> redos.analyzeRegex(r'(a|aa)+$')
+    ["overlapping alternation 'a|aa' in '(a|aa)+'"]
+    >>> redos.analyzeRegex(r'(\\d+\\.?\\d+)*x')
+    ["overlapping quantifier '\\\\d+' in '(\\\\d+\\\\.?\\\\d+)*'"]
+    """
+    problems = []  # type: List[str]
+    _findProblems(_Parser(pattern, flags).parse(), problems)
+    return problems
+
+
+def _rewriteNestedRepeat(mo):
+    # type: (Any) -> str
+    """The replacement function for _NESTED_REPEAT_REGEX in rewriteRegex()."""
+    if mo.group(5) is not None:
+        return mo.group()  # An escape or character class, which is left as it is.
+    nonCapturing, atom, inner, outer = mo.group(1, 2, 3, 4)
+    if nonCapturing:
+        return atom + ("+" if inner == outer == "+" else "*")
+    if inner == outer == "+":
+        return "(" + atom + "+)"  # The group still captures the same text.
+    return mo.group()
+
+
+def rewriteRegex(pattern, flags=0):
+    # type: (str, int) -> str
+    """Returns pattern with the nested quantifiers that can be safely
+    removed removed: a repeated group around a repeated character, such as
+    (?:a+)+ or (?:[0-9]*)+, becomes the repeated character (a+ or [0-9]*),
+    which matches the same text. A capturing group keeps capturing the same
+    text, so (a+)+ becomes (a+). The rest of the pattern is unchanged.
+    Verbose patterns aren't rewritten."""
+    if flags & re.VERBOSE or re.match(r"\(\?[aiLmsu]*x", pattern):
+        return pattern
+    while True:
+        rewritten = _NESTED_REPEAT_REGEX.sub(_rewriteNestedRepeat, pattern)
+        if rewritten == pattern:
+            return pattern
+        pattern = rewritten
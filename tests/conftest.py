@@ -0,0 +1,4 @@
+import sys
+
+# test_aio.py uses async generators and asyncio.run(), which need Python 3.7 or later.
+collect_ignore = ['test_aio.py'] if sys.version_info < (3, 7) else []
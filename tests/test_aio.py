@@ -0,0 +1,121 @@
+import asyncio
+import concurrent.futures
+import datetime
+
+import pytest
+
+import pysimplevalidate as pysv
+
+
+async def collect(stream):
+    return [item async for item in stream]
+
+
+def test_validateStream_loopback():
+    lines = ['1', 'two', '  3  ', '400', '', '5']
+
+    async def main():
+        results = []
+
+        async def handleClient(reader, writer):
+            async for line, result, exc in pysv.validateStream(reader, pysv.validateInt, max=100, maxQueueSize=2):
+                results.append((line, result, exc.code if exc else None))
+            writer.close()
+
+        server = await asyncio.start_server(handleClient, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(('\r\n'.join(lines) + '\n').encode('utf-8'))
+        writer.write_eof()
+        await reader.read()  # Wait for the server to finish and close the connection.
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return results
+
+    assert asyncio.run(main()) == [
+        ('1', 1, None), ('two', None, 'NOT_INT'), ('  3  ', 3, None), ('400', None, 'NUM_MAX'),
+        ('', None, 'BLANK'), ('5', 5, None)]
+
+
+def test_validateStream_backpressure():
+    async def main():
+        numRead = 0
+        maxReadAhead = 0
+
+        async def lines():
+            nonlocal numRead
+            for i in range(200):
+                numRead += 1
+                yield str(i)
+
+        numTaken = 0
+        async for line, result, exc in pysv.validateStream(lines(), pysv.validateInt, maxQueueSize=10):
+            numTaken += 1
+            await asyncio.sleep(0)  # A slow consumer.
+            maxReadAhead = max(maxReadAhead, numRead - numTaken)
+            assert result == int(line)
+        return numTaken, maxReadAhead
+
+    numTaken, maxReadAhead = asyncio.run(main())
+    assert numTaken == 200
+    assert maxReadAhead <= 12  # The queue's 10 lines, plus the line being put and the line being taken.
+
+
+def test_validateStream_executor():
+    values = ['2019/10/31 12:30:00', 'nope', '2019/02/30 00:00:00'] * 50 + ['2020/01/01 00:00:00']
+
+    async def lines():
+        for value in values:
+            yield value.encode('utf-8') + b'\n'
+            await asyncio.sleep(0)
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        results = asyncio.run(collect(pysv.validateStream(
+            lines(), pysv.validateDatetime, executor=executor, chunkSize=7, formats=['%Y/%m/%d %H:%M:%S'])))
+    assert [line for line, result, exc in results] == values
+    assert [result for line, result, exc in results] == [
+        datetime.datetime(2019, 10, 31, 12, 30), None, None] * 50 + [datetime.datetime(2020, 1, 1)]
+    assert [exc.code for line, result, exc in results if exc is not None] == ['NOT_DATETIME'] * 100
+
+    # The executor's threads validate with the caller's useLang() and useRegexEngine() settings.
+    def settings(value):
+        return pysv.getLang(), pysv.getRegexEngine().name
+
+    async def main():
+        with pysv.useLang('de'), pysv.useRegexEngine('pike'):
+            return await collect(pysv.validateStream(lines(), settings, executor=executor, chunkSize=7))
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        results = asyncio.run(main())
+    assert [result for line, result, exc in results] == [('de', 'pike')] * len(values)
+
+
+def test_validateStream_errors():
+    async def brokenLines():
+        yield '1'
+        raise ConnectionResetError('the sender went away')
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(collect(pysv.validateStream(brokenLines(), pysv.validateInt)))
+
+    async def endlessLines():
+        i = 0
+        while True:
+            i += 1
+            yield str(i)
+
+    async def firstThree():
+        results = []
+        async for line, result, exc in pysv.validateStream(endlessLines(), pysv.validateInt):
+            results.append(result)
+            if len(results) == 3:
+                break  # Stops the reader task, so the endless source isn't read forever.
+        return results
+
+    assert asyncio.run(firstThree()) == [1, 2, 3]
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        asyncio.run(collect(pysv.validateStream(['1'], pysv.validateInt)))
+    with pytest.raises(pysv.PySimpleValidateException):
+        asyncio.run(collect(pysv.validateStream(endlessLines(), pysv.validateInt, maxQueueSize=0)))
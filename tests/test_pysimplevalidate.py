@@ -1,4 +1,16 @@
+import array
+import calendar
+import concurrent.futures
 import datetime
+import functools
+import inspect
+import json
+import mmap
+import os
+import pickle
+import re
+import tempfile
+import threading
 
 import pytest
 # NOTE: PySimpleValidate tests using PyTest 3.6.3. Doesn't support versions before 3.0.
@@ -390,6 +402,1238 @@ def test_validateFilename():
     with pytest.raises(pysv.ValidationException, match='is not a valid filename'):
         pysv.validateFilename('|')
 
+
+def test_validateUSState_names():
+    assert pysv.validateUSState('new york') == 'NY'
+    assert pysv.validateUSState('NEW  YORK') == 'NY'
+    assert pysv.validateUSState('ny', returnStateName=True) == 'New York'
+
+
+def test_validateCAProvince():
+    # Test typical usage.
+    assert pysv.validateCAProvince('on') == 'ON'
+    assert pysv.validateCAProvince('British Columbia') == 'BC'
+    assert pysv.validateCAProvince('qc', returnProvinceName=True) == 'Quebec'
+
+    # Test typical failure cases.
+    with pytest.raises(pysv.ValidationException, match="'CA' is not a Canadian province or territory."):
+        pysv.validateCAProvince('CA')
+
+
+def test_validateCountry():
+    # Test typical usage.
+    assert pysv.validateCountry('us') == 'US'
+    assert pysv.validateCountry('USA') == 'US'
+    assert pysv.validateCountry('japan') == 'JP'
+    assert pysv.validateCountry('jpn', returnCountryName=True) == 'Japan'
+
+    # Test typical failure cases.
+    with pytest.raises(pysv.ValidationException, match="'Atlantis' is not a country."):
+        pysv.validateCountry('Atlantis')
+
+
+def test_validateCurrency():
+    # Test typical usage.
+    assert pysv.validateCurrency('eur') == 'EUR'
+    assert pysv.validateCurrency('840') == 'USD'
+    assert pysv.validateCurrency('pound sterling') == 'GBP'
+    assert pysv.validateCurrency('CHF', returnCurrencyName=True) == 'Swiss Franc'
+
+    # Test typical failure cases.
+    with pytest.raises(pysv.ValidationException, match="'XYZ' is not a currency."):
+        pysv.validateCurrency('XYZ')
+
+
+def test_validateMonth(monkeypatch):
+    # Test typical usage.
+    assert pysv.validateMonth('jan') == 'January'
+    assert pysv.validateMonth('MARCH') == 'March'
+    assert pysv.validateMonth('Sept') == 'September'
+    assert pysv.validateMonth('12') == 'December'
+    assert pysv.validateDayOfWeek('fri') == 'Friday'
+
+    # Test a custom table.
+    assert pysv.validateMonth('ene', monthNames={'ENE': 'Enero', 'FEB': 'Febrero'}) == 'Enero'
+
+    # Test that changing the public tables doesn't leave the default tables' cached indexes stale.
+    monkeypatch.setitem(pysv.ENGLISH_MONTHS, 'JAN', 'Janvier')
+    assert pysv.validateMonth('jan') == 'January'
+    assert pysv.validateMonth('jan', monthNames=pysv.ENGLISH_MONTHS) == 'Janvier'
+
+    # Test typical failure cases.
+    with pytest.raises(pysv.ValidationException, match="'Smarch' is not a month."):
+        pysv.validateMonth('Smarch')
+
+
+def test_Blocklist(tmp_path):
+    blocklist = pysv.Blocklist(exact=['admin', ('root', 'Reserved name.')], substrings=['darn', ('heck', 'No hecking.')])
+    assert len(blocklist) == 4
+
+    # Test exact entries.
+    assert blocklist.search('admin') == pysv.DEFAULT_BLOCKLIST_RESPONSE
+    assert blocklist.search('root') == 'Reserved name.'
+    assert blocklist.search('rooted') is None
+
+    # Test substring entries.
+    assert blocklist.search('oh heck no') == 'No hecking.'
+    assert blocklist.search('darned') == pysv.DEFAULT_BLOCKLIST_RESPONSE
+    assert blocklist.search('dar n') is None
+
+    # Test case sensitivity.
+    assert blocklist.search('ROOT') is None
+    assert pysv.Blocklist(exact=['root'], caseSensitive=False).search('ROOT') == pysv.DEFAULT_BLOCKLIST_RESPONSE
+
+    # Test using a Blocklist in blockRegexes.
+    with pytest.raises(pysv.ValidationException, match='Reserved name.'):
+        pysv.validateStr('root', blockRegexes=[blocklist])
+    assert pysv.validateStr('alice', blockRegexes=[blocklist, 'x']) == 'alice'
+    assert pysv.validateStr('root', allowRegexes=['root'], blockRegexes=[blocklist]) == 'root'
+
+    # Test saving and loading with mmap.
+    filename = str(tmp_path / 'names.blocklist')
+    blocklist.save(filename)
+    loaded = pysv.Blocklist.load(filename)
+    assert loaded.search('root') == 'Reserved name.'
+    assert loaded.search('heckle') == 'No hecking.'
+    assert loaded.search('alice') is None
+    loaded.close()
+
+    # Test typical failure cases.
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.Blocklist(exact=[42])
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.Blocklist(substrings=[''])
+    with open(filename, 'wb') as fileObj:
+        fileObj.write(b'not a blocklist file')
+    with pytest.raises(pysv.PySimpleValidateException, match='not a blocklist file'):
+        pysv.Blocklist.load(filename)
+
+
+def test_ValidationException():
+    # Test the code and params of a failed validation.
+    with pytest.raises(pysv.ValidationException) as excInfo:
+        pysv.validateNum('5', max=4)
+    assert excInfo.value.code == 'NUM_MAX'
+    assert excInfo.value.params == {'value': '5', 'limit': 4}
+    assert excInfo.value.args == ('Number must be at maximum 4.',)
+    assert str(excInfo.value) == 'Number must be at maximum 4.'
+
+    # Test that pickling keeps the message, code, and params.
+    unpickled = pickle.loads(pickle.dumps(excInfo.value))
+    assert str(unpickled) == 'Number must be at maximum 4.'
+    assert unpickled.code == 'NUM_MAX' and unpickled.params == excInfo.value.params
+    assert unpickled.args == excInfo.value.args
+
+    # Test that the value in the message is truncated, but not in params.
+    with pytest.raises(pysv.ValidationException) as excInfo:
+        pysv.validateInt('X' * 60)
+    assert excInfo.value.code == 'NOT_INT'
+    assert excInfo.value.params['value'] == 'X' * 60
+    assert str(excInfo.value) == repr('X' * 50 + '...') + ' is not an integer.'
+
+    # Test that excMsg replaces the message but keeps the code.
+    with pytest.raises(pysv.ValidationException, match='Pick a state.') as excInfo:
+        pysv.validateUSState('gaseous', excMsg='Pick a state.')
+    assert excInfo.value.code == 'NOT_STATE'
+
+    # Test blocklist responses.
+    with pytest.raises(pysv.ValidationException, match='No cats.') as excInfo:
+        pysv.validateStr('cat', blockRegexes=[('cat', 'No cats.')])
+    assert excInfo.value.code == 'BLOCKED'
+
+    # Test exceptions raised with just a message.
+    exc = pysv.ValidationException('Custom message.')
+    assert str(exc) == 'Custom message.'
+    assert exc.code is None and exc.params == {}
+
+    # Every code has a standard message.
+    for code, (template, paramNames) in pysv.ERROR_MESSAGES.items():
+        assert str(pysv.ValidationException(None, code, dict.fromkeys(paramNames, 'x')))
+
+
+def test_validateBatch():
+    # Test collecting every failure.
+    result = pysv.validateBatch(['1', 'two', '3', '400', 'five'], pysv.validateInt, max=100)
+    assert result.results == [1, None, 3, None, None]
+    assert result.numValidated == 5
+    assert result.numFailed == 3
+    assert [index for index, exc in result.failures] == [1, 3, 4]
+    assert result.failureCounts == {'NOT_INT': 2, 'NUM_MAX': 1}
+    assert result.firstFailures == {'NOT_INT': 1, 'NUM_MAX': 3}
+    assert not result.aborted and result.abortReason is None
+
+    # Test stopping at the first failure.
+    result = pysv.validateBatch(['1', 'two', '3'], pysv.validateInt, collectAll=False)
+    assert result.results == [1, None]
+    assert result.aborted and result.abortReason == 'collectAll'
+
+    # Test the error budget.
+    result = pysv.validateBatch(['x'] * 10, pysv.validateInt, maxErrors=3)
+    assert result.numValidated == 3 and result.abortReason == 'maxErrors'
+
+    # Test the error rate, which isn't checked until minSampleSize values are validated.
+    values = ['x', '1', '2', '3'] * 50  # 25% bad
+    result = pysv.validateBatch(values, pysv.validateInt, maxErrorRate=0.2, minSampleSize=8)
+    assert result.numValidated == 8 and result.abortReason == 'maxErrorRate'
+    result = pysv.validateBatch(values, pysv.validateInt, maxErrorRate=0.4, minSampleSize=8)
+    assert result.numValidated == 200 and not result.aborted
+
+    # Test that any iterable works.
+    assert pysv.validateBatch(iter(['1', '2']), pysv.validateInt).results == [1, 2]
+
+    # Test typical failure cases.
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateBatch(['1'], 'validateInt')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateBatch(['1'], pysv.validateInt, maxErrors=0)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateBatch(['1'], pysv.validateInt, maxErrors=True)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateBatch(['1'], pysv.validateInt, maxErrorRate=1.5)
+
+
+def _writeCatalog(localeFolder, lang, messages):
+    # Writes a gettext .mo file with the given msgid: msgstr dict.
+    import struct
+    folder = localeFolder / lang / 'LC_MESSAGES'
+    folder.mkdir(parents=True)
+    keys = sorted(messages)
+    ids = b''.join(k.encode('utf-8') + b'\0' for k in keys)
+    strs = b''.join(messages[k].encode('utf-8') + b'\0' for k in keys)
+    keyStart = 7 * 4 + 16 * len(keys)
+    valueStart = keyStart + len(ids)
+    offsets = []
+    position = 0
+    for k in keys:
+        offsets += [len(k.encode('utf-8')), keyStart + position]
+        position += len(k.encode('utf-8')) + 1
+    position = 0
+    for k in keys:
+        offsets += [len(messages[k].encode('utf-8')), valueStart + position]
+        position += len(messages[k].encode('utf-8')) + 1
+    header = struct.pack('<7I', 0x950412de, 0, len(keys), 7 * 4, 7 * 4 + 8 * len(keys), 0, 0)
+    (folder / 'pysimplevalidate.mo').write_bytes(header + struct.pack('<%dI' % len(offsets), *offsets) + ids + strs)
+
+
+def test_lang(tmp_path, monkeypatch):
+    _writeCatalog(tmp_path, 'de', {'%r is not an integer.': '%r ist keine ganze Zahl.'})
+    monkeypatch.setattr(pysv, 'LOCALE_FOLDER', str(tmp_path))
+    monkeypatch.setattr(pysv, '_catalogs', {})
+
+    # Test the default language.
+    assert pysv.getLang() == 'en'
+    with pytest.raises(pysv.ValidationException, match="'x' is not an integer."):
+        pysv.validateInt('x')
+
+    # Test useLang().
+    with pysv.useLang('de'):
+        assert pysv.getLang() == 'de'
+        with pytest.raises(pysv.ValidationException, match="'x' ist keine ganze Zahl."):
+            pysv.validateInt('x')
+        # Messages without a translation are left in English.
+        with pytest.raises(pysv.ValidationException, match='Blank values are not allowed.'):
+            pysv.validateInt('')
+    assert pysv.getLang() == 'en'
+
+    # Test that the message uses the language from when the exception was raised.
+    with pysv.useLang('de'):
+        try:
+            pysv.validateInt('x')
+        except pysv.ValidationException as exc:
+            germanExc = exc
+    assert str(germanExc) == "'x' ist keine ganze Zahl."
+
+    # Test that languages with no catalog fall back to English.
+    with pysv.useLang('xx'):
+        with pytest.raises(pysv.ValidationException, match="'x' is not an integer."):
+            pysv.validateInt('x')
+
+    # Test setLang(), and that useLang() in other threads doesn't affect this one.
+    import threading
+    messages = {}
+
+    def validateIn(lang):
+        with pysv.useLang(lang):
+            try:
+                pysv.validateInt('x')
+            except pysv.ValidationException as exc:
+                messages[lang] = str(exc)
+
+    threads = [threading.Thread(target=validateIn, args=(lang,)) for lang in ('de', 'en')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert messages == {'de': "'x' ist keine ganze Zahl.", 'en': "'x' is not an integer."}
+
+    try:
+        pysv.setLang('de')
+        assert pysv.getLang() == 'de'
+        with pysv.useLang('en'):
+            assert pysv.getLang() == 'en'
+    finally:
+        pysv.setLang('en')
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.setLang(None)
+
+
+def test_validateInt_exact():
+    # Test that ints larger than 2**53 don't lose precision.
+    assert pysv.validateInt(str(2 ** 64 + 1)) == 2 ** 64 + 1
+    assert pysv.validateInt(str(2 ** 64 + 1) + '.000') == 2 ** 64 + 1
+    assert pysv.validateInt('-7.0') == -7
+    assert pysv.validateInt('3.') == 3
+    assert pysv.validateInt('3e2') == 300
+
+    with pytest.raises(pysv.ValidationException, match="'inf' is not an integer."):
+        pysv.validateInt('inf')
+    with pytest.raises(pysv.ValidationException, match="'3.01' is not an integer."):
+        pysv.validateInt('3.01')
+
+
+def test_validateDecimal():
+    import decimal
+
+    # Test typical usage.
+    assert pysv.validateDecimal('3.14') == decimal.Decimal('3.14')
+    assert pysv.validateDecimal('-.5') == decimal.Decimal('-0.5')
+    assert pysv.validateDecimal('1.5e3') == decimal.Decimal('1500')
+    assert pysv.validateDecimal('', blank=True) == ''
+
+    # Test maxDigits and maxScale.
+    assert pysv.validateDecimal('12345.678', maxDigits=8, maxScale=3) == decimal.Decimal('12345.678')
+    assert pysv.validateDecimal('0.005', maxDigits=3) == decimal.Decimal('0.005')
+    assert pysv.validateDecimal('000012.50', maxDigits=4) == decimal.Decimal('12.50')
+    with pytest.raises(pysv.ValidationException, match='Number must have at most 7 digits.'):
+        pysv.validateDecimal('12345.678', maxDigits=7)
+    with pytest.raises(pysv.ValidationException, match='Number must have at most 2 digits after the decimal point.') as excInfo:
+        pysv.validateDecimal('1.500', maxScale=2)
+    assert excInfo.value.code == 'DECIMAL_SCALE'
+    with pytest.raises(pysv.ValidationException, match='Number must have at most 18 digits.'):
+        pysv.validateDecimal('1e999999999', maxDigits=18)
+
+    # Test the range arguments, including Decimal limits.
+    assert pysv.validateDecimal('4', max=4) == 4
+    with pytest.raises(pysv.ValidationException, match='Number must be at minimum 0.1.'):
+        pysv.validateDecimal('0.05', min=decimal.Decimal('0.1'))
+    with pytest.raises(pysv.ValidationException, match='Number must be less than 4.'):
+        pysv.validateDecimal('4.0', lessThan=4)
+
+    # Test typical failure cases.
+    for value in ('abc', '.', 'NaN', 'Infinity', '1.2.3', '1e'):
+        with pytest.raises(pysv.ValidationException, match='is not a decimal number.'):
+            pysv.validateDecimal(value)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateDecimal('1', maxDigits=0)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateDecimal('1', maxDigits=2, maxScale=3)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateDecimal('1', min='0')
+
+
+def test_validateNumBuffer():
+    def bits(validity, count):
+        return [bool(validity[i // 8] & (1 << (i % 8))) for i in range(count)]
+
+    values, validity = pysv.validateNumBuffer(b'1\n2.0\nfoo\n\n5e1\r\n99999999999999999999\n-3\n', numType='int')
+    assert values.typecode == 'q'
+    assert list(values) == [1, 2, 0, 0, 50, 0, -3]
+    assert bits(validity, 7) == [True, True, False, False, True, False, True]
+
+    values, validity = pysv.validateNumBuffer(memoryview(b'1.5,-2,x,inf'), delimiter=b',', min=0)
+    assert values.typecode == 'd'
+    assert list(values) == [1.5, 0.0, 0.0, float('inf')]
+    assert bits(validity, 4) == [True, False, False, True]
+
+    with tempfile.TemporaryFile() as fo:
+        fo.write(b'\n'.join(str(i).encode('ascii') for i in range(20)))
+        fo.flush()
+        mm = mmap.mmap(fo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            values, validity = pysv.validateNumBuffer(mm, numType='int', lessThan=10, greaterThan=2)
+        finally:
+            mm.close()
+    assert list(values) == [0, 0, 0] + list(range(3, 10)) + [0] * 10
+    assert validity == bytearray([0xf8, 0x03, 0x00])
+
+    assert pysv.validateNumBuffer(b'') == (array.array('d'), bytearray())
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateNumBuffer('1\n2')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateNumBuffer(b'1\n2', delimiter=b'')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateNumBuffer(b'1\n2', numType='num')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateNumBuffer(b'1\n2', min=5, max=1)
+
+
+def test_main(tmp_path):
+    import io
+    from pysimplevalidate.__main__ import main
+
+    def run(argv, inputBytes=b''):
+        stdin, stdout, stderr = io.BytesIO(inputBytes), io.BytesIO(), io.BytesIO()
+        exitCode = main(argv, stdin=stdin, stdout=stdout, stderr=stderr)
+        return exitCode, stdout.getvalue(), stderr.getvalue()
+
+    assert run(['-v', 'int', '--min', '0', '--max', '100'], b'5\n500\nabc\r\n 42 \n7') == (1, b'5\n42\n7\n', b'500\nabc\n')
+    assert run(['-v', 'int'], b'1\n2\n') == (0, b'1\n2\n', b'')
+    assert run(['-v', 'int'], b'') == (0, b'', b'')
+    assert run(['-v', 'choice', '--choice', 'cat', '--choice', 'dog', '--reasons'], b'cat\nfish\n') == (
+        1, b'cat\n', b"fish\t'fish' is not a valid choice.\n")
+
+    exitCode, stdout, stderr = run(['-v', 'float', '--greater-than', '0', '--stats'], b'1.5\n-2\nx\n')
+    assert stdout == b'1.5\n'
+    assert stderr.startswith(b'-2\nx\n3 values, 1 accepted, 2 rejected (66.67%)\n')
+    assert b'  NUM_GREATER_THAN: 1\n' in stderr and b'  NOT_FLOAT: 1\n' in stderr
+
+    # Multiple files, small chunks, worker processes, and a rejects file.
+    (tmp_path / 'a.txt').write_bytes(b''.join(b'%d\n' % i for i in range(500)))
+    (tmp_path / 'b.txt').write_bytes(b'x\n-1\n999')
+    rejectsPath = str(tmp_path / 'rejects.txt')
+    argv = ['-v', 'int', '--less-than', '500', '--greater-than', '-1', '-j', '2', '--chunk-size', '100',
+            '--rejects', rejectsPath, str(tmp_path / 'a.txt'), str(tmp_path / 'b.txt')]
+    exitCode, stdout, stderr = run(argv)
+    assert (exitCode, stdout, stderr) == (1, b''.join(b'%d\n' % i for i in range(500)), b'')
+    with open(rejectsPath, 'rb') as fo:
+        assert fo.read() == b'x\n-1\n999\n'
+
+    # Options that don't apply to the validator, or invalid arguments, are usage errors.
+    for argv in (['-v', 'email', '--min', '3'], ['-v', 'choice'], ['-v', 'choice', '--choice', 'a'],
+                 ['-v', 'int', '--min', '5', '--max', '1']):
+        with pytest.raises(SystemExit) as excinfo:
+            run(argv)
+        assert excinfo.value.code == 2
+
+
+def test_validateRegexBatch():
+    def perValue(validator, values, **kwargs):
+        results = []
+        for value in values:
+            try:
+                results.append(validator(value, **kwargs))
+            except pysv.ValidationException:
+                results.append(None)
+        return results
+
+    values = ['al@inventwithpython.com', ' al@example.com ', 'alinventwithpython.com', '', 'https://x.org/a?b=c',
+              'localhost', '127.0.0.1', '256.1.1.1', '1.2.3.4 x', '1::8', 'fe80::7:8%eth0', '::255.255.255.255',
+              'cat bat', 'CAT\ndog', 'dog\t', '12', 'a' * 300]
+    assert pysv.validateEmailBatch(values) == perValue(pysv.validateEmail, values)
+    assert pysv.validateURLBatch(values) == perValue(pysv.validateURL, values)
+    assert pysv.validateIPv4Batch(values) == perValue(pysv.validateIPv4, values)
+    assert pysv.validateIPv6Batch(values) == perValue(pysv.validateIPv6, values)
+    assert pysv.validateEmailBatch(values, blank=True, strip=False) == perValue(pysv.validateEmail, values, blank=True, strip=False)
+    kwargs = {'allowRegexes': [r'^\d+$'], 'blockRegexes': [r'example']}
+    assert pysv.validateEmailBatch(values, **kwargs) == perValue(pysv.validateEmail, values, **kwargs)
+
+    # Patterns that can't be scanned in a joined str (or can't span values) fall back to search() per value.
+    for regex, flags in [(r'cat', 0), (r'(cat)|(dog)', re.IGNORECASE), (r'^\w+$', 0), (r'\w*', 0), (r'b?', 0),
+                         (r'cat\s+\w+', 0), (r'(\w)\1', 0), (r'\w+\Z', 0), (r'dog(?!\n)', 0), (r'(?i)cat', 0),
+                         (r'cat # a comment', re.VERBOSE), (r'.*', re.DOTALL), (r'[^a]+', 0), (r'$', 0)]:
+        values = ['cat bat', 'CAT', 'dog', 'cat ', '  dog', 'aa', 'bb', 'zz', 'cat', 'dog', 'xyz']
+        assert pysv.validateRegexBatch(values, regex, flags, strip=False) == perValue(pysv.validateRegex, values, regex=regex, flags=flags, strip=False)
+        assert pysv.validateRegexBatch(values[-4:], re.compile(regex, flags)) == perValue(pysv.validateRegex, values[-4:], regex=re.compile(regex, flags))
+
+    assert pysv.validateRegexBatch([], r'cat') == []
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateRegexBatch(['cat'], 42)
+
+    # The joined-scan regexes are cached for a bounded number of patterns.
+    for i in range(pysv._MAX_COMPILED_PATTERNS + 10):
+        pysv.validateRegexBatch(['tenant%d' % i], r'tenant%d$' % i)
+    assert len(pysv._joinedScanRegexes) <= pysv._MAX_COMPILED_PATTERNS
+
+
+def test_validateFilepath_exists(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'docs').mkdir()
+    (tmp_path / 'docs' / 'a.txt').write_text('a')
+    (tmp_path / 'docs' / 'sub').mkdir()
+    (tmp_path / 'top.txt').write_text('top')
+    (tmp_path / 'docs' / 'link.txt').symlink_to(tmp_path / 'top.txt')
+    (tmp_path / 'docs' / 'broken').symlink_to(tmp_path / 'nothing')
+    (tmp_path / 'dirlink').symlink_to(tmp_path / 'docs')
+
+    paths = ['docs/a.txt', 'docs/sub', 'docs/sub/', 'docs/missing.txt', 'docs/link.txt', 'docs/broken', 'top.txt',
+             'missing/a.txt', 'top.txt/a.txt', 'dirlink/a.txt', 'dirlink/../top.txt', 'docs/./a.txt', '.', '??.txt',
+             str(tmp_path / 'docs' / 'a.txt'), str(tmp_path / 'docs' / 'nope'), '']
+    for kwargs in ({}, {'mustExist': True}, {'mustBeFile': True}, {'mustBeDir': True}, {'mustExist': True, 'blank': True}):
+        expected = []
+        for path in paths:
+            try:
+                expected.append(pysv.validateFilepath(path, **kwargs))
+            except pysv.ValidationException:
+                expected.append(None)
+        assert pysv.validateFilepathBatch(paths, **kwargs) == expected
+
+    assert pysv.validateFilepath('docs/a.txt', mustBeFile=True) == 'docs/a.txt'
+    with pytest.raises(pysv.ValidationException) as excinfo:
+        pysv.validateFilepath('docs/missing.txt', mustExist=True)
+    assert excinfo.value.code == 'PATH_NOT_FOUND'
+    with pytest.raises(pysv.ValidationException) as excinfo:
+        pysv.validateFilepath('docs/sub', mustBeFile=True)
+    assert excinfo.value.code == 'NOT_FILE'
+    with pytest.raises(pysv.ValidationException) as excinfo:
+        pysv.validateFilepath('docs/a.txt', mustBeDir=True)
+    assert excinfo.value.code == 'NOT_DIR'
+
+    # A cached listing is reused until its ttl expires or the cache is cleared.
+    cache = pysv.DirectoryCache(ttl=3600)
+    assert pysv.validateFilepathBatch(['docs/new.txt'], mustExist=True, cache=cache) == [None]
+    (tmp_path / 'docs' / 'new.txt').write_text('new')
+    assert pysv.validateFilepathBatch(['docs/new.txt'], mustExist=True, cache=cache) == [None]
+    cache.clear()
+    assert pysv.validateFilepathBatch(['docs/new.txt'], mustExist=True, cache=cache) == ['docs/new.txt']
+    assert pysv.validateFilepathBatch(['docs/new.txt'], mustExist=True, cache=pysv.DirectoryCache(ttl=0)) == ['docs/new.txt']
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateFilepath('foo.txt', mustBeFile=True, mustBeDir=True)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateFilepathBatch(['foo.txt'], cache={})
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.DirectoryCache(ttl=-1)
+
+
+def test_validateFilename_platforms(tmp_path, monkeypatch):
+    for name in ('CON', 'nul.txt', 'Com1.tar.gz', 'LPT9', 'aux .c', '.', '..'):
+        with pytest.raises(pysv.ValidationException, match='is a reserved filename'):
+            pysv.validateFilename(name, platform='windows')
+    for name in ('CON', 'nul.txt', 'console', 'COM10', '.config'):
+        assert pysv.validateFilename(name, platform='posix') == name
+    assert pysv.validateFilename('console.txt') == 'console.txt'
+    assert pysv.validateFilename('COM10') == 'COM10'
+
+    for name in ('a:b', 'a\x01b', 'trailing.', 'trailing '):
+        with pytest.raises(pysv.ValidationException, match='is not a valid filename'):
+            pysv.validateFilename(name, platform='windows', strip=False)
+        assert pysv.validateFilename(name, platform='posix', strip=False) == name
+    assert pysv.validateFilename(' leading', platform='windows', strip=False) == ' leading'
+    with pytest.raises(pysv.ValidationException, match='is not a valid filename'):
+        pysv.validateFilename(' leading', strip=False)
+    with pytest.raises(pysv.ValidationException, match='is not a valid filename'):
+        pysv.validateFilename('a\x00b', platform='posix')
+
+    # POSIX counts UTF-8 bytes and Windows counts UTF-16 code units.
+    assert pysv.validateFilename('a' * 255) == 'a' * 255
+    with pytest.raises(pysv.ValidationException, match='is too long for a filename'):
+        pysv.validateFilename('a' * 256, platform='windows')
+    assert pysv.validateFilename('é' * 255, platform='windows') == 'é' * 255
+    with pytest.raises(pysv.ValidationException, match='is too long for a filename'):
+        pysv.validateFilename('é' * 128, platform='posix')
+    with pytest.raises(pysv.ValidationException, match='is too long for a filename'):
+        pysv.validateFilename('\U0001f600' * 128, platform='windows')
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateFilename('foo.txt', platform='macos')
+
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'src' / 'aux.c').write_text('')
+    (tmp_path / 'src' / 'main.c').write_text('')
+    (tmp_path / 'docs:old').mkdir()
+    (tmp_path / 'docs:old' / 'readme.txt').write_text('')
+    failures = sorted(pysv.validateFilenameTree(str(tmp_path)))
+    assert [(path, exc.code) for path, exc in failures] == [
+        (str(tmp_path / 'docs:old'), 'NOT_FILENAME'), (str(tmp_path / 'src' / 'aux.c'), 'FILENAME_RESERVED')]
+    assert str(failures[1][1]) == "'aux.c' is a reserved filename."
+    assert pysv.validateFilenameTree(str(tmp_path), platform='posix') == []
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateFilenameTree(str(tmp_path / 'nonexistent'))
+
+    # Folders that can't be read are reported instead of skipped.
+    realScandir = os.scandir
+
+    def scandir(path):
+        if os.path.basename(path) == 'src':
+            raise PermissionError(13, 'Permission denied', path)
+        return realScandir(path)
+
+    monkeypatch.setattr(os, 'scandir', scandir)
+    failures = pysv.validateFilenameTree(str(tmp_path), platform='posix')
+    assert [(path, exc.code) for path, exc in failures] == [(str(tmp_path / 'src'), 'DIR_UNREADABLE')]
+    assert str(failures[0][1]).endswith(" is a folder that can't be read.")
+
+
+def test_validateDate_outputs():
+    assert pysv.validateDate('1970/01/02', output='epoch') == 86400
+    assert pysv.validateDate('1969/12/31', output='epochms') == -86400000
+    assert pysv.validateDate('2004/02/29', output='ordinal') == datetime.date(2004, 2, 29).toordinal()
+    assert pysv.validateDate('2004/02/29', output='tuple') == (2004, 2, 29)
+    assert pysv.validateTime('01:02:03', output='epoch') == 3723
+    assert pysv.validateTime('01:02:03.456', formats=['%H:%M:%S.%f'], output='epochms') == 3723456
+    assert pysv.validateTime('01:02:03', output='tuple') == (1, 2, 3, 0)
+
+    for value in ('2018/10/31 12:00:01', '1969/12/31 23:59:59', '2038/01/19 03:14:08'):
+        dt = pysv.validateDatetime(value)
+        epoch = int((dt - datetime.datetime(1970, 1, 1)).total_seconds())
+        assert pysv.validateDatetime(value, output='epoch') == epoch
+        assert pysv.validateDatetime(value, output='epochms') == epoch * 1000
+        assert pysv.validateDatetime(value, output='ordinal') == dt.toordinal()
+    assert pysv.validateDatetime('1970-01-01 00:00:00.999999 +0100', formats=['%Y-%m-%d %H:%M:%S.%f %z'], output='epochms') == -3599001
+    assert pysv.validateDatetime('2018/10/31 12:00:01', output='tuple') == (2018, 10, 31, 12, 0, 1, 0)
+
+    # The min and max arguments are inclusive.
+    assert pysv.validateDate('2019/01/01', min=datetime.date(2019, 1, 1), max=datetime.date(2019, 1, 1)) == datetime.date(2019, 1, 1)
+    with pytest.raises(pysv.ValidationException, match='is before the minimum of 2019-01-01') as excinfo:
+        pysv.validateDate('2018/12/31', min=datetime.date(2019, 1, 1))
+    assert excinfo.value.code == 'DATE_MIN'
+    with pytest.raises(pysv.ValidationException, match='is after the maximum of 12:00:00'):
+        pysv.validateTime('12:00:01', max=datetime.time(12))
+    with pytest.raises(pysv.ValidationException) as excinfo:
+        pysv.validateDatetime('2018/10/31 12:00:01', max=datetime.datetime(2018, 10, 31, 12), output='epoch')
+    assert excinfo.value.code == 'DATE_MAX'
+    assert pysv.validateDate('today', allowRegexes=['today'], min=datetime.date(2019, 1, 1), output='epoch') == 'today'
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateTime('12:00:01', output='ordinal')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateDate('2019/01/01', output='seconds')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateDate('2019/01/01', min=datetime.datetime(2019, 1, 1))
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateDate('2019/01/01', min=datetime.date(2020, 1, 1), max=datetime.date(2019, 1, 1))
+
+    values, validity = pysv.validateDateTimeArray(['1970/01/02', 'nope', '', '2019/06/01', '1970/01/01'],
+                                                  min=datetime.date(1970, 1, 2), blank=True)
+    assert values.typecode == 'q'
+    assert list(values) == [86400, 0, 0, pysv.validateDate('2019/06/01', output='epoch'), 0]
+    assert validity == bytearray([0b01001])
+    values, validity = pysv.validateDateTimeArray(['00:00:01', '25:00:00'], pysv.validateTime, output='epochms')
+    assert (list(values), validity) == ([1000, 0], bytearray([1]))
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateDateTimeArray(['1'], pysv.validateInt)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateDateTimeArray(['2019/01/01'], output='tuple')
+
+
+def test_validatePhone():
+    assert pysv.validatePhone('+1 (415) 555-2671') == '+14155552671'
+    assert pysv.validatePhone('+1.415.555.2671') == '+14155552671'
+    assert pysv.validatePhone('001 415 555 2671') == '+14155552671'
+    assert pysv.validatePhone('(415) 555-2671', defaultRegion='us') == '+14155552671'
+    assert pysv.validatePhone('1-415-555-2671', defaultRegion='CA') == '+14155552671'
+    assert pysv.validatePhone('+44 (0)20 7946 0958') == '+442079460958'
+    assert pysv.validatePhone('020 7946 0958', defaultRegion='GB') == '+442079460958'
+    assert pysv.validatePhone('+39 06 6982 1234') == '+390669821234'  # Italy keeps the leading 0.
+    assert pysv.validatePhone('8 912 345 67 89', defaultRegion='RU') == '+79123456789'
+    assert pysv.validatePhone('+7 812 123 45 67') == '+78121234567'  # The 8 here is part of the number.
+    assert pysv.validatePhone('030 123456', defaultRegion='DE') == '+4930123456'
+    assert pysv.validatePhone('+49 (0)30 123456') == '+4930123456'
+    assert pysv.validatePhone('0049 030 123456') == '+4930123456'
+    assert pysv.validatePhone('03 1234 5678', defaultRegion='JP') == '+81312345678'
+    assert pysv.validatePhone('+81 (0)3 1234 5678') == '+81312345678'
+    assert pysv.validatePhone('+353 1 234 5678') == '+35312345678'
+    assert pysv.validatePhone('+44 20 7946 0958', defaultRegion='US') == '+442079460958'
+
+    for value in ('415 555 2671', '+1 415 555 267', '+1 415 555 26711', '+999 1234567', '+44 20 7946 0958 x12',
+                  '+', '+1', 'phone', '+33 1 23 45 67 89 00 00 00', '+٣٣ 1 23 45 67 89'):
+        with pytest.raises(pysv.ValidationException, match='is not a valid phone number') as excinfo:
+            pysv.validatePhone(value)
+        assert excinfo.value.code == 'NOT_PHONE'
+    assert pysv.validatePhone('', blank=True) == ''
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validatePhone('555 2671', defaultRegion='XX')
+
+    values = ['+1 415 555 2671', '(415) 555-2671', '555-2671', '', ' 0044 20 7946 0958 ', 'unknown']
+    assert pysv.validatePhoneBatch(values, defaultRegion='US') == [
+        '+14155552671', '+14155552671', None, None, '+442079460958', None]
+    assert pysv.validatePhoneBatch(values, defaultRegion='US', blank=True, allowRegexes=['^unknown$']) == [
+        '+14155552671', '+14155552671', None, '', '+442079460958', 'unknown']
+
+
+def test_validatePostalCode():
+    assert pysv.validatePostalCode('90210') == '90210'
+    assert pysv.validatePostalCode('90210-1234') == '90210-1234'
+    assert pysv.validatePostalCode('90210', state='CA') == '90210'
+    assert pysv.validatePostalCode('90210', state='california') == '90210'
+    assert pysv.validatePostalCode('10001', state='NY') == '10001'
+    assert pysv.validatePostalCode('20500', state='DC') == '20500'
+    assert pysv.validatePostalCode('00901', state='pr') == '00901'
+    assert pysv.validatePostalCode('99501', state='Alaska') == '99501'
+    assert pysv.validatePostalCode('k1a0b1', country='CA') == 'K1A 0B1'
+    assert pysv.validatePostalCode('SW1A 1AA', country='United Kingdom') == 'SW1A 1AA'
+    assert pysv.validatePostalCode('ec1a1bb', country='GB') == 'EC1A 1BB'
+    assert pysv.validatePostalCode('1234ab', country='NL') == '1234 AB'
+    assert pysv.validatePostalCode('10115', country='DEU') == '10115'
+    assert pysv.validatePostalCode('1000001', country='JP') == '100-0001'
+    assert pysv.validatePostalCode('', blank=True) == ''
+
+    for value, country in (('9021', 'US'), ('902101', 'US'), ('ABCDE', 'US'), ('D1A 0B1', 'CA'),
+                           ('1234', 'DE'), ('0123 AB', 'NL'), ('SW1A 1CA', 'GB')):
+        with pytest.raises(pysv.ValidationException, match='is not a valid postal code') as excinfo:
+            pysv.validatePostalCode(value, country=country)
+        assert excinfo.value.code == 'NOT_POSTAL_CODE'
+    for value, state in (('90210', 'NY'), ('10001', 'New Jersey'), ('26901', 'WV')):
+        with pytest.raises(pysv.ValidationException, match='is not a ZIP code in') as excinfo:
+            pysv.validatePostalCode(value, state=state)
+        assert excinfo.value.code == 'POSTAL_CODE_STATE'
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validatePostalCode('12345', country='XX')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validatePostalCode('12345', country='DE', state='NY')
+    for state in ('ZZ', 'XX', 'Atlantis'):
+        with pytest.raises(pysv.PySimpleValidateException):
+            pysv.validatePostalCode('90210', state=state)
+    assert pysv.validatePostalCode('09001', state='AE') == '09001'
+
+    # Every state in USA_STATES has ZIP codes.
+    prefixTable, stateNumbers = pysv._getZIP3Tables()
+    assert set().union(*prefixTable) >= set(stateNumbers[abbrev] for abbrev in pysv.USA_STATES)
+
+    # Some prefixes are shared by more than one state or territory.
+    for value, state in (('96950', 'MP'), ('96799', 'AS'), ('96939', 'PW'), ('96910', 'GU'), ('96701', 'HI')):
+        assert pysv.validatePostalCode(value, state=state) == value
+    assert pysv.validatePostalCodeBatch(['96950', '96799', '96939'], states=['MP', 'AS', 'CA']) == [
+        '96950', '96799', None]
+
+    values = ['90210', '10001', '9021', '', '60601', 'N/A']
+    states = ['CA', 'NJ', 'CA', 'TX', None, 'IL']
+    assert pysv.validatePostalCodeBatch(values, states=states) == ['90210', None, None, None, '60601', None]
+    assert pysv.validatePostalCodeBatch(values, states=states, blank=True, allowRegexes=['^N/A$']) == [
+        '90210', None, None, '', '60601', 'N/A']
+    assert pysv.validatePostalCodeBatch(['m5v 3l9', '12345'], country='CA') == ['M5V 3L9', None]
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validatePostalCodeBatch(values, states=states[:2])
+
+
+def test_threadSafety():
+    # The constant tables are plain dicts, so they can be serialized.
+    for table in (pysv.USA_STATES, pysv.USA_STATES_REVERSED, pysv.ENGLISH_MONTHS, pysv.ENGLISH_DAYS_OF_WEEK):
+        assert json.loads(json.dumps(table)) == table
+    assert pickle.loads(pickle.dumps(pysv.FILENAME_RULES)) == pysv.FILENAME_RULES
+
+    # Numeric formats are parsed without strptime(), with the same results.
+    for timeFormat, values in (('%Y/%m/%d', ('2019/10/31', '2019/1/3', '2019/02/30', '2019/10/31 ', '19/10/31')),
+                               ('%m/%d/%y', ('12/31/99', '1/ 2/68', '1/2/69', '13/1/20')),
+                               ('%Y-%m-%dT%H:%M:%S.%f', ('2019-10-31t23:59:59.12', '2019-10-31T23:59:60.0')),
+                               ('(%H)  %M%%', ('(1) \t2%', '(24) 00%')),
+                               ('%d %b %Y', ('31 Oct 2019', '31 Foo 2019'))):
+        for value in values:
+            try:
+                expected = datetime.datetime.strptime(value, timeFormat)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    pysv._strptime(value, timeFormat)
+            else:
+                assert pysv._strptime(value, timeFormat) == expected
+    assert pysv._strptimeRegexes['%Y/%m/%d'] is not None
+    assert pysv._strptimeRegexes['%d %b %Y'] is None  # Month names are left to strptime().
+
+    # The lazily built tables are only built once when threads race to use them.
+    pysv._phoneTables = None
+    barrier = threading.Barrier(8)
+
+    def validate(i):
+        barrier.wait()
+        return pysv.validatePhone('+1 415 555 %04d' % i), id(pysv._getPhoneTables())
+    with concurrent.futures.ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(validate, range(8)))
+    assert [phone for phone, tablesId in results] == ['+1415555%04d' % i for i in range(8)]
+    assert len(set(tablesId for phone, tablesId in results)) == 1
+
+    values = [str(i) if i % 7 else 'x%d' % i for i in range(2500)]
+    expected = pysv.validateBatch(values, pysv.validateInt, max=2000)
+    result = pysv.validateBatchThreaded(iter(values), pysv.validateInt, numThreads=4, chunkSize=300, max=2000)
+    assert result.results == expected.results
+    assert [(i, exc.code) for i, exc in result.failures] == [(i, exc.code) for i, exc in expected.failures]
+    assert result.failureCounts == expected.failureCounts == {'NOT_INT': 358, 'NUM_MAX': 427}
+    assert result.firstFailures == expected.firstFailures
+    assert result.numValidated == 2500
+    with concurrent.futures.ThreadPoolExecutor(2) as pool:
+        result = pysv.validateBatchThreaded(['2019/10/31', 'x'], pysv.validateDate, executor=pool, formats=['%Y/%m/%d'])
+    assert result.results == [datetime.date(2019, 10, 31), None]
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.validateBatchThreaded(values, pysv.validateInt, numThreads=0)
+
+    # The chunks use the caller's useLang() and useRegexEngine() settings, not those of the executor's threads.
+    def settings(value):
+        return pysv.getLang(), pysv.getRegexEngine().name
+    with pysv.useLang('de'), pysv.useRegexEngine('pike'):
+        result = pysv.validateBatchThreaded(['1', '2', '3'], settings, numThreads=2, chunkSize=1)
+        assert result.results == [('de', 'pike')] * 3
+        result = pysv.validateBatchThreaded(['x'], pysv.validateInt, numThreads=2)
+    assert result.failures[0][1]._lang == 'de'  # The failure messages are in the caller's language.
+
+
+def test_RecordSchema(monkeypatch):
+    monthrangeCalls = []
+    monthrange = calendar.monthrange
+
+    def countingMonthrange(year, month):
+        monthrangeCalls.append((year, month))
+        return monthrange(year, month)
+    monkeypatch.setattr(calendar, 'monthrange', countingMonthrange)
+    monkeypatch.setattr(pysv, '_DAYS_IN_MONTH', {})
+
+    schema = pysv.RecordSchema()
+    schema.addField('day', pysv.validateDayOfMonth, dependsOn=['year', 'month'])
+    schema.addField('month', pysv.validateInt, min=1, max=12)
+    schema.addField('year', pysv.validateInt, min=1900, max=2100)
+    schema.addField('state', pysv.validateUSState)
+    schema.addField('zip', pysv.validatePostalCode, dependsOn={'state': 'state'})
+    assert schema._getOrder() == ['month', 'year', 'day', 'state', 'zip']
+
+    records = [{'year': '2019', 'month': '10', 'day': str(i % 31 + 1), 'state': 'NY', 'zip': '10001'} for i in range(1000)]
+    results = list(schema.validateRecords(records))
+    assert all(errors == {} for values, errors in results)
+    assert results[30][0] == {'year': 2019, 'month': 10, 'day': 31, 'state': 'NY', 'zip': '10001'}
+    assert monthrangeCalls == [(2019, 10)]
+
+    values, errors = schema.validateRecord({'year': '2019', 'month': '13', 'day': '1', 'state': 'New York', 'zip': '90210'})
+    assert values == {'year': 2019, 'state': 'NY'}  # The day isn't validated, because the month failed.
+    assert sorted((name, exc.code) for name, exc in errors.items()) == [('month', 'NUM_MAX'), ('zip', 'POSTAL_CODE_STATE')]
+    values, errors = schema.validateRecord({'year': '2019', 'month': '2'})
+    assert sorted((name, exc.code) for name, exc in errors.items()) == [
+        ('day', 'NOT_DAY_OF_MONTH'), ('state', 'BLANK')]
+
+    # The derive results are memoized for each combination of dependency values.
+    deriveCalls = []
+
+    def dayLimits(year, month):
+        deriveCalls.append((year, month))
+        return {'min': 1, 'max': calendar.monthrange(year, month)[1]}
+    schema.addField('day', pysv.validateInt, dependsOn=['year', 'month'], derive=dayLimits)
+    records = [{'year': '2020', 'month': str(i % 3 + 1), 'day': '29', 'state': 'NY', 'zip': '10001'} for i in range(300)]
+    assert [sorted(errors) for values, errors in schema.validateRecords(records)][:3] == [[], [], []]
+    assert sorted(deriveCalls) == [(2020, 1), (2020, 2), (2020, 3)]
+
+    schema = pysv.RecordSchema()
+    schema.addField('a', pysv.validateStr, dependsOn=['b'])
+    with pytest.raises(pysv.PySimpleValidateException, match='no rule'):
+        schema.validateRecord({})
+    schema.addField('b', pysv.validateStr, dependsOn=['a'])
+    with pytest.raises(pysv.PySimpleValidateException, match='cycle'):
+        schema.validateRecord({})
+    with pytest.raises(pysv.PySimpleValidateException):
+        schema.addField('c', pysv.validateStr, dependsOn='a')
+
+
+def test_regexEngines():
+    from pysimplevalidate import pikevm
+
+    ipv6Values = ['::1', 'fe80::7:8%eth0', '2001:db8::1', 'cat']
+    reResults = pysv.validateIPv6Batch(ipv6Values)
+    assert pysv.getRegexEngine() == pysv.StdlibRegexEngine()
+    with pysv.useRegexEngine('pike'):
+        assert pysv.getRegexEngine() == pysv.PikeRegexEngine()
+        assert pysv.validateIP('192.168.0.1') == '192.168.0.1'
+        assert pysv.validateURL('https://www.example.com/path') == 'https://www.example.com/path'
+        assert pysv.validateIPv6Batch(ipv6Values) == reResults
+        with pytest.raises(pysv.ValidationException):
+            pysv.validateStr('cat', blockRegexes=[re.compile('^c')])
+        assert pysv.validateInt('x', allowRegexes=[r'^x$']) == 'x'
+    assert pysv.getRegexEngine() == pysv.StdlibRegexEngine()
+
+    # The pike engine finds the same matches and groups as re on the built-in patterns.
+    for regex, value in [(pysv.IPV6_REGEX, '2001:db8:3:4::192.0.2.33'), (pysv.EMAIL_REGEX, 'al@example.com'),
+                         (pysv.URL_REGEX, 'see http://example.com/a?b=c.'), (pysv.DECIMAL_REGEX, ' -12.50e3 '),
+                         (re.compile(r'(?P<user>\w+)@(\w+)\.com|x+?', re.I), 'mail AL@EXAMPLE.COM')]:
+        mo, pikeMo = regex.search(value), pikevm.compile(regex.pattern, regex.flags).search(value)
+        assert (mo.span(), mo.groups()) == (pikeMo.span(), pikeMo.groups())
+    assert pikevm.compile(r'^a{2,3}?$').match('aa') is not None
+    assert pikevm.compile(r'\bcat\b').search('concat cat').span() == (7, 10)
+    for unsupported in [r'(a)\1', r'(?=a)', r'(?<!a)b', r'a++']:
+        with pytest.raises(re.error):
+            pikevm.compile(unsupported)
+
+    # Backtracking takes exponential time for this value, but the pike engine takes linear time.
+    with pytest.raises(pysv.ValidationException, match='does not match'):
+        pysv.validateRegex('a' * 10000 + '!', r'^(a+)+$', regexEngine='pike')
+    assert pysv.validateRegexBatch(['aa', 'ab'], r'^(a|aa)+$', regexEngine=pysv.PikeRegexEngine()) == ['aa', None]
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.setRegexEngine('perl')
+    try:
+        import regex  # noqa: F401
+    except ImportError:
+        with pytest.raises(pysv.PySimpleValidateException, match='pip install regex'):
+            pysv.RegexModuleEngine(timeout=0.1)
+    else:
+        with pysv.useRegexEngine(pysv.RegexModuleEngine(timeout=0.05)):
+            with pytest.raises(pysv.ValidationException) as excInfo:
+                pysv.validateRegex('a' * 40 + '!', r'^(a+)+$')
+            assert excInfo.value.code == 'REGEX_TIMEOUT'
+
+
+def test_reDoSPolicy():
+    assert pysv.getReDoSPolicy() == 'warn'
+    assert pysv.analyzeRegex(r'^(a+)+$') == ["nested quantifiers in '(a+)+'"]
+    assert pysv.analyzeRegex(r'^(a|aa)*c$') and pysv.analyzeRegex(r'^(\d+\d+)+$')
+    assert pysv.analyzeRegex(r'^(a|ab)*c$') == []
+    assert pysv.analyzeRegex(pysv.URL_REGEX.pattern) == []
+    assert pysv.rewriteRegex(r'^(?:a+)+$') == '^a+$'
+
+    with pytest.warns(pysv.ReDoSWarning, match='exponential time'):
+        pysv.validateStr('aaa', allowRegexes=[r'^(a+)+$'])
+    with pytest.warns(pysv.ReDoSWarning):
+        pysv.validateStr('aaa', blockRegexes=[(r'^(\w+\s?)+!$', 'No shouting.')])
+    with pytest.warns(pysv.ReDoSWarning):
+        assert pysv.validateRegex('aaa', r'^(a|aa)+$') == 'aaa'
+    with pytest.warns(pysv.ReDoSWarning):
+        assert pysv.validateRegexStr(r'(x+x+)+y').pattern == r'(x+x+)+y'
+
+    # Patterns nested too deeply for the parser aren't analyzed, and long alternations are analyzed quickly.
+    deepPattern = '(' * 200 + 'a' + ')' * 200
+    assert pysv._getReDoSRisk(deepPattern) == ([], None)
+    assert pysv._getLiteralPrefilter(deepPattern) is None
+    assert pysv.validateStr('b', blockRegexes=[deepPattern]) == 'b'
+    with pytest.raises(pysv.ValidationException):
+        pysv.validateStr('a', blockRegexes=[deepPattern])
+    words = [r'[a-f]%d\d' % i for i in range(500)]
+    assert pysv.analyzeRegex('^(?:%s)+$' % '|'.join(words)) == []
+    assert pysv.analyzeRegex('^(?:%s)+$' % '|'.join(words[:10] + ['a|aa'])) != []
+
+    try:
+        pysv.setReDoSPolicy('reject')
+        with pytest.raises(pysv.PySimpleValidateException, match='nested quantifiers'):
+            pysv.validateStr('aaa', allowRegexes=[r'^(a+)+$'])
+        with pytest.raises(pysv.PySimpleValidateException):
+            pysv.validateRegexBatch(['aaa'], re.compile(r'^(a+)+$'))
+        with pytest.raises(pysv.ValidationException) as excInfo:
+            pysv.validateRegexStr(r'(x+x+)+y')
+        assert excInfo.value.code == 'REGEX_REDOS'
+
+        # The pike engine takes linear time, so its patterns aren't checked.
+        with pysv.useRegexEngine('pike'):
+            assert pysv.validateRegex('aaa', r'^(a+)+$') == 'aaa'
+
+        # Safe rewrites are used instead of rejecting the pattern.
+        pysv.setReDoSPolicy('reject', rewrite=True)
+        assert pysv.validateRegex('aaa', r'^(?:a+)+$') == 'aaa'
+        assert pysv.validateRegexStr(r'^(?:a+)+$').pattern == '^a+$'
+        with pytest.raises(pysv.PySimpleValidateException):
+            pysv.validateRegex('aaa', r'^(a|aa)+$')
+
+        pysv.setReDoSPolicy('allow')
+        assert pysv.validateRegex('aaa', r'^(a|aa)+$') == 'aaa'
+        with pytest.raises(pysv.PySimpleValidateException):
+            pysv.setReDoSPolicy('ignore')
+    finally:
+        pysv.setReDoSPolicy('warn')
+
+
+def test_literalPrefilter():
+    assert pysv.literalPrefilter(r'.*casino.*').exact
+    assert pysv.literalPrefilter(r'^admin').prefix == 'admin'
+    assert pysv.literalPrefilter(r'(?i)casino') is None
+    with pytest.raises(re.error):
+        pysv.literalPrefilter(r'(cat')
+
+    # The prefilter's answers agree with the regex's.
+    patterns = [r'.*casino.*', r'^admin', r'\.exe$', r'^admin$', r'\Acat\Z', r'ab\d+c', r'(?:ab)+x$', r'(?m)^cat', r'$']
+    values = ['casino', 'online casino', 'admin', 'admin\n', 'xadmin', 'a.exe', 'a.exe\n', 'cat', 'dog\ncat', 'ab12c', 'ababx']
+    for pattern in patterns:
+        prefilter = pysv.literalPrefilter(pattern)
+        for value in values:
+            assert prefilter.check(value) in (None, re.search(pattern, value) is not None), (pattern, value)
+
+    assert pysv.validateStr('hello', blockRegexes=[r'.*casino.*', r'^admin', (r'\.exe$', 'No programs.')]) == 'hello'
+    with pytest.raises(pysv.ValidationException, match='No programs.'):
+        pysv.validateStr('setup.exe', blockRegexes=[r'.*casino.*', r'^admin', (r'\.exe$', 'No programs.')])
+    assert pysv.validateNum('admin1', allowRegexes=[r'^admin\d']) == 'admin1'
+    with pytest.raises(re.error):
+        pysv.validateStr('hello', blockRegexes=[r'(cat'])
+
+
+def test_combinators():
+    validateIP = pysv.anyOf(pysv.validateIPv4, pysv.validateIPv6, blockRegexes=[r'^10\.'])
+    assert validateIP(' 192.168.0.1 ') == '192.168.0.1'
+    assert validateIP('::1') == '::1'
+    with pytest.raises(pysv.ValidationException) as excInfo:
+        validateIP('cat')
+    assert excInfo.value.code == 'NOT_ANY_OF'
+    assert [exc.code for exc in excInfo.value.params['errors']] == ['NOT_IPV4', 'NOT_IPV6']
+    with pytest.raises(pysv.ValidationException, match='This response is invalid.'):
+        validateIP('10.0.0.1')  # The blockRegexes are checked once, before the validators.
+    with pytest.raises(pysv.ValidationException, match='Not an IP.'):
+        pysv.anyOf(pysv.validateIPv4, pysv.validateIPv6, excMsg='Not an IP.')('cat')
+    assert pysv.anyOf(pysv.validateInt, blank=True)('') == ''
+
+    def validateEven(value):
+        if value[-1] not in '02468':
+            raise pysv.ValidationException('odd')
+        return value
+
+    validateSmallEven = pysv.allOf(pysv.validateInt, functools.partial(pysv.validateNum, max=100), validateEven)
+    assert validateSmallEven('42') == 42
+    with pytest.raises(pysv.ValidationException, match='odd'):
+        validateSmallEven('43')
+    with pytest.raises(pysv.ValidationException) as excInfo:
+        validateSmallEven('400')
+    assert excInfo.value.code == 'NUM_MAX'
+
+    assert pysv.then(pysv.validateInt, functools.partial(pysv.validateNum, min=0))('42') == 42
+    with pytest.raises(pysv.ValidationException) as excInfo:
+        pysv.then(pysv.validateInt, functools.partial(pysv.validateNum, min=0), excMsg='Bad.')('-1')
+    assert str(excInfo.value) == 'Bad.' and excInfo.value.code == 'NUM_MIN'
+
+    # The adaptive order moves the validator that passes most values to the front, without changing the results.
+    adaptiveIP = pysv.anyOf(pysv.validateIPv4, pysv.validateIPv6, adaptive=True)
+    values = ['2001:db8::%x' % i for i in range(600)] + ['192.168.0.1']
+    assert [adaptiveIP(value) for value in values] == [pysv.validateIP(value) for value in values]
+    assert adaptiveIP.order == (pysv.validateIPv6, pysv.validateIPv4)
+    # When a value passes more than one validator, the result is still the first given validator's.
+    adaptiveStrOrInt = pysv.anyOf(pysv.validateStr, pysv.validateInt, adaptive=True)
+    assert [adaptiveStrOrInt(str(i)) for i in range(300)] == [str(i) for i in range(300)]
+    assert adaptiveStrOrInt.order == (pysv.validateInt, pysv.validateStr)
+    assert adaptiveStrOrInt('42') == '42' and adaptiveStrOrInt('x') == 'x'
+    adaptiveAll = pysv.allOf(pysv.validateNum, pysv.validateInt, adaptive=True)
+    for i in range(300):
+        with pytest.raises(pysv.ValidationException):
+            adaptiveAll('%d.5' % i)
+    assert adaptiveAll.order == (pysv.validateInt, pysv.validateNum)
+    assert adaptiveAll('7') == 7
+    with pytest.raises(pysv.ValidationException) as excinfo:
+        adaptiveAll('abc')  # Fails both validators, and is reported with the first one's exception.
+    assert excinfo.value.code == 'NOT_NUM'
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.anyOf()
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.anyOf(pysv.validateInt, 'validateFloat')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.then(pysv.validateInt, adaptive=True)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.allOf(pysv.validateInt, min=0)
+
+
+def test_warmupAndPatternBundle(tmp_path, monkeypatch):
+    monkeypatch.setattr(pysv, '_postalCodeRules', {})
+    monkeypatch.setattr(pysv, '_strptimeRegexes', {})
+    pysv.warmup(patterns=[r'.*casino.*', (r'^admin', 'Reserved name.')], dateFormats=['%d.%m.%Y'])
+    assert 'GB' in pysv._postalCodeRules
+    assert '%Y/%m/%d' in pysv._strptimeRegexes and '%d.%m.%Y' in pysv._strptimeRegexes
+    assert pysv._literalPrefilters[r'.*casino.*'].exact
+    pysv.warmup(regexEngine='pike')
+    assert (pysv.PikeRegexEngine(), pysv.IPV4_REGEX.pattern, pysv.IPV4_REGEX.flags) in pysv._compiledPatterns
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.warmup(patterns=r'^admin')
+
+    # The warmed patterns stay compiled, however many there are, and aren't left to re's bounded cache.
+    monkeypatch.setattr(pysv, '_warmedPatterns', {})
+    patterns = [r'^word%d\b' % i for i in range(pysv._MAX_COMPILED_PATTERNS + 100)]
+    for engine in ('re', 'pike'):
+        pysv.warmup(patterns=patterns, regexEngine=engine)
+        compiled = [pysv._compilePattern(pattern, 0, pysv.REGEX_ENGINES[engine]()) for pattern in patterns]
+        re.purge()
+        pysv._compiledPatterns.clear()
+        assert all(pysv._compilePattern(pattern, 0, pysv.REGEX_ENGINES[engine]()) is compiledPattern
+                   for pattern, compiledPattern in zip(patterns, compiled))
+    assert len(pysv._warmedPatterns) == 2 * len(patterns)
+
+    rules = {'a': [r'.*casino.*', (r'^admin', 'Reserved name.')], 'b': [re.compile(r'(?P<x>cat)', re.I)]}
+    bundle = pysv.PatternBundle(rules)
+    filename = str(tmp_path / 'rules.bundle')
+    bundle.save(filename)
+    loaded = pysv.PatternBundle.load(filename)
+    assert sorted(loaded) == ['a', 'b'] and len(loaded) == 2 and 'a' in loaded
+    assert loaded['a'] == bundle['a'] and loaded['b'] == bundle['b']
+    assert loaded['b'][0].search('CAT').group('x') == 'CAT'
+    with pytest.raises(pysv.ValidationException, match='Reserved name.'):
+        pysv.validateStr('administrator', blockRegexes=loaded['a'])
+    pysv.warmup(patterns=loaded)
+
+    # A bundle saved by another version of Python compiles the patterns from their source instead.
+    monkeypatch.setattr(pysv.bundle, '_CODE_VERSION', 'other')
+    assert pysv.PatternBundle.load(filename)['b'] == bundle['b']
+
+    (tmp_path / 'bad.bundle').write_text('{"format": "something else"}')
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.PatternBundle.load(str(tmp_path / 'bad.bundle'))
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.PatternBundle({'a': [42]})
+    with pytest.raises(re.error):
+        pysv.PatternBundle({'a': ['(cat']})
+
+
+def test_slowInputLog():
+    validateInt = pysv.validateInt
+    assert list(inspect.signature(validateInt).parameters)[:2] == ['value', 'blank']  # The decorator keeps these.
+    assert validateInt.__name__ == 'validateInt' and validateInt.__doc__.startswith('Raises ValidationException')
+    log = pysv.SlowInputLog(threshold=0.0, maxRecords=3)
+    pysv.setSlowInputLog(log)
+    try:
+        assert pysv.getSlowInputLog() is log and pysv.validateInt is validateInt  # The validators aren't replaced.
+        assert pysv.validateIP('192.168.0.1') == '192.168.0.1'
+        with pytest.raises(pysv.ValidationException):
+            pysv.validateDate('x' * 100, formats=['%Y/%m/%d', '%d %B %Y'])
+        assert pysv.validateStr('hello', blockRegexes=[re.compile(r'\d+')]) == 'hello'
+        records = log.records
+        assert [record['validator'] for record in records] == ['validateIP', 'validateDate', 'validateStr']
+        assert records[0]['regex'] is not None and records[0]['format'] is None
+        assert records[1]['format'] == '%Y/%m/%d' and records[1]['value'] == 'x' * pysv.MAX_ERROR_STR_LEN + '...'
+        assert records[1]['args'] == {'formats': ['%Y/%m/%d', '%d %B %Y']}
+        assert records[2]['regex'] == r'\d+' and records[2]['seconds'] >= 0
+
+        # Only the last maxRecords records are kept.
+        pysv.validateInt('42')
+        assert len(log) == 3 and log.records[-1]['validator'] == 'validateInt'
+        assert [record['validator'] for record in json.loads(log.dumps())][0] == 'validateDate'
+
+        # Validators imported before the log was set, and the default arguments that refer to them, are timed too.
+        log.clear()
+        validateInt('7')
+        pysv.validateDateTimeArray(['2019/01/02'])
+        assert [record['validator'] for record in log.records] == ['validateInt', 'validateDate']
+
+        # Positional arguments are recorded by name, and a call with the wrong arguments raises its TypeError.
+        log.clear()
+        pysv.validateInt(' 42 ', True, max=50)
+        assert log.records[0]['args'] == {'blank': True, 'max': 50} and log.records[0]['value'] == ' 42 '
+        with pytest.raises(TypeError):
+            pysv.validateInt('42', minimum=5)
+        assert len(log) == 1
+
+        # Validations under the threshold aren't recorded.
+        log.clear()
+        log.threshold = 60
+        pysv.validateInt('42')
+        assert len(log) == 0
+    finally:
+        pysv.setSlowInputLog(None)
+    assert pysv.validateInt is validateInt and pysv.getSlowInputLog() is None
+
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.SlowInputLog(threshold=-1)
+    with pytest.raises(pysv.PySimpleValidateException):
+        pysv.setSlowInputLog('log')
+
+
+def test_typedValues():
+    import decimal
+
+    # Ints, floats, Decimals, and dates are checked as is, with the same results as their strs.
+    assert pysv.validateInt(42) == 42
+    assert pysv.validateInt(42.0) == 42 and type(pysv.validateInt(42.0)) is int
+    assert pysv.validateInt(10**30) == 10**30
+    assert pysv.validateFloat(3) == 3.0 and type(pysv.validateFloat(3)) is float
+    assert pysv.validateNum(2.5) == 2.5
+    with pytest.raises(pysv.ValidationException, match="'4.5' is not an integer."):
+        pysv.validateInt(4.5)
+    with pytest.raises(pysv.ValidationException, match="Number must be at minimum 0."):
+        pysv.validateInt(-1, min=0)
+    with pytest.raises(pysv.ValidationException):
+        pysv.validateNum(1e20)  # Like '1e+20', which isn't an int or a float with a '.'.
+    with pytest.raises(pysv.ValidationException):
+        pysv.validateInt(True)  # bools aren't numbers, even though they're a subclass of int.
+
+    assert pysv.validateDecimal(decimal.Decimal('1.50'), maxScale=2) == decimal.Decimal('1.50')
+    assert pysv.validateDecimal(7) == decimal.Decimal(7)
+    assert pysv.validateDecimal(0.1) == decimal.Decimal('0.1')  # Floats are still converted from their str.
+    with pytest.raises(pysv.ValidationException, match='at most 2 digits after'):
+        pysv.validateDecimal(decimal.Decimal('1.505'), maxScale=2)
+    with pytest.raises(pysv.ValidationException):
+        pysv.validateDecimal(decimal.Decimal('NaN'))
+
+    # Dates and times don't have to match the formats, since they aren't text.
+    day = datetime.date(2004, 2, 29)
+    assert pysv.validateDate(day) is day
+    assert pysv.validateDate(day, output='tuple') == (2004, 2, 29)
+    assert pysv.validateDatetime(datetime.datetime(2018, 10, 31, 12, 0, 1), output='epoch') == 1540987201
+    assert pysv.validateTime(datetime.time(12, 0, 1)) == datetime.time(12, 0, 1)
+    with pytest.raises(pysv.ValidationException, match="'2004-02-29' is after the maximum of 2003-12-31."):
+        pysv.validateDate(day, max=datetime.date(2003, 12, 31))
+    with pytest.raises(pysv.ValidationException):
+        pysv.validateDate(datetime.datetime(2004, 2, 29))  # A datetime isn't a date, so its str is parsed instead.
+
+    # Values that must be stripped or matched against regexes are still converted to strs.
+    assert pysv.validateInt(42, allowRegexes=[r'42']) == 42
+    with pytest.raises(pysv.ValidationException, match='This response is invalid.'):
+        pysv.validateInt(42, blockRegexes=[r'42'])
+    assert pysv.validateInt(1000, strip='0') == 1
+
+
+def test_bytesValues():
+    # Bytes-like values are matched as bytes, and the validators return bytes.
+    assert pysv.validateIPv4(b'127.0.0.1') == b'127.0.0.1'
+    assert pysv.validateIP(memoryview(b' ::1 ')) == b'::1'
+    assert pysv.validateEmail(bytearray(b'al@inventwithpython.com')) == b'al@inventwithpython.com'
+    assert pysv.validateURL(b'https://inventwithpython.com') == b'https://inventwithpython.com'
+    assert pysv.validateURL(b'localhost') == b'localhost'
+    assert pysv.validateStr(b'  hello  ') == b'hello'
+    assert pysv.validateStr(b'xxhelloxx', strip='x') == b'hello'
+    assert pysv.validateStr(b'  ', blank=True) == b''
+    assert pysv.validateRegex(b'GET /index.html HTTP/1.1', r'/\S*') == b'/index.html'
+    with pytest.raises(pysv.ValidationException, match="'al' is not a valid email address."):
+        pysv.validateEmail(b'al')
+    with pytest.raises(pysv.ValidationException, match='Blank values are not allowed.'):
+        pysv.validateStr(b'')
+
+    # Error messages decode the value, replacing invalid UTF-8.
+    with pytest.raises(pysv.ValidationException, match="'�@' is not a valid email address."):
+        pysv.validateEmail(b'\xff@')
+
+    # str patterns are matched against bytes values, as bytes patterns if they're ASCII.
+    with pytest.raises(pysv.ValidationException, match='This response is invalid.'):
+        pysv.validateStr(b'online casino', blockRegexes=[r'casino'])
+    assert pysv.validateStr(b'localhost', allowRegexes=[re.compile(r'^LOCAL', re.IGNORECASE)], blockRegexes=['.'])
+    assert pysv._getBytesPattern(pysv.IPV4_REGEX) == pysv.IPV4_BYTES_REGEX
+    assert pysv._getBytesPattern(r'caf\w') == re.compile(rb'caf\w')
+
+    # Other patterns, and engines that only match strs, match the value decoded from UTF-8.
+    assert pysv._getBytesPattern(r'café') is None
+    assert pysv.validateRegex(b'caf\xc3\xa9!', r'é.') == b'\xc3\xa9!'
+    assert pysv.validateRegex(b'b\xffat', r'b.at', regexEngine='pike') == b'b\xffat'
+    assert pysv.validateStr(b'\xc3\xa9hello\xc3\xa9', strip='é') == b'hello'
+    with pytest.raises(pysv.ValidationException, match='This response is invalid.'):
+        pysv.validateStr('café'.encode('utf-8'), blockRegexes=[r'é$'])
+    with pytest.raises(pysv.ValidationException, match="Naughty"):
+        pysv.validateStr(b'naughty word', blockRegexes=[pysv.Blocklist(substrings=[('naughty', 'Naughty')])])
+
+    # A value gets the same verdict from an ASCII pattern as bytes as it does as a str, even when it isn't ASCII.
+    def verdict(value, **kwargs):
+        try:
+            result = pysv.validateStr(value, **kwargs)
+        except pysv.ValidationException as exc:
+            return exc.code
+        return result.decode('utf-8') if isinstance(result, bytes) else result
+    patterns = [r'^\w+$', r'(?i)^CAFÉ', r'(?i)^É', r'\d', r'\s', r'^\W', r'caf\w\b', r'\bcaf']
+    for value in ['café', 'cafe', 'ÉCOLE', '٣', 'a\u00a0b', 'hello world', 'x']:
+        for pattern in patterns:
+            for option in ('blockRegexes', 'allowRegexes'):
+                assert verdict(value, **{option: [pattern]}) == verdict(value.encode('utf-8'), **{option: [pattern]}), (
+                    value, pattern, option)
+            try:
+                expected = pysv.validateRegex(value, pattern).encode('utf-8')
+            except pysv.ValidationException:
+                expected = None
+            try:
+                assert pysv.validateRegex(value.encode('utf-8'), pattern) == expected, (value, pattern)
+            except pysv.ValidationException:
+                assert expected is None, (value, pattern)
+
+    # Bytes patterns can't search str values, so the regex arguments must be str patterns.
+    for kwargs in ({'blockRegexes': [re.compile(b'darn')]}, {'blockRegexes': [(re.compile(b'darn'), 'Darn.')]},
+                   {'allowRegexes': [re.compile(b'darn')]}):
+        for value in (b'\xff', b'darn', 'darn'):
+            with pytest.raises(pysv.PySimpleValidateException):
+                pysv.validateStr(value, **kwargs)
+    for validator in (pysv.validateRegex, pysv.validateRegexBatch):
+        with pytest.raises(pysv.PySimpleValidateException):
+            validator([b'darn'] if validator is pysv.validateRegexBatch else b'darn', re.compile(b'darn'))
+
+    # The batch validators return what the validators return for each bytes-like value.
+    values = [b'1.2.3.4', bytearray(b' 10.0.0.1 '), memoryview(b'1.2.3'), b'', '5.6.7.8', b'\xff1.2.3.4']
+    assert pysv.validateIPv4Batch(values) == [b'1.2.3.4', b'10.0.0.1', None, None, '5.6.7.8', b'1.2.3.4']
+    for kwargs in ({}, {'blank': True, 'blockRegexes': ['^5']}, {'allowRegexes': [r'\d$']}):
+        expected = []
+        for value in values:
+            try:
+                expected.append(pysv.validateIPv4(value, **kwargs))
+            except pysv.ValidationException:
+                expected.append(None)
+        assert pysv.validateIPv4Batch(values, **kwargs) == expected, kwargs
+    assert pysv.validateRegexBatch([b'caf\xc3\xa9!', b'\xffcaf\xc3\xa9'], r'é.?', allowRegexes=[r'^\W']) == [
+        b'\xc3\xa9!', b'\xffcaf\xc3\xa9']
+    assert pysv.validateURLBatch([b'localhost', b'https://inventwithpython.com']) == [
+        b'localhost', b'https://inventwithpython.com']
+    assert pysv.validateEmailBatch([bytearray(b'al@inventwithpython.com')]) == [b'al@inventwithpython.com']
+    assert pysv.validateIPv6Batch([b'::1']) == [b'::1']
+
+
 if __name__ == '__main__':
     pytest.main()
 